@@ -1,23 +1,23 @@
 """Command-line interface for improveit-dashboard."""
 
 import argparse
-import csv
-import io
-import json
 import logging
-import subprocess
+import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from improveit_dashboard import __version__
-from improveit_dashboard.controllers.analyzer import analyze_engagement, classify_comments
-from improveit_dashboard.controllers.discovery import run_discovery
-from improveit_dashboard.controllers.github_client import GitHubClient
-from improveit_dashboard.controllers.persistence import load_model, save_model
-from improveit_dashboard.models.config import Configuration
 from improveit_dashboard.utils.logging import get_logger, setup_logging
-from improveit_dashboard.views.dashboard import generate_dashboard, generate_responsiveness_reports
-from improveit_dashboard.views.reports import generate_user_reports
+
+# Commands import what they need when they run, so that starting the CLI
+# (and --help/--version) does not load requests, numpy, yaml or the views
+if TYPE_CHECKING:
+    from improveit_dashboard.controllers.query import Query
+    from improveit_dashboard.models.config import Configuration
+    from improveit_dashboard.models.pull_request import PullRequest
+    from improveit_dashboard.models.repository import Repository
 
 logger = get_logger(__name__)
 
@@ -80,6 +80,11 @@ def create_parser() -> argparse.ArgumentParser:
         type=int,
         help="Maximum number of PRs to process",
     )
+    update_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its checkpoint",
+    )
     update_parser.add_argument(
         "--no-generate",
         action="store_true",
@@ -90,6 +95,12 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Create git commit with summary of changes",
     )
+    update_parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print which PRs a refresh would fetch within the API budget, with "
+        "estimated calls and duration, without network access (dry run)",
+    )
 
     # Generate command
     generate_parser = subparsers.add_parser(
@@ -109,9 +120,9 @@ def create_parser() -> argparse.ArgumentParser:
     )
     export_parser.add_argument(
         "--format",
-        choices=["json", "csv"],
+        choices=["json", "jsonl", "csv", "parquet"],
         default="json",
-        help="Export format (default: json)",
+        help="Export format (default: json; parquet requires pyarrow)",
     )
     export_parser.add_argument(
         "--output",
@@ -125,6 +136,127 @@ def create_parser() -> argparse.ArgumentParser:
         default="all",
         help="Filter PRs to export",
     )
+    export_parser.add_argument(
+        "--fields",
+        help="Comma-separated PR fields to export (default: all; csv: a summary set)",
+    )
+    export_parser.add_argument(
+        "--where",
+        metavar="EXPR",
+        help="Filter expression, combined with --filter "
+        "(e.g. \"tool = codespell and idle_days > 30\"; see 'query --help')",
+    )
+
+    # Query command
+    query_parser = subparsers.add_parser(
+        "query",
+        help="List PRs matching a filter expression",
+        description="List PRs matching a filter expression over PR fields, "
+        "repository fields (repo.<field>) and age_days/idle_days, e.g.: "
+        "status = open and tool = codespell and response_status = awaiting_maintainer "
+        "and idle_days > 30 and repo.behavior_category = welcoming. "
+        "Operators: = != < <= > >= ~ (substring) and [not] in (...); "
+        "combine with and/or/not and parentheses.",
+    )
+    query_parser.add_argument("expression", help="Filter expression")
+    query_parser.add_argument(
+        "--format",
+        choices=["text", "json", "jsonl", "csv"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    query_parser.add_argument(
+        "--fields",
+        help="Comma-separated PR fields to show",
+    )
+    query_parser.add_argument(
+        "--limit",
+        type=int,
+        help="Show at most this many PRs",
+    )
+    query_parser.add_argument(
+        "--count",
+        action="store_true",
+        help="Only print the number of matching PRs",
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve read-only JSON queries over the model",
+        description="Load the model once and answer JSON queries over HTTP "
+        "(/prs, /inbox, /repos, /repos/<owner>/<name>, /status), "
+        "reloading the model when its file changes.",
+    )
+    serve_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to bind (default: 127.0.0.1)",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to bind (default: 8765)",
+    )
+    serve_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks of the model file for changes (default: 2)",
+    )
+
+    # Webhook command
+    webhook_parser = subparsers.add_parser(
+        "webhook",
+        help="Receive GitHub webhooks and apply them to the model",
+        description="Receive pull_request, issue_comment, check_run and status webhooks "
+        "(verified with the shared secret from IMPROVEIT_WEBHOOK_SECRET or "
+        "webhook_secret), apply them to the model without API calls, and save the "
+        "model and regenerate affected views every webhook_flush_interval seconds. "
+        "Run `update` occasionally to reconcile what webhooks cannot describe.",
+    )
+    webhook_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to bind (default: 127.0.0.1)",
+    )
+    webhook_parser.add_argument(
+        "--port",
+        type=int,
+        default=8766,
+        help="Port to bind (default: 8766)",
+    )
+    webhook_parser.add_argument(
+        "--no-generate",
+        action="store_true",
+        help="Save the model without regenerating views",
+    )
+    webhook_parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="DIR",
+        help="Record verified deliveries as JSON files in DIR (for offline replay)",
+    )
+
+    # Watch command
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep the model up to date, polling each PR on its own cadence",
+        description="Keep the model in memory and poll each PR when due: recently "
+        "active PRs every watch_hot_interval, idle ones up to every "
+        "watch_stale_interval, closed ones every closed_revalidate_days (merged PRs "
+        "are not polled). Unchanged PRs cost a conditional request, which does not "
+        "count against the rate limit, plus 5 CI calls while their CI is pending. "
+        "New PRs are found with an incremental search every watch_search_interval; "
+        "the model is saved and views of changed PRs regenerated every "
+        "watch_checkpoint_interval.",
+    )
+    watch_parser.add_argument(
+        "--no-generate",
+        action="store_true",
+        help="Save the model without regenerating views",
+    )
 
     # Reanalyze command
     reanalyze_parser = subparsers.add_parser(
@@ -133,9 +265,49 @@ def create_parser() -> argparse.ArgumentParser:
     )
     reanalyze_parser.add_argument(
         "prs",
-        nargs="+",
+        nargs="*",
         help="PRs to reanalyze in format 'owner/repo#number' (e.g., 'kestra-io/kestra#12912')",
     )
+    reanalyze_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Recompute from the payload archive instead of fetching from GitHub",
+    )
+    reanalyze_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Reanalyze every PR in the model (requires --offline)",
+    )
+    reanalyze_parser.add_argument(
+        "--repo",
+        action="append",
+        default=[],
+        help="Only PRs of this repository, owner/repo (repeatable; requires --offline)",
+    )
+    reanalyze_parser.add_argument(
+        "--author",
+        action="append",
+        default=[],
+        help="Only PRs by this author (repeatable; requires --offline)",
+    )
+    reanalyze_parser.add_argument(
+        "--status",
+        action="append",
+        default=[],
+        choices=["draft", "open", "merged", "closed"],
+        help="Only PRs with this status (repeatable; requires --offline)",
+    )
+    reanalyze_parser.add_argument(
+        "--needs-reanalysis",
+        action="store_true",
+        help="Only PRs marked as needing reanalysis (requires --offline)",
+    )
+    reanalyze_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for offline reanalysis (default: CPU count)",
+    )
     reanalyze_parser.add_argument(
         "--commit",
         action="store_true",
@@ -145,7 +317,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def cmd_update(args: argparse.Namespace, config: Configuration) -> int:
+def cmd_update(args: argparse.Namespace, config: "Configuration") -> int:
     """Run the update command."""
     # Apply CLI overrides
     if args.force:
@@ -155,10 +327,25 @@ def cmd_update(args: argparse.Namespace, config: Configuration) -> int:
 
     incremental = not args.full
 
+    if args.plan:
+        from improveit_dashboard.controllers.planner import offline_plan
+
+        print(offline_plan(config).render())
+        return 0
+
+    from improveit_dashboard.controllers.pipeline import run_pipeline
+
     logger.info("Starting PR discovery...")
 
     try:
-        run = run_discovery(config, incremental=incremental)
+        result = run_pipeline(
+            config,
+            incremental=incremental,
+            resume=args.resume,
+            generate=not args.no_generate,
+            commit=args.commit,
+        )
+        run = result.run
 
         # Print summary
         print("\nDiscovery complete:")
@@ -168,123 +355,41 @@ def cmd_update(args: argparse.Namespace, config: Configuration) -> int:
         print(f"  Newly merged: {run.newly_merged_prs}")
         print(f"  Newly closed: {run.newly_closed_prs}")
         print(f"  Total processed: {run.total_processed}")
-        print(f"  API calls: {run.api_calls_made}")
+        print(f"  Unchanged (skipped): {run.unchanged_prs}")
+        print(f"  API calls: {run.api_calls_made} ({run.api_retries} retried)")
 
         if run.errors:
             print(f"\n  Errors: {len(run.errors)}")
             for error in run.errors[:5]:
                 print(f"    - {error}")
 
-        # Generate views unless --no-generate
-        if not args.no_generate:
-            logger.info("Generating dashboard views...")
-            result = cmd_generate(args, config)
-            if result != 0:
-                return result
+        for path in result.generated:
+            print(f"Generated: {path}")
 
-        # Create git commit if requested
-        if args.commit:
-            logger.info("Creating git commit...")
-            result = _create_commit(run.to_commit_message())
-            if result != 0:
-                return result
-
-        return 0
+        return result.commit_status or 0
 
     except Exception as e:
         logger.error(f"Update failed: {e}")
         return 1
 
 
-def _create_commit(message: str) -> int:
-    """Create a git commit with the given message.
-
-    Returns 0 on success, 1 if no changes to commit, 2 on error.
-    """
-    try:
-        # Check if there are changes to commit
-        result = subprocess.run(
-            ["git", "diff", "--quiet"],
-            capture_output=True,
-        )
-        staged_result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            capture_output=True,
-        )
-
-        # If both exit 0, there are no changes
-        if result.returncode == 0 and staged_result.returncode == 0:
-            print("No changes to commit")
-            return 0
-
-        # Stage all changes
-        subprocess.run(["git", "add", "-A"], check=True)
-
-        # Create commit
-        subprocess.run(
-            ["git", "commit", "-m", message],
-            check=True,
-        )
-
-        print("Created commit with summary:")
-        # Print first line of commit message
-        print(f"  {message.split(chr(10))[0]}")
-
-        return 0
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Git commit failed: {e}")
-        return 2
-    except FileNotFoundError:
-        logger.error("Git not found in PATH")
-        return 2
-
-
-def cmd_generate(args: argparse.Namespace, config: Configuration) -> int:
+def cmd_generate(args: argparse.Namespace, config: "Configuration") -> int:
     """Run the generate command."""
+    from improveit_dashboard.controllers.persistence import load_model
+    from improveit_dashboard.controllers.pipeline import generate_views
+
     logger.info("Generating dashboard views...")
 
     try:
         # Load model
-        repositories, _ = load_model(config.data_file)
+        repositories, _ = load_model(config.data_file, cache=config.model_cache)
 
         if not repositories:
             logger.warning("No data to generate views from")
             print("No PR data found. Run 'improveit-dashboard update' first.")
             return 0
 
-        # Build behavior overrides map from config
-        behavior_overrides: dict[str, str] = {}
-        for repo_name, override in config.repository_overrides.items():
-            behavior_overrides[repo_name] = override.category
-            if override.note:
-                logger.info(f"Override {repo_name}: {override.category} ({override.note})")
-
-        # Generate main dashboard
-        generate_dashboard(
-            repositories=repositories,
-            output_path=config.output_readme,
-            tracked_users=config.tracked_users,
-            behavior_overrides=behavior_overrides,
-        )
-        print(f"Generated: {config.output_readme}")
-
-        # Generate per-user reports
-        user_reports = generate_user_reports(
-            repositories=repositories,
-            output_dir=config.output_readmes_dir,
-            tracked_users=config.tracked_users,
-        )
-        for path in user_reports:
-            print(f"Generated: {path}")
-
-        # Generate responsiveness reports
-        responsiveness_reports = generate_responsiveness_reports(
-            repositories=repositories,
-            output_dir=config.output_summaries_dir,
-            behavior_overrides=behavior_overrides,
-        )
-        for path in responsiveness_reports:
+        for path in generate_views(config, repositories):
             print(f"Generated: {path}")
 
         return 0
@@ -294,137 +399,237 @@ def cmd_generate(args: argparse.Namespace, config: Configuration) -> int:
         return 1
 
 
-def cmd_export(args: argparse.Namespace, config: Configuration) -> int:
+def cmd_export(args: argparse.Namespace, config: "Configuration") -> int:
     """Run the export command."""
+    from improveit_dashboard.controllers.persistence import load_model
+    from improveit_dashboard.controllers.query import Query, combine
+    from improveit_dashboard.views.export import (
+        BINARY_FORMATS,
+        FILTER_PRESETS,
+        export_prs,
+        parse_fields,
+    )
+
     logger.info("Exporting data...")
 
+    try:
+        field_names = parse_fields(args.fields) if args.fields else None
+        expression = combine(FILTER_PRESETS[args.filter], args.where)
+        query = Query(expression, config.behavior_overrides()) if expression else None
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
     try:
         # Load model
-        repositories, _ = load_model(config.data_file)
+        repositories, _ = load_model(config.data_file, cache=config.model_cache)
 
         if not repositories:
             logger.warning("No data to export")
             return 0
 
-        # Collect PRs based on filter
-        prs = []
-        for repo in repositories.values():
-            for pr in repo.prs.values():
-                if args.filter == "all":
-                    prs.append(pr)
-                elif args.filter == "needs-response" and pr.response_status == "awaiting_submitter":
-                    prs.append(pr)
-                elif args.filter == "open" and pr.status in ("draft", "open"):
-                    prs.append(pr)
-                elif args.filter == "merged" and pr.status == "merged":
-                    prs.append(pr)
-
-        # Export
-        if args.format == "json":
-            output = [pr.to_dict() for pr in prs]
-            content = json.dumps(output, indent=2)
-        else:
-            # CSV format
-            buffer = io.StringIO()
-            writer = csv.writer(buffer)
-
-            # Header
-            writer.writerow(
-                [
-                    "repository",
-                    "number",
-                    "title",
-                    "author",
-                    "status",
-                    "tool",
-                    "created_at",
-                    "merged_at",
-                    "response_status",
-                    "last_developer_comment_body",
-                ]
-            )
+        prs = _select(repositories, query)
+        binary = args.format in BINARY_FORMATS
 
-            # Data
-            for pr in prs:
-                writer.writerow(
-                    [
-                        pr.repository,
-                        pr.number,
-                        pr.title,
-                        pr.author,
-                        pr.status,
-                        pr.tool,
-                        pr.created_at.isoformat(),
-                        pr.merged_at.isoformat() if pr.merged_at else "",
-                        pr.response_status,
-                        pr.last_developer_comment_body or "",
-                    ]
-                )
-
-            content = buffer.getvalue()
-
-        # Output
+        # Stream rows to the output file, or to stdout for piping
         if args.output:
             args.output.parent.mkdir(parents=True, exist_ok=True)
-            args.output.write_text(content)
-            print(f"Exported {len(prs)} PRs to {args.output}")
+            if binary:
+                with open(args.output, "wb") as f:
+                    count = export_prs(prs, f, args.format, field_names)
+            else:
+                with open(args.output, "w", encoding="utf-8", newline="") as f:
+                    count = export_prs(prs, f, args.format, field_names)
+            print(f"Exported {count} PRs to {args.output}")
         else:
-            print(content)
+            out = sys.stdout.buffer if binary else sys.stdout
+            count = export_prs(prs, out, args.format, field_names)
+            out.flush()
+            logger.info(f"Exported {count} PRs")
 
         return 0
 
+    except BrokenPipeError:
+        return _closed_stdout()
+
     except Exception as e:
         logger.error(f"Export failed: {e}")
         return 1
 
 
-def cmd_reanalyze(args: argparse.Namespace, config: Configuration) -> int:
+def cmd_query(args: argparse.Namespace, config: "Configuration") -> int:
+    """Run the query command."""
+    import itertools
+
+    from improveit_dashboard.controllers.persistence import load_model
+    from improveit_dashboard.controllers.query import Query
+    from improveit_dashboard.views.export import export_prs, parse_fields
+
+    try:
+        field_names = parse_fields(args.fields) if args.fields else None
+        query = Query(args.expression, config.behavior_overrides())
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    try:
+        repositories, _ = load_model(config.data_file, cache=config.model_cache)
+        prs = _select(repositories, query)
+        if args.limit is not None:
+            prs = itertools.islice(prs, args.limit)
+
+        if args.count:
+            print(sum(1 for _ in prs))
+        else:
+            export_prs(prs, sys.stdout, args.format, field_names)
+            sys.stdout.flush()
+        return 0
+
+    except BrokenPipeError:
+        return _closed_stdout()
+
+    except Exception as e:
+        logger.error(f"Query failed: {e}")
+        return 1
+
+
+def cmd_serve(args: argparse.Namespace, config: "Configuration") -> int:
+    """Run the serve command."""
+    from improveit_dashboard.controllers.server import ModelServer
+
+    try:
+        server = ModelServer(config, poll_interval=args.poll_interval)
+        server.serve(args.host, args.port)
+        return 0
+    except OSError as e:
+        logger.error(f"Cannot serve on {args.host}:{args.port}: {e}")
+        return 1
+
+
+def cmd_webhook(args: argparse.Namespace, config: "Configuration") -> int:
+    """Run the webhook command."""
+    if not config.webhook_secret:
+        logger.error("Webhook secret not set. Set IMPROVEIT_WEBHOOK_SECRET or webhook_secret.")
+        return 1
+
+    from improveit_dashboard.controllers.webhook import WebhookReceiver
+
+    try:
+        receiver = WebhookReceiver(config, generate=not args.no_generate, record_dir=args.record)
+        receiver.serve(args.host, args.port)
+        return 0
+    except OSError as e:
+        logger.error(f"Cannot receive webhooks on {args.host}:{args.port}: {e}")
+        return 1
+
+
+def cmd_watch(args: argparse.Namespace, config: "Configuration") -> int:
+    """Run the watch command."""
+    from improveit_dashboard.controllers.watch import WatchDaemon
+
+    WatchDaemon(config, generate=not args.no_generate).run_forever()
+    return 0
+
+
+def _select(
+    repositories: dict[str, "Repository"], query: "Query | None"
+) -> Iterator["PullRequest"]:
+    """Iterate over the PRs matching a query (all PRs if None).
+
+    A one-shot command scans the model once either way, so no index is built.
+    """
+    if query is not None:
+        return query.select(repositories)
+    return (pr for repo in repositories.values() for pr in repo.prs.values())
+
+
+def _closed_stdout() -> int:
+    """Handle the reader of stdout (e.g. `head`) stopping early."""
+    # Silence the failing flush of stdout at exit
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+def cmd_reanalyze(args: argparse.Namespace, config: "Configuration") -> int:
     """Force reanalysis of specific PRs."""
-    logger.info(f"Reanalyzing {len(args.prs)} PRs...")
+    from datetime import UTC, datetime
 
-    # Initialize client
-    client = GitHubClient(
-        token=config.github_token,
-        rate_limit_threshold=config.rate_limit_threshold,
-    )
+    from improveit_dashboard.controllers.history import HistoryStore, history_path
+    from improveit_dashboard.controllers.persistence import load_model, save_model
+    from improveit_dashboard.controllers.pipeline import generate_views
+    from improveit_dashboard.utils.git import create_commit
+
+    bulk = args.all or args.repo or args.author or args.status or args.needs_reanalysis
+    if bulk and not args.offline:
+        logger.error("Selectors require --offline (reanalyzing in bulk online costs API budget)")
+        return 1
+    if not bulk and not args.prs:
+        logger.error("Specify PRs to reanalyze or use --offline with --all or selectors")
+        return 1
 
     # Load existing model
-    repositories, last_run = load_model(config.data_file)
+    repositories, last_run = load_model(config.data_file, cache=config.model_cache)
 
-    reanalyzed = 0
-    for pr_spec in args.prs:
-        try:
-            # Parse PR spec: owner/repo#number
-            if "#" not in pr_spec:
-                logger.error(f"Invalid PR format: {pr_spec} (expected owner/repo#number)")
-                continue
+    if args.offline:
+        reanalyzed = _reanalyze_offline(args, config, repositories)
+    else:
+        reanalyzed = _reanalyze_online(args, config, repositories)
 
-            repo_part, number_part = pr_spec.rsplit("#", 1)
-            pr_number = int(number_part)
+    if reanalyzed > 0:
+        # Save updated model
+        save_model(config.data_file, repositories, last_run)
+        if config.record_history:
+            HistoryStore(history_path(config.data_file)).record(
+                repositories, datetime.now(UTC), source="reanalyze"
+            )
+        print(f"\nReanalyzed {reanalyzed} PRs")
 
-            if "/" not in repo_part:
-                logger.error(f"Invalid repo format: {repo_part} (expected owner/repo)")
-                continue
+        # Regenerate views
+        logger.info("Regenerating views...")
+        generate_views(config, repositories)
 
-            owner, repo_name = repo_part.split("/", 1)
-            full_name = f"{owner}/{repo_name}"
+        # Commit if requested
+        if args.commit:
+            if bulk:
+                pr_list = f"{reanalyzed} archived PRs"
+            else:
+                pr_list = ", ".join(args.prs[:3])
+                if len(args.prs) > 3:
+                    pr_list += f" (+{len(args.prs) - 3} more)"
+            source = "archived payloads" if args.offline else "updated bot detection"
+            message = f"Reanalyze PRs: {pr_list}\n\nForced reanalysis with {source}."
+            result = create_commit(message)
+            if result != 0:
+                return result
 
-            # Find PR in model
-            if full_name not in repositories:
-                logger.warning(f"Repository {full_name} not found in model")
-                continue
+    return 0
+
+
+def _reanalyze_online(
+    args: argparse.Namespace, config: "Configuration", repositories: dict[str, "Repository"]
+) -> int:
+    """Refetch comments for the PRs given on the command line and reanalyze them."""
+    from improveit_dashboard.controllers.analyzer import analyze_engagement, classify_comments
+    from improveit_dashboard.controllers.github_client import GitHubClient
+
+    logger.info(f"Reanalyzing {len(args.prs)} PRs...")
 
-            repo = repositories[full_name]
-            if pr_number not in repo.prs:
-                logger.warning(f"PR {pr_spec} not found in model")
+    # Initialize client
+    client = GitHubClient.from_config(config)
+
+    reanalyzed = 0
+    for pr_spec in args.prs:
+        try:
+            pr = _find_pr(repositories, pr_spec)
+            if pr is None:
                 continue
 
-            pr = repo.prs[pr_number]
+            owner, repo_name = pr.repository.split("/", 1)
             logger.info(f"Reanalyzing {pr_spec}: {pr.title}")
 
             # Fetch and reclassify comments
-            comments_data = client.fetch_pr_comments(owner, repo_name, pr_number)
-            comments = classify_comments(comments_data, pr.author)
+            comments_data = client.fetch_pr_comments(owner, repo_name, pr.number)
+            comments = classify_comments(comments_data, pr.author, config.get_bot_matcher())
             analyze_engagement(comments, pr)
 
             print(f"  Reanalyzed {pr_spec}:")
@@ -443,39 +648,63 @@ def cmd_reanalyze(args: argparse.Namespace, config: Configuration) -> int:
         except Exception as e:
             logger.error(f"Failed to reanalyze {pr_spec}: {e}")
 
-    if reanalyzed > 0:
-        # Save updated model
-        save_model(config.data_file, repositories, last_run)
-        print(f"\nReanalyzed {reanalyzed} PRs")
+    return reanalyzed
 
-        # Regenerate views
-        logger.info("Regenerating views...")
-        generate_dashboard(
-            repositories=repositories,
-            output_path=config.output_readme,
-            tracked_users=config.tracked_users,
-        )
-        generate_user_reports(
-            repositories=repositories,
-            output_dir=config.output_readmes_dir,
-            tracked_users=config.tracked_users,
-        )
-        generate_responsiveness_reports(
-            repositories=repositories,
-            output_dir=config.output_summaries_dir,
+
+def _reanalyze_offline(
+    args: argparse.Namespace, config: "Configuration", repositories: dict[str, "Repository"]
+) -> int:
+    """Recompute derived fields of selected PRs from the payload archive."""
+    from improveit_dashboard.controllers.archive import PayloadArchive, archive_path
+    from improveit_dashboard.controllers.reanalysis import PRSelector, reanalyze_bulk
+
+    selector = PRSelector(
+        prs={spec for spec in args.prs if _find_pr(repositories, spec)},
+        repositories=set(args.repo),
+        authors=set(args.author),
+        statuses=set(args.status),
+        analysis_statuses={"needs_reanalysis"} if args.needs_reanalysis else set(),
+    )
+    if args.prs and not selector.prs:
+        return 0
+
+    archive = PayloadArchive(archive_path(config.data_file))
+    result = reanalyze_bulk(
+        repositories, archive, selector, jobs=args.jobs, matcher=config.get_bot_matcher()
+    )
+
+    print(f"  Selected {result.selected} PRs, reanalyzed {result.reanalyzed}")
+    if result.missing:
+        print(
+            f"  {result.missing} PRs have no archived payloads (run 'update --force' to fetch them)"
         )
+    return result.reanalyzed
 
-        # Commit if requested
-        if args.commit:
-            pr_list = ", ".join(args.prs[:3])
-            if len(args.prs) > 3:
-                pr_list += f" (+{len(args.prs) - 3} more)"
-            message = f"Reanalyze PRs: {pr_list}\n\nForced reanalysis with updated bot detection."
-            result = _create_commit(message)
-            if result != 0:
-                return result
 
-    return 0
+def _find_pr(repositories: dict[str, "Repository"], pr_spec: str) -> "PullRequest | None":
+    """Look up a PR given as 'owner/repo#number', logging why if not found."""
+    # Parse PR spec: owner/repo#number
+    repo_part, _, number_part = pr_spec.rpartition("#")
+    if not repo_part or not number_part.isdigit():
+        logger.error(f"Invalid PR format: {pr_spec} (expected owner/repo#number)")
+        return None
+    pr_number = int(number_part)
+
+    if "/" not in repo_part:
+        logger.error(f"Invalid repo format: {repo_part} (expected owner/repo)")
+        return None
+
+    # Find PR in model
+    if repo_part not in repositories:
+        logger.warning(f"Repository {repo_part} not found in model")
+        return None
+
+    repo = repositories[repo_part]
+    if pr_number not in repo.prs:
+        logger.warning(f"PR {pr_spec} not found in model")
+        return None
+
+    return repo.prs[pr_number]
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -493,15 +722,21 @@ def main(argv: list[str] | None = None) -> int:
     setup_logging(level=level)
 
     # Load configuration
+    from improveit_dashboard.models.config import Configuration
+
     config = Configuration.from_file(args.config)
     # Apply environment variable overrides
     env_config = Configuration.from_env()
     if env_config.github_token:
         config.github_token = env_config.github_token
+    if env_config.github_tokens:
+        config.github_tokens = env_config.github_tokens
     if env_config.force_mode:
         config.force_mode = env_config.force_mode
     if env_config.max_prs_per_run:
         config.max_prs_per_run = env_config.max_prs_per_run
+    if env_config.rate_limit_pacing:
+        config.rate_limit_pacing = env_config.rate_limit_pacing
 
     # Validate config
     errors = config.validate()
@@ -511,10 +746,15 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     # Commands that require GitHub token
-    commands_requiring_token = {"update", "reanalyze"}
+    commands_requiring_token = {"update", "watch", "reanalyze"}
 
-    # Check for token only for commands that need it
-    if args.command in commands_requiring_token and not config.github_token:
+    # Check for token only for commands that need it (offline reanalysis does not)
+    needs_token = (
+        args.command in commands_requiring_token
+        and not getattr(args, "offline", False)
+        and not getattr(args, "plan", False)
+    )
+    if needs_token and not config.get_all_tokens():
         logger.error("GITHUB_TOKEN not set. Set it via environment variable or config file.")
         return 1
 
@@ -525,6 +765,14 @@ def main(argv: list[str] | None = None) -> int:
         return cmd_generate(args, config)
     elif args.command == "export":
         return cmd_export(args, config)
+    elif args.command == "query":
+        return cmd_query(args, config)
+    elif args.command == "serve":
+        return cmd_serve(args, config)
+    elif args.command == "webhook":
+        return cmd_webhook(args, config)
+    elif args.command == "watch":
+        return cmd_watch(args, config)
     elif args.command == "reanalyze":
         return cmd_reanalyze(args, config)
     else:
@@ -1,13 +1,35 @@
-"""Controllers for improveit-dashboard."""
+"""Controllers for improveit-dashboard.
 
-from improveit_dashboard.controllers.github_client import GitHubClient
-from improveit_dashboard.controllers.persistence import (
-    load_model,
-    save_model,
-)
+Exports are resolved on first access (PEP 562), so importing one
+controller module does not load the others and their dependencies
+(requests for the GitHub client, numpy for analytics).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from improveit_dashboard.controllers.github_client import GitHubClient
+    from improveit_dashboard.controllers.persistence import load_model, save_model
+
+# Exported name -> defining module
+_EXPORTS = {
+    "GitHubClient": "improveit_dashboard.controllers.github_client",
+    "load_model": "improveit_dashboard.controllers.persistence",
+    "save_model": "improveit_dashboard.controllers.persistence",
+}
 
 __all__ = [
     "GitHubClient",
     "load_model",
     "save_model",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
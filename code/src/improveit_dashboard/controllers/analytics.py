@@ -0,0 +1,438 @@
+"""Columnar analytics over the whole model.
+
+A ModelSnapshot holds one NumPy array per PR attribute (PRs in model
+order) with categorical fields encoded as indexes into fixed
+vocabularies. Grouped aggregations over all repositories then run as a
+handful of vectorized operations instead of Python loops over PR objects.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import BehaviorCategory, Repository
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+IntArray = npt.NDArray[np.int64]
+FloatArray = npt.NDArray[np.float64]
+
+# Vocabularies for categorical columns; a column stores the index of the value
+STATUSES = ("draft", "open", "merged", "closed")
+TOOLS = ("codespell", "shellcheck", "other")
+ADOPTION_LEVELS = ("full_automation", "config_only", "typo_fixes", "rejected")
+BEHAVIOR_CATEGORIES: tuple[BehaviorCategory, ...] = (
+    "welcoming",
+    "selective",
+    "unresponsive",
+    "hostile",
+    "insufficient_data",
+)
+
+DRAFT, OPEN, MERGED, CLOSED = range(len(STATUSES))
+WELCOMING, SELECTIVE, UNRESPONSIVE, HOSTILE, INSUFFICIENT_DATA = range(len(BEHAVIOR_CATEGORIES))
+
+
+def _timestamps(values: Iterable[datetime | None], count: int) -> FloatArray:
+    """Build a POSIX timestamp column with NaN for missing values."""
+    return np.fromiter(
+        (np.nan if v is None else v.timestamp() for v in values), dtype=np.float64, count=count
+    )
+
+
+# Row layout used while building a snapshot: one tuple per PR
+_ROW_DTYPE = np.dtype(
+    [
+        ("repo", np.int64),
+        ("author", np.int64),
+        ("status", np.int64),
+        ("tool", np.int64),
+        ("adoption", np.int64),
+        ("response_hours", np.float64),
+        ("comments", np.int64),
+    ]
+)
+
+
+@dataclass
+class ModelSnapshot:
+    """Columnar view of all PRs in the model.
+
+    Row ``i`` of every column describes ``prs[i]``. Missing response times
+    are NaN. Timestamp columns (POSIX seconds, NaN if missing) are only
+    built when first used, as converting datetimes is the costliest part
+    of building a snapshot.
+    """
+
+    repo_names: list[str]
+    authors: list[str]
+    prs: list[PullRequest]
+    repo: IntArray  # Index into repo_names
+    author: IntArray  # Index into authors
+    status: IntArray  # Index into STATUSES
+    tool: IntArray  # Index into TOOLS
+    adoption: IntArray  # Index into ADOPTION_LEVELS
+    response_hours: FloatArray
+    comments: IntArray
+
+    @property
+    def size(self) -> int:
+        """Number of PRs."""
+        return len(self.prs)
+
+    @cached_property
+    def created_at(self) -> FloatArray:
+        """PR creation times."""
+        return _timestamps((pr.created_at for pr in self.prs), self.size)
+
+    @cached_property
+    def updated_at(self) -> FloatArray:
+        """PR last update times."""
+        return _timestamps((pr.updated_at for pr in self.prs), self.size)
+
+    @cached_property
+    def merged_at(self) -> FloatArray:
+        """PR merge times (NaN for unmerged PRs)."""
+        return _timestamps((pr.merged_at for pr in self.prs), self.size)
+
+    @cached_property
+    def closed_at(self) -> FloatArray:
+        """PR close times (NaN for PRs that are still open)."""
+        return _timestamps((pr.closed_at for pr in self.prs), self.size)
+
+    @property
+    def merge_hours(self) -> FloatArray:
+        """Hours from creation to merge (NaN for unmerged PRs)."""
+        hours: FloatArray = (self.merged_at - self.created_at) / 3600
+        return hours
+
+    @classmethod
+    def from_repositories(cls, repositories: dict[str, Repository]) -> "ModelSnapshot":
+        """Build a snapshot of the model in a single pass over its PRs.
+
+        Args:
+            repositories: Dict mapping full_name to Repository
+
+        Returns:
+            ModelSnapshot with one row per PR
+        """
+        statuses = {value: i for i, value in enumerate(STATUSES)}
+        tools = {value: i for i, value in enumerate(TOOLS)}
+        adoption_levels = {value: i for i, value in enumerate(ADOPTION_LEVELS)}
+        authors: dict[str, int] = {}
+        nan = float("nan")
+
+        prs = [pr for repo in repositories.values() for pr in repo.prs.values()]
+        rows = np.fromiter(
+            (
+                (
+                    index,
+                    authors.setdefault(pr.author, len(authors)),
+                    statuses[pr.status],
+                    tools[pr.tool],
+                    adoption_levels[pr.adoption_level],
+                    nan
+                    if pr.time_to_first_response_hours is None
+                    else pr.time_to_first_response_hours,
+                    pr.total_comments,
+                )
+                for index, repo in enumerate(repositories.values())
+                for pr in repo.prs.values()
+            ),
+            dtype=_ROW_DTYPE,
+            count=len(prs),
+        )
+
+        return cls(
+            repo_names=list(repositories),
+            authors=list(authors),
+            prs=prs,
+            repo=rows["repo"],
+            author=rows["author"],
+            status=rows["status"],
+            tool=rows["tool"],
+            adoption=rows["adoption"],
+            response_hours=rows["response_hours"],
+            comments=rows["comments"],
+        )
+
+
+@dataclass
+class RepositoryMetrics:
+    """Aggregate metrics for every repository of a snapshot.
+
+    Arrays are indexed like ``ModelSnapshot.repo_names``; averages are NaN
+    where there is nothing to average.
+    """
+
+    repo_names: list[str]
+    total: IntArray
+    status_counts: IntArray  # Shape (repositories, len(STATUSES))
+    acceptance_rate: FloatArray  # Merged / all PRs
+    decided_acceptance_rate: FloatArray  # Merged / (merged + closed)
+    avg_response_hours: FloatArray
+    avg_engagement: FloatArray
+    behavior: IntArray  # Index into BEHAVIOR_CATEGORIES
+
+    def count(self, status: int) -> IntArray:
+        """Get per-repository PR counts for a status code."""
+        counts: IntArray = self.status_counts[:, status]
+        return counts
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ModelSnapshot) -> "RepositoryMetrics":
+        """Aggregate a snapshot per repository.
+
+        Args:
+            snapshot: Columnar model snapshot
+
+        Returns:
+            RepositoryMetrics for all repositories in the snapshot
+        """
+        n_repos = len(snapshot.repo_names)
+        total = np.bincount(snapshot.repo, minlength=n_repos).astype(np.int64)
+        status_counts = (
+            np.bincount(
+                snapshot.repo * len(STATUSES) + snapshot.status,
+                minlength=n_repos * len(STATUSES),
+            )
+            .reshape(n_repos, len(STATUSES))
+            .astype(np.int64)
+        )
+        merged = status_counts[:, MERGED]
+        decided = merged + status_counts[:, CLOSED]
+
+        acceptance_rate = _ratio(merged, total, default=0.0)
+        avg_response_hours = grouped_mean(snapshot.response_hours, snapshot.repo, n_repos)
+
+        return cls(
+            repo_names=snapshot.repo_names,
+            total=total,
+            status_counts=status_counts,
+            acceptance_rate=acceptance_rate,
+            decided_acceptance_rate=_ratio(merged, decided, default=np.nan),
+            avg_response_hours=avg_response_hours,
+            avg_engagement=_ratio(
+                np.bincount(snapshot.repo, weights=snapshot.comments, minlength=n_repos),
+                total,
+                default=0.0,
+            ),
+            behavior=categorize_behavior(total, acceptance_rate, avg_response_hours),
+        )
+
+
+def _ratio(numerator: npt.NDArray[np.generic], denominator: IntArray, default: float) -> FloatArray:
+    """Elementwise division with ``default`` where the denominator is zero."""
+    result = np.full(len(denominator), default, dtype=np.float64)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def grouped_mean(values: FloatArray, groups: IntArray, n_groups: int) -> FloatArray:
+    """Mean of non-NaN values per group (NaN for groups without values).
+
+    Args:
+        values: Values, NaN for missing
+        groups: Group index of each value
+        n_groups: Number of groups
+
+    Returns:
+        Array of means indexed by group
+    """
+    present = ~np.isnan(values)
+    sums = np.bincount(groups[present], weights=values[present], minlength=n_groups)
+    counts = np.bincount(groups[present], minlength=n_groups).astype(np.int64)
+    return _ratio(sums, counts, default=np.nan)
+
+
+def grouped_percentiles(
+    values: FloatArray, groups: IntArray, n_groups: int, percentiles: Sequence[float]
+) -> FloatArray:
+    """Percentiles of non-NaN values per group, computed for all groups at once.
+
+    Uses linear interpolation between closest ranks (NumPy's default
+    ``percentile`` method).
+
+    Args:
+        values: Values, NaN for missing
+        groups: Group index of each value
+        n_groups: Number of groups
+        percentiles: Percentiles in [0, 100]
+
+    Returns:
+        Array of shape (n_groups, len(percentiles)); NaN for empty groups
+    """
+    present = ~np.isnan(values)
+    values, groups = values[present], groups[present]
+    order = np.lexsort((values, groups))
+    values = values[order]
+
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    result = np.full((n_groups, len(percentiles)), np.nan)
+    nonempty = counts > 0
+    if not nonempty.any():
+        return result
+
+    # Fractional rank of each percentile within each non-empty group
+    rank = np.outer(counts[nonempty] - 1, np.asarray(percentiles, dtype=np.float64) / 100)
+    low = np.floor(rank).astype(np.int64)
+    high = np.ceil(rank).astype(np.int64)
+    base = starts[nonempty][:, None]
+    low_values = values[base + low]
+    result[nonempty] = low_values + (values[base + high] - low_values) * (rank - low)
+    return result
+
+
+def categorize_behavior(
+    total: IntArray, acceptance_rate: FloatArray, avg_response_hours: FloatArray
+) -> IntArray:
+    """Vectorized ``Repository._categorize_behavior``.
+
+    Args:
+        total: PR count per repository
+        acceptance_rate: Merged / all PRs per repository
+        avg_response_hours: Mean time to first response (NaN if none)
+
+    Returns:
+        Index into BEHAVIOR_CATEGORIES per repository
+    """
+    responded = ~np.isnan(avg_response_hours)
+    # NaN compares False, so "fast" is only true for repositories with responses
+    with np.errstate(invalid="ignore"):
+        fast = avg_response_hours < 72
+        very_fast = avg_response_hours < 24
+    categories: IntArray = np.select(
+        [
+            total < 2,
+            responded & fast & (acceptance_rate > 0.7),
+            acceptance_rate > 0.3,
+            (acceptance_rate == 0) & responded & very_fast,
+        ],
+        [INSUFFICIENT_DATA, WELCOMING, SELECTIVE, HOSTILE],
+        default=UNRESPONSIVE,
+    ).astype(np.int64)
+    return categories
+
+
+# Percentiles reported for time distributions
+PERCENTILES = (25, 50, 75, 90)
+
+# Time-to-merge histogram: upper bucket edges in hours, and bucket labels
+MERGE_TIME_EDGES_HOURS = (24.0, 24.0 * 7, 24.0 * 30, 24.0 * 90)
+MERGE_TIME_BUCKETS = ("< 1 day", "1-7 days", "7-30 days", "30-90 days", "> 90 days")
+
+
+def _round(value: float) -> float | None:
+    """Round a statistic for reporting (None for NaN)."""
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def _distributions(
+    values: FloatArray,
+    groups: IntArray,
+    labels: Sequence[str],
+    edges: Sequence[float] | None = None,
+    buckets: Sequence[str] = (),
+) -> dict[str, dict[str, Any]]:
+    """Summarize the non-NaN values of each group.
+
+    Args:
+        values: Values, NaN for missing
+        groups: Group index of each value
+        labels: Group labels, indexed by group
+        edges: Upper histogram bucket edges (no histogram if None)
+        buckets: Histogram bucket labels (one more than edges)
+
+    Returns:
+        Mapping of group label to count, mean, percentiles and histogram
+    """
+    n_groups = len(labels)
+    present = ~np.isnan(values)
+    counts = np.bincount(groups[present], minlength=n_groups)
+    means = grouped_mean(values, groups, n_groups)
+    percentiles = grouped_percentiles(values, groups, n_groups, PERCENTILES)
+    histogram = None
+    if edges is not None:
+        bucket = np.searchsorted(np.asarray(edges), values[present], side="right")
+        histogram = np.bincount(
+            groups[present] * len(buckets) + bucket, minlength=n_groups * len(buckets)
+        ).reshape(n_groups, len(buckets))
+
+    result: dict[str, dict[str, Any]] = {}
+    for g, label in enumerate(labels):
+        summary: dict[str, Any] = {"count": int(counts[g]), "mean": _round(means[g])}
+        summary.update((f"p{p}", _round(percentiles[g, i])) for i, p in enumerate(PERCENTILES))
+        if histogram is not None:
+            summary["histogram"] = dict(zip(buckets, map(int, histogram[g]), strict=True))
+        result[label] = summary
+    return result
+
+
+def compute_statistics(snapshot: ModelSnapshot, repo_categories: Sequence[str]) -> dict[str, Any]:
+    """Compute cross-repository statistics from a snapshot.
+
+    Args:
+        snapshot: Columnar model snapshot
+        repo_categories: Behavior category of each repository (overrides
+            applied), indexed like ``snapshot.repo_names``
+
+    Returns:
+        JSON-serializable statistics: time to first response per tool,
+        time to merge per tool and adoption level, and acceptance per
+        repository behavior category
+    """
+    everything = np.zeros(snapshot.size, dtype=np.int64)
+    response = snapshot.response_hours
+    merge = snapshot.merge_hours
+    merge_kwargs: dict[str, Any] = {
+        "edges": MERGE_TIME_EDGES_HOURS,
+        "buckets": MERGE_TIME_BUCKETS,
+    }
+
+    # Acceptance per category: count PRs by (category of their repository, status)
+    category_index: dict[str, int] = {c: i for i, c in enumerate(BEHAVIOR_CATEGORIES)}
+    repo_category = np.fromiter(
+        (category_index[c] for c in repo_categories), dtype=np.int64, count=len(repo_categories)
+    )
+    n_categories = len(BEHAVIOR_CATEGORIES)
+    pr_category = repo_category[snapshot.repo]
+    by_status = np.bincount(
+        pr_category * len(STATUSES) + snapshot.status, minlength=n_categories * len(STATUSES)
+    ).reshape(n_categories, len(STATUSES))
+    repos_per_category = np.bincount(repo_category, minlength=n_categories)
+    merged, closed = by_status[:, MERGED], by_status[:, CLOSED]
+    acceptance = _ratio(merged, (merged + closed).astype(np.int64), default=np.nan)
+
+    return {
+        "total_prs": snapshot.size,
+        "total_repositories": len(snapshot.repo_names),
+        "time_to_first_response_hours": {
+            "all": _distributions(response, everything, ["all"])["all"],
+            "by_tool": _distributions(response, snapshot.tool, TOOLS),
+        },
+        "time_to_merge_hours": {
+            "all": _distributions(merge, everything, ["all"], **merge_kwargs)["all"],
+            "by_tool": _distributions(merge, snapshot.tool, TOOLS, **merge_kwargs),
+            "by_adoption_level": _distributions(
+                merge, snapshot.adoption, ADOPTION_LEVELS, **merge_kwargs
+            ),
+        },
+        "acceptance_by_behavior": {
+            category: {
+                "repositories": int(repos_per_category[c]),
+                "prs": int(by_status[c].sum()),
+                "merged": int(merged[c]),
+                "closed": int(closed[c]),
+                "acceptance_rate": _round(acceptance[c]),
+            }
+            for c, category in enumerate(BEHAVIOR_CATEGORIES)
+        },
+    }
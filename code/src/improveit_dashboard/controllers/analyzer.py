@@ -3,13 +3,16 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from improveit_dashboard.models.comment import Comment
+from improveit_dashboard.models.comment import AuthorType, Comment
+from improveit_dashboard.models.engagement import EngagementState
 from improveit_dashboard.models.pull_request import (
     AdoptionLevel,
+    PRStatus,
     PullRequest,
     ResponseStatus,
 )
 from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.matching import BotMatcher
 
 logger = get_logger(__name__)
 
@@ -17,12 +20,14 @@ logger = get_logger(__name__)
 def classify_comments(
     comments_data: list[dict[str, Any]],
     pr_author: str,
+    matcher: BotMatcher | None = None,
 ) -> list[Comment]:
     """Parse and classify comments from GitHub API response.
 
     Args:
         comments_data: List of comment data from GitHub API
         pr_author: Username of the PR author
+        matcher: Bot detection rules (default: built-in patterns)
 
     Returns:
         List of Comment objects
@@ -30,7 +35,7 @@ def classify_comments(
     comments = []
     for data in comments_data:
         try:
-            comment = Comment.from_github_response(data, pr_author)
+            comment = Comment.from_github_response(data, pr_author, matcher)
             comments.append(comment)
         except Exception as e:
             logger.warning(f"Failed to parse comment {data.get('id')}: {e}")
@@ -40,7 +45,8 @@ def classify_comments(
 def analyze_engagement(
     comments: list[Comment],
     pr: PullRequest,
-) -> None:
+    state: EngagementState | None = None,
+) -> EngagementState:
     """Analyze PR engagement metrics from comments.
 
     Updates the PullRequest object in place with:
@@ -49,116 +55,118 @@ def analyze_engagement(
     - Response status
     - Last developer comment
 
+    Comments are folded into an EngagementState, which is stored on the PR
+    so later refreshes can pass it back together with only the comments
+    posted since. A full analysis folds all comments into an empty state.
+
     Args:
-        comments: List of Comment objects
+        comments: List of Comment objects (all comments, or only those newer
+            than the ones already in ``state``)
         pr: PullRequest to update
-    """
-    pr.total_comments = len(comments)
-    pr.submitter_comments = sum(1 for c in comments if c.author_type == "submitter")
-    pr.maintainer_comments = sum(1 for c in comments if c.author_type == "maintainer")
-    pr.bot_comments = sum(1 for c in comments if c.author_type == "bot")
+        state: Engagement state from a previous analysis, if incremental
 
-    # Reset fields that may have stale values from previous analysis
-    pr.time_to_first_response_hours = None
-    pr.last_comment_author = None
-    pr.last_comment_is_maintainer = False
-    pr.last_maintainer_comment_at = None
-    pr.last_developer_comment_body = None
-    pr.days_awaiting_submitter = None
+    Returns:
+        The updated engagement state
+    """
+    if state is None:
+        state = EngagementState()
+        # Reset fields that may have stale values from previous analysis
+        pr.last_developer_comment_body = None
 
-    # Sort comments by time
-    sorted_comments = sorted(comments, key=lambda c: c.created_at)
+    state.fold(comments)
+    pr.engagement = state
 
-    # Find first maintainer (non-bot, non-submitter) response
-    first_maintainer = None
-    for comment in sorted_comments:
-        if comment.author_type == "maintainer":
-            first_maintainer = comment
-            break
+    pr.total_comments = state.total_comments
+    pr.submitter_comments = state.submitter_comments
+    pr.maintainer_comments = state.maintainer_comments
+    pr.bot_comments = state.bot_comments
 
-    if first_maintainer:
+    pr.time_to_first_response_hours = None
+    if state.first_maintainer_comment_at:
         # Calculate time to first response in hours
-        delta = first_maintainer.created_at - pr.created_at
+        delta = state.first_maintainer_comment_at - pr.created_at
         pr.time_to_first_response_hours = delta.total_seconds() / 3600
 
-    # Find last comment and last maintainer comment
-    last_comment = None
-    last_maintainer_comment = None
-    last_developer_comment = (
-        None  # Non-submitter (can be bot for this field? No, spec says "developer")
-    )
-
-    for comment in reversed(sorted_comments):
-        if last_comment is None:
-            last_comment = comment
-
-        if last_maintainer_comment is None and comment.author_type == "maintainer":
-            last_maintainer_comment = comment
-
-        # Last developer = last non-submitter, non-bot
-        if last_developer_comment is None and comment.author_type == "maintainer":
-            last_developer_comment = comment
-
-        if last_comment and last_maintainer_comment and last_developer_comment:
-            break
-
     # Update PR with last comment info
-    if last_comment:
-        pr.last_comment_author = last_comment.author
-        pr.last_comment_is_maintainer = last_comment.author_type == "maintainer"
-
-    if last_maintainer_comment:
-        pr.last_maintainer_comment_at = last_maintainer_comment.created_at
+    pr.last_comment_author = state.last_comment_author
+    pr.last_comment_is_maintainer = state.last_comment_author_type == "maintainer"
+    pr.last_maintainer_comment_at = state.last_maintainer_comment_at
 
-    if last_developer_comment:
-        pr.last_developer_comment_body = last_developer_comment.body
+    # Last developer = last non-submitter, non-bot (the last maintainer comment)
+    for comment in comments:
+        if comment.id == state.last_maintainer_comment_id:
+            pr.last_developer_comment_body = comment.body
 
     # Determine response status
-    pr.response_status = _determine_response_status(pr, last_comment, last_maintainer_comment)
+    pr.response_status = _determine_response_status(
+        pr, state.last_comment_author_type, state.last_maintainer_comment_at is not None
+    )
 
     # Calculate days awaiting submitter
-    if pr.response_status == "awaiting_submitter" and last_maintainer_comment:
+    pr.days_awaiting_submitter = None
+    if pr.response_status == "awaiting_submitter" and state.last_maintainer_comment_at:
         now = datetime.utcnow()
-        if last_maintainer_comment.created_at.tzinfo:
+        if state.last_maintainer_comment_at.tzinfo:
             # Make now timezone-aware
             now = datetime.now(UTC)
-        delta = now - last_maintainer_comment.created_at
+        delta = now - state.last_maintainer_comment_at
         pr.days_awaiting_submitter = delta.days
 
+    return state
+
+
+def apply_status_change(pr: PullRequest, new_status: PRStatus) -> None:
+    """Update a PR for a status change without refetching comments or files.
+
+    Recomputes the metrics that depend on status alone (adoption level and
+    response status), using the comment and file analysis already stored.
+
+    Args:
+        pr: PullRequest to update in place
+        new_status: New PR status
+    """
+    pr.status = new_status
+    pr.adoption_level = determine_adoption_level(pr.automation_types, new_status)
+    if new_status in ("merged", "closed"):
+        # Same outcome as _determine_response_status for closed/merged PRs
+        pr.response_status = (
+            "awaiting_submitter" if pr.last_maintainer_comment_at else "no_response"
+        )
+
 
 def _determine_response_status(
     pr: PullRequest,
-    last_comment: Comment | None,
-    last_maintainer_comment: Comment | None,
+    last_comment_type: AuthorType | None,
+    has_maintainer_comment: bool,
 ) -> ResponseStatus:
     """Determine response status based on comments and PR state.
 
     Args:
         pr: PullRequest being analyzed
-        last_comment: Most recent comment
-        last_maintainer_comment: Most recent maintainer comment
+        last_comment_type: Author type of the most recent comment
+        has_maintainer_comment: Whether any maintainer has commented
 
     Returns:
         Response status
     """
     # Closed/merged PRs don't need response tracking
     if pr.status in ("merged", "closed"):
-        if last_maintainer_comment:
+        if has_maintainer_comment:
             return "awaiting_submitter"  # Historical - maintainer had last word
         return "no_response"
 
     # No comments at all
-    if not last_comment:
+    if last_comment_type is None:
         return "no_response"
 
     # No maintainer comments (only bots or submitter)
-    if not last_maintainer_comment:
+    if not has_maintainer_comment:
         return "awaiting_maintainer"
 
     # Check if last non-bot comment is from maintainer
-    if last_comment.author_type == "maintainer":
+    if last_comment_type == "maintainer":
         return "awaiting_submitter"
-    elif last_comment.author_type == "submitter":
+    elif last_comment_type == "submitter":
         return "awaiting_maintainer"
     else:
         # Last comment is bot - look at last human
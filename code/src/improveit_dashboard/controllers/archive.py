@@ -0,0 +1,153 @@
+"""Compressed, content-addressed archive of raw GitHub API payloads.
+
+Discovery stores the raw comments, files and check-run payloads of every PR
+it fetches, so derived fields (bot classification, automation detection, CI
+status) can be recomputed offline after the analysis rules change.
+
+Layout next to the model file::
+
+    data/archive/index.json              # "owner/repo#123" -> {kind: digest}
+    data/archive/objects/ab/cdef....json.gz
+
+Objects are gzipped canonical JSON named by the SHA-256 of their content,
+so identical payloads are stored once and unchanged files stay unchanged in
+git.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Literal
+
+from improveit_dashboard.controllers.persistence import write_json_atomic
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PayloadKind = Literal["comments", "files", "checks"]
+
+
+def archive_path(data_file: Path) -> Path:
+    """Get the archive directory for a model file (``data/archive``)."""
+    return data_file.parent / "archive"
+
+
+def load_object(path: Path) -> Any:
+    """Read an archived payload object."""
+    with gzip.open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+class PayloadArchive:
+    """Content-addressed store of raw per-PR API payloads."""
+
+    def __init__(self, root: Path):
+        """Initialize archive.
+
+        Args:
+            root: Archive directory (created on first write)
+        """
+        self.root = root
+        self.index_path = root / "index.json"
+        self._index: dict[str, dict[str, str]] | None = None
+        self._dirty = False
+
+    @property
+    def index(self) -> dict[str, dict[str, str]]:
+        """Mapping of PR key -> payload kind -> object digest (loaded lazily)."""
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, encoding="utf-8") as f:
+                        self._index = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to load archive index {self.index_path}: {e}")
+        return self._index
+
+    def put(self, repo_name: str, pr_number: int, kind: PayloadKind, payload: Any) -> str:
+        """Store a payload for a PR.
+
+        Args:
+            repo_name: Repository full name
+            pr_number: PR number
+            kind: Payload kind
+            payload: JSON-serializable payload
+
+        Returns:
+            Digest of the stored object
+        """
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            # mtime=0 keeps the compressed bytes deterministic
+            with open(temp_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(data)
+            os.replace(temp_path, path)
+
+        entry = self.index.setdefault(work_key(repo_name, pr_number), {})
+        if entry.get(kind) != digest:
+            entry[kind] = digest
+            self._dirty = True
+        return digest
+
+    def get(self, repo_name: str, pr_number: int, kind: PayloadKind) -> Any | None:
+        """Load a payload for a PR.
+
+        Args:
+            repo_name: Repository full name
+            pr_number: PR number
+            kind: Payload kind
+
+        Returns:
+            The payload, or None if not archived
+        """
+        path = self.object_path(repo_name, pr_number, kind)
+        if path is None:
+            return None
+        try:
+            return load_object(path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read archived {kind} for {repo_name}#{pr_number}: {e}")
+            return None
+
+    def object_path(self, repo_name: str, pr_number: int, kind: PayloadKind) -> Path | None:
+        """Get the object file holding a PR's payload, or None if not archived."""
+        digest = self.index.get(work_key(repo_name, pr_number), {}).get(kind)
+        return self._object_path(digest) if digest else None
+
+    def merge_comments(
+        self, repo_name: str, pr_number: int, new_comments: list[dict[str, Any]]
+    ) -> None:
+        """Merge incrementally fetched comments into the archived thread.
+
+        Only done when the full thread is already archived; otherwise the
+        archive would hold an incomplete thread.
+
+        Args:
+            repo_name: Repository full name
+            pr_number: PR number
+            new_comments: Comments returned for a ``since`` query
+        """
+        archived = self.get(repo_name, pr_number, "comments")
+        if archived is None:
+            return
+        by_id = {comment["id"]: comment for comment in archived}
+        by_id.update((comment["id"], comment) for comment in new_comments)
+        self.put(repo_name, pr_number, "comments", sorted(by_id.values(), key=lambda c: c["id"]))
+
+    def flush(self) -> None:
+        """Write the index if it changed."""
+        if self._dirty and self._index is not None:
+            write_json_atomic(self.index_path, self._index)
+            self._dirty = False
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest[2:]}.json.gz"
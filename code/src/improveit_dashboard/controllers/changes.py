@@ -0,0 +1,142 @@
+"""Per-run JSONL feed of PR changes found by discovery.
+
+Each discovery run appends events to its own file next to the model file::
+
+    data/changes/20250115T100000Z.jsonl   # Named after the run's start time
+
+One JSON object per line, written as soon as a PR is processed, so
+consumers can tail the file while the run is in progress::
+
+    {"type": "new_pr", "pr": "owner/repo#12", "at": "...", "status": "open", ...}
+    {"type": "status", "pr": "owner/repo#12", "at": "...", "old": "open", "new": "merged"}
+    {"type": "maintainer_comment", "pr": "owner/repo#12", "at": "...", "count": 1}
+    {"type": "ci", "pr": "owner/repo#12", "at": "...", "field": "ci_status",
+     "old": "success", "new": "failure"}
+
+A resumed run appends to the same file; PRs redone after an interruption
+may repeat their events, so consumers should treat the feed as
+at-least-once.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ChangeType = Literal["new_pr", "status", "maintainer_comment", "ci"]
+
+# CI fields whose flips are reported
+CI_FIELDS = ("ci_status", "codespell_workflow_ci", "main_branch_ci")
+
+
+def changes_path(data_file: Path) -> Path:
+    """Get the change feed directory for a model file (``data/changes``)."""
+    return data_file.parent / "changes"
+
+
+def feed_file(root: Path, started_at: datetime) -> Path:
+    """Get the feed file of a run."""
+    return root / f"{started_at.strftime('%Y%m%dT%H%M%SZ')}.jsonl"
+
+
+def diff_pr(before: PullRequest | None, after: PullRequest) -> list[dict[str, Any]]:
+    """Describe how a PR changed as change feed events.
+
+    Args:
+        before: PR as previously stored (None if new)
+        after: PR after processing
+
+    Returns:
+        Events, in the order new PR, status, maintainer comments, CI
+    """
+    key = work_key(after.repository, after.number)
+    at = after.updated_at.isoformat()
+    events: list[dict[str, Any]] = []
+
+    if before is None:
+        events.append(
+            {
+                "type": "new_pr",
+                "pr": key,
+                "at": after.created_at.isoformat(),
+                "status": after.status,
+                "tool": after.tool,
+                "author": after.author,
+                "title": after.title,
+                "url": after.url,
+            }
+        )
+    elif before.status != after.status:
+        events.append(
+            {"type": "status", "pr": key, "at": at, "old": before.status, "new": after.status}
+        )
+
+    new_comments = after.maintainer_comments - (before.maintainer_comments if before else 0)
+    if new_comments > 0:
+        comment_at = after.last_maintainer_comment_at
+        events.append(
+            {
+                "type": "maintainer_comment",
+                "pr": key,
+                "at": comment_at.isoformat() if comment_at else at,
+                "count": new_comments,
+            }
+        )
+
+    if before is not None:
+        for name in CI_FIELDS:
+            old, new = getattr(before, name), getattr(after, name)
+            if old != new and new is not None:
+                events.append(
+                    {"type": "ci", "pr": key, "at": at, "field": name, "old": old, "new": new}
+                )
+
+    return events
+
+
+class ChangeFeed:
+    """Appends a run's change events to its JSONL file."""
+
+    def __init__(self, path: Path):
+        """Initialize feed.
+
+        Args:
+            path: Feed file (see feed_file); created on the first event
+        """
+        self.path = path
+        self.events = 0
+        self._file: IO[str] | None = None
+
+    def record(self, before: PullRequest | None, after: PullRequest) -> list[dict[str, Any]]:
+        """Append the events describing a processed PR.
+
+        Args:
+            before: PR as previously stored (None if new)
+            after: PR after processing
+
+        Returns:
+            The appended events
+        """
+        events = diff_pr(before, after)
+        if events:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            for event in events:
+                self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+            # Flush per PR so tailing consumers see complete lines promptly
+            self._file.flush()
+            self.events += len(events)
+        return events
+
+    def close(self) -> None:
+        """Close the feed file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,24 +1,68 @@
 """PR discovery orchestration."""
 
-from datetime import UTC, datetime
-from typing import Any, cast
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import Any, Literal, TypeVar, cast
 
 from improveit_dashboard.controllers.analyzer import (
     analyze_engagement,
+    apply_status_change,
     classify_comments,
     detect_automation_types,
     determine_adoption_level,
 )
+from improveit_dashboard.controllers.archive import PayloadArchive, archive_path
+from improveit_dashboard.controllers.changes import ChangeFeed, changes_path, feed_file
 from improveit_dashboard.controllers.github_client import GitHubClient
-from improveit_dashboard.controllers.persistence import load_model, save_model
+from improveit_dashboard.controllers.history import HistoryStore, history_path
+from improveit_dashboard.controllers.persistence import (
+    checkpoint_path,
+    clear_checkpoint,
+    load_checkpoint,
+    load_model,
+    mark_dirty,
+    save_checkpoint,
+    save_model,
+)
+from improveit_dashboard.controllers.planner import (
+    Candidate,
+    Change,
+    RefreshPlan,
+    plan_refresh,
+    seconds_per_call,
+)
+from improveit_dashboard.models.checkpoint import DiscoveryCheckpoint, WorkItem, work_key
 from improveit_dashboard.models.config import Configuration
 from improveit_dashboard.models.discovery_run import DiscoveryRun
 from improveit_dashboard.models.pull_request import PRStatus, PullRequest, ToolType
 from improveit_dashboard.models.repository import Repository
 from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.matching import BotMatcher
+from improveit_dashboard.utils.rate_limit import RateLimitError
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Result of processing one PR
+ProcessOutcome = Literal["new", "updated", "unchanged"]
+
+# CI statuses that no longer change without a new commit
+FINAL_CI_STATUSES = ("success", "failure")
+
+
+@dataclass
+class DiscoveryResult:
+    """Outcome of a discovery run, with the model it left in memory."""
+
+    run: DiscoveryRun
+    repositories: dict[str, Repository]
+    # Keys ("owner/repo#N") of PRs fetched or updated; views of other PRs are unaffected
+    changed: set[str]
+
 
 def determine_pr_status(pr_data: dict[str, Any]) -> PRStatus:
     """Determine PR status from GitHub API response.
@@ -46,150 +90,534 @@ def parse_datetime(dt_str: str | None) -> datetime | None:
     return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
 
 
+def build_pr(
+    config: Configuration,
+    repo_name: str,
+    pr_number: int,
+    pr_data: dict[str, Any],
+    now: datetime,
+) -> PullRequest:
+    """Build a PR from a pull request payload (REST API or webhook).
+
+    Only the fields the payload describes are set; comment, file and CI
+    analysis are left to the caller.
+
+    Args:
+        config: Configuration (tool keywords)
+        repo_name: Repository full name
+        pr_number: PR number
+        pr_data: Pull request object
+        now: Fallback for missing timestamps
+
+    Returns:
+        New PullRequest
+    """
+    title = pr_data.get("title", "")
+    status = determine_pr_status(pr_data)
+
+    # Who merged the PR; for closed PRs the closer is not in the payload
+    closed_by = None
+    if status == "merged" and (merged_by := pr_data.get("merged_by")):
+        closed_by = merged_by.get("login")
+
+    return PullRequest(
+        number=pr_number,
+        repository=repo_name,
+        platform="github",
+        url=pr_data.get("html_url", f"https://github.com/{repo_name}/pull/{pr_number}"),
+        tool=cast(ToolType, config.get_tool_for_title(title)),
+        title=title,
+        author=pr_data.get("user", {}).get("login", "unknown"),
+        created_at=parse_datetime(pr_data.get("created_at")) or now,
+        updated_at=parse_datetime(pr_data.get("updated_at")) or now,
+        merged_at=parse_datetime(pr_data.get("merged_at")),
+        closed_at=parse_datetime(pr_data.get("closed_at")),
+        status=status,
+        commit_count=pr_data.get("commits", 1),
+        files_changed=pr_data.get("changed_files", 1),
+        closed_by=closed_by,
+        head_sha=(pr_data.get("head") or {}).get("sha"),
+    )
+
+
 def run_discovery(
     config: Configuration,
     incremental: bool = True,
+    resume: bool = False,
 ) -> DiscoveryRun:
     """Run the PR discovery process.
 
+    See ``discover``, which also returns the updated model.
+
     Args:
         config: Configuration object
         incremental: If True, only fetch PRs updated since last run
+        resume: Continue the run recorded in the checkpoint, if any
 
     Returns:
         DiscoveryRun with execution metadata
     """
-    run = DiscoveryRun(
-        started_at=datetime.now(UTC),
-        mode="force" if config.force_mode else "normal",
-    )
+    return discover(config, incremental=incremental, resume=resume).run
+
+
+def discover(
+    config: Configuration,
+    incremental: bool = True,
+    resume: bool = False,
+) -> DiscoveryResult:
+    """Run the PR discovery process.
+
+    Progress (the planned work queue, completed PRs and partial counters) is
+    checkpointed beside the model file at every periodic save, so a crashed or
+    interrupted run can be continued with ``resume=True``.
+
+    Args:
+        config: Configuration object
+        incremental: If True, only fetch PRs updated since last run
+        resume: Continue the run recorded in the checkpoint, if any, instead
+            of searching again
 
+    Returns:
+        DiscoveryResult with execution metadata, the updated model and the
+        PRs that changed (on resume, including those done before the
+        interruption)
+    """
     # Initialize client
-    client = GitHubClient(
-        token=config.github_token,
-        rate_limit_threshold=config.rate_limit_threshold,
-    )
+    client = GitHubClient.from_config(config)
 
     # Load existing model
-    repositories, last_run = load_model(config.data_file)
+    repositories, last_run = load_model(config.data_file, cache=config.model_cache)
+
+    ckpt_path = checkpoint_path(config.data_file)
+    checkpoint = load_checkpoint(ckpt_path) if resume else None
+    if resume and checkpoint is None:
+        logger.warning(f"No checkpoint at {ckpt_path}, starting a new run")
+
+    changed: set[str] = set()
+    if checkpoint is not None:
+        run = checkpoint.run
+        logger.info(
+            f"Resuming run started at {run.started_at}: "
+            f"{len(checkpoint.completed)} of {len(checkpoint.queue)} PRs already done"
+        )
+        # Views were not regenerated for PRs done before the interruption
+        changed.update(checkpoint.completed)
+    else:
+        run = DiscoveryRun(
+            started_at=datetime.now(UTC),
+            mode="force" if config.force_mode else "normal",
+        )
 
-    # Determine update cutoff
-    updated_since = None
-    if incremental and last_run and last_run.started_at:
-        updated_since = last_run.started_at
-        logger.info(f"Incremental mode: fetching PRs updated since {updated_since}")
+        cutoffs = _search_cutoffs(config, repositories, last_run, incremental)
+        previous_marks = last_run.user_high_water_marks if last_run else {}
+        run.user_high_water_marks = {
+            user: mark
+            for user in config.tracked_users
+            if (mark := cutoffs[user] or previous_marks.get(user)) is not None
+        }
+
+        found, candidate_marks = _search_prs(client, config, run, cutoffs)
+        logger.info(f"Found {len(found)} PRs to process")
+        plan = _plan(client, config, found, repositories, run, last_run)
+        logger.info(plan.summary())
+        prs_to_process = plan.items
+        # Deferred PRs are found again next run, as their authors' marks stay put
+        deferred_authors = plan.deferred_authors()
+        candidate_marks = {
+            user: mark
+            for user, mark in candidate_marks.items()
+            if user.lower() not in deferred_authors
+        }
+
+        # Persist the plan right away so a resume never has to search again
+        checkpoint = DiscoveryCheckpoint(
+            run=run,
+            queue=prs_to_process,
+            incremental=incremental,
+            candidate_marks=candidate_marks,
+        )
+        save_checkpoint(ckpt_path, checkpoint)
 
-    # Get all keywords for filtering
-    all_keywords = config.get_all_keywords()
+    archive = PayloadArchive(archive_path(config.data_file)) if config.archive_payloads else None
+    feed = (
+        ChangeFeed(feed_file(changes_path(config.data_file), run.started_at))
+        if config.change_feed
+        else None
+    )
 
-    # Track PRs to process
-    prs_to_process: list[tuple[str, int, dict[str, Any]]] = []  # (repo, pr_num, search_data)
+    def save_progress() -> None:
+        # meta.last_run keeps pointing at the last *completed* run until we finish
+        save_model(config.data_file, repositories, last_run)
+        mark_dirty(config.data_file, changed)
+        save_checkpoint(ckpt_path, checkpoint)
+        if archive is not None:
+            archive.flush()
 
-    # Search for PRs from each tracked user
-    for username in config.tracked_users:
-        try:
-            results = client.search_user_prs(
-                username=username,
-                updated_since=updated_since,
-                keywords=all_keywords,
-            )
-            for item in results:
-                # Extract repo from repository_url
-                repo_url = item.get("repository_url", "")
-                # Format: https://api.github.com/repos/owner/repo
-                parts = repo_url.rstrip("/").split("/")
-                if len(parts) >= 2:
-                    repo_full_name = f"{parts[-2]}/{parts[-1]}"
-                    pr_number = item.get("number", 0)
-                    prs_to_process.append((repo_full_name, pr_number, item))
+    # Process PRs
+    processed = 0
+    interrupted = False
+    try:
+        for repo_name, pr_number, search_data in checkpoint.pending():
+            # Check max PRs limit
+            if config.max_prs_per_run and processed >= config.max_prs_per_run:
+                logger.info(f"Reached max PRs limit ({config.max_prs_per_run})")
+                break
+
+            # Skip merged PRs in normal mode
+            repo = repositories.get(repo_name)
+            existing_pr = repo.prs.get(pr_number) if repo else None
+            if existing_pr and existing_pr.status == "merged" and not config.force_mode:
+                logger.debug(f"Skipping merged PR: {repo_name}#{pr_number}")
+                checkpoint.mark_completed(repo_name, pr_number)
+                continue
+
+            outcome: ProcessOutcome | None = None
+            try:
+                # Process this PR
+                outcome = _with_rate_limit_wait(
+                    client,
+                    partial(
+                        _process_pr,
+                        client=client,
+                        config=config,
+                        repositories=repositories,
+                        repo_name=repo_name,
+                        pr_number=pr_number,
+                        search_data=search_data,
+                        run=run,
+                        archive=archive,
+                        feed=feed,
+                    ),
+                )
+
+                if outcome == "unchanged":
+                    # Up to date according to the search payload - no API calls spent
+                    run.unchanged_prs += 1
+                else:
+                    processed += 1
+                    run.total_processed += 1
+                    changed.add(work_key(repo_name, pr_number))
+
+                    if outcome == "new":
+                        run.new_prs += 1
+                    else:
+                        run.updated_prs += 1
+
+            except RateLimitError as e:
+                # Reset is too far away to wait for - keep the rest for --resume
+                error_msg = f"Stopping after {processed} PRs: {e} (continue with --resume)"
+                logger.error(error_msg)
+                run.errors.append(error_msg)
+                interrupted = True
+                break
+
+            except Exception as e:
+                error_msg = f"Failed to process {repo_name}#{pr_number}: {e}"
+                logger.error(error_msg)
+                run.errors.append(error_msg)
+
+            checkpoint.mark_completed(repo_name, pr_number)
+
+            # Periodic save
+            if outcome in ("new", "updated") and processed % config.batch_size == 0:
+                logger.info(f"Periodic save after {processed} PRs")
+                save_progress()
+
+    except BaseException:
+        # Crash or Ctrl-C: keep everything done so far resumable
+        logger.error("Discovery interrupted, saving checkpoint (continue with --resume)")
+        save_progress()
+        raise
+    finally:
+        if feed is not None:
+            feed.close()
+
+    run.api_calls_made += client.api_calls
+    run.api_retries += client.retry_policy.retries_used
+    run.rate_limit_remaining = client.token_pool.total_remaining()
+
+    if failures := client.retry_policy.get_stats():
+        logger.info(f"Transient API failures by endpoint: {failures}")
+
+    if interrupted:
+        save_progress()
+        return DiscoveryResult(run, repositories, changed)
+
+    _advance_high_water_marks(run, checkpoint)
 
-        except Exception as e:
-            error_msg = f"Failed to search PRs for {username}: {e}"
-            logger.error(error_msg)
-            run.errors.append(error_msg)
+    # Final save
+    run.completed_at = datetime.now(UTC)
+    save_model(config.data_file, repositories, run)
+    mark_dirty(config.data_file, changed)
+    clear_checkpoint(ckpt_path)
+    if archive is not None:
+        archive.flush()
+    if config.record_history:
+        HistoryStore(history_path(config.data_file)).record(repositories, run.completed_at)
+    if feed is not None and feed.events:
+        logger.info(f"Wrote {feed.events} change events to {feed.path}")
 
-    logger.info(f"Found {len(prs_to_process)} PRs to process")
+    logger.info(
+        f"Discovery complete: {run.new_prs} new PRs, "
+        f"{run.updated_prs} updated, {run.newly_merged_prs} merged, "
+        f"{run.unchanged_prs} unchanged"
+    )
 
-    # Sort PRs by processing priority:
-    # 1. New PRs (not in model)
-    # 2. Unmerged PRs by freshness (most recent first)
-    # 3. Merged PRs (skip in normal mode)
-    def get_priority(item: tuple[str, int, dict[str, Any]]) -> tuple[int, int]:
-        repo_name, pr_num, data = item
-        repo = repositories.get(repo_name)
-        existing_pr = repo.prs.get(pr_num) if repo else None
+    return DiscoveryResult(run, repositories, changed)
 
-        # New PRs get highest priority (0)
-        if existing_pr is None:
-            return (0, 0)
 
-        # Merged PRs get lowest priority (2)
-        if existing_pr.status == "merged":
-            return (2, -existing_pr.freshness_score)
+def process_pr(
+    client: GitHubClient,
+    config: Configuration,
+    repositories: dict[str, Repository],
+    repo_name: str,
+    pr_number: int,
+    run: DiscoveryRun,
+    search_data: dict[str, Any] | None = None,
+    archive: PayloadArchive | None = None,
+    feed: ChangeFeed | None = None,
+) -> ProcessOutcome:
+    """Fetch one PR into the model, waiting for the rate limit reset if needed.
 
-        # Unmerged PRs sorted by freshness (1)
-        return (1, -existing_pr.freshness_score)
+    Without a search payload, a known PR is re-checked with a conditional
+    request for its details: if GitHub answers 304 Not Modified (which does
+    not count against the rate limit) only the CI status of an active PR
+    whose CI had not finished is refetched, and nothing at all otherwise.
 
-    prs_to_process.sort(key=get_priority)
+    Args:
+        client: GitHub client
+        config: Configuration
+        repositories: Repositories dict to update
+        repo_name: Repository full name
+        pr_number: PR number
+        run: Discovery run to update
+        search_data: Search result item for the PR, if it came from a search
+        archive: Archive to store raw comments, files and checks in
+        feed: Change feed to report new PRs and changes to
 
-    # Process PRs
-    processed = 0
-    for repo_name, pr_number, search_data in prs_to_process:
-        # Check max PRs limit
-        if config.max_prs_per_run and processed >= config.max_prs_per_run:
-            logger.info(f"Reached max PRs limit ({config.max_prs_per_run})")
-            break
+    Returns:
+        "new", "updated" or "unchanged"
+    """
+    return _with_rate_limit_wait(
+        client,
+        partial(
+            _process_pr,
+            client=client,
+            config=config,
+            repositories=repositories,
+            repo_name=repo_name,
+            pr_number=pr_number,
+            search_data=search_data or {},
+            run=run,
+            archive=archive,
+            feed=feed,
+        ),
+    )
 
-        # Skip merged PRs in normal mode
-        repo = repositories.get(repo_name)
-        existing_pr = repo.prs.get(pr_number) if repo else None
-        if existing_pr and existing_pr.status == "merged" and not config.force_mode:
-            logger.debug(f"Skipping merged PR: {repo_name}#{pr_number}")
-            continue
 
-        try:
-            # Process this PR
-            was_new = _process_pr(
-                client=client,
-                config=config,
-                repositories=repositories,
-                repo_name=repo_name,
-                pr_number=pr_number,
-                search_data=search_data,
-                run=run,
-            )
+def search_updates(
+    client: GitHubClient,
+    config: Configuration,
+    repositories: dict[str, Repository],
+    run: DiscoveryRun,
+) -> list[WorkItem]:
+    """Search tracked users' PRs updated since their high-water marks.
 
-            processed += 1
-            run.total_processed += 1
+    The high-water marks in ``run`` are advanced to the search results right
+    away, so the caller must process (or retry) every returned item.
 
-            if was_new:
-                run.new_prs += 1
-            else:
-                run.updated_prs += 1
+    Args:
+        client: GitHub client
+        config: Configuration
+        repositories: Current model
+        run: Run holding the high-water marks, and recording errors
+
+    Returns:
+        Work items (repo full name, PR number, search item)
+    """
+    cutoffs = _search_cutoffs(config, repositories, run, incremental=True)
+    items, candidate_marks = _search_prs(client, config, run, cutoffs)
+    run.user_high_water_marks.update(candidate_marks)
+    return items
+
+
+def _search_cutoffs(
+    config: Configuration,
+    repositories: dict[str, Repository],
+    last_run: DiscoveryRun | None,
+    incremental: bool,
+) -> dict[str, datetime | None]:
+    """Determine the search cutoff for each tracked user.
+
+    Users with a high-water mark resume from it. Users without one (newly
+    tracked) get a full backfill. Models written before high-water marks
+    existed fall back to the last run's start time for users that already
+    have PRs in the model.
+
+    Args:
+        config: Configuration
+        repositories: Current model
+        last_run: Last completed discovery run, if any
+        incremental: If False, every user gets a full search
+
+    Returns:
+        Dict of username -> cutoff (None for a full search)
+    """
+    if not incremental or last_run is None:
+        return dict.fromkeys(config.tracked_users)
+
+    marks = last_run.user_high_water_marks
+    legacy_cutoff = None if marks else last_run.started_at
+    known_authors = (
+        {pr.author.lower() for repo in repositories.values() for pr in repo.prs.values()}
+        if legacy_cutoff
+        else set()
+    )
+
+    cutoffs: dict[str, datetime | None] = {}
+    for username in config.tracked_users:
+        if username in marks:
+            cutoffs[username] = marks[username]
+        elif legacy_cutoff and username.lower() in known_authors:
+            cutoffs[username] = legacy_cutoff
+        else:
+            logger.info(f"No high-water mark for {username}: running a full backfill")
+            cutoffs[username] = None
+    return cutoffs
+
+
+def _search_prs(
+    client: GitHubClient,
+    config: Configuration,
+    run: DiscoveryRun,
+    cutoffs: dict[str, datetime | None],
+) -> tuple[list[WorkItem], dict[str, datetime]]:
+    """Search tracked users' PRs and build the work queue.
 
+    Args:
+        client: GitHub client
+        config: Configuration
+        run: Discovery run to record errors in
+        cutoffs: Per-user "updated since" cutoff (None for a full search)
+
+    Returns:
+        Tuple of (work queue, candidate high-water marks). The queue holds
+        (repo full name, PR number, search item) tuples; a user's candidate
+        mark is the latest ``updated_at`` among their results and only
+        becomes their high-water mark once all their PRs are processed.
+    """
+    # Compiled once from all tool keywords for filtering
+    title_matcher = config.get_title_matcher()
+
+    prs_to_process: list[WorkItem] = []
+    candidate_marks: dict[str, datetime] = {}
+
+    # Search for PRs from each tracked user
+    for username in config.tracked_users:
+        updated_since = cutoffs.get(username)
+        try:
+            results = _with_rate_limit_wait(
+                client,
+                partial(
+                    client.search_user_prs,
+                    username=username,
+                    updated_since=updated_since,
+                    title_matcher=title_matcher,
+                ),
+            )
         except Exception as e:
-            error_msg = f"Failed to process {repo_name}#{pr_number}: {e}"
+            error_msg = f"Failed to search PRs for {username}: {e}"
             logger.error(error_msg)
             run.errors.append(error_msg)
+            continue
 
-        # Periodic save
-        if processed > 0 and processed % config.batch_size == 0:
-            logger.info(f"Periodic save after {processed} PRs")
-            save_model(config.data_file, repositories, run)
+        latest: datetime | None = None
+        for item in results:
+            # Extract repo from repository_url
+            repo_url = item.get("repository_url", "")
+            # Format: https://api.github.com/repos/owner/repo
+            parts = repo_url.rstrip("/").split("/")
+            if len(parts) >= 2:
+                repo_full_name = f"{parts[-2]}/{parts[-1]}"
+                pr_number = item.get("number", 0)
+                prs_to_process.append((repo_full_name, pr_number, item))
 
-    # Final save
-    run.completed_at = datetime.now(UTC)
-    run.api_calls_made = client.api_calls
-    run.rate_limit_remaining = client.rate_limit.remaining
+            updated_at = parse_datetime(item.get("updated_at"))
+            if updated_at and (latest is None or updated_at > latest):
+                latest = updated_at
 
-    save_model(config.data_file, repositories, run)
+        # Without results the search still covered everything up to now
+        candidate_marks[username] = latest or updated_since or run.started_at
 
-    logger.info(
-        f"Discovery complete: {run.new_prs} new PRs, "
-        f"{run.updated_prs} updated, {run.newly_merged_prs} merged"
+    return prs_to_process, candidate_marks
+
+
+def _advance_high_water_marks(run: DiscoveryRun, checkpoint: DiscoveryCheckpoint) -> None:
+    """Move users' high-water marks forward if all their PRs were processed.
+
+    Users with PRs left in the queue (e.g. due to ``max_prs_per_run``) keep
+    their previous mark so the remaining PRs are found again next run.
+    """
+    pending_authors = {
+        item.get("user", {}).get("login", "").lower() for _, _, item in checkpoint.pending()
+    }
+    for username, mark in checkpoint.candidate_marks.items():
+        if username.lower() in pending_authors:
+            logger.info(f"Not advancing high-water mark for {username}: PRs left unprocessed")
+            continue
+        run.user_high_water_marks[username] = mark
+
+
+def _plan(
+    client: GitHubClient,
+    config: Configuration,
+    prs_to_process: list[WorkItem],
+    repositories: dict[str, Repository],
+    run: DiscoveryRun,
+    last_run: DiscoveryRun | None,
+) -> RefreshPlan:
+    """Choose the PRs to refresh within the rate limit headroom (see controllers.planner)."""
+    candidates = []
+    for item in prs_to_process:
+        repo_name, pr_number, search_data = item
+        repo = repositories.get(repo_name)
+        pr = repo.prs.get(pr_number) if repo else None
+        change: Change = "full"
+        if pr is not None and not config.force_mode:
+            change = (
+                "skip"
+                if pr.status == "merged"
+                else cast(Change, _search_change(pr, search_data, config.closed_revalidate_days))
+            )
+        candidates.append(Candidate(item, pr, change))
+
+    # Refreshes only cost core calls (the search has its own limit); keep the
+    # threshold in reserve, as the client stops there anyway
+    budget = max(0, client.token_pool.total_remaining("core") - config.rate_limit_threshold)
+    return plan_refresh(
+        candidates,
+        budget,
+        run.started_at,
+        max_prs=config.max_prs_per_run,
+        seconds_per_call=seconds_per_call(last_run),
     )
 
-    return run
+
+def _with_rate_limit_wait(client: GitHubClient, func: Callable[[], T]) -> T:
+    """Call ``func``, waiting once for the rate limit reset if it hits the limit.
+
+    Raises:
+        RateLimitError: If the limit is hit again or the reset is too far away
+    """
+    try:
+        return func()
+    except RateLimitError as e:
+        delay = client.retry_policy.rate_limit_delay(e.reset_timestamp)
+        if delay is None:
+            raise
+        logger.warning(f"{e}; waiting {delay:.0f}s for rate limit reset")
+        time.sleep(delay)
+        return func()
 
 
 def _process_pr(
@@ -200,9 +628,17 @@ def _process_pr(
     pr_number: int,
     search_data: dict[str, Any],
     run: DiscoveryRun,
-) -> bool:
+    archive: PayloadArchive | None = None,
+    feed: ChangeFeed | None = None,
+) -> ProcessOutcome:
     """Process a single PR.
 
+    Known PRs are first compared against the search payload (see
+    ``_search_change``): unchanged PRs cost no API calls, plain status
+    changes are applied from the payload alone, active PRs whose CI had not
+    finished only get their CI status refetched, and closed PRs are frozen,
+    at most revalidated (details and comments, no files).
+
     Args:
         client: GitHub client
         config: Configuration
@@ -211,9 +647,11 @@ def _process_pr(
         pr_number: PR number
         search_data: Data from search API
         run: Discovery run to update
+        archive: Archive to store raw comments, files and checks in
+        feed: Change feed to report new PRs and changes to
 
     Returns:
-        True if this was a new PR, False if update
+        "new", "updated", or "unchanged" if nothing had to be fetched
     """
     logger.debug(f"Processing {repo_name}#{pr_number}")
 
@@ -232,7 +670,25 @@ def _process_pr(
 
     # Check if PR exists
     existing_pr = repo.prs.get(pr_number)
-    was_new = existing_pr is None
+    outcome: ProcessOutcome = "new" if existing_pr is None else "updated"
+
+    revalidate = False
+    if existing_pr and not config.force_mode:
+        change = _search_change(existing_pr, search_data, config.closed_revalidate_days)
+        if change == "unchanged":
+            logger.debug(f"Unchanged per search data: {repo_name}#{pr_number}")
+            return "unchanged"
+        if change == "status":
+            before = replace(existing_pr)
+            _apply_search_status(existing_pr, search_data, run)
+            if feed is not None:
+                feed.record(before, existing_pr)
+            repo.recalculate_metrics()
+            repo.last_checked_at = existing_pr.last_fetched_at
+            return "updated"
+        if change == "ci":
+            return _update_ci(client, repo, existing_pr, archive, feed)
+        revalidate = change == "revalidate"
 
     # Get existing etag for conditional request
     etag = existing_pr.etag if existing_pr else None
@@ -246,102 +702,288 @@ def _process_pr(
     )
 
     if not modified and existing_pr:
-        # No changes, keep existing
+        # No changes, keep existing - but CI runs finishing do not change the PR
         logger.debug(f"No changes for {repo_name}#{pr_number}")
-        return False
+        pending = existing_pr.ci_status not in FINAL_CI_STATUSES
+        if existing_pr.is_active and existing_pr.head_sha and pending:
+            return _update_ci(client, repo, existing_pr, archive, feed)
+        return "unchanged"
 
     if not pr_data:
         # Deleted or inaccessible
         logger.warning(f"Could not fetch {repo_name}#{pr_number}")
-        return False
-
-    # Determine tool type from title
-    title = pr_data.get("title", "")
-    tool = cast(ToolType, config.get_tool_for_title(title))
-
-    # Determine status
-    old_status = existing_pr.status if existing_pr else None
-    new_status = determine_pr_status(pr_data)
-
-    # Track newly merged/closed
-    if old_status and old_status != new_status:
-        if new_status == "merged":
-            run.newly_merged_prs += 1
-        elif new_status == "closed":
-            run.newly_closed_prs += 1
+        return "updated"
 
-    # Determine who closed/merged the PR
-    closed_by = None
-    if new_status == "merged":
-        merged_by_data = pr_data.get("merged_by")
-        if merged_by_data:
-            closed_by = merged_by_data.get("login")
-    elif new_status == "closed":
-        # For closed PRs, the closer info is not directly in PR data
-        # We'd need to fetch timeline events, but for now we leave it None
-        # unless it was auto-closed (then it might be in the data)
-        pass
-
-    # Create/update PR model
     now = datetime.now(UTC)
-    pr = PullRequest(
-        number=pr_number,
-        repository=repo_name,
-        platform="github",
-        url=pr_data.get("html_url", f"https://github.com/{repo_name}/pull/{pr_number}"),
-        tool=tool,
-        title=title,
-        author=pr_data.get("user", {}).get("login", "unknown"),
-        created_at=parse_datetime(pr_data.get("created_at")) or now,
-        updated_at=parse_datetime(pr_data.get("updated_at")) or now,
-        merged_at=parse_datetime(pr_data.get("merged_at")),
-        closed_at=parse_datetime(pr_data.get("closed_at")),
-        status=new_status,
-        analysis_status="analyzed",
-        commit_count=pr_data.get("commits", 1),
-        files_changed=pr_data.get("changed_files", 1),
-        etag=new_etag,
-        last_fetched_at=now,
-        closed_by=closed_by,
-    )
+    pr = build_pr(config, repo_name, pr_number, pr_data, now)
+    pr.analysis_status = "analyzed"
+    pr.etag = new_etag
+    pr.last_fetched_at = now
 
     # Fetch and analyze comments
     try:
-        comments_data = client.fetch_pr_comments(repo.owner, repo.name, pr_number)
-        comments = classify_comments(comments_data, pr.author)
-        analyze_engagement(comments, pr)
+        comments_data, complete = _analyze_comments(
+            client,
+            repo,
+            pr,
+            existing_pr,
+            pr_data.get("comments"),
+            force=config.force_mode,
+            matcher=config.get_bot_matcher(),
+        )
+        if archive is not None:
+            if complete:
+                archive.put(repo_name, pr_number, "comments", comments_data)
+            else:
+                archive.merge_comments(repo_name, pr_number, comments_data)
+    except RateLimitError:
+        raise
     except Exception as e:
         logger.warning(f"Failed to analyze comments for {repo_name}#{pr_number}: {e}")
 
-    # Fetch and analyze files
-    try:
-        files_data = client.fetch_pr_files(repo.owner, repo.name, pr_number)
-        pr.automation_types = detect_automation_types(files_data)
+    # Fetch and analyze files (pushes do not reach a closed PR, so its files are kept)
+    if revalidate and existing_pr and pr.status == "closed":
+        pr.automation_types = existing_pr.automation_types
         pr.adoption_level = determine_adoption_level(pr.automation_types, pr.status)
-    except Exception as e:
-        logger.warning(f"Failed to analyze files for {repo_name}#{pr_number}: {e}")
-
-    # Fetch CI/merge status for active PRs
-    if pr.is_active:
+    else:
         try:
-            head_sha = pr_data.get("head", {}).get("sha")
-            if head_sha:
-                status_data = client.fetch_pr_status(repo.owner, repo.name, pr_number, head_sha)
-                pr.has_conflicts = status_data.get("has_conflicts", False)
-                pr.ci_status = status_data.get("ci_status")
-                pr.codespell_workflow_ci = status_data.get("codespell_workflow_ci")
-
-                # Fetch main branch CI status
-                main_branch_ci = client.fetch_branch_status(repo.owner, repo.name)
-                pr.main_branch_ci = main_branch_ci
+            files_data = client.fetch_pr_files(repo.owner, repo.name, pr_number)
+            if archive is not None:
+                archive.put(repo_name, pr_number, "files", files_data)
+            pr.automation_types = detect_automation_types(files_data)
+            pr.adoption_level = determine_adoption_level(pr.automation_types, pr.status)
+        except RateLimitError:
+            raise
         except Exception as e:
-            logger.warning(f"Failed to fetch CI status for {repo_name}#{pr_number}: {e}")
+            logger.warning(f"Failed to analyze files for {repo_name}#{pr_number}: {e}")
+
+    # Fetch CI/merge status for active PRs
+    if pr.is_active and pr.head_sha:
+        _refresh_ci(client, repo, pr, archive)
+
+    # Track newly merged/closed (only now: a rate limit wait above reruns this PR)
+    old_status = existing_pr.status if existing_pr else None
+    if old_status and old_status != pr.status:
+        if pr.status == "merged":
+            run.newly_merged_prs += 1
+        elif pr.status == "closed":
+            run.newly_closed_prs += 1
 
     # Add PR to repository
     repo.add_pr(pr)
+    if feed is not None:
+        feed.record(existing_pr, pr)
 
     # Recalculate repository metrics
     repo.recalculate_metrics()
     repo.last_checked_at = now
 
-    return was_new
+    return outcome
+
+
+def _update_ci(
+    client: GitHubClient,
+    repo: Repository,
+    pr: PullRequest,
+    archive: PayloadArchive | None = None,
+    feed: ChangeFeed | None = None,
+) -> ProcessOutcome:
+    """Refetch the CI status of a known PR and report any change.
+
+    Returns:
+        "updated" if the CI or merge status changed, else "unchanged"
+    """
+    before = replace(pr)
+    _refresh_ci(client, repo, pr, archive)
+    if pr == before:
+        return "unchanged"
+    if feed is not None:
+        feed.record(before, pr)
+    return "updated"
+
+
+def _refresh_ci(
+    client: GitHubClient,
+    repo: Repository,
+    pr: PullRequest,
+    archive: PayloadArchive | None = None,
+) -> None:
+    """Fetch the CI and merge status of a PR's head commit and its base branch.
+
+    Failures other than hitting the rate limit are logged and leave the
+    stored status as it was.
+
+    Args:
+        client: GitHub client
+        repo: Repository of the PR
+        pr: Active PR with a known head_sha, updated in place
+        archive: Archive to store the raw checks in
+    """
+    assert pr.head_sha is not None
+    try:
+        status_data = client.fetch_pr_status(repo.owner, repo.name, pr.number, pr.head_sha)
+        pr.has_conflicts = status_data.get("has_conflicts", False)
+        pr.ci_status = status_data.get("ci_status")
+        pr.codespell_workflow_ci = status_data.get("codespell_workflow_ci")
+        if archive is not None:
+            checks = {k: status_data.get(k) for k in ("status_state", "check_runs")}
+            archive.put(repo.full_name, pr.number, "checks", checks)
+
+        # Fetch main branch CI status
+        pr.main_branch_ci = client.fetch_branch_status(repo.owner, repo.name)
+    except RateLimitError:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to fetch CI status for {repo.full_name}#{pr.number}: {e}")
+
+
+def _analyze_comments(
+    client: GitHubClient,
+    repo: Repository,
+    pr: PullRequest,
+    existing_pr: PullRequest | None,
+    expected_count: int | None,
+    force: bool = False,
+    matcher: BotMatcher | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Fetch and analyze a PR's comments, incrementally when possible.
+
+    If the stored PR has an engagement state, only comments updated since
+    its cursor are fetched and folded in. Edits to already seen comments, or
+    a total that does not match ``expected_count`` (e.g. after a deletion),
+    fall back to fetching and analyzing the whole thread.
+
+    Args:
+        client: GitHub client
+        repo: Repository the PR belongs to
+        pr: Freshly built PR to update in place
+        existing_pr: PR as previously stored, if any
+        expected_count: Comment count reported by the API, if known
+        force: Always reanalyze the whole thread
+        matcher: Bot detection rules
+
+    Returns:
+        Tuple of (fetched comment payloads, whether they are the whole thread)
+    """
+    state = existing_pr.engagement if existing_pr and not force else None
+    if existing_pr and state and existing_pr.author == pr.author:
+        comments_data = client.fetch_pr_comments(
+            repo.owner, repo.name, pr.number, since=state.last_seen_at
+        )
+        new = state.new_comments(classify_comments(comments_data, pr.author, matcher))
+        if new is not None:
+            pr.last_developer_comment_body = existing_pr.last_developer_comment_body
+            candidate = analyze_engagement(new, pr, replace(state))
+            if expected_count is None or candidate.total_comments == expected_count:
+                return comments_data, False
+        logger.debug(f"Comment thread of {pr.repository}#{pr.number} changed, refetching")
+
+    comments_data = client.fetch_pr_comments(repo.owner, repo.name, pr.number)
+    analyze_engagement(classify_comments(comments_data, pr.author, matcher), pr)
+    return comments_data, True
+
+
+def _search_status(search_data: dict[str, Any]) -> PRStatus:
+    """Determine PR status from a search result item."""
+    if (search_data.get("pull_request") or {}).get("merged_at"):
+        return "merged"
+    return determine_pr_status(search_data)
+
+
+def _search_change(
+    pr: PullRequest,
+    search_data: dict[str, Any],
+    closed_revalidate_days: int = 7,
+    now: datetime | None = None,
+) -> str:
+    """Compare a stored PR with its search result item.
+
+    Closed PRs are frozen like merged ones: see ``_closed_change``.
+
+    Args:
+        pr: PR as stored in the model
+        search_data: Item from the search API (empty for a direct poll)
+        closed_revalidate_days: Days after which a frozen closed PR is revalidated
+        now: Current time (defaults to now)
+
+    Returns:
+        "unchanged" if the PR was not updated since it was last analyzed
+        (and, if active, its CI had finished), "ci" if only the CI status of
+        an active PR with pending or unknown CI needs refetching,
+        "status" if only its state changed in a way the payload fully
+        describes (closed, or toggled between draft and open),
+        "revalidate" if a closed PR needs its details and comments
+        checked, "full" if the PR has to be fetched again
+    """
+    if pr.status == "closed" and pr.analysis_status == "analyzed":
+        return _closed_change(pr, search_data, closed_revalidate_days, now or datetime.now(UTC))
+
+    updated_at = parse_datetime(search_data.get("updated_at"))
+    if updated_at is None or pr.analysis_status != "analyzed":
+        return "full"
+
+    if search_data.get("comments") != pr.total_comments:
+        return "full"
+
+    if updated_at == pr.updated_at:
+        # CI runs finishing (on the PR or its base branch) do not bump updated_at
+        if pr.is_active and pr.ci_status not in FINAL_CI_STATUSES:
+            return "ci" if pr.head_sha else "full"
+        return "unchanged"
+
+    # Merges need merged_by, and reopened PRs need fresh CI data
+    new_status = _search_status(search_data)
+    if new_status != pr.status and (
+        new_status == "closed" or (pr.is_active and new_status in ("draft", "open"))
+    ):
+        return "status"
+
+    return "full"
+
+
+def _closed_change(
+    pr: PullRequest, search_data: dict[str, Any], revalidate_days: int, now: datetime
+) -> str:
+    """Decide whether a frozen closed PR needs fetching.
+
+    Closed PRs rarely change, so unlike open ones they are not refetched
+    because of a differing payload alone. A reopen unfreezes the PR right
+    away (full fetch, including files and CI). Activity (``updated_at`` or
+    the comment count moved), a direct poll without payload, or
+    ``revalidate_days`` since the last fetch only revalidate it: details
+    (a conditional request) and comments, keeping its files.
+
+    Returns:
+        "full", "revalidate" or "unchanged"
+    """
+    updated_at = parse_datetime(search_data.get("updated_at"))
+    if updated_at is None:
+        return "revalidate"
+    if _search_status(search_data) != "closed":
+        return "full"
+    if updated_at != pr.updated_at or search_data.get("comments") != pr.total_comments:
+        return "revalidate"
+    if pr.last_fetched_at is None or now - pr.last_fetched_at >= timedelta(days=revalidate_days):
+        return "revalidate"
+    return "unchanged"
+
+
+def _apply_search_status(pr: PullRequest, search_data: dict[str, Any], run: DiscoveryRun) -> None:
+    """Update a PR's status from its search result item.
+
+    Args:
+        pr: PR to update in place
+        search_data: Item from the search API
+        run: Discovery run to update
+    """
+    new_status = _search_status(search_data)
+    logger.debug(f"Status change from search data: {pr.repository}#{pr.number} -> {new_status}")
+
+    if new_status == "closed":
+        run.newly_closed_prs += 1
+
+    now = datetime.now(UTC)
+    pr.updated_at = parse_datetime(search_data.get("updated_at")) or now
+    pr.closed_at = parse_datetime(search_data.get("closed_at"))
+    pr.last_fetched_at = now
+    apply_status_change(pr, new_status)
@@ -1,19 +1,92 @@
 """GitHub API client for PR discovery and data fetching."""
 
-from datetime import datetime
-from typing import Any, Literal
+import threading
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urljoin
 
 import requests
 
 from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.matching import TitleMatcher
 from improveit_dashboard.utils.rate_limit import RateLimitHandler
+from improveit_dashboard.utils.retry import RetryPolicy
+from improveit_dashboard.utils.token_pool import PooledToken, TokenPool
+
+if TYPE_CHECKING:
+    from improveit_dashboard.models.config import Configuration
 
 CIStatus = Literal["success", "failure", "pending"]
 
 logger = get_logger(__name__)
 
 
+def _split_etag(etag: str) -> tuple[str | None, str]:
+    """Split a stored ETag into the key of the token it was received with and its value.
+
+    GitHub varies responses on the Authorization header, so an ETag is only
+    reliable with the token that received it. ETags stored before they were
+    scoped have no token key.
+    """
+    key, sep, value = etag.partition(":")
+    if sep and len(key) == 8 and not key.startswith(("W/", '"')):
+        return key, value
+    return None, etag
+
+
+def summarize_checks(
+    status_state: str | None, check_runs: list[dict[str, Any]]
+) -> dict[str, CIStatus | None]:
+    """Derive CI status from the combined status and check runs of a commit.
+
+    Args:
+        status_state: ``state`` of the combined status API response, if any
+        check_runs: ``check_runs`` of the check runs API response
+
+    Returns:
+        Dict with ci_status and codespell_workflow_ci
+    """
+    ci_status: CIStatus | None = None
+    codespell_workflow_ci: CIStatus | None = None
+
+    if status_state == "success":
+        ci_status = "success"
+    elif status_state == "failure" or status_state == "error":
+        ci_status = "failure"
+    elif status_state == "pending":
+        ci_status = "pending"
+
+    # Determine overall CI status from check runs
+    if check_runs:
+        conclusions = [cr.get("conclusion") for cr in check_runs if cr.get("conclusion")]
+        statuses = [cr.get("status") for cr in check_runs]
+
+        if all(c == "success" for c in conclusions if c):
+            if ci_status != "failure":
+                ci_status = "success"
+        elif any(c in ("failure", "cancelled", "timed_out") for c in conclusions):
+            ci_status = "failure"
+        elif any(s in ("queued", "in_progress") for s in statuses):
+            if ci_status is None:
+                ci_status = "pending"
+
+        # Look for codespell workflow specifically
+        for cr in check_runs:
+            name = cr.get("name", "").lower()
+            if "codespell" in name:
+                conclusion = cr.get("conclusion")
+                if conclusion == "success":
+                    codespell_workflow_ci = "success"
+                elif conclusion in ("failure", "cancelled", "timed_out"):
+                    codespell_workflow_ci = "failure"
+                elif cr.get("status") in ("queued", "in_progress"):
+                    codespell_workflow_ci = "pending"
+                break
+
+    return {"ci_status": ci_status, "codespell_workflow_ci": codespell_workflow_ci}
+
+
 class GitHubClient:
     """Client for GitHub REST API v3.
 
@@ -27,12 +100,20 @@ class GitHubClient:
         self,
         token: str,
         rate_limit_threshold: int = 100,
+        rate_limit_pacing: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        extra_tokens: list[str] | None = None,
     ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token
             rate_limit_threshold: Pause when remaining calls fall below this
+            rate_limit_pacing: Spread requests evenly over the rate limit window
+                instead of sleeping until reset when the threshold is reached
+            retry_policy: Policy for retrying transient failures (default: RetryPolicy())
+            extra_tokens: Additional tokens; requests are rotated across all
+                tokens, each with its own rate limit budget
         """
         self.token = token
         self.session = requests.Session()
@@ -45,28 +126,86 @@ class GitHubClient:
         if token:
             self.session.headers["Authorization"] = f"Bearer {token}"
 
-        self.rate_limit = RateLimitHandler(threshold=rate_limit_threshold)
+        self.token_pool = TokenPool(
+            [token, *(extra_tokens or [])],
+            threshold=rate_limit_threshold,
+            pacing=rate_limit_pacing,
+        )
+        self._local = threading.local()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._calls_lock = threading.Lock()
         self.api_calls = 0
 
+    @classmethod
+    def from_config(cls, config: "Configuration") -> "GitHubClient":
+        """Create a client from configuration (tokens, rate limit, retries)."""
+        tokens = config.get_all_tokens()
+        return cls(
+            token=tokens[0] if tokens else "",
+            rate_limit_threshold=config.rate_limit_threshold,
+            rate_limit_pacing=config.rate_limit_pacing,
+            retry_policy=RetryPolicy(
+                max_attempts=config.max_retries + 1,
+                retry_budget=config.retry_budget,
+            ),
+            extra_tokens=tokens[1:],
+        )
+
+    @property
+    def _current(self) -> PooledToken:
+        """Token used by this thread's most recent request."""
+        entry: PooledToken = getattr(self._local, "entry", self.token_pool.entries[0])
+        return entry
+
+    @property
+    def rate_limit(self) -> RateLimitHandler:
+        """Rate limit handler of the token used for the most recent request."""
+        return self._current.rate_limit
+
+    def _check_rate_limit(self, response: requests.Response) -> None:
+        """Check rate limit after a request, waiting only if no token has headroom.
+
+        Raises:
+            RateLimitError: If every token is critically low
+        """
+        entry = self._current
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        if len(self.token_pool) > 1 and self.token_pool.has_headroom(resource, exclude=entry):
+            # Another token can take over - no need to wait for this one
+            return
+        entry.rate_limit.check_and_wait(response)
+
     def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        etag: str | None = None,
     ) -> requests.Response:
         """Make an API request.
 
+        Transient failures (connection errors, 5xx gateway errors, 429 and
+        secondary rate limit 403s) are retried according to ``retry_policy``.
+        A token whose primary rate limit is exhausted is retried right away
+        with another token from the pool, if one has headroom.
+
+        A conditional request (``etag``) goes to the token that received the
+        ETag while it has headroom; other tokens send the request without
+        ``If-None-Match``.
+
         Args:
             method: HTTP method
             endpoint: API endpoint (relative to base URL)
             params: Query parameters
             headers: Additional headers
+            etag: Stored ETag (see ``_split_etag``) for a conditional request
 
         Returns:
-            Response object
+            Response object (the last one if retries were exhausted)
 
         Raises:
+            requests.ConnectionError: If the connection keeps failing
             requests.HTTPError: On API errors (except rate limit)
         """
         url = urljoin(self.BASE_URL + "/", endpoint.lstrip("/"))
@@ -75,32 +214,120 @@ class GitHubClient:
         if headers:
             req_headers.update(headers)
 
-        response = self.session.request(
-            method,
-            url,
-            params=params,
-            headers=req_headers,
-        )
+        # Search has its own (much smaller) rate limit bucket
+        resource = "search" if endpoint.lstrip("/").startswith("search/") else "core"
 
-        self.api_calls += 1
+        etag_key, etag_value = _split_etag(etag) if etag else (None, None)
+        etag_owner = self.token_pool.find(etag_key) if etag_key else None
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if etag_owner is not None and etag_owner.rate_limit.headroom(resource) > 0:
+                entry = etag_owner
+            else:
+                entry = self.token_pool.select(resource)
+            self._local.entry = entry
+            entry.rate_limit.acquire(resource)
+            if entry.token:
+                req_headers["Authorization"] = f"Bearer {entry.token}"
+            if etag_value and (etag_key is None or entry is etag_owner):
+                req_headers["If-None-Match"] = etag_value
+            else:
+                req_headers.pop("If-None-Match", None)
+
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    headers=req_headers,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self.retry_policy.backoff(endpoint, attempt, reason=str(e))
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+
+            with self._calls_lock:
+                self.api_calls += 1
+
+            # Update rate limit (don't wait yet - caller decides)
+            entry.rate_limit.update_from_response(response)
+
+            retry_after = self._retry_after(response)
+            if retry_after is None:
+                return response
+
+            exhausted = response.headers.get("X-RateLimit-Remaining") == "0"
+            if exhausted and self.token_pool.has_headroom(resource, exclude=entry):
+                # Only this token is exhausted - switch tokens instead of waiting for its reset
+                logger.info(f"Token {entry.label} exhausted for {resource}, switching tokens")
+                continue
+
+            delay = self.retry_policy.backoff(
+                endpoint,
+                attempt,
+                retry_after=retry_after or None,
+                reason=f"HTTP {response.status_code}",
+            )
+            if delay is None:
+                return response
+            time.sleep(delay)
 
-        # Update rate limit (don't wait yet - caller decides)
-        self.rate_limit.update_from_response(response)
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        """Determine whether a response is worth retrying.
+
+        Returns:
+            None if the response should be returned as is, otherwise the
+            server-requested wait in seconds (0 = use exponential backoff)
+        """
+        status = response.status_code
+        if status in (500, 502, 503, 504):
+            return 0.0
+
+        if status not in (403, 429):
+            return None
 
-        return response
+        headers = response.headers
+        if retry_after := headers.get("Retry-After"):
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                return 60.0
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            # Primary rate limit exhausted - wait for the window to reset
+            reset = int(headers.get("X-RateLimit-Reset", 0))
+            return float(max(1, reset - int(time.time())))
+
+        if status == 429:
+            return 60.0
+
+        # 403 is only transient for secondary rate limits; otherwise access denied
+        body = response.text if isinstance(getattr(response, "text", None), str) else ""
+        if "secondary rate limit" in body.lower():
+            # GitHub asks to wait at least a minute when no Retry-After is sent
+            return 60.0
+        return None
 
     def search_user_prs(
         self,
         username: str,
         updated_since: datetime | None = None,
         keywords: list[str] | None = None,
+        title_matcher: TitleMatcher | None = None,
     ) -> list[dict[str, Any]]:
         """Search for PRs authored by a user.
 
         Args:
             username: GitHub username
-            updated_since: Only return PRs updated after this date
-            keywords: Filter by title keywords (any match)
+            updated_since: Only return PRs updated at or after this time
+            keywords: Filter by title keywords (any match at a word start)
+            title_matcher: Filter by a compiled matcher (takes precedence
+                over keywords)
 
         Returns:
             List of PR search results
@@ -112,11 +339,14 @@ class GitHubClient:
         ]
 
         if updated_since:
-            date_str = updated_since.strftime("%Y-%m-%d")
-            query_parts.append(f"updated:>{date_str}")
+            timestamp = updated_since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+            query_parts.append(f"updated:>={timestamp}")
 
         query = " ".join(query_parts)
 
+        if title_matcher is None and keywords:
+            title_matcher = TitleMatcher({"keywords": keywords})
+
         logger.info(f"Searching PRs for user {username}: {query}")
 
         all_items: list[dict[str, Any]] = []
@@ -136,7 +366,7 @@ class GitHubClient:
             )
 
             # Check rate limit after each request
-            self.rate_limit.check_and_wait(response)
+            self._check_rate_limit(response)
 
             if response.status_code == 422:
                 logger.warning(f"Invalid search query: {query}")
@@ -151,13 +381,10 @@ class GitHubClient:
                 break
 
             # Filter by keywords if specified
-            if keywords:
-                filtered = []
-                for item in items:
-                    title_lower = item.get("title", "").lower()
-                    if any(kw.lower() in title_lower for kw in keywords):
-                        filtered.append(item)
-                items = filtered
+            if title_matcher is not None:
+                items = [
+                    item for item in items if title_matcher.match(item.get("title", "")) is not None
+                ]
 
             all_items.extend(items)
             logger.debug(f"Page {page}: found {len(items)} matching PRs")
@@ -188,20 +415,17 @@ class GitHubClient:
         Returns:
             Tuple of (pr_data, new_etag, modified)
             - pr_data: PR data dict or None if not modified
-            - new_etag: New ETag value
+            - new_etag: New ETag value, prefixed with the key of the token
+              that received it ("<key>:<etag>", see ``_split_etag``)
             - modified: True if data was modified, False if 304
         """
-        headers = {}
-        if etag:
-            headers["If-None-Match"] = etag
-
         response = self._request(
             "GET",
             f"/repos/{owner}/{repo}/pulls/{pr_number}",
-            headers=headers,
+            etag=etag,
         )
 
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         # Not modified
         if response.status_code == 304:
@@ -215,6 +439,8 @@ class GitHubClient:
         response.raise_for_status()
 
         new_etag = response.headers.get("ETag")
+        if new_etag:
+            new_etag = f"{self._current.key}:{new_etag}"
         return response.json(), new_etag, True
 
     def fetch_pr_comments(
@@ -222,6 +448,7 @@ class GitHubClient:
         owner: str,
         repo: str,
         pr_number: int,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
         """Fetch all comments on a PR.
 
@@ -231,6 +458,7 @@ class GitHubClient:
             owner: Repository owner
             repo: Repository name
             pr_number: PR number
+            since: Only return comments created or edited at or after this time
 
         Returns:
             List of comment data dicts
@@ -238,17 +466,18 @@ class GitHubClient:
         all_comments: list[dict[str, Any]] = []
         page = 1
 
+        params: dict[str, Any] = {"per_page": 100}
+        if since:
+            params["since"] = since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
         while True:
             response = self._request(
                 "GET",
                 f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
-                params={
-                    "per_page": 100,
-                    "page": page,
-                },
+                params={**params, "page": page},
             )
 
-            self.rate_limit.check_and_wait(response)
+            self._check_rate_limit(response)
 
             if response.status_code == 404:
                 logger.warning(f"Comments not found: {owner}/{repo}#{pr_number}")
@@ -290,7 +519,7 @@ class GitHubClient:
             params={"per_page": 100},
         )
 
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         if response.status_code == 404:
             logger.warning(f"PR files not found: {owner}/{repo}#{pr_number}")
@@ -320,7 +549,7 @@ class GitHubClient:
             f"/repos/{owner}/{repo}",
         )
 
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         if response.status_code == 404:
             logger.warning(f"Repository not found: {owner}/{repo}")
@@ -351,7 +580,8 @@ class GitHubClient:
             head_sha: SHA of the PR head commit
 
         Returns:
-            Dict with ci_status, main_branch_ci, codespell_workflow_ci, has_conflicts
+            Dict with ci_status, main_branch_ci, codespell_workflow_ci, has_conflicts,
+            plus the raw status_state and check_runs they were derived from
         """
         result: dict[str, Any] = {
             "ci_status": None,
@@ -365,17 +595,11 @@ class GitHubClient:
             "GET",
             f"/repos/{owner}/{repo}/commits/{head_sha}/status",
         )
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
+        status_state = None
         if response.status_code == 200:
-            data = response.json()
-            state = data.get("state")
-            if state == "success":
-                result["ci_status"] = "success"
-            elif state == "failure" or state == "error":
-                result["ci_status"] = "failure"
-            elif state == "pending":
-                result["ci_status"] = "pending"
+            status_state = response.json().get("state")
 
         # Get check runs (GitHub Actions, etc.)
         response = self._request(
@@ -383,45 +607,23 @@ class GitHubClient:
             f"/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
             params={"per_page": 100},
         )
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
+        check_runs: list[dict[str, Any]] = []
         if response.status_code == 200:
-            data = response.json()
-            check_runs = data.get("check_runs", [])
-
-            # Determine overall CI status from check runs
-            if check_runs:
-                conclusions = [cr.get("conclusion") for cr in check_runs if cr.get("conclusion")]
-                statuses = [cr.get("status") for cr in check_runs]
-
-                if all(c == "success" for c in conclusions if c):
-                    if result["ci_status"] != "failure":
-                        result["ci_status"] = "success"
-                elif any(c in ("failure", "cancelled", "timed_out") for c in conclusions):
-                    result["ci_status"] = "failure"
-                elif any(s in ("queued", "in_progress") for s in statuses):
-                    if result["ci_status"] is None:
-                        result["ci_status"] = "pending"
-
-                # Look for codespell workflow specifically
-                for cr in check_runs:
-                    name = cr.get("name", "").lower()
-                    if "codespell" in name:
-                        conclusion = cr.get("conclusion")
-                        if conclusion == "success":
-                            result["codespell_workflow_ci"] = "success"
-                        elif conclusion in ("failure", "cancelled", "timed_out"):
-                            result["codespell_workflow_ci"] = "failure"
-                        elif cr.get("status") in ("queued", "in_progress"):
-                            result["codespell_workflow_ci"] = "pending"
-                        break
+            check_runs = response.json().get("check_runs", [])
+
+        result.update(summarize_checks(status_state, check_runs))
+        # Raw inputs, kept for the payload archive
+        result["status_state"] = status_state
+        result["check_runs"] = check_runs
 
         # Get PR mergeable state (for conflicts)
         response = self._request(
             "GET",
             f"/repos/{owner}/{repo}/pulls/{pr_number}",
         )
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         if response.status_code == 200:
             data = response.json()
@@ -455,7 +657,7 @@ class GitHubClient:
             "GET",
             f"/repos/{owner}/{repo}/branches/{branch}",
         )
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         if response.status_code == 404:
             # Try "master" as fallback
@@ -476,7 +678,7 @@ class GitHubClient:
             "GET",
             f"/repos/{owner}/{repo}/commits/{head_sha}/status",
         )
-        self.rate_limit.check_and_wait(response)
+        self._check_rate_limit(response)
 
         if response.status_code != 200:
             return None
@@ -497,8 +699,12 @@ class GitHubClient:
         """Get current rate limit status.
 
         Returns:
-            Dict with remaining, limit, reset_timestamp, api_calls
+            Dict with remaining, limit, reset_timestamp (of the last used token),
+            api_calls, retries, tokens and pool_remaining (core calls left across all tokens)
         """
         status = self.rate_limit.get_status()
         status["api_calls"] = self.api_calls
+        status["tokens"] = len(self.token_pool)
+        status["pool_remaining"] = self.token_pool.total_remaining()
+        status["retries"] = self.retry_policy.retries_used
         return status
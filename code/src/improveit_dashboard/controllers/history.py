@@ -0,0 +1,235 @@
+"""Append-only history of per-run aggregates and PR state transitions.
+
+Layout next to the model file::
+
+    data/history/runs.jsonl   # One line per recorded run
+    data/history/state.json   # Latest per-PR state (cache, rebuilt from runs.jsonl)
+
+Each line of ``runs.jsonl`` is delta-encoded against the previous one: it
+holds only the aggregates whose value changed and the PRs whose status or
+response status changed, so the file grows with the volume of changes, not
+with the size of the model::
+
+    {"at": "2025-01-15T10:00:00+00:00", "source": "update",
+     "aggregates": {"open": 41, "merged": 120, "merge_rate": 0.7},
+     "transitions": [["owner/repo#12", "status", "open", "merged"]]}
+
+The first line lists every PR as a transition from ``null``.
+"""
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from improveit_dashboard.controllers.persistence import write_json_atomic
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# PR fields whose changes are recorded as transitions
+TRACKED_FIELDS = ("status", "response_status")
+
+# (PR key, field, old value, new value); old is None for new PRs
+Transition = tuple[str, str, str | None, str | None]
+
+
+def history_path(data_file: Path) -> Path:
+    """Get the history directory for a model file (``data/history``)."""
+    return data_file.parent / "history"
+
+
+def compute_aggregates(repositories: dict[str, Repository]) -> dict[str, Any]:
+    """Compute the aggregate values tracked over time.
+
+    Args:
+        repositories: Dict mapping full_name to Repository
+
+    Returns:
+        Mapping of aggregate name to value
+    """
+    statuses: Counter[str] = Counter()
+    responses: Counter[str] = Counter()
+    for repo in repositories.values():
+        for pr in repo.prs.values():
+            statuses[pr.status] += 1
+            if pr.status in ("open", "draft"):
+                responses[pr.response_status] += 1
+
+    decided = statuses["merged"] + statuses["closed"]
+    return {
+        "repositories": len(repositories),
+        "total_prs": statuses.total(),
+        "draft": statuses["draft"],
+        "open": statuses["open"],
+        "merged": statuses["merged"],
+        "closed": statuses["closed"],
+        "merge_rate": round(statuses["merged"] / decided, 4) if decided else None,
+        "awaiting_maintainer": responses["awaiting_maintainer"],
+        "awaiting_submitter": responses["awaiting_submitter"],
+        "no_response": responses["no_response"],
+    }
+
+
+def pr_states(repositories: dict[str, Repository]) -> dict[str, list[str]]:
+    """Get the tracked field values of every PR, keyed by "owner/repo#N"."""
+    return {
+        work_key(repo_name, pr.number): [getattr(pr, name) for name in TRACKED_FIELDS]
+        for repo_name, repo in repositories.items()
+        for pr in repo.prs.values()
+    }
+
+
+@dataclass
+class HistoryEntry:
+    """One recorded run, with aggregates decoded to full values."""
+
+    at: datetime
+    source: str  # "update", "reanalyze", ...
+    aggregates: dict[str, Any]
+    transitions: list[Transition] = field(default_factory=list)
+
+    @property
+    def new_prs(self) -> int:
+        """Number of PRs first recorded in this run."""
+        return sum(1 for _, name, old, _ in self.transitions if name == "status" and old is None)
+
+    def count_transitions(self, name: str, new: str) -> int:
+        """Count already known PRs whose field changed to a value in this run.
+
+        Args:
+            name: Field name (e.g. "status")
+            new: Value transitioned to
+
+        Returns:
+            Number of matching transitions
+        """
+        return sum(
+            1
+            for _, field_name, old, value in self.transitions
+            if field_name == name and value == new and old is not None
+        )
+
+
+class HistoryStore:
+    """Append-only, delta-encoded store of run history."""
+
+    def __init__(self, root: Path):
+        """Initialize store.
+
+        Args:
+            root: History directory (created on first write)
+        """
+        self.root = root
+        self.runs_path = root / "runs.jsonl"
+        self.state_path = root / "state.json"
+
+    def record(
+        self, repositories: dict[str, Repository], at: datetime, source: str = "update"
+    ) -> HistoryEntry | None:
+        """Append the changes since the last recorded run.
+
+        Args:
+            repositories: Current model
+            at: Time of the run
+            source: What produced the changes
+
+        Returns:
+            The recorded entry, or None if nothing changed
+        """
+        previous_aggregates, previous_states = self._load_state()
+        aggregates = compute_aggregates(repositories)
+        states = pr_states(repositories)
+
+        changed = {
+            name: value
+            for name, value in aggregates.items()
+            if name not in previous_aggregates or previous_aggregates[name] != value
+        }
+        transitions: list[Transition] = []
+        for key, values in states.items():
+            before = previous_states.get(key)
+            for i, name in enumerate(TRACKED_FIELDS):
+                old = before[i] if before else None
+                if old != values[i]:
+                    transitions.append((key, name, old, values[i]))
+
+        if not changed and not transitions:
+            logger.debug("No changes to record in history")
+            return None
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        line = {
+            "at": at.isoformat(),
+            "source": source,
+            "aggregates": changed,
+            "transitions": [list(t) for t in transitions],
+        }
+        with open(self.runs_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(line, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        write_json_atomic(
+            self.state_path,
+            {
+                "runs_size": self.runs_path.stat().st_size,
+                "aggregates": aggregates,
+                "prs": states,
+            },
+        )
+        logger.info(f"Recorded history: {len(transitions)} transitions")
+        return HistoryEntry(at=at, source=source, aggregates=aggregates, transitions=transitions)
+
+    def entries(self) -> Iterator[HistoryEntry]:
+        """Stream recorded runs, oldest first, with full aggregate values."""
+        if not self.runs_path.exists():
+            return
+        aggregates: dict[str, Any] = {}
+        with open(self.runs_path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted append
+                    logger.warning(f"Skipping corrupt history line {number}")
+                    continue
+                aggregates = {**aggregates, **data.get("aggregates", {})}
+                yield HistoryEntry(
+                    at=datetime.fromisoformat(data["at"]),
+                    source=data.get("source", "update"),
+                    aggregates=aggregates,
+                    transitions=[
+                        (key, name, old, new) for key, name, old, new in data.get("transitions", [])
+                    ],
+                )
+
+    def _load_state(self) -> tuple[dict[str, Any], dict[str, list[str]]]:
+        """Get the last recorded aggregates and PR states.
+
+        Uses the state cache when it matches runs.jsonl, otherwise replays
+        the history.
+        """
+        if self.state_path.exists() and self.runs_path.exists():
+            try:
+                with open(self.state_path, encoding="utf-8") as f:
+                    state = json.load(f)
+                if state.get("runs_size") == self.runs_path.stat().st_size:
+                    return state["aggregates"], state["prs"]
+            except (OSError, json.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Ignoring history state cache: {e}")
+
+        aggregates: dict[str, Any] = {}
+        states: dict[str, list[str]] = {}
+        for entry in self.entries():
+            aggregates = entry.aggregates
+            for key, name, _, new in entry.transitions:
+                values = states.setdefault(key, [""] * len(TRACKED_FIELDS))
+                values[TRACKED_FIELDS.index(name)] = new or ""
+        return aggregates, states
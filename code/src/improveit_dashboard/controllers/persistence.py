@@ -1,12 +1,30 @@
-"""Atomic JSON persistence for model data."""
-
+"""Atomic JSON persistence for model data.
+
+Parsing the JSON model and building its objects dominates the start-up of
+read-only commands, so ``load_model`` keeps a pickle of the parsed model
+beside the JSON file (``repositories.cache.pickle``). The cache records the
+JSON file's size, mtime and SHA-256 and is only used while they match;
+``save_model`` removes it. It is a local, git-ignored file written by this
+tool only - never load a cache file from an untrusted source.
+"""
+
+import gc
+import hashlib
 import json
 import os
-from datetime import datetime
+import pickle
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import fields
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from improveit_dashboard import __version__
+from improveit_dashboard.models.checkpoint import DiscoveryCheckpoint
 from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
 from improveit_dashboard.models.repository import Repository
 from improveit_dashboard.utils.logging import get_logger
 
@@ -16,12 +34,41 @@ logger = get_logger(__name__)
 # JSON file format version
 MODEL_VERSION = "1.0"
 
+# Bump when the layout of the model cache changes
+CACHE_FORMAT = 1
+
+# Files modified this recently may change again within the mtime resolution,
+# so their cache entry is always verified by content hash
+RACY_MTIME_SECONDS = 2.0
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection while building many objects.
+
+    Loading creates hundreds of thousands of acyclic objects, which would
+    otherwise trigger repeated full collections that dominate load time.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def model_cache_path(data_file: Path) -> Path:
+    """Get the model cache file path stored beside the model file."""
+    return data_file.with_name(f"{data_file.stem}.cache.pickle")
+
 
-def load_model(path: Path) -> tuple[dict[str, Repository], DiscoveryRun | None]:
+def load_model(path: Path, cache: bool = True) -> tuple[dict[str, Repository], DiscoveryRun | None]:
     """Load model from JSON file.
 
     Args:
         path: Path to repositories.json
+        cache: Use (and refresh) the model cache beside the file
 
     Returns:
         Tuple of (repositories dict, last run info)
@@ -32,25 +79,33 @@ def load_model(path: Path) -> tuple[dict[str, Repository], DiscoveryRun | None]:
         logger.info(f"No existing model at {path}, starting fresh")
         return {}, None
 
-    logger.info(f"Loading model from {path}")
+    stat = path.stat()
+    if cache and (cached := _read_cache(model_cache_path(path), path, stat)) is not None:
+        logger.info(f"Loaded {len(cached[0])} repositories from cache")
+        return cached
 
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Check version
-    meta = data.get("meta", {})
-    version = meta.get("version", "1.0")
-    if version != MODEL_VERSION:
-        logger.warning(f"Model version mismatch: {version} != {MODEL_VERSION}")
+    logger.info(f"Loading model from {path}")
 
-    # Parse repositories
-    repositories: dict[str, Repository] = {}
-    for full_name, repo_data in data.get("repositories", {}).items():
-        try:
-            repo = Repository.from_dict(repo_data)
-            repositories[full_name] = repo
-        except Exception as e:
-            logger.error(f"Failed to parse repository {full_name}: {e}")
+    raw = path.read_bytes()
+    parse_errors = 0
+    with _gc_paused():
+        data = json.loads(raw)
+
+        # Check version
+        meta = data.get("meta", {})
+        version = meta.get("version", "1.0")
+        if version != MODEL_VERSION:
+            logger.warning(f"Model version mismatch: {version} != {MODEL_VERSION}")
+
+        # Parse repositories
+        repositories: dict[str, Repository] = {}
+        for full_name, repo_data in data.get("repositories", {}).items():
+            try:
+                repo = Repository.from_dict(repo_data)
+                repositories[full_name] = repo
+            except Exception as e:
+                logger.error(f"Failed to parse repository {full_name}: {e}")
+                parse_errors += 1
 
     # Parse last run
     last_run = None
@@ -59,11 +114,83 @@ def load_model(path: Path) -> tuple[dict[str, Repository], DiscoveryRun | None]:
             last_run = DiscoveryRun.from_dict(meta["last_run"])
         except Exception as e:
             logger.error(f"Failed to parse last_run: {e}")
+            parse_errors += 1
 
     logger.info(f"Loaded {len(repositories)} repositories")
+    # Only cache clean loads, so parse errors keep being reported
+    if cache and not parse_errors:
+        _write_cache(model_cache_path(path), _cache_key(raw, stat), (repositories, last_run))
     return repositories, last_run
 
 
+def _schema() -> str:
+    """Fingerprint of the code the cached objects were built with."""
+    names = [f.name for cls in (Repository, PullRequest, DiscoveryRun) for f in fields(cls)]
+    return f"{__version__}:{MODEL_VERSION}:{CACHE_FORMAT}:" + ",".join(names)
+
+
+def _cache_key(raw: bytes, stat: os.stat_result) -> dict[str, Any]:
+    """Describe the model file contents a cache entry is built from."""
+    racy = time.time() - stat.st_mtime < RACY_MTIME_SECONDS
+    return {
+        "schema": _schema(),
+        "size": len(raw),
+        "mtime_ns": None if racy else stat.st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+
+
+def _read_cache(
+    path: Path, data_file: Path, stat: os.stat_result
+) -> tuple[dict[str, Repository], DiscoveryRun | None] | None:
+    """Load the cached model if it was built from the current model file.
+
+    Matching size and mtime are trusted; otherwise (e.g. after a git
+    checkout rewrote an identical file) the content hash decides.
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            # The key is pickled separately so a stale cache is rejected unread
+            key = pickle.load(f)
+            fresh = key["schema"] == _schema() and key["size"] == stat.st_size
+            if fresh and key["mtime_ns"] != stat.st_mtime_ns:
+                fresh = key["sha256"] == hashlib.sha256(data_file.read_bytes()).hexdigest()
+            if not fresh:
+                logger.debug(f"Ignoring stale model cache {path}")
+                return None
+            with _gc_paused():
+                model: tuple[dict[str, Repository], DiscoveryRun | None] = pickle.load(f)
+            return model
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable model cache {path}: {e}")
+        return None
+
+
+def _write_cache(
+    path: Path,
+    key: dict[str, Any],
+    model: tuple[dict[str, Repository], DiscoveryRun | None],
+) -> None:
+    """Write the model cache via temp file + rename; failures are not fatal."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(path)
+        logger.debug(f"Wrote model cache {path}")
+    except Exception as e:
+        logger.warning(f"Failed to write model cache {path}: {e}")
+        temp_path.unlink(missing_ok=True)
+
+
+def clear_model_cache(data_file: Path) -> None:
+    """Remove the model cache of a model file."""
+    model_cache_path(data_file).unlink(missing_ok=True)
+
+
 def save_model(
     path: Path,
     repositories: dict[str, Repository],
@@ -83,6 +210,9 @@ def save_model(
     # Ensure directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # The cache describes the file about to be replaced
+    clear_model_cache(path)
+
     # Build model data
     data: dict[str, Any] = {
         "meta": {
@@ -99,17 +229,21 @@ def save_model(
     for full_name, repo in sorted(repositories.items()):
         data["repositories"][full_name] = repo.to_dict()
 
-    # Write to temp file
-    temp_path = path.with_suffix(".json.tmp")
+    write_json_atomic(path, data, indent=2)
+    logger.info(f"Saved {len(repositories)} repositories to {path}")
+
+
+def write_json_atomic(path: Path, data: Any, indent: int | None = None) -> None:
+    """Write JSON to path via temp file + fsync + rename."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
     try:
         with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, indent=indent, ensure_ascii=False)
             f.flush()
             os.fsync(f.fileno())
 
         # Atomic rename
         temp_path.rename(path)
-        logger.info(f"Saved {len(repositories)} repositories to {path}")
 
     except Exception:
         # Clean up temp file on error
@@ -118,6 +252,91 @@ def save_model(
         raise
 
 
+def dirty_path(data_file: Path) -> Path:
+    """Get the file of PRs awaiting view generation, stored beside the model file."""
+    return data_file.with_name(f"{data_file.stem}.dirty.json")
+
+
+def mark_dirty(data_file: Path, keys: set[str]) -> None:
+    """Record PRs whose views must be regenerated, adding to those recorded.
+
+    Callers mark the PRs they saved before generating any views, so PRs
+    are not lost when generation is skipped, fails or is interrupted.
+
+    Args:
+        data_file: Path to repositories.json
+        keys: PR keys ("owner/repo#N")
+    """
+    if not keys:
+        return
+    path = dirty_path(data_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(path, sorted(load_dirty(data_file) | keys))
+
+
+def load_dirty(data_file: Path) -> set[str]:
+    """Get the PRs awaiting view generation (empty if unreadable)."""
+    path = dirty_path(data_file)
+    if not path.exists():
+        return set()
+    try:
+        with open(path, encoding="utf-8") as f:
+            return set(json.load(f))
+    except Exception as e:
+        logger.error(f"Failed to parse {path}: {e}")
+        return set()
+
+
+def clear_dirty(data_file: Path) -> None:
+    """Forget the PRs awaiting view generation after the views were generated."""
+    dirty_path(data_file).unlink(missing_ok=True)
+
+
+def checkpoint_path(data_file: Path) -> Path:
+    """Get the checkpoint file path stored beside the model file."""
+    return data_file.with_name(f"{data_file.stem}.checkpoint.json")
+
+
+def save_checkpoint(path: Path, checkpoint: DiscoveryCheckpoint) -> None:
+    """Save discovery checkpoint atomically.
+
+    Args:
+        path: Path to checkpoint file (see checkpoint_path)
+        checkpoint: Checkpoint to save
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint.saved_at = datetime.now(UTC)
+    write_json_atomic(path, checkpoint.to_dict())
+    logger.debug(f"Saved checkpoint: {len(checkpoint.completed)}/{len(checkpoint.queue)} PRs done")
+
+
+def load_checkpoint(path: Path) -> DiscoveryCheckpoint | None:
+    """Load discovery checkpoint.
+
+    Args:
+        path: Path to checkpoint file
+
+    Returns:
+        Checkpoint or None if missing or unreadable
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            return DiscoveryCheckpoint.from_dict(json.load(f))
+    except Exception as e:
+        logger.error(f"Failed to parse checkpoint {path}: {e}")
+        return None
+
+
+def clear_checkpoint(path: Path) -> None:
+    """Remove checkpoint file after a completed run."""
+    if path.exists():
+        path.unlink()
+        logger.debug(f"Removed checkpoint {path}")
+
+
 def get_last_updated(path: Path) -> datetime | None:
     """Get the last_updated timestamp from model file.
 
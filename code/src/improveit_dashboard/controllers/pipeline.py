@@ -0,0 +1,183 @@
+"""In-process update -> generate -> commit pipeline.
+
+Discovery leaves the updated model in memory; handing it straight to view
+generation avoids re-parsing the model file that discovery just wrote, and
+the set of changed PRs lets generation skip views nothing touched.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from improveit_dashboard.controllers.analytics import ModelSnapshot
+from improveit_dashboard.controllers.history import HistoryStore, history_path
+from improveit_dashboard.controllers.persistence import clear_dirty, load_dirty
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.git import create_commit
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.views.dashboard import generate_dashboard, generate_responsiveness_reports
+from improveit_dashboard.views.reports import generate_user_reports
+from improveit_dashboard.views.statistics import generate_statistics_report
+from improveit_dashboard.views.trends import generate_trends_report
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of an update pipeline run."""
+
+    run: DiscoveryRun
+    repositories: dict[str, Repository]
+    changed: set[str]  # "owner/repo#N" of PRs discovery fetched or updated
+    generated: list[Path] = field(default_factory=list)
+    commit_status: int | None = None  # create_commit result, None if not committed
+
+
+def changed_authors(repositories: dict[str, Repository], changed: set[str]) -> set[str]:
+    """Get the authors of changed PRs.
+
+    Args:
+        repositories: Dict mapping full_name to Repository
+        changed: PR keys ("owner/repo#N")
+
+    Returns:
+        Author logins
+    """
+    authors: set[str] = set()
+    for key in changed:
+        repo_name, _, number = key.rpartition("#")
+        repo = repositories.get(repo_name)
+        pr = repo.prs.get(int(number)) if repo else None
+        if pr is not None:
+            authors.add(pr.author)
+    return authors
+
+
+def generate_views(
+    config: Configuration,
+    repositories: dict[str, Repository],
+    changed: set[str] | None = None,
+) -> list[Path]:
+    """Generate all views from an in-memory model.
+
+    Behavior overrides from the configuration are applied to every view.
+
+    Args:
+        config: Configuration
+        repositories: Dict mapping full_name to Repository
+        changed: PRs that changed since the views were last generated; when
+            given, PRs left dirty by earlier saves (see mark_dirty) are
+            added, nothing is generated if there are none and only the
+            reports of their authors are regenerated (default: regenerate
+            everything)
+
+    Returns:
+        List of generated file paths
+    """
+    if changed is not None:
+        changed = changed | load_dirty(config.data_file)
+        if not changed:
+            logger.info("No PRs changed, views are up to date")
+            return []
+
+    behavior_overrides = config.behavior_overrides()
+    for repo_name, override in config.repository_overrides.items():
+        if override.note:
+            logger.info(f"Override {repo_name}: {override.category} ({override.note})")
+
+    generated: list[Path] = []
+
+    # Main dashboard
+    generate_dashboard(
+        repositories=repositories,
+        output_path=config.output_readme,
+        tracked_users=config.tracked_users,
+        behavior_overrides=behavior_overrides,
+    )
+    generated.append(config.output_readme)
+
+    # Per-user reports, only for users with changed PRs
+    users = config.tracked_users
+    if changed is not None:
+        authors = changed_authors(repositories, changed)
+        users = [user for user in users if user in authors]
+    generated.extend(
+        generate_user_reports(
+            repositories=repositories,
+            output_dir=config.output_readmes_dir,
+            tracked_users=users,
+        )
+    )
+
+    # Columnar snapshot shared by the aggregate reports
+    snapshot = ModelSnapshot.from_repositories(repositories)
+
+    generated.extend(
+        generate_responsiveness_reports(
+            repositories=repositories,
+            output_dir=config.output_summaries_dir,
+            behavior_overrides=behavior_overrides,
+            snapshot=snapshot,
+        )
+    )
+    generated.extend(
+        generate_statistics_report(
+            repositories=repositories,
+            output_dir=config.output_summaries_dir,
+            behavior_overrides=behavior_overrides,
+            snapshot=snapshot,
+        )
+    )
+
+    # Trends report (from the run history, not the model)
+    trends = generate_trends_report(
+        HistoryStore(history_path(config.data_file)), config.output_summaries_dir
+    )
+    if trends is not None:
+        generated.append(trends)
+
+    # Only now: PRs stay dirty if any view above failed
+    clear_dirty(config.data_file)
+    return generated
+
+
+def run_pipeline(
+    config: Configuration,
+    incremental: bool = True,
+    resume: bool = False,
+    generate: bool = True,
+    commit: bool = False,
+) -> PipelineResult:
+    """Run discovery, then generate views and commit, without reloading the model.
+
+    Args:
+        config: Configuration
+        incremental: If True, only fetch PRs updated since last run
+        resume: Continue the run recorded in the checkpoint, if any
+        generate: Regenerate the views affected by the run
+        commit: Create a git commit summarizing the run
+
+    Returns:
+        PipelineResult with the run, the model and what was generated
+    """
+    # Imported here so generating views alone does not load the GitHub client
+    from improveit_dashboard.controllers.discovery import discover
+
+    discovery = discover(config, incremental=incremental, resume=resume)
+    result = PipelineResult(
+        run=discovery.run,
+        repositories=discovery.repositories,
+        changed=discovery.changed,
+    )
+
+    if generate:
+        logger.info("Generating dashboard views...")
+        result.generated = generate_views(config, result.repositories, result.changed)
+
+    if commit:
+        logger.info("Creating git commit...")
+        result.commit_status = create_commit(result.run.to_commit_message())
+
+    return result
@@ -0,0 +1,316 @@
+"""Budget-aware planning of which PRs a discovery run refreshes.
+
+Every candidate PR gets an estimated API call cost and an expected
+information value. The planner then spends the rate limit headroom on the
+most valuable PRs per call:
+
+- Cost: details, comments (one page per 100, a single incremental page for
+  analyzed PRs), files, and for open/draft PRs 5 CI calls (head status,
+  check runs, mergeable state, base branch and its status). Revalidating a
+  frozen closed PR costs only details and comments, and an otherwise
+  unchanged active PR whose CI had not finished only the CI calls. PRs the
+  search payload shows unchanged or only changed state, and merged PRs in
+  normal mode, cost nothing and are always kept.
+- Value: new PRs are worth most (nothing is known about them). Open PRs
+  awaiting the submitter, recently active PRs (decaying with a one-week
+  half-life) and PRs with pending CI are likely to have changed; closed
+  PRs rarely do.
+
+PRs left out are deferred: discovery does not advance their authors'
+high-water marks, so the next run finds them again.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+
+from improveit_dashboard.controllers.persistence import load_model
+from improveit_dashboard.models.checkpoint import WorkItem, work_key
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+# How a candidate differs from the model (see discovery._search_change);
+# "skip" for merged PRs normal mode does not refetch
+Change = Literal["unchanged", "status", "ci", "revalidate", "full", "skip"]
+
+# API calls per part of a refresh (see discovery._process_pr)
+DETAILS_CALLS = 1
+FILES_CALLS = 1
+CI_CALLS = 5
+COMMENTS_PER_PAGE = 100
+
+# Expected information value of refreshing a PR
+NEW_VALUE = 4.0
+OPEN_VALUE = 1.0
+CLOSED_VALUE = 0.3
+MERGED_VALUE = 0.1
+AWAITING_SUBMITTER_VALUE = 3.0
+ACTIVITY_VALUE = 3.0  # For activity right now, halving every ACTIVITY_HALF_LIFE_DAYS
+ACTIVITY_HALF_LIFE_DAYS = 7.0
+PENDING_CI_VALUE = 2.0
+
+# Seconds per API call when no previous run measured it
+DEFAULT_SECONDS_PER_CALL = 0.5
+
+# Core API requests per token per hour
+HOURLY_LIMIT = 5000
+
+
+@dataclass
+class Candidate:
+    """A PR a run could refresh."""
+
+    item: WorkItem
+    pr: PullRequest | None  # As stored in the model (None if new)
+    change: Change = "full"
+
+
+@dataclass
+class PlannedRefresh:
+    """A candidate with its estimated cost and value."""
+
+    candidate: Candidate
+    calls: int
+    value: float
+    reasons: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """PR key ("owner/repo#N")."""
+        return work_key(self.candidate.item[0], self.candidate.item[1])
+
+
+@dataclass
+class RefreshPlan:
+    """PRs selected for refreshing within a budget, most valuable first."""
+
+    selected: list[PlannedRefresh]
+    deferred: list[PlannedRefresh]
+    budget: int
+    seconds_per_call: float
+
+    @property
+    def calls(self) -> int:
+        """Estimated API calls of the selected PRs."""
+        return sum(planned.calls for planned in self.selected)
+
+    @property
+    def duration(self) -> timedelta:
+        """Estimated duration of the selected refreshes."""
+        return timedelta(seconds=round(self.calls * self.seconds_per_call))
+
+    @property
+    def items(self) -> list[WorkItem]:
+        """Work items of the selected PRs, in processing order."""
+        return [planned.candidate.item for planned in self.selected]
+
+    def deferred_authors(self) -> set[str]:
+        """Lowercased logins of the authors of deferred PRs."""
+        authors = set()
+        for planned in self.deferred:
+            candidate = planned.candidate
+            login = candidate.item[2].get("user", {}).get("login")
+            if login is None and candidate.pr is not None:
+                login = candidate.pr.author
+            if login:
+                authors.add(login.lower())
+        return authors
+
+    def summary(self) -> str:
+        """One-line description of the plan."""
+        fetched = sum(1 for planned in self.selected if planned.calls)
+        text = (
+            f"Planned {fetched} PR refreshes (~{self.calls} API calls of {self.budget} "
+            f"available, ~{self.duration})"
+        )
+        if self.deferred:
+            deferred_calls = sum(planned.calls for planned in self.deferred)
+            text += f", deferred {len(self.deferred)} (~{deferred_calls} calls)"
+        return text
+
+    def render(self) -> str:
+        """Text table of the plan, for ``update --plan``."""
+        lines = [self.summary(), "", f"{'value':>6} {'calls':>5}  {'pr':<40} reasons"]
+        for planned in self.selected:
+            if planned.calls:
+                lines.append(_row(planned))
+        if self.deferred:
+            lines += ["", "Deferred:"]
+            lines += [_row(planned) for planned in self.deferred]
+        return "\n".join(lines)
+
+
+def _row(planned: PlannedRefresh) -> str:
+    """Format one planned refresh as a table row."""
+    return (
+        f"{planned.value:6.2f} {planned.calls:5d}  {planned.key:<40} {', '.join(planned.reasons)}"
+    )
+
+
+def estimate_calls(candidate: Candidate) -> int:
+    """Estimate the API calls refreshing a candidate costs.
+
+    Args:
+        candidate: Candidate PR
+
+    Returns:
+        Estimated number of API calls
+    """
+    if candidate.change == "ci":
+        return CI_CALLS
+    if candidate.change not in ("full", "revalidate"):
+        return 0
+    pr = candidate.pr
+    search_data = candidate.item[2]
+    comments = search_data.get("comments", pr.total_comments if pr else 0) or 0
+    if pr is not None and pr.engagement is not None:
+        comment_calls = 1  # Only comments since the last analysis
+    else:
+        comment_calls = max(1, math.ceil(comments / COMMENTS_PER_PAGE))
+    if candidate.change == "revalidate":
+        return DETAILS_CALLS + comment_calls
+    # The search state tells reopened PRs apart (they get CI fetched again)
+    status = search_data.get("state") or (pr.status if pr else "open")
+    ci_calls = CI_CALLS if status in ("open", "draft") else 0
+    return DETAILS_CALLS + comment_calls + FILES_CALLS + ci_calls
+
+
+def refresh_value(candidate: Candidate, now: datetime) -> tuple[float, list[str]]:
+    """Estimate how much refreshing a candidate is expected to tell us.
+
+    Args:
+        candidate: Candidate PR
+        now: Current time, for recency
+
+    Returns:
+        Tuple of (value, reasons contributing to it)
+    """
+    pr = candidate.pr
+    if pr is None:
+        return NEW_VALUE, ["new"]
+    if pr.status == "merged":
+        return MERGED_VALUE, ["merged"]
+    if pr.status == "closed":
+        return CLOSED_VALUE, ["closed"]
+
+    value = OPEN_VALUE
+    reasons: list[str] = [pr.status]
+    if pr.response_status == "awaiting_submitter":
+        value += AWAITING_SUBMITTER_VALUE
+        reasons.append("awaiting submitter")
+    last_active = max(pr.updated_at, pr.last_maintainer_comment_at or pr.updated_at)
+    idle_days = max(0.0, (now - last_active).total_seconds() / 86400)
+    recency = ACTIVITY_VALUE * 0.5 ** (idle_days / ACTIVITY_HALF_LIFE_DAYS)
+    value += recency
+    if recency >= ACTIVITY_VALUE / 4:
+        reasons.append(f"active {idle_days:.0f}d ago")
+    if pr.ci_status == "pending":
+        value += PENDING_CI_VALUE
+        reasons.append("CI pending")
+    return value, reasons
+
+
+def plan_refresh(
+    candidates: list[Candidate],
+    budget: int,
+    now: datetime,
+    max_prs: int | None = None,
+    seconds_per_call: float = DEFAULT_SECONDS_PER_CALL,
+) -> RefreshPlan:
+    """Choose the PRs to refresh within an API call budget.
+
+    Free candidates are always selected. The others are taken greedily by
+    value per call (skipping those that no longer fit) until the budget or
+    ``max_prs`` is used up.
+
+    Args:
+        candidates: PRs the run could refresh
+        budget: API calls available
+        now: Current time
+        max_prs: Maximum number of PRs to fetch, if limited
+        seconds_per_call: For the duration estimate
+
+    Returns:
+        Plan with selected PRs (new ones first, then by value) and deferred PRs
+    """
+    planned = []
+    for candidate in candidates:
+        value, reasons = refresh_value(candidate, now)
+        planned.append(PlannedRefresh(candidate, estimate_calls(candidate), value, reasons))
+
+    selected = [p for p in planned if p.calls == 0]
+    deferred = []
+    remaining = budget
+    fetched = 0
+    for p in sorted((p for p in planned if p.calls), key=lambda p: (-p.value / p.calls, -p.value)):
+        if p.calls <= remaining and (max_prs is None or fetched < max_prs):
+            selected.append(p)
+            remaining -= p.calls
+            fetched += 1
+        else:
+            deferred.append(p)
+
+    # New PRs, then the most valuable, so an interrupted run has done the most useful work
+    selected.sort(key=lambda p: (p.calls == 0, p.candidate.pr is not None, -p.value))
+    return RefreshPlan(selected, deferred, budget, seconds_per_call)
+
+
+def model_candidates(repositories: dict[str, Repository], force: bool = False) -> list[Candidate]:
+    """Treat every PR in the model as changed (for planning without a search).
+
+    Args:
+        repositories: Current model
+        force: Whether merged PRs are refetched too
+
+    Returns:
+        One candidate per PR
+    """
+    candidates = []
+    for repo in repositories.values():
+        for pr in repo.prs.values():
+            change: Change = "full"
+            if not force and pr.status == "merged":
+                change = "skip"
+            elif not force and pr.status == "closed" and pr.analysis_status == "analyzed":
+                change = "revalidate"  # Frozen
+            candidates.append(Candidate((repo.full_name, pr.number, {}), pr, change))
+    return candidates
+
+
+def seconds_per_call(last_run: DiscoveryRun | None) -> float:
+    """Get the seconds per API call measured by a completed run (or the default)."""
+    if last_run is None or last_run.completed_at is None or last_run.api_calls_made < 50:
+        return DEFAULT_SECONDS_PER_CALL
+    elapsed = (last_run.completed_at - last_run.started_at).total_seconds()
+    return elapsed / last_run.api_calls_made
+
+
+def offline_plan(config: Configuration, now: datetime | None = None) -> RefreshPlan:
+    """Plan a refresh of every PR in the model without network access.
+
+    Without a search, every PR is assumed to have changed, so this is the
+    plan for the worst case. The budget is the headroom the last run left,
+    or the full hourly limit of every configured token once an hour passed.
+
+    Args:
+        config: Configuration (data_file, tokens, force_mode, max_prs_per_run)
+        now: Current time (defaults to now)
+
+    Returns:
+        The plan
+    """
+    now = now or datetime.now(UTC)
+    repositories, last_run = load_model(config.data_file, cache=config.model_cache)
+    budget = HOURLY_LIMIT * max(1, len(config.get_all_tokens()))
+    if last_run and last_run.completed_at and now - last_run.completed_at < timedelta(hours=1):
+        budget = last_run.rate_limit_remaining
+    return plan_refresh(
+        model_candidates(repositories, config.force_mode),
+        max(0, budget - config.rate_limit_threshold),
+        now,
+        max_prs=config.max_prs_per_run,
+        seconds_per_call=seconds_per_call(last_run),
+    )
@@ -0,0 +1,486 @@
+"""Filter expressions over PRs and their repositories, with field indexes.
+
+A query is parsed and compiled once into a predicate::
+
+    status = open and tool = codespell and response_status = awaiting_maintainer
+        and idle_days > 30 and repo.behavior_category = welcoming
+
+Grammar (keywords are case-insensitive)::
+
+    expr       := term ("or" term)*
+    term       := factor ("and" factor)*
+    factor     := "not" factor | "(" expr ")" | comparison
+    comparison := field op value | field ["not"] "in" "(" value ("," value)* ")"
+    op         := "=" | "==" | "!=" | "<" | "<=" | ">" | ">=" | "~"
+
+Fields are PullRequest fields, ``repo.<field>`` for Repository fields, and
+the derived ``age_days`` (since creation) and ``idle_days`` (since the last
+update). Values are coerced to the field's type when the query is parsed:
+numbers, ``true``/``false``, ``null``, ISO dates for timestamps, and plain or
+quoted strings (checked against the allowed values of enumerated fields).
+``~`` is a case-insensitive substring match; on list fields such as
+``automation_types``, ``=`` tests membership.
+
+``ModelIndex`` maps values of frequently filtered fields (author, status,
+response_status, tool, repository, repo.behavior_category) to PR positions.
+``Query.select`` uses it for equality and ``in`` conditions instead of
+scanning every PR; the full predicate is still applied to the candidates
+unless the index answers every condition.
+"""
+
+import re
+import types
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fields with a value -> PRs index
+INDEXED_FIELDS = (
+    "author",
+    "status",
+    "response_status",
+    "tool",
+    "repository",
+    "repo.behavior_category",
+)
+
+# Derived fields: days since a timestamp
+DERIVED_FIELDS = {"age_days": "created_at", "idle_days": "updated_at"}
+
+Predicate = Callable[[PullRequest, Repository], bool]
+
+
+class QueryError(ValueError):
+    """Raised for invalid filter expressions."""
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """``field op value``; for "in"/"not in", value is a tuple."""
+
+    field: str
+    op: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class BoolOp:
+    """Conjunction or disjunction of conditions."""
+
+    op: Literal["and", "or"]
+    operands: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    """Negated condition."""
+
+    operand: "Node"
+
+
+Node = Comparison | BoolOp | Not
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """How to read and compare a queryable field."""
+
+    kind: Literal["str", "int", "float", "bool", "datetime", "list"]
+    choices: tuple[str, ...] = ()  # Allowed values of Literal fields
+
+
+def _field_spec(hint: Any) -> FieldSpec:
+    """Describe a dataclass field annotation."""
+    if get_origin(hint) in (Union, types.UnionType):
+        (hint,) = [arg for arg in get_args(hint) if arg is not type(None)]
+    if get_origin(hint) is Literal:
+        return FieldSpec("str", tuple(get_args(hint)))
+    if get_origin(hint) is list and get_args(hint) == (str,):
+        return FieldSpec("list")
+    kinds: dict[Any, Literal["str", "int", "float", "bool", "datetime"]] = {
+        str: "str",
+        int: "int",
+        float: "float",
+        bool: "bool",
+        datetime: "datetime",
+    }
+    if hint not in kinds:
+        raise TypeError(f"Unsupported field type: {hint}")
+    return FieldSpec(kinds[hint])
+
+
+def _queryable(cls: type, prefix: str = "") -> dict[str, FieldSpec]:
+    """Get the queryable (scalar or list) fields of a model dataclass."""
+    hints = get_type_hints(cls)
+    specs: dict[str, FieldSpec] = {}
+    for f in fields(cls):
+        try:
+            specs[prefix + f.name] = _field_spec(hints[f.name])
+        except (TypeError, ValueError):
+            continue  # Nested models (engagement, prs) are not queryable
+    return specs
+
+
+FIELDS: dict[str, FieldSpec] = {
+    **_queryable(PullRequest),
+    **_queryable(Repository, "repo."),
+    **{name: FieldSpec("float") for name in DERIVED_FIELDS},
+}
+
+# Tokens: parentheses, commas, operators, quoted strings, bare words
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<punct>[(),])
+        | (?P<op>==|!=|<=|>=|=|<|>|~)
+        | (?P<string>'[^']*'|"[^"]*")
+        | (?P<word>[^\s(),=!<>~'"]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _tokenize(text: str) -> list[tuple[str, str, int]]:
+    """Split an expression into (kind, text, position) tokens."""
+    tokens: list[tuple[str, str, int]] = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None or match.lastgroup is None:
+            raise QueryError(f"Unexpected character at {pos}: {text[pos : pos + 10]!r}")
+        kind = match.lastgroup
+        value, start = match.group(kind), match.start(kind)
+        if kind == "word" and value.lower() in ("and", "or", "not", "in"):
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value, start))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser producing a Node tree."""
+
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise QueryError("Empty filter expression")
+        node = self._expr()
+        if self.pos < len(self.tokens):
+            _, text, at = self.tokens[self.pos]
+            raise QueryError(f"Unexpected {text!r} at {at}")
+        return node
+
+    def _peek(self, kind: str, text: str | None = None) -> bool:
+        if self.pos >= len(self.tokens):
+            return False
+        token_kind, token_text, _ = self.tokens[self.pos]
+        return token_kind == kind and (text is None or token_text == text)
+
+    def _take(self, kind: str, text: str | None = None) -> str:
+        if not self._peek(kind, text):
+            found = repr(self.tokens[self.pos][1]) if self.pos < len(self.tokens) else "end"
+            expected = text or {"word": "a field or value", "op": "an operator"}.get(kind, kind)
+            raise QueryError(f"Expected {expected}, found {found}")
+        self.pos += 1
+        return self.tokens[self.pos - 1][1]
+
+    def _expr(self) -> Node:
+        operands = [self._term()]
+        while self._peek("keyword", "or"):
+            self.pos += 1
+            operands.append(self._term())
+        return operands[0] if len(operands) == 1 else BoolOp("or", tuple(operands))
+
+    def _term(self) -> Node:
+        operands = [self._factor()]
+        while self._peek("keyword", "and"):
+            self.pos += 1
+            operands.append(self._factor())
+        return operands[0] if len(operands) == 1 else BoolOp("and", tuple(operands))
+
+    def _factor(self) -> Node:
+        if self._peek("keyword", "not"):
+            self.pos += 1
+            return Not(self._factor())
+        if self._peek("punct", "("):
+            self.pos += 1
+            node = self._expr()
+            self._take("punct", ")")
+            return node
+        return self._comparison()
+
+    def _comparison(self) -> Node:
+        name = self._take("word")
+        if name not in FIELDS:
+            raise QueryError(f"Unknown field {name!r}. Available: {', '.join(FIELDS)}")
+        spec = FIELDS[name]
+
+        negated = False
+        if self._peek("keyword", "not"):
+            self.pos += 1
+            negated = True
+        if self._peek("keyword", "in"):
+            self.pos += 1
+            self._take("punct", "(")
+            values = [_coerce(name, spec, self._value())]
+            while self._peek("punct", ","):
+                self.pos += 1
+                values.append(_coerce(name, spec, self._value()))
+            self._take("punct", ")")
+            node: Node = Comparison(name, "in", tuple(values))
+            return Not(node) if negated else node
+        if negated:
+            raise QueryError(f"Expected 'in' after 'not' for field {name!r}")
+
+        op = self._take("op")
+        raw = self._value()
+        if op == "~":
+            if spec.kind not in ("str", "list"):
+                raise QueryError(f"'~' needs a text field, {name!r} is {spec.kind}")
+            return Comparison(name, op, (raw or "").lower())
+        if op in ("<", "<=", ">", ">=") and spec.kind in ("str", "bool", "list"):
+            raise QueryError(f"Cannot order {spec.kind} field {name!r}")
+        return Comparison(name, "=" if op == "==" else op, _coerce(name, spec, raw))
+
+    def _value(self) -> str | None:
+        if self._peek("string"):
+            return self._take("string")[1:-1]
+        word = self._take("word")
+        return None if word.lower() == "null" else word
+
+
+def _coerce(name: str, spec: FieldSpec, raw: str | None) -> Any:
+    """Convert a literal to the type of the field it is compared with."""
+    if raw is None:
+        return None
+    try:
+        if spec.kind in ("int", "float"):
+            number = float(raw)
+            return int(number) if spec.kind == "int" and number.is_integer() else number
+        if spec.kind == "bool":
+            if raw.lower() not in ("true", "false"):
+                raise ValueError(raw)
+            return raw.lower() == "true"
+        if spec.kind == "datetime":
+            parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    except ValueError as e:
+        raise QueryError(f"Invalid {spec.kind} value for {name!r}: {raw!r}") from e
+    if spec.choices and raw not in spec.choices:
+        raise QueryError(f"{name!r} must be one of: {', '.join(spec.choices)} (got {raw!r})")
+    return raw
+
+
+def _getter(
+    name: str, overrides: dict[str, str], now: datetime
+) -> Callable[[PullRequest, Repository], Any]:
+    """Build a function reading a field from a PR and its repository."""
+    if name in DERIVED_FIELDS:
+        source = DERIVED_FIELDS[name]
+        return lambda pr, repo: (now - getattr(pr, source)).total_seconds() / 86400
+    if name == "repo.behavior_category":
+        return lambda pr, repo: overrides.get(repo.full_name, repo.behavior_category)
+    if name.startswith("repo."):
+        attr = name.removeprefix("repo.")
+        return lambda pr, repo: getattr(repo, attr)
+    return lambda pr, repo: getattr(pr, name)
+
+
+_ORDERING: dict[str, Callable[[Any, Any], bool]] = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def _compile(node: Node, overrides: dict[str, str], now: datetime) -> Predicate:
+    """Compile a Node tree into a predicate."""
+    if isinstance(node, BoolOp):
+        parts = [_compile(operand, overrides, now) for operand in node.operands]
+        if node.op == "and":
+            return lambda pr, repo: all(part(pr, repo) for part in parts)
+        return lambda pr, repo: any(part(pr, repo) for part in parts)
+    if isinstance(node, Not):
+        inner = _compile(node.operand, overrides, now)
+        return lambda pr, repo: not inner(pr, repo)
+
+    get = _getter(node.field, overrides, now)
+    value = node.value
+    is_list = FIELDS[node.field].kind == "list"
+    if node.op == "~":
+        if is_list:
+            return lambda pr, repo: any(value in item.lower() for item in get(pr, repo))
+        return lambda pr, repo: value in (get(pr, repo) or "").lower()
+    if node.op == "in":
+        options = set(value)
+        if is_list:
+            return lambda pr, repo: not options.isdisjoint(get(pr, repo))
+        return lambda pr, repo: get(pr, repo) in options
+    if node.op in ("=", "!="):
+        negate = node.op == "!="
+        if is_list:
+            return lambda pr, repo: (value in get(pr, repo)) != negate
+        return lambda pr, repo: (get(pr, repo) == value) != negate
+    compare = _ORDERING[node.op]
+
+    def ordered(pr: PullRequest, repo: Repository) -> bool:
+        current = get(pr, repo)
+        return current is not None and value is not None and compare(current, value)
+
+    return ordered
+
+
+def combine(*expressions: str | None) -> str | None:
+    """AND together the given expressions, ignoring None (None if none given)."""
+    parts = [f"({expression})" for expression in expressions if expression]
+    return " and ".join(parts) or None
+
+
+class ModelIndex:
+    """PRs of a model in order, with value -> position indexes for INDEXED_FIELDS."""
+
+    def __init__(
+        self,
+        repositories: dict[str, Repository],
+        behavior_overrides: dict[str, str] | None = None,
+    ):
+        """Build indexes.
+
+        Args:
+            repositories: Dict mapping full_name to Repository
+            behavior_overrides: Repository full_name -> behavior category,
+                applied to ``repo.behavior_category`` (queries must use the same)
+        """
+        self.repositories = repositories
+        self.behavior_overrides = behavior_overrides or {}
+        self.prs: list[PullRequest] = []
+        self.positions: dict[str, dict[Any, list[int]]] = {name: {} for name in INDEXED_FIELDS}
+        getters = [
+            (self.positions[name], _getter(name, self.behavior_overrides, datetime.now(UTC)))
+            for name in INDEXED_FIELDS
+        ]
+        for repo in repositories.values():
+            for pr in repo.prs.values():
+                position = len(self.prs)
+                self.prs.append(pr)
+                for positions, get in getters:
+                    positions.setdefault(get(pr, repo), []).append(position)
+
+    def lookup(self, name: str, value: Any) -> list[int]:
+        """Get the positions of PRs whose indexed field has a value."""
+        return self.positions[name].get(value, [])
+
+    def values(self, name: str) -> dict[Any, int]:
+        """Count PRs per value of an indexed field."""
+        return {value: len(positions) for value, positions in self.positions[name].items()}
+
+
+def _candidates(node: Node, index: ModelIndex) -> list[int] | None:
+    """Get sorted PR positions that may match, or None if a full scan is needed."""
+    if isinstance(node, Comparison):
+        if node.field not in INDEXED_FIELDS:
+            return None
+        if node.op == "=":
+            return index.lookup(node.field, node.value)
+        if node.op == "in":
+            return sorted({p for value in node.value for p in index.lookup(node.field, value)})
+        return None
+    if isinstance(node, BoolOp):
+        found = [_candidates(operand, index) for operand in node.operands]
+        if node.op == "and":
+            # Any indexed conjunct bounds the result; intersect them all
+            bounded = sorted((positions for positions in found if positions is not None), key=len)
+            if len(bounded) < 2:
+                return bounded[0] if bounded else None
+            common = set(bounded[0]).intersection(*bounded[1:])
+            return [p for p in bounded[0] if p in common]
+        if any(positions is None for positions in found):
+            return None
+        return sorted({p for positions in found if positions is not None for p in positions})
+    return None
+
+
+def _exact(node: Node) -> bool:
+    """Check whether the index candidates of a node are exactly its matches."""
+    if isinstance(node, Comparison):
+        return node.field in INDEXED_FIELDS and node.op in ("=", "in")
+    if isinstance(node, BoolOp):
+        return all(_exact(operand) for operand in node.operands)
+    return False
+
+
+class Query:
+    """A parsed and compiled filter expression."""
+
+    def __init__(
+        self,
+        text: str,
+        behavior_overrides: dict[str, str] | None = None,
+        now: datetime | None = None,
+    ):
+        """Parse and compile an expression.
+
+        Args:
+            text: Filter expression (see module docstring)
+            behavior_overrides: Repository full_name -> behavior category,
+                applied to ``repo.behavior_category``
+            now: Reference time for derived day counts (default: now)
+
+        Raises:
+            QueryError: If the expression is invalid
+        """
+        self.text = text
+        self.behavior_overrides = behavior_overrides or {}
+        self.node = _Parser(text).parse()
+        self.predicate = _compile(self.node, self.behavior_overrides, now or datetime.now(UTC))
+
+    def matches(self, pr: PullRequest, repo: Repository) -> bool:
+        """Check whether a PR (of the given repository) matches."""
+        return self.predicate(pr, repo)
+
+    def select(
+        self,
+        repositories: dict[str, Repository],
+        index: ModelIndex | None = None,
+    ) -> Iterator[PullRequest]:
+        """Iterate over matching PRs in model order.
+
+        Args:
+            repositories: Dict mapping full_name to Repository
+            index: Indexes of ``repositories``; without one (or if it was built
+                with other behavior overrides), every PR is scanned
+
+        Yields:
+            Matching PRs
+        """
+        if index is not None and index.behavior_overrides != self.behavior_overrides:
+            index = None
+        positions = _candidates(self.node, index) if index is not None else None
+        if index is None or positions is None:
+            for repo in repositories.values():
+                for pr in repo.prs.values():
+                    if self.predicate(pr, repo):
+                        yield pr
+            return
+
+        if _exact(self.node):
+            for position in positions:
+                yield index.prs[position]
+            return
+
+        logger.debug(f"Query uses index: {len(positions)} of {len(index.prs)} PRs to check")
+        for position in positions:
+            pr = index.prs[position]
+            if self.predicate(pr, repositories[pr.repository]):
+                yield pr
@@ -0,0 +1,203 @@
+"""Bulk offline reanalysis of PRs from archived payloads.
+
+Classification and engagement analysis are pure functions of a PR and its
+raw payloads, so they run in a process pool: each worker reads the archived
+objects it needs, recomputes the derived fields and returns the updated PR,
+which is merged back into the model in the parent process.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from improveit_dashboard.controllers.analyzer import (
+    analyze_engagement,
+    classify_comments,
+    detect_automation_types,
+    determine_adoption_level,
+)
+from improveit_dashboard.controllers.archive import PayloadArchive, PayloadKind, load_object
+from improveit_dashboard.controllers.github_client import summarize_checks
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.matching import BotMatcher
+
+logger = get_logger(__name__)
+
+PAYLOAD_KINDS: tuple[PayloadKind, ...] = ("comments", "files", "checks")
+
+# Below this many PRs a process pool costs more than it saves
+MIN_PARALLEL_PRS = 200
+
+
+@dataclass
+class PRSelector:
+    """Selects PRs from the model; empty criteria match everything.
+
+    Criteria of different kinds are combined with AND, values within one
+    kind with OR.
+    """
+
+    prs: set[str] = field(default_factory=set)  # "owner/repo#123"
+    repositories: set[str] = field(default_factory=set)
+    authors: set[str] = field(default_factory=set)
+    statuses: set[str] = field(default_factory=set)
+    analysis_statuses: set[str] = field(default_factory=set)
+
+    def matches(self, pr: PullRequest) -> bool:
+        """Check whether a PR is selected."""
+        if self.prs and work_key(pr.repository, pr.number) not in self.prs:
+            return False
+        if self.repositories and pr.repository not in self.repositories:
+            return False
+        if self.authors and pr.author.lower() not in {a.lower() for a in self.authors}:
+            return False
+        if self.statuses and pr.status not in self.statuses:
+            return False
+        return not self.analysis_statuses or pr.analysis_status in self.analysis_statuses
+
+
+@dataclass
+class ReanalysisResult:
+    """Outcome of a bulk reanalysis."""
+
+    selected: int = 0
+    reanalyzed: int = 0
+    missing: int = 0  # Selected PRs without archived payloads
+
+
+def select_prs(repositories: dict[str, Repository], selector: PRSelector) -> list[PullRequest]:
+    """Get the PRs matching a selector, in model order."""
+    return [
+        pr for repo in repositories.values() for pr in repo.prs.values() if selector.matches(pr)
+    ]
+
+
+def apply_payloads(
+    pr: PullRequest,
+    payloads: dict[PayloadKind, Any],
+    matcher: BotMatcher | None = None,
+) -> PullRequest:
+    """Recompute a PR's derived fields from raw payloads.
+
+    Updates engagement metrics (comments), automation types and adoption
+    level (files), and CI status (checks), for whichever payloads are given.
+
+    Args:
+        pr: PullRequest to update in place
+        payloads: Payloads by kind ("comments", "files", "checks")
+        matcher: Bot detection rules (default: built-in patterns)
+
+    Returns:
+        The updated PR
+    """
+    if (comments_data := payloads.get("comments")) is not None:
+        analyze_engagement(classify_comments(comments_data, pr.author, matcher), pr)
+        pr.analysis_status = "analyzed"
+
+    if (files_data := payloads.get("files")) is not None:
+        pr.automation_types = detect_automation_types(files_data)
+        pr.adoption_level = determine_adoption_level(pr.automation_types, pr.status)
+
+    if (checks := payloads.get("checks")) is not None:
+        summary = summarize_checks(checks.get("status_state"), checks.get("check_runs", []))
+        pr.ci_status = summary["ci_status"]
+        pr.codespell_workflow_ci = summary["codespell_workflow_ci"]
+
+    return pr
+
+
+def _reanalyze_task(
+    task: tuple[PullRequest, dict[PayloadKind, Path]], matcher: BotMatcher | None = None
+) -> PullRequest:
+    """Worker: load a PR's archived objects and reanalyze it."""
+    pr, paths = task
+    payloads: dict[PayloadKind, Any] = {}
+    for kind, path in paths.items():
+        try:
+            payloads[kind] = load_object(path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read archived {kind} for {pr.repository}#{pr.number}: {e}")
+    return apply_payloads(pr, payloads, matcher)
+
+
+def reanalyze_bulk(
+    repositories: dict[str, Repository],
+    archive: PayloadArchive,
+    selector: PRSelector,
+    jobs: int | None = None,
+    matcher: BotMatcher | None = None,
+) -> ReanalysisResult:
+    """Reanalyze selected PRs from archived payloads using a process pool.
+
+    Results are merged back into ``repositories`` and the metrics of every
+    touched repository are recalculated; saving is left to the caller.
+
+    Args:
+        repositories: Model to update in place
+        archive: Payload archive
+        selector: Which PRs to reanalyze
+        jobs: Worker processes (default: CPU count; 1 runs in-process)
+        matcher: Bot detection rules (default: built-in patterns)
+
+    Returns:
+        ReanalysisResult with counts
+    """
+    result = ReanalysisResult()
+    tasks: list[tuple[PullRequest, dict[PayloadKind, Path]]] = []
+    for pr in select_prs(repositories, selector):
+        result.selected += 1
+        paths = {
+            kind: path
+            for kind in PAYLOAD_KINDS
+            if (path := archive.object_path(pr.repository, pr.number, kind)) is not None
+        }
+        if paths:
+            tasks.append((pr, paths))
+        else:
+            result.missing += 1
+
+    jobs = jobs or _available_cpus()
+    logger.info(f"Reanalyzing {len(tasks)} PRs from {archive.root} with {jobs} worker(s)")
+
+    task = partial(_reanalyze_task, matcher=matcher)
+    updated: Iterable[PullRequest]
+    if jobs == 1 or len(tasks) < MIN_PARALLEL_PRS:
+        updated = map(task, tasks)
+        result.reanalyzed = _merge(repositories, updated)
+    else:
+        # Large chunks keep pickling overhead low; several per worker balance load
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            updated = pool.map(task, tasks, chunksize=chunksize)
+            result.reanalyzed = _merge(repositories, updated)
+
+    return result
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may use (respects affinity/container limits)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _merge(repositories: dict[str, Repository], updated: Iterable[PullRequest]) -> int:
+    """Put reanalyzed PRs back into the model and refresh repository metrics."""
+    touched: set[str] = set()
+    count = 0
+    for pr in updated:
+        repositories[pr.repository].prs[pr.number] = pr
+        touched.add(pr.repository)
+        count += 1
+
+    for repo_name in touched:
+        repositories[repo_name].recalculate_metrics()
+    return count
@@ -0,0 +1,338 @@
+"""Read-only JSON HTTP server over the model.
+
+The model is loaded once and indexed (see ``controllers.query.ModelIndex``),
+so queries are answered from memory instead of re-parsing the model file.
+A background thread reloads the model when the model file changes; requests
+keep using the previous model until the new one is fully loaded.
+
+Endpoints (GET, JSON responses)::
+
+    /prs?q=EXPR&author=&status=&tool=&repository=&category=&fields=&limit=&offset=
+    /inbox?author=&fields=           # Open PRs awaiting the submitter, oldest first
+    /repos?category=&min_prs=        # Per-repository statistics
+    /repos/<owner>/<name>            # Statistics and PRs of one repository
+    /status                          # Model file, load time and counts
+
+``q`` is a filter expression; the other /prs parameters are shortcuts for
+equality conditions and are ANDed with it. Invalid parameters get a 400
+response with an ``error`` message.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from improveit_dashboard.controllers.persistence import load_model
+from improveit_dashboard.controllers.query import ModelIndex, Query, combine
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.views.export import FILTER_PRESETS, parse_fields, pr_row
+
+logger = get_logger(__name__)
+
+# /prs shortcut parameter -> query field
+PR_PARAMETERS = {
+    "author": "author",
+    "status": "status",
+    "tool": "tool",
+    "repository": "repository",
+    "category": "repo.behavior_category",
+}
+
+# PRs returned by /prs unless limit is given
+DEFAULT_LIMIT = 100
+
+INBOX_QUERY = combine(FILTER_PRESETS["open"], FILTER_PRESETS["needs-response"])
+
+Response = tuple[int, dict[str, Any]]
+
+
+def model_signature(path: Path) -> tuple[int, int] | None:
+    """Identify the current version of a model file (None if missing)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def repository_stats(repo: Repository, category: str) -> dict[str, Any]:
+    """Summarize a repository for JSON responses.
+
+    Args:
+        repo: Repository
+        category: Behavior category, with overrides applied
+
+    Returns:
+        Repository identity, PR counts by status and research metrics
+    """
+    counts = dict.fromkeys(("draft", "open", "merged", "closed"), 0)
+    for pr in repo.prs.values():
+        counts[pr.status] += 1
+    return {
+        "repository": repo.full_name,
+        "url": repo.url,
+        "accessible": repo.accessible,
+        "behavior_category": category,
+        "total_prs": repo.total_prs,
+        **counts,
+        "pr_acceptance_rate": repo.pr_acceptance_rate,
+        "avg_time_to_first_response_hours": repo.avg_time_to_first_response_hours,
+        "avg_engagement_level": repo.avg_engagement_level,
+        "last_checked_at": repo.last_checked_at.isoformat() if repo.last_checked_at else None,
+    }
+
+
+@dataclass
+class ModelState:
+    """A loaded model with the indexes and summaries that queries use."""
+
+    repositories: dict[str, Repository]
+    index: ModelIndex
+    repository_stats: dict[str, dict[str, Any]]
+    signature: tuple[int, int] | None
+    loaded_at: datetime
+
+    @classmethod
+    def load(cls, config: Configuration) -> "ModelState":
+        """Load and index the configured model file."""
+        signature = model_signature(config.data_file)
+        repositories, _ = load_model(config.data_file, cache=config.model_cache)
+        overrides = config.behavior_overrides()
+        return cls(
+            repositories=repositories,
+            index=ModelIndex(repositories, overrides),
+            repository_stats={
+                name: repository_stats(repo, overrides.get(name, repo.behavior_category))
+                for name, repo in repositories.items()
+            },
+            signature=signature,
+            loaded_at=datetime.now(UTC),
+        )
+
+
+def _param(params: dict[str, list[str]], name: str) -> str | None:
+    """Get the last value of a query string parameter."""
+    values = params.get(name)
+    return values[-1] if values else None
+
+
+def _int_param(params: dict[str, list[str]], name: str, default: int) -> int:
+    """Get a non-negative integer query string parameter."""
+    raw = _param(params, name)
+    if raw is None:
+        return default
+    if not raw.isdigit():
+        raise ValueError(f"{name} must be a non-negative integer, got {raw!r}")
+    return int(raw)
+
+
+def _quote(value: str) -> str:
+    """Quote a parameter value as a filter expression string."""
+    for quote in ("'", '"'):
+        if quote not in value:
+            return f"{quote}{value}{quote}"
+    raise ValueError(f"Value contains both quote characters: {value!r}")
+
+
+class ModelServer:
+    """Answers JSON queries over the model, reloading it when the file changes."""
+
+    def __init__(self, config: Configuration, poll_interval: float = 2.0):
+        """Load the model.
+
+        Args:
+            config: Configuration (data_file, model_cache, repository overrides)
+            poll_interval: Seconds between checks of the model file for changes
+        """
+        self.config = config
+        self.poll_interval = poll_interval
+        self.state = ModelState.load(config)
+        self._stop = threading.Event()
+        self._routes: dict[str, Callable[[ModelState, dict[str, list[str]]], Response]] = {
+            "/prs": self._prs,
+            "/inbox": self._inbox,
+            "/repos": self._repos,
+            "/status": self._status,
+        }
+        logger.info(f"Loaded {len(self.state.index.prs)} PRs from {config.data_file}")
+
+    def reload_if_changed(self) -> bool:
+        """Reload the model if its file changed since it was loaded.
+
+        Returns:
+            True if the model was reloaded
+        """
+        if model_signature(self.config.data_file) == self.state.signature:
+            return False
+        state = ModelState.load(self.config)
+        # Swapping the reference is atomic; in-flight requests keep the old state
+        self.state = state
+        logger.info(f"Reloaded model: {len(state.index.prs)} PRs")
+        return True
+
+    def handle(self, target: str) -> Response:
+        """Answer a GET request.
+
+        Args:
+            target: Request path with query string, e.g. "/prs?status=open"
+
+        Returns:
+            HTTP status and JSON body
+        """
+        url = urlsplit(target)
+        params = parse_qs(url.query)
+        path = url.path.rstrip("/") or "/"
+        state = self.state
+        try:
+            if path.startswith("/repos/"):
+                return self._repository(state, path.removeprefix("/repos/"), params)
+            route = self._routes.get(path)
+            if route is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {path}"}
+            return route(state, params)
+        except ValueError as e:  # Includes QueryError for invalid expressions
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Serve HTTP requests until interrupted.
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 for any free port)
+        """
+        httpd = self.make_http_server(host, port)
+        watcher = threading.Thread(target=self.watch, name="model-watcher", daemon=True)
+        watcher.start()
+        logger.info(f"Serving on http://{host}:{httpd.server_address[1]}/")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
+        finally:
+            self._stop.set()
+            httpd.server_close()
+
+    def make_http_server(self, host: str, port: int) -> ThreadingHTTPServer:
+        """Create a threaded HTTP server dispatching to this model server."""
+        app = self
+
+        class Handler(_QueryHandler):
+            server_app = app
+
+        return ThreadingHTTPServer((host, port), Handler)
+
+    def watch(self) -> None:
+        """Check the model file for changes every poll_interval until stopped."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                logger.error(f"Reload failed, keeping the loaded model: {e}")
+
+    def stop(self) -> None:
+        """Stop watching for model changes."""
+        self._stop.set()
+
+    def _select(self, state: ModelState, expression: str | None) -> list[PullRequest]:
+        """Get the PRs matching an expression (all PRs if None)."""
+        if expression is None:
+            return state.index.prs
+        query = Query(expression, state.index.behavior_overrides)
+        return list(query.select(state.repositories, state.index))
+
+    def _prs(self, state: ModelState, params: dict[str, list[str]]) -> Response:
+        """List PRs matching a filter expression and shortcut parameters."""
+        conditions = [
+            f"{field} = {_quote(value)}"
+            for name, field in PR_PARAMETERS.items()
+            if (value := _param(params, name)) is not None
+        ]
+        expression = combine(_param(params, "q"), *conditions)
+        fields = parse_fields(spec) if (spec := _param(params, "fields")) else None
+        limit = _int_param(params, "limit", DEFAULT_LIMIT)
+        offset = _int_param(params, "offset", 0)
+
+        prs = self._select(state, expression)
+        return HTTPStatus.OK, {
+            "total": len(prs),
+            "offset": offset,
+            "prs": [pr_row(pr, fields) for pr in prs[offset : offset + limit]],
+        }
+
+    def _inbox(self, state: ModelState, params: dict[str, list[str]]) -> Response:
+        """List open PRs awaiting the submitter, longest waiting first."""
+        author = _param(params, "author")
+        expression = combine(INBOX_QUERY, f"author = {_quote(author)}" if author else None)
+        fields = parse_fields(spec) if (spec := _param(params, "fields")) else None
+
+        prs = sorted(
+            self._select(state, expression),
+            key=lambda pr: pr.last_maintainer_comment_at or pr.updated_at,
+        )
+        return HTTPStatus.OK, {"total": len(prs), "prs": [pr_row(pr, fields) for pr in prs]}
+
+    def _repos(self, state: ModelState, params: dict[str, list[str]]) -> Response:
+        """List repository statistics."""
+        category = _param(params, "category")
+        min_prs = _int_param(params, "min_prs", 0)
+        repositories = [
+            stats
+            for stats in state.repository_stats.values()
+            if (category is None or stats["behavior_category"] == category)
+            and stats["total_prs"] >= min_prs
+        ]
+        return HTTPStatus.OK, {"total": len(repositories), "repositories": repositories}
+
+    def _repository(self, state: ModelState, name: str, params: dict[str, list[str]]) -> Response:
+        """Get the statistics and PRs of one repository."""
+        stats = state.repository_stats.get(name)
+        if stats is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown repository: {name}"}
+        fields = parse_fields(spec) if (spec := _param(params, "fields")) else None
+        prs = state.repositories[name].prs.values()
+        return HTTPStatus.OK, {**stats, "prs": [pr_row(pr, fields) for pr in prs]}
+
+    def _status(self, state: ModelState, params: dict[str, list[str]]) -> Response:
+        """Describe the loaded model."""
+        return HTTPStatus.OK, {
+            "data_file": str(self.config.data_file),
+            "loaded_at": state.loaded_at.isoformat(),
+            "repositories": len(state.repositories),
+            "prs": len(state.index.prs),
+            "statuses": state.index.values("status"),
+        }
+
+
+class JSONRequestHandler(BaseHTTPRequestHandler):
+    """Request handler writing JSON responses and logging through our logger."""
+
+    def send_json(self, status: int, body: dict[str, Any]) -> None:
+        """Send a JSON response."""
+        data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _QueryHandler(JSONRequestHandler):
+    """Answers GET requests with ModelServer responses."""
+
+    server_app: ModelServer
+
+    def do_GET(self) -> None:
+        self.send_json(*self.server_app.handle(self.path))
@@ -0,0 +1,448 @@
+"""Long-running watch daemon polling each PR on its own cadence.
+
+``update`` is a one-shot pass treating every non-merged PR alike. ``watch``
+keeps the model in memory instead and re-checks each PR when it is due:
+
+- Open and draft PRs are polled after a fraction (1/IDLE_RATIO) of their
+  idle time, i.e. the time since their last update, maintainer comment or
+  change seen by the daemon, bounded by ``watch_hot_interval`` (a PR
+  touched in the last couple of hours is polled every few minutes) and
+  ``watch_stale_interval`` (idle for weeks: daily).
+- Closed PRs are frozen and polled every ``closed_revalidate_days``
+  (weekly), in case they are reopened; such a poll only revalidates their
+  details and comments. Merged PRs are final and not polled, as in ``update``.
+
+A poll is a conditional request for the PR details (see
+``discovery.process_pr``): unchanged PRs are answered 304 Not Modified,
+which does not count against the rate limit, and only changed PRs get
+their comments, files and checks fetched. Finishing CI runs do not change
+the PR, so an unchanged open PR whose CI had not finished still costs the
+CI calls (see ``planner.CI_CALLS``) until it does. New PRs (and updates to PRs not
+due yet) are found with the incremental search every
+``watch_search_interval``, as ``update`` would find them.
+
+Every ``watch_checkpoint_interval`` the model is saved (with the daemon's
+high-water marks, so a later ``update`` stays incremental), history is
+recorded and the views of changed PRs are regenerated. The schedule (when
+each PR was last polled and last changed) is kept beside the model in
+``<data_file stem>.watch.json`` so a restarted daemon does not poll
+everything again.
+"""
+
+import heapq
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from improveit_dashboard.controllers.archive import PayloadArchive, archive_path
+from improveit_dashboard.controllers.changes import ChangeFeed, changes_path, feed_file
+from improveit_dashboard.controllers.discovery import (
+    ProcessOutcome,
+    parse_datetime,
+    process_pr,
+    search_updates,
+)
+from improveit_dashboard.controllers.github_client import GitHubClient
+from improveit_dashboard.controllers.history import HistoryStore, history_path
+from improveit_dashboard.controllers.persistence import (
+    load_model,
+    mark_dirty,
+    save_model,
+    write_json_atomic,
+)
+from improveit_dashboard.controllers.pipeline import generate_views
+from improveit_dashboard.controllers.server import model_signature
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.rate_limit import RateLimitError
+
+logger = get_logger(__name__)
+
+# An open PR idle for a day is polled hourly, one idle for an hour every 2.5 minutes
+IDLE_RATIO = 24
+
+# Longest sleep between checks for due work (keeps shutdown and reloads responsive)
+MAX_SLEEP = 60.0
+
+
+def watch_state_path(data_file: Path) -> Path:
+    """Get the watch schedule file path stored beside the model file."""
+    return data_file.with_name(f"{data_file.stem}.watch.json")
+
+
+def parse_key(key: str) -> tuple[str, int]:
+    """Split a PR key ("owner/repo#123") into repository name and number."""
+    repo_name, _, number = key.rpartition("#")
+    return repo_name, int(number)
+
+
+@dataclass
+class PollPolicy:
+    """Decides how often a PR is polled (intervals in seconds)."""
+
+    hot: float = 300.0
+    stale: float = 86400.0
+    closed: float = 604800.0
+
+    @classmethod
+    def from_config(cls, config: Configuration) -> "PollPolicy":
+        """Create the policy from the watch_* intervals of a configuration."""
+        return cls(
+            hot=config.watch_hot_interval,
+            stale=config.watch_stale_interval,
+            closed=config.closed_revalidate_days * 86400.0,
+        )
+
+    def interval(
+        self, pr: PullRequest, now: datetime, changed_at: datetime | None = None
+    ) -> float | None:
+        """Get the time from one poll of a PR to the next.
+
+        Args:
+            pr: Pull request
+            now: Current time
+            changed_at: When the daemon last saw the PR change, if ever
+
+        Returns:
+            Seconds between polls, or None if the PR is not polled (merged)
+        """
+        if pr.status == "merged":
+            return None
+        if pr.status == "closed":
+            return self.closed
+        activity = [pr.updated_at, pr.last_maintainer_comment_at, changed_at]
+        last_active = max(at for at in activity if at is not None)
+        idle = (now - last_active).total_seconds()
+        return min(self.stale, max(self.hot, idle / IDLE_RATIO))
+
+
+@dataclass
+class WatchState:
+    """Schedule state of the watch daemon, persisted between restarts."""
+
+    # PR key -> when it was last polled / last seen changing
+    polled_at: dict[str, datetime] = field(default_factory=dict)
+    changed_at: dict[str, datetime] = field(default_factory=dict)
+    searched_at: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict."""
+        return {
+            "polled_at": {key: at.isoformat() for key, at in self.polled_at.items()},
+            "changed_at": {key: at.isoformat() for key, at in self.changed_at.items()},
+            "searched_at": self.searched_at.isoformat() if self.searched_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WatchState":
+        """Deserialize from dict."""
+        return cls(
+            polled_at={k: datetime.fromisoformat(v) for k, v in data["polled_at"].items()},
+            changed_at={k: datetime.fromisoformat(v) for k, v in data["changed_at"].items()},
+            searched_at=parse_datetime(data.get("searched_at")),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "WatchState":
+        """Load the state from path (empty if missing or unreadable)."""
+        if not path.exists():
+            return cls()
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to parse watch state {path}, starting afresh: {e}")
+            return cls()
+
+
+class WatchDaemon:
+    """Keeps the model in memory, polling PRs when due and saving periodically."""
+
+    def __init__(
+        self,
+        config: Configuration,
+        client: GitHubClient | None = None,
+        generate: bool = True,
+        now: datetime | None = None,
+    ):
+        """Load the model and schedule its PRs.
+
+        Args:
+            config: Configuration (tracked users, watch_* intervals, data_file, ...)
+            client: GitHub client (created from config if None)
+            generate: Regenerate the views of changed PRs at checkpoints
+            now: Start time (defaults to the current time)
+        """
+        now = now or datetime.now(UTC)
+        self.config = config
+        self.client = client or GitHubClient.from_config(config)
+        self.generate = generate
+        self.policy = PollPolicy.from_config(config)
+        self.state_path = watch_state_path(config.data_file)
+        self.state = WatchState.load(self.state_path)
+        self.feed = (
+            ChangeFeed(feed_file(changes_path(config.data_file), now))
+            if config.change_feed
+            else None
+        )
+        self.run = DiscoveryRun(started_at=now, mode="force" if config.force_mode else "normal")
+        self.pending: set[str] = set()  # Keys of PRs changed since the last checkpoint
+        self.checkpointed_at = now
+        self.paused_until: datetime | None = None  # Rate limit reset we are waiting for
+        self._stop = threading.Event()
+        self._load(now)
+
+    def _load(self, now: datetime) -> None:
+        """(Re)load the model and archive, and schedule every PR."""
+        self.signature = model_signature(self.config.data_file)
+        self.repositories, last_run = load_model(
+            self.config.data_file, cache=self.config.model_cache
+        )
+        if last_run is not None:
+            # Searches continue from the marks of whoever saved the model last
+            self.run.user_high_water_marks = dict(last_run.user_high_water_marks)
+        self.archive = (
+            PayloadArchive(archive_path(self.config.data_file))
+            if self.config.archive_payloads
+            else None
+        )
+        self._queue: list[tuple[datetime, str]] = []
+        self._due: dict[str, datetime] = {}
+        for repo in self.repositories.values():
+            for pr in repo.prs.values():
+                self._schedule(work_key(repo.full_name, pr.number), now, pr)
+
+    def _schedule(
+        self,
+        key: str,
+        now: datetime,
+        pr: PullRequest | None = None,
+        due: datetime | None = None,
+    ) -> None:
+        """Queue the next poll of a PR (by default one interval after its last poll)."""
+        if due is None:
+            assert pr is not None
+            interval = self.policy.interval(pr, now, self.state.changed_at.get(key))
+            if interval is None:
+                self._due.pop(key, None)
+                return
+            last_polled = self.state.polled_at.get(key) or pr.last_fetched_at or pr.updated_at
+            due = last_polled + timedelta(seconds=interval)
+        self._due[key] = due
+        heapq.heappush(self._queue, (due, key))
+
+    def next_due(self) -> datetime | None:
+        """Get when the next PR poll is due (None if nothing is scheduled)."""
+        while self._queue and self._due.get(self._queue[0][1]) != self._queue[0][0]:
+            heapq.heappop(self._queue)  # Superseded by a later _schedule
+        return self._queue[0][0] if self._queue else None
+
+    def tick(self, now: datetime) -> int:
+        """Do the work due at a point in time: search, polls and checkpoint.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of PRs that changed (new or updated)
+        """
+        self._reload_if_changed(now)
+        if self.paused_until is not None and now < self.paused_until:
+            return 0
+        self.paused_until = None
+
+        fetched = 0
+        interval = timedelta(seconds=self.config.watch_search_interval)
+        try:
+            if self.state.searched_at is None or now - self.state.searched_at >= interval:
+                fetched += self.search(now)
+            while (due := self.next_due()) is not None and due <= now:
+                _, key = heapq.heappop(self._queue)
+                del self._due[key]
+                fetched += self.poll(key, now)
+        except RateLimitError as e:
+            self.paused_until = datetime.fromtimestamp(e.reset_timestamp, UTC)
+            logger.warning(f"{e}; pausing until {self.paused_until.isoformat()}")
+
+        checkpoint_interval = timedelta(seconds=self.config.watch_checkpoint_interval)
+        if self.pending and now - self.checkpointed_at >= checkpoint_interval:
+            self.checkpoint(now)
+        return fetched
+
+    def search(self, now: datetime) -> int:
+        """Fetch the PRs found by an incremental search.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of PRs that changed (new or updated)
+        """
+        items = search_updates(self.client, self.config, self.repositories, self.run)
+        self.state.searched_at = now
+        fetched = 0
+        for repo_name, pr_number, search_data in items:
+            key = work_key(repo_name, pr_number)
+            existing = self._find(key)
+            if existing and existing.status == "merged" and not self.config.force_mode:
+                continue
+            fetched += self._fetch(key, now, search_data)
+        return fetched
+
+    def poll(self, key: str, now: datetime) -> int:
+        """Re-check a PR with a conditional request and schedule its next poll.
+
+        Args:
+            key: PR key ("owner/repo#N")
+            now: Current time
+
+        Returns:
+            1 if the PR changed, else 0
+        """
+        return self._fetch(key, now, None)
+
+    def checkpoint(self, now: datetime) -> list[Path]:
+        """Save the model, history and schedule, and regenerate changed views.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Generated file paths
+        """
+        self.checkpointed_at = now
+        if self._reload_if_changed(now):
+            return []
+        self.run.completed_at = now
+        self.run.api_calls_made = self.client.api_calls
+        self.run.api_retries = self.client.retry_policy.retries_used
+        self.run.rate_limit_remaining = self.client.token_pool.total_remaining()
+        save_model(self.config.data_file, self.repositories, self.run)
+        mark_dirty(self.config.data_file, self.pending)
+        self.signature = model_signature(self.config.data_file)
+        write_json_atomic(self.state_path, self.state.to_dict())
+        if self.archive is not None:
+            self.archive.flush()
+        if self.config.record_history:
+            HistoryStore(history_path(self.config.data_file)).record(
+                self.repositories, now, source="watch"
+            )
+        changed, self.pending = self.pending, set()
+        self.run.errors = []  # Saved errors cover the time since the previous checkpoint
+        logger.info(
+            f"Checkpoint: {len(changed)} PRs changed, {self.client.api_calls} API calls so far"
+        )
+        return generate_views(self.config, self.repositories, changed) if self.generate else []
+
+    def run_forever(self) -> None:
+        """Work until stopped or interrupted, then save pending changes."""
+        logger.info(f"Watching {len(self._due)} PRs of {len(self.config.tracked_users)} users")
+        try:
+            while not self._stop.is_set():
+                now = datetime.now(UTC)
+                self.tick(now)
+                self._stop.wait(self.sleep_time(datetime.now(UTC)))
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
+        finally:
+            if self.pending:
+                self.checkpoint(datetime.now(UTC))
+            else:
+                write_json_atomic(self.state_path, self.state.to_dict())
+            if self.feed is not None:
+                self.feed.close()
+
+    def sleep_time(self, now: datetime) -> float:
+        """Get the seconds until the next search, poll or checkpoint is due."""
+        times = [
+            self.state.searched_at + timedelta(seconds=self.config.watch_search_interval)
+            if self.state.searched_at
+            else now
+        ]
+        if (due := self.next_due()) is not None:
+            times.append(due)
+        if self.pending:
+            times.append(
+                self.checkpointed_at + timedelta(seconds=self.config.watch_checkpoint_interval)
+            )
+        wake = max(min(times), self.paused_until or now)
+        return min(MAX_SLEEP, max(1.0, (wake - now).total_seconds()))
+
+    def stop(self) -> None:
+        """Stop run_forever after the current tick."""
+        self._stop.set()
+
+    def _find(self, key: str) -> PullRequest | None:
+        """Get a PR of the model by key."""
+        repo_name, number = parse_key(key)
+        repo = self.repositories.get(repo_name)
+        return repo.prs.get(number) if repo else None
+
+    def _fetch(self, key: str, now: datetime, search_data: dict[str, Any] | None) -> int:
+        """Fetch a PR, count the outcome and schedule its next poll."""
+        repo_name, number = parse_key(key)
+        try:
+            outcome: ProcessOutcome = process_pr(
+                self.client,
+                self.config,
+                self.repositories,
+                repo_name,
+                number,
+                self.run,
+                search_data=search_data,
+                archive=self.archive,
+                feed=self.feed,
+            )
+        except RateLimitError:
+            # Retried once the daemon resumes
+            self._schedule(key, now, due=now)
+            raise
+        except Exception as e:
+            error_msg = f"Failed to poll {key}: {e}"
+            logger.error(error_msg)
+            self.run.errors.append(error_msg)
+            self._schedule(key, now, due=now + timedelta(seconds=self.policy.hot))
+            return 0
+
+        pr = self._find(key)
+        if pr is None:  # Deleted or inaccessible and never fetched
+            return 0
+        if outcome == "unchanged":
+            self.run.unchanged_prs += 1
+        else:
+            self.run.total_processed += 1
+            if outcome == "new":
+                self.run.new_prs += 1
+            else:
+                self.run.updated_prs += 1
+            self.state.changed_at[key] = now
+            self.pending.add(key)
+        if search_data is None or outcome != "unchanged":
+            self.state.polled_at[key] = now
+        self._schedule(key, now, pr)
+        return 0 if outcome == "unchanged" else 1
+
+    def _reload_if_changed(self, now: datetime) -> bool:
+        """Reload the model if another process replaced it.
+
+        Our unsaved changes are dropped and those PRs are polled again right
+        away (polls re-fetch, so nothing is lost but the API calls).
+
+        Returns:
+            True if the model was reloaded
+        """
+        if model_signature(self.config.data_file) == self.signature:
+            return False
+        logger.info(f"Model file changed, reloading and re-polling {len(self.pending)} PRs")
+        repolls = self.pending
+        self.pending = set()
+        self._load(now)
+        for key in repolls:
+            self._schedule(key, now, due=now)
+        return True
@@ -0,0 +1,541 @@
+"""Webhook receiver applying GitHub events to the model in near real time.
+
+GitHub delivers ``pull_request``, ``issue_comment``, ``check_run`` and
+``status`` events to a local endpoint. Each delivery is verified against its
+``X-Hub-Signature-256`` header (HMAC-SHA256 of the body with the shared
+secret) and applied to the affected PR with the analyzer functions
+discovery uses, without any API call. Changed PRs are batched: every
+``webhook_flush_interval`` seconds the model is saved and the views of the
+changed PRs are regenerated (see ``controllers.pipeline.generate_views``).
+
+Polling with ``update`` becomes an occasional reconciliation pass for what
+payloads cannot describe:
+
+- New PRs get no file analysis (automation types); their
+  ``analysis_status`` stays "never_analyzed" until the next update.
+- Comment edits and deletions, or comment counts that do not add up, need
+  the archived thread; without it the PR is marked "needs_reanalysis".
+- ``status`` events carry a commit SHA, not a PR; they are matched to PRs
+  whose head was seen in a ``pull_request`` or ``check_run`` event.
+
+Deliveries can be recorded as ``{"event": ..., "payload": ...}`` files (the
+format of the corpus in tests/fixtures/webhooks) and replayed offline with
+``load_delivery`` and ``WebhookReceiver.apply``.
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import UTC, datetime
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from improveit_dashboard.controllers.analyzer import (
+    analyze_engagement,
+    apply_status_change,
+    classify_comments,
+    determine_adoption_level,
+)
+from improveit_dashboard.controllers.archive import PayloadArchive, archive_path
+from improveit_dashboard.controllers.changes import ChangeFeed, changes_path, feed_file
+from improveit_dashboard.controllers.discovery import build_pr, parse_datetime
+from improveit_dashboard.controllers.history import HistoryStore, history_path
+from improveit_dashboard.controllers.persistence import load_model, mark_dirty, save_model
+from improveit_dashboard.controllers.pipeline import generate_views
+from improveit_dashboard.controllers.reanalysis import apply_payloads
+from improveit_dashboard.controllers.server import JSONRequestHandler, model_signature
+from improveit_dashboard.models.checkpoint import work_key
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+EVENTS = ("pull_request", "issue_comment", "check_run", "status")
+
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+
+# PR fields taken from a pull_request payload; the rest come from analysis
+PAYLOAD_FIELDS = (
+    "url",
+    "tool",
+    "title",
+    "updated_at",
+    "merged_at",
+    "closed_at",
+    "commit_count",
+    "files_changed",
+    "closed_by",
+    "head_sha",
+)
+
+Response = tuple[int, dict[str, Any]]
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Compute the X-Hub-Signature-256 value of a delivery body."""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Check a delivery's X-Hub-Signature-256 header in constant time."""
+    return signature is not None and hmac.compare_digest(sign(secret, body), signature)
+
+
+def load_delivery(path: Path) -> tuple[str, dict[str, Any]]:
+    """Read a recorded delivery.
+
+    Args:
+        path: File written by a receiver with ``record_dir`` set
+
+    Returns:
+        Tuple of (event name, payload)
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["event"], data["payload"]
+
+
+def combined_state(statuses: dict[str, str], base: str | None = None) -> str | None:
+    """Combine commit status states per context like GitHub's combined status.
+
+    Args:
+        statuses: State per context
+        base: Combined state of contexts not in statuses, if known
+    """
+    states = set(statuses.values()) | ({base} if base else set())
+    if not states:
+        return None
+    if states & {"failure", "error"}:
+        return "failure"
+    if "pending" in states:
+        return "pending"
+    return "success"
+
+
+class WebhookReceiver:
+    """Applies webhook deliveries to the model and saves it in batches."""
+
+    def __init__(
+        self,
+        config: Configuration,
+        generate: bool = True,
+        record_dir: Path | None = None,
+    ):
+        """Load the model.
+
+        Args:
+            config: Configuration (webhook_secret, data_file, tracked users, ...)
+            generate: Regenerate the views of changed PRs when saving
+            record_dir: Directory to record verified deliveries in
+        """
+        self.config = config
+        self.generate = generate
+        self.record_dir = record_dir
+        self.matcher = config.get_bot_matcher()
+        self.title_matcher = config.get_title_matcher()
+        self.tracked_users = {user.lower() for user in config.tracked_users}
+        self.feed = (
+            ChangeFeed(feed_file(changes_path(config.data_file), datetime.now(UTC)))
+            if config.change_feed
+            else None
+        )
+        self.pending: set[str] = set()  # Keys of PRs changed since the last save
+        self._pending_since: float | None = None
+        # Deliveries applied since the last save, replayed if the model file is
+        # replaced underneath us (e.g. by a reconciliation update)
+        self._unsaved: list[tuple[str, dict[str, Any]]] = []
+        self._replaying = False
+        self._recorded = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._load()
+
+    def _load(self) -> None:
+        """(Re)load the model, and the archive that goes with it."""
+        self.signature = model_signature(self.config.data_file)
+        self.repositories, self.last_run = load_model(
+            self.config.data_file, cache=self.config.model_cache
+        )
+        self.archive = (
+            PayloadArchive(archive_path(self.config.data_file))
+            if self.config.archive_payloads
+            else None
+        )
+        # Check payloads by PR key when there is no archive to keep them in
+        self._checks: dict[str, dict[str, Any]] = {}
+
+    def deliver(
+        self,
+        event: str | None,
+        body: bytes,
+        signature: str | None,
+        delivery: str | None = None,
+    ) -> Response:
+        """Verify and apply a delivery.
+
+        Args:
+            event: X-GitHub-Event header
+            body: Request body
+            signature: X-Hub-Signature-256 header
+            delivery: X-GitHub-Delivery header, used to name recordings
+
+        Returns:
+            HTTP status and JSON body
+        """
+        if not verify_signature(self.config.webhook_secret, body, signature):
+            logger.warning(f"Rejected delivery {delivery} with an invalid signature")
+            return HTTPStatus.UNAUTHORIZED, {"error": "Invalid signature"}
+        try:
+            payload = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"}
+
+        if self.record_dir is not None:
+            self._record(event or "unknown", payload, delivery)
+        if event == "ping":
+            return HTTPStatus.OK, {"pong": True}
+        if event not in EVENTS:
+            return HTTPStatus.ACCEPTED, {"ignored": f"Unsupported event: {event}"}
+
+        with self._lock:
+            self._reload_if_changed()
+            try:
+                changed = self.apply(event, payload)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Malformed {event} delivery {delivery}: {e}")
+                return HTTPStatus.BAD_REQUEST, {"error": f"Malformed {event} payload: {e}"}
+            self._unsaved.append((event, payload))
+        return HTTPStatus.OK, {"changed": sorted(changed)}
+
+    def apply(self, event: str, payload: dict[str, Any]) -> set[str]:
+        """Apply an event to the model (not thread-safe; see deliver).
+
+        Args:
+            event: Event name (one of EVENTS)
+            payload: Event payload
+
+        Returns:
+            Keys ("owner/repo#N") of PRs that changed
+        """
+        repo_name = payload["repository"]["full_name"]
+        if event == "pull_request":
+            return self._pull_request(repo_name, payload)
+        if event == "issue_comment":
+            return self._issue_comment(repo_name, payload)
+        if event == "check_run":
+            check_run = payload["check_run"]
+            numbers = [ref["number"] for ref in check_run.get("pull_requests", [])]
+            changed: set[str] = set()
+            for pr in self._prs_for_head(repo_name, check_run["head_sha"], numbers):
+                checks = self._head_checks(pr, check_run["head_sha"])
+                checks["check_runs"] = [
+                    run for run in checks["check_runs"] if run.get("id") != check_run.get("id")
+                ] + [{k: check_run.get(k) for k in ("id", "name", "status", "conclusion")}]
+                changed |= self._apply_checks(pr, checks)
+            return changed
+        if event == "status":
+            changed = set()
+            for pr in self._prs_for_head(repo_name, payload["sha"], []):
+                checks = self._head_checks(pr, payload["sha"])
+                checks["statuses"] = {**checks["statuses"], payload["context"]: payload["state"]}
+                checks["status_state"] = combined_state(checks["statuses"], checks["base_state"])
+                changed |= self._apply_checks(pr, checks)
+            return changed
+        raise ValueError(f"Unsupported event: {event}")
+
+    def flush(self) -> list[Path]:
+        """Save the model and regenerate the views of changed PRs.
+
+        Returns:
+            Generated file paths
+        """
+        with self._lock:
+            if not self.pending:
+                return []
+            self._reload_if_changed()
+            save_model(self.config.data_file, self.repositories, self.last_run)
+            mark_dirty(self.config.data_file, self.pending)
+            self.signature = model_signature(self.config.data_file)
+            if self.archive is not None:
+                self.archive.flush()
+            if self.config.record_history:
+                HistoryStore(history_path(self.config.data_file)).record(
+                    self.repositories, datetime.now(UTC), source="webhook"
+                )
+            changed, self.pending = self.pending, set()
+            self._pending_since = None
+            self._unsaved.clear()
+            logger.info(f"Saved model with {len(changed)} PRs changed by webhooks")
+            # Views are generated under the lock: deliveries must not mutate the model meanwhile
+            return generate_views(self.config, self.repositories, changed) if self.generate else []
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8766) -> None:
+        """Receive deliveries until interrupted, then save pending changes.
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 for any free port)
+        """
+        httpd = self.make_http_server(host, port)
+        flusher = threading.Thread(target=self.flush_periodically, name="flusher", daemon=True)
+        flusher.start()
+        logger.info(f"Receiving webhooks on http://{host}:{httpd.server_address[1]}/")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
+        finally:
+            self._stop.set()
+            httpd.server_close()
+            self.flush()
+            if self.feed is not None:
+                self.feed.close()
+
+    def make_http_server(self, host: str, port: int) -> ThreadingHTTPServer:
+        """Create a threaded HTTP server passing POSTed deliveries to this receiver."""
+        receiver = self
+
+        class Handler(_WebhookHandler):
+            server_app = receiver
+
+        return ThreadingHTTPServer((host, port), Handler)
+
+    def flush_periodically(self) -> None:
+        """Flush changes once they are webhook_flush_interval old, until stopped."""
+        interval = self.config.webhook_flush_interval
+        while not self._stop.wait(min(1.0, interval) or 0.1):
+            since = self._pending_since
+            if since is not None and time.monotonic() - since >= interval:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Saving webhook changes failed, will retry: {e}")
+
+    def _reload_if_changed(self) -> None:
+        """Reload the model if another process replaced it, replaying our changes."""
+        if model_signature(self.config.data_file) == self.signature:
+            return
+        logger.info(f"Model file changed, reloading and replaying {len(self._unsaved)} deliveries")
+        self._load()
+        # The feed already has the events of these deliveries
+        self._replaying = True
+        try:
+            for event, payload in self._unsaved:
+                self.apply(event, payload)
+        finally:
+            self._replaying = False
+
+    def _record(self, event: str, payload: dict[str, Any], delivery: str | None) -> None:
+        """Write a delivery to record_dir."""
+        assert self.record_dir is not None
+        self._recorded += 1
+        name = delivery or f"{time.time_ns()}-{self._recorded}"
+        self.record_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.record_dir / f"{event}-{name}.json", "w", encoding="utf-8") as f:
+            json.dump({"event": event, "payload": payload}, f, indent=2)
+            f.write("\n")
+
+    def _changed(self, before: PullRequest | None, pr: PullRequest) -> set[str]:
+        """Queue a PR for saving if it changed, and report the change."""
+        if before == pr:
+            return set()
+        key = work_key(pr.repository, pr.number)
+        self.repositories[pr.repository].recalculate_metrics()
+        if self.feed is not None and not self._replaying:
+            self.feed.record(before, pr)
+        if not self.pending:
+            self._pending_since = time.monotonic()
+        self.pending.add(key)
+        return {key}
+
+    def _find(self, repo_name: str, number: int) -> PullRequest | None:
+        """Get a PR of the model."""
+        repo = self.repositories.get(repo_name)
+        return repo.prs.get(number) if repo else None
+
+    def _pull_request(self, repo_name: str, payload: dict[str, Any]) -> set[str]:
+        """Apply a pull_request event (opened, edited, closed, reopened, ...)."""
+        pr_data = payload["pull_request"]
+        number = pr_data["number"]
+        now = datetime.now(UTC)
+        fresh = build_pr(self.config, repo_name, number, pr_data, now)
+        head_sha = (pr_data.get("head") or {}).get("sha")
+        new_commits = payload.get("action") == "synchronize"
+
+        pr = self._find(repo_name, number)
+        if pr is None:
+            if fresh.author.lower() not in self.tracked_users:
+                return set()
+            if self.title_matcher.match(fresh.title) is None:
+                return set()
+            if repo_name not in self.repositories:
+                owner, name = repo_name.split("/", 1)
+                self.repositories[repo_name] = Repository(
+                    owner=owner, name=name, platform="github", url=f"https://github.com/{repo_name}"
+                )
+            if pr_data.get("comments", 0) == 0:
+                # Without comments the engagement analysis is complete already
+                analyze_engagement([], fresh)
+            fresh.adoption_level = determine_adoption_level(fresh.automation_types, fresh.status)
+            self.repositories[repo_name].add_pr(fresh)
+            if head_sha:
+                self._put_checks(fresh, self._head_checks(fresh, head_sha, reset=True))
+            return self._changed(None, fresh)
+
+        before = replace(pr)
+        for name in PAYLOAD_FIELDS:
+            setattr(pr, name, getattr(fresh, name))
+        if fresh.status != pr.status:
+            apply_status_change(pr, fresh.status)
+        if pr.engagement is not None:
+            # Response status depends on the PR status too (e.g. when reopened)
+            analyze_engagement([], pr, replace(pr.engagement))
+        if pr_data.get("comments") not in (None, pr.total_comments):
+            pr.analysis_status = "needs_reanalysis"
+        if head_sha:
+            checks = self._head_checks(pr, head_sha, reset=new_commits)
+            if checks != self._get_checks(pr):
+                self._put_checks(pr, checks)
+                apply_payloads(pr, {"checks": checks})
+        return self._changed(before, pr)
+
+    def _issue_comment(self, repo_name: str, payload: dict[str, Any]) -> set[str]:
+        """Apply an issue_comment event (created, edited, deleted) on a PR."""
+        issue = payload["issue"]
+        pr = self._find(repo_name, issue["number"]) if "pull_request" in issue else None
+        if pr is None:
+            return set()
+
+        before = replace(pr)
+        if self._apply_comment(
+            pr, payload.get("action"), payload["comment"], issue.get("comments")
+        ):
+            pr.updated_at = parse_datetime(issue.get("updated_at")) or pr.updated_at
+        else:
+            logger.info(f"Comments of {repo_name}#{pr.number} need a reanalysis")
+            pr.analysis_status = "needs_reanalysis"
+        return self._changed(before, pr)
+
+    def _apply_comment(
+        self,
+        pr: PullRequest,
+        action: str | None,
+        comment_data: dict[str, Any],
+        expected_count: int | None,
+    ) -> bool:
+        """Update a PR's engagement for a comment event.
+
+        Uses the archived thread when there is one; otherwise new comments
+        are folded into the stored engagement state.
+
+        Returns:
+            False if the engagement could not be brought up to date
+        """
+        thread = self.archive.get(pr.repository, pr.number, "comments") if self.archive else None
+        if self.archive is not None and thread is not None:
+            by_id = {comment["id"]: comment for comment in thread}
+            if action == "deleted":
+                by_id.pop(comment_data["id"], None)
+            else:
+                by_id[comment_data["id"]] = comment_data
+            thread = sorted(by_id.values(), key=lambda c: c["id"])
+            self.archive.put(pr.repository, pr.number, "comments", thread)
+            apply_payloads(pr, {"comments": thread}, self.matcher)
+        elif action == "created" and pr.engagement is not None:
+            comments = classify_comments([comment_data], pr.author, self.matcher)
+            new = pr.engagement.new_comments(comments)
+            if new is None:
+                return False
+            analyze_engagement(new, pr, replace(pr.engagement))
+        else:
+            return False
+        return expected_count is None or pr.total_comments == expected_count
+
+    def _get_checks(self, pr: PullRequest) -> dict[str, Any] | None:
+        """Get the stored check payload of a PR."""
+        if self.archive is not None:
+            checks: dict[str, Any] | None = self.archive.get(pr.repository, pr.number, "checks")
+            return checks
+        return self._checks.get(work_key(pr.repository, pr.number))
+
+    def _put_checks(self, pr: PullRequest, checks: dict[str, Any]) -> None:
+        """Store the check payload of a PR."""
+        if self.archive is not None:
+            self.archive.put(pr.repository, pr.number, "checks", checks)
+        else:
+            self._checks[work_key(pr.repository, pr.number)] = checks
+
+    def _head_checks(self, pr: PullRequest, head_sha: str, reset: bool = False) -> dict[str, Any]:
+        """Get a copy of a PR's check payload for a head commit.
+
+        Checks of another commit are discarded; checks stored by discovery
+        (which does not record the commit) are assumed to be of this one
+        unless ``reset``.
+        """
+        checks = self._get_checks(pr) or {}
+        if reset or checks.get("head_sha") not in (None, head_sha):
+            checks = {}
+        if "statuses" in checks:
+            base_state = checks.get("base_state")
+        else:
+            # Discovery's combined status also covers contexts no delivery named yet
+            base_state = checks.get("status_state")
+        return {
+            "status_state": checks.get("status_state"),
+            "base_state": base_state,
+            "check_runs": list(checks.get("check_runs", [])),
+            "statuses": dict(checks.get("statuses", {})),
+            "head_sha": head_sha,
+        }
+
+    def _prs_for_head(
+        self, repo_name: str, head_sha: str, numbers: list[int]
+    ) -> Iterator[PullRequest]:
+        """Find the active PRs of a repository with a head commit.
+
+        Args:
+            repo_name: Repository full name
+            head_sha: Head commit SHA
+            numbers: PR numbers the event names (empty for PRs from forks)
+        """
+        repo = self.repositories.get(repo_name)
+        if repo is None:
+            return
+        for pr in repo.prs.values():
+            if not pr.is_active:
+                continue
+            if pr.number in numbers or (self._get_checks(pr) or {}).get("head_sha") == head_sha:
+                yield pr
+
+    def _apply_checks(self, pr: PullRequest, checks: dict[str, Any]) -> set[str]:
+        """Store a PR's updated check payload and recompute its CI status."""
+        before = replace(pr)
+        self._put_checks(pr, checks)
+        apply_payloads(pr, {"checks": checks})
+        return self._changed(before, pr)
+
+
+class _WebhookHandler(JSONRequestHandler):
+    """Passes POSTed deliveries to a WebhookReceiver."""
+
+    server_app: WebhookReceiver
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        self.send_json(
+            *self.server_app.deliver(
+                self.headers.get("X-GitHub-Event"),
+                body,
+                self.headers.get(SIGNATURE_HEADER),
+                self.headers.get("X-GitHub-Delivery"),
+            )
+        )
@@ -1,15 +1,19 @@
 """Data models for improveit-dashboard."""
 
+from improveit_dashboard.models.checkpoint import DiscoveryCheckpoint
 from improveit_dashboard.models.comment import Comment
 from improveit_dashboard.models.config import Configuration
 from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.engagement import EngagementState
 from improveit_dashboard.models.pull_request import PullRequest
 from improveit_dashboard.models.repository import Repository
 
 __all__ = [
     "Comment",
     "Configuration",
+    "DiscoveryCheckpoint",
     "DiscoveryRun",
+    "EngagementState",
     "PullRequest",
     "Repository",
 ]
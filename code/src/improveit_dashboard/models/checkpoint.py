@@ -0,0 +1,78 @@
+"""DiscoveryCheckpoint model for resuming interrupted discovery runs."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+
+# A planned unit of work: (repository full name, PR number, search result item)
+WorkItem = tuple[str, int, dict[str, Any]]
+
+
+def work_key(repo_name: str, pr_number: int) -> str:
+    """Return the checkpoint key for a PR ("owner/repo#123")."""
+    return f"{repo_name}#{pr_number}"
+
+
+@dataclass
+class DiscoveryCheckpoint:
+    """Progress of an in-flight discovery run.
+
+    Holds the planned work queue (search results, already prioritized), the
+    set of PRs completed so far, the per-user high-water marks to commit once
+    their PRs are done, and the partial run counters, so that an
+    interrupted run can continue without searching or processing PRs again.
+    """
+
+    run: DiscoveryRun
+    queue: list[WorkItem] = field(default_factory=list)
+    completed: set[str] = field(default_factory=set)
+    incremental: bool = True
+    candidate_marks: dict[str, datetime] = field(default_factory=dict)
+    saved_at: datetime | None = None
+
+    def pending(self) -> list[WorkItem]:
+        """Return queued work items not completed yet, in queue order."""
+        return [item for item in self.queue if work_key(item[0], item[1]) not in self.completed]
+
+    def mark_completed(self, repo_name: str, pr_number: int) -> None:
+        """Record that a PR has been handled."""
+        self.completed.add(work_key(repo_name, pr_number))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run": self.run.to_dict(),
+            "incremental": self.incremental,
+            "candidate_marks": {
+                user: mark.isoformat() for user, mark in self.candidate_marks.items()
+            },
+            "saved_at": self.saved_at.isoformat() if self.saved_at else None,
+            "queue": [
+                {"repository": repo_name, "number": pr_number, "search_data": search_data}
+                for repo_name, pr_number, search_data in self.queue
+            ],
+            "completed": sorted(self.completed),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DiscoveryCheckpoint":
+        """Create from dictionary (JSON deserialization)."""
+        saved_at = data.get("saved_at")
+        return cls(
+            run=DiscoveryRun.from_dict(data["run"]),
+            queue=[
+                (item["repository"], item["number"], item.get("search_data", {}))
+                for item in data.get("queue", [])
+            ],
+            completed=set(data.get("completed", [])),
+            incremental=data.get("incremental", True),
+            candidate_marks={
+                user: datetime.fromisoformat(mark.replace("Z", "+00:00"))
+                for user, mark in data.get("candidate_marks", {}).items()
+            },
+            saved_at=(
+                datetime.fromisoformat(saved_at.replace("Z", "+00:00")) if saved_at else None
+            ),
+        )
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal
 
+from improveit_dashboard.utils.matching import BotMatcher
+
 AuthorType = Literal["submitter", "maintainer", "bot"]
 
 # Known bot usernames that may not have [bot] suffix
@@ -42,13 +44,8 @@ BOT_MESSAGE_PATTERNS = [
 ]
 
 
-def _is_bot_message(body: str) -> bool:
-    """Check if comment body matches known bot message patterns."""
-    body_lower = body.lower().strip()
-    for pattern in BOT_MESSAGE_PATTERNS:
-        if pattern in body_lower:
-            return True
-    return False
+# Matcher for the built-in patterns (config can extend it, see Configuration)
+DEFAULT_BOT_MATCHER = BotMatcher(KNOWN_BOT_USERNAMES, BOT_MESSAGE_PATTERNS)
 
 
 @dataclass
@@ -61,6 +58,7 @@ class Comment:
     body: str
     created_at: datetime
     is_bot: bool
+    updated_at: datetime | None = None
 
     def validate(self) -> list[str]:
         """Validate model constraints. Returns list of error messages."""
@@ -76,12 +74,18 @@ class Comment:
         return errors
 
     @classmethod
-    def from_github_response(cls, data: dict[str, Any], pr_author: str) -> "Comment":
+    def from_github_response(
+        cls,
+        data: dict[str, Any],
+        pr_author: str,
+        matcher: BotMatcher | None = None,
+    ) -> "Comment":
         """Create from GitHub API response.
 
         Args:
             data: GitHub API comment response
             pr_author: Username of the PR author (for classification)
+            matcher: Bot detection rules (default: built-in patterns)
         """
         user = data["user"]
         login = user["login"]
@@ -89,12 +93,7 @@ class Comment:
         body = data.get("body", "")
 
         # Determine if bot (multiple detection methods)
-        is_bot = (
-            user_type == "Bot"
-            or login.endswith("[bot]")
-            or login.lower() in KNOWN_BOT_USERNAMES
-            or _is_bot_message(body)
-        )
+        is_bot = (matcher or DEFAULT_BOT_MATCHER).is_bot(login, body, user_type)
 
         # Determine author type
         if is_bot:
@@ -107,6 +106,12 @@ class Comment:
         # Parse created_at
         created_at_str = data["created_at"]
         created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+        updated_at_str = data.get("updated_at")
+        updated_at = (
+            datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
+            if updated_at_str
+            else None
+        )
 
         return cls(
             id=data["id"],
@@ -115,4 +120,5 @@ class Comment:
             body=body,
             created_at=created_at,
             is_bot=is_bot,
+            updated_at=updated_at,
         )
@@ -2,10 +2,12 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, cast
 
-import yaml
+from improveit_dashboard.models.comment import DEFAULT_BOT_MATCHER
+from improveit_dashboard.utils.matching import BotMatcher, TitleMatcher
 
 # Valid behavior categories
 BehaviorCategory = Literal["welcoming", "selective", "unresponsive", "hostile", "insufficient_data"]
@@ -14,6 +16,25 @@ VALID_BEHAVIOR_CATEGORIES: frozenset[str] = frozenset(
 )
 
 
+def _split_tokens(value: str) -> list[str]:
+    """Split a comma/whitespace separated list of tokens."""
+    return [t for t in value.replace(",", " ").split() if t]
+
+
+@lru_cache(maxsize=8)
+def _bot_matcher(usernames: tuple[str, ...], message_patterns: tuple[str, ...]) -> BotMatcher:
+    """Build (once per distinct rule set) the built-in bot matcher plus extra rules."""
+    if not usernames and not message_patterns:
+        return DEFAULT_BOT_MATCHER
+    return DEFAULT_BOT_MATCHER.extend(usernames, message_patterns)
+
+
+@lru_cache(maxsize=8)
+def _title_matcher(tool_keywords: tuple[tuple[str, tuple[str, ...]], ...]) -> TitleMatcher:
+    """Build (once per distinct keyword set) the title matcher."""
+    return TitleMatcher(dict(tool_keywords))
+
+
 @dataclass
 class RepositoryOverride:
     """Manual override for repository behavior category."""
@@ -46,14 +67,35 @@ class Configuration:
     )
     platforms: list[str] = field(default_factory=lambda: ["github"])
 
+    # Extra bot detection rules, added to the built-in ones
+    bot_usernames: list[str] = field(default_factory=list)
+    bot_message_patterns: list[str] = field(default_factory=list)
+
     # API settings
     github_token: str = ""
+    github_tokens: list[str] = field(default_factory=list)  # Extra tokens for the pool
     rate_limit_threshold: int = 100
+    rate_limit_pacing: bool = False
+    max_retries: int = 4  # Retries per request for transient failures
+    retry_budget: int = 200  # Total retries allowed per run
+    webhook_secret: str = ""  # Shared secret verifying webhook deliveries
 
     # Processing settings
     force_mode: bool = False
     batch_size: int = 10
     max_prs_per_run: int | None = None
+    closed_revalidate_days: int = 7  # Closed PRs are frozen, revalidated this often
+    archive_payloads: bool = True  # Keep raw API payloads for offline reanalysis
+    record_history: bool = True  # Append per-run aggregates/transitions to data/history
+    change_feed: bool = True  # Write each run's PR changes to data/changes/<run>.jsonl
+    model_cache: bool = True  # Keep a pickle of the parsed model beside data_file
+    webhook_flush_interval: float = 30.0  # Seconds to batch webhook changes before saving
+
+    # Watch daemon cadence (seconds)
+    watch_hot_interval: float = 300.0  # Shortest poll interval, for just-active PRs
+    watch_stale_interval: float = 86400.0  # Longest poll interval for open PRs
+    watch_search_interval: float = 900.0  # Searching for new and updated PRs
+    watch_checkpoint_interval: float = 600.0  # Saving the model and regenerating views
 
     # Paths
     data_file: Path = field(default_factory=lambda: Path("data/repositories.json"))
@@ -69,6 +111,10 @@ class Configuration:
         # Load token from environment if not set
         if not self.github_token:
             self.github_token = os.getenv("GITHUB_TOKEN", "")
+        if not self.github_tokens:
+            self.github_tokens = _split_tokens(os.getenv("GITHUB_TOKENS", ""))
+        if not self.webhook_secret:
+            self.webhook_secret = os.getenv("IMPROVEIT_WEBHOOK_SECRET", "")
 
         # Ensure paths are Path objects
         if isinstance(self.data_file, str):
@@ -86,6 +132,8 @@ class Configuration:
         if not path.exists():
             return cls()
 
+        import yaml  # Imported here: only needed when a config file is read
+
         with open(path, encoding="utf-8") as f:
             data = yaml.safe_load(f) or {}
 
@@ -100,6 +148,9 @@ class Configuration:
         if env_token := os.getenv("GITHUB_TOKEN"):
             config.github_token = env_token
 
+        if env_tokens := os.getenv("GITHUB_TOKENS"):
+            config.github_tokens = _split_tokens(env_tokens)
+
         if env_force := os.getenv("IMPROVEIT_FORCE_MODE"):
             config.force_mode = env_force.lower() in ("true", "1", "yes")
 
@@ -112,6 +163,9 @@ class Configuration:
         if env_threshold := os.getenv("IMPROVEIT_RATE_LIMIT_THRESHOLD"):
             config.rate_limit_threshold = int(env_threshold)
 
+        if env_pacing := os.getenv("IMPROVEIT_RATE_LIMIT_PACING"):
+            config.rate_limit_pacing = env_pacing.lower() in ("true", "1", "yes")
+
         if env_data_file := os.getenv("IMPROVEIT_DATA_FILE"):
             config.data_file = Path(env_data_file)
 
@@ -131,12 +185,30 @@ class Configuration:
         if "platforms" in data:
             kwargs["platforms"] = data["platforms"]
 
+        if "bot_usernames" in data:
+            kwargs["bot_usernames"] = list(data["bot_usernames"] or [])
+
+        if "bot_message_patterns" in data:
+            kwargs["bot_message_patterns"] = list(data["bot_message_patterns"] or [])
+
         if "github_token" in data:
             kwargs["github_token"] = data["github_token"]
 
+        if "github_tokens" in data:
+            kwargs["github_tokens"] = list(data["github_tokens"] or [])
+
         if "rate_limit_threshold" in data:
             kwargs["rate_limit_threshold"] = data["rate_limit_threshold"]
 
+        if "rate_limit_pacing" in data:
+            kwargs["rate_limit_pacing"] = data["rate_limit_pacing"]
+
+        if "max_retries" in data:
+            kwargs["max_retries"] = data["max_retries"]
+
+        if "retry_budget" in data:
+            kwargs["retry_budget"] = data["retry_budget"]
+
         if "force_mode" in data:
             kwargs["force_mode"] = data["force_mode"]
 
@@ -146,6 +218,39 @@ class Configuration:
         if "max_prs_per_run" in data:
             kwargs["max_prs_per_run"] = data["max_prs_per_run"]
 
+        if "closed_revalidate_days" in data:
+            kwargs["closed_revalidate_days"] = int(data["closed_revalidate_days"])
+
+        if "archive_payloads" in data:
+            kwargs["archive_payloads"] = data["archive_payloads"]
+
+        if "record_history" in data:
+            kwargs["record_history"] = data["record_history"]
+
+        if "change_feed" in data:
+            kwargs["change_feed"] = data["change_feed"]
+
+        if "model_cache" in data:
+            kwargs["model_cache"] = data["model_cache"]
+
+        if "webhook_secret" in data:
+            kwargs["webhook_secret"] = data["webhook_secret"]
+
+        if "webhook_flush_interval" in data:
+            kwargs["webhook_flush_interval"] = float(data["webhook_flush_interval"])
+
+        if "watch_hot_interval" in data:
+            kwargs["watch_hot_interval"] = float(data["watch_hot_interval"])
+
+        if "watch_stale_interval" in data:
+            kwargs["watch_stale_interval"] = float(data["watch_stale_interval"])
+
+        if "watch_search_interval" in data:
+            kwargs["watch_search_interval"] = float(data["watch_search_interval"])
+
+        if "watch_checkpoint_interval" in data:
+            kwargs["watch_checkpoint_interval"] = float(data["watch_checkpoint_interval"])
+
         if "data_file" in data:
             kwargs["data_file"] = Path(data["data_file"])
 
@@ -194,12 +299,37 @@ class Configuration:
         if self.rate_limit_threshold < 0:
             errors.append("rate_limit_threshold must be non-negative")
 
+        if self.max_retries < 0:
+            errors.append("max_retries must be non-negative")
+
+        if self.retry_budget < 0:
+            errors.append("retry_budget must be non-negative")
+
         if self.batch_size < 1:
             errors.append("batch_size must be at least 1")
 
         if self.max_prs_per_run is not None and self.max_prs_per_run < 1:
             errors.append("max_prs_per_run must be at least 1 if set")
 
+        if self.closed_revalidate_days < 0:
+            errors.append("closed_revalidate_days must be non-negative")
+
+        if self.webhook_flush_interval < 0:
+            errors.append("webhook_flush_interval must be non-negative")
+
+        watch_intervals = {
+            "watch_hot_interval": self.watch_hot_interval,
+            "watch_stale_interval": self.watch_stale_interval,
+            "watch_search_interval": self.watch_search_interval,
+            "watch_checkpoint_interval": self.watch_checkpoint_interval,
+        }
+        for name, interval in watch_intervals.items():
+            if interval <= 0:
+                errors.append(f"{name} must be positive")
+
+        if self.watch_hot_interval > self.watch_stale_interval:
+            errors.append("watch_hot_interval must not exceed watch_stale_interval")
+
         # Validate repository overrides
         for repo_name, override in self.repository_overrides.items():
             override_errors = override.validate()
@@ -219,6 +349,18 @@ class Configuration:
         """
         return self.repository_overrides.get(repo_full_name)
 
+    def behavior_overrides(self) -> dict[str, str]:
+        """Get the behavior category overrides, keyed by repository full name."""
+        return {name: override.category for name, override in self.repository_overrides.items()}
+
+    def get_all_tokens(self) -> list[str]:
+        """Get all configured GitHub tokens, primary first, without duplicates."""
+        return list(dict.fromkeys(t for t in [self.github_token, *self.github_tokens] if t))
+
+    def get_bot_matcher(self) -> BotMatcher:
+        """Get the bot matcher: built-in rules extended with configured ones."""
+        return _bot_matcher(tuple(self.bot_usernames), tuple(self.bot_message_patterns))
+
     def get_all_keywords(self) -> list[str]:
         """Get flat list of all tool keywords."""
         keywords: list[str] = []
@@ -226,14 +368,16 @@ class Configuration:
             keywords.extend(kw_list)
         return keywords
 
+    def get_title_matcher(self) -> TitleMatcher:
+        """Get the matcher compiled from tool_keywords."""
+        return _title_matcher(
+            tuple((tool, tuple(keywords)) for tool, keywords in self.tool_keywords.items())
+        )
+
     def get_tool_for_title(self, title: str) -> str:
         """Determine tool type from PR title.
 
-        Returns the first matching tool or 'other' if no match.
+        Keywords match at word starts (see TitleMatcher). Returns the first
+        matching tool in tool_keywords order or 'other' if no match.
         """
-        title_lower = title.lower()
-        for tool, keywords in self.tool_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in title_lower:
-                    return tool
-        return "other"
+        return self.get_title_matcher().match(title) or "other"
@@ -23,14 +23,19 @@ class DiscoveryRun:
     newly_merged_prs: int = 0
     newly_closed_prs: int = 0
     total_processed: int = 0
+    unchanged_prs: int = 0
 
     # API usage
     api_calls_made: int = 0
+    api_retries: int = 0
     rate_limit_remaining: int = 5000
 
     # Errors
     errors: list[str] = field(default_factory=list)
 
+    # Per-user search cutoff: latest PR update seen by a fully processed search
+    user_high_water_marks: dict[str, datetime] = field(default_factory=dict)
+
     def to_commit_message(self) -> str:
         """Generate git commit message summarizing this run."""
         lines = [
@@ -42,7 +47,9 @@ class DiscoveryRun:
             f"- {self.newly_merged_prs} PRs newly merged since last run",
             f"- {self.newly_closed_prs} PRs closed without merge",
             f"- Processed {self.total_processed} PRs total",
-            f"- API calls: {self.api_calls_made}, remaining quota: {self.rate_limit_remaining}",
+            f"- Skipped {self.unchanged_prs} unchanged PRs",
+            f"- API calls: {self.api_calls_made} ({self.api_retries} retried), "
+            f"remaining quota: {self.rate_limit_remaining}",
             "",
             f"Mode: {self.mode}",
             f"Run: {self.started_at.isoformat()}",
@@ -70,9 +77,14 @@ class DiscoveryRun:
             "newly_merged_prs": self.newly_merged_prs,
             "newly_closed_prs": self.newly_closed_prs,
             "total_processed": self.total_processed,
+            "unchanged_prs": self.unchanged_prs,
             "api_calls_made": self.api_calls_made,
+            "api_retries": self.api_retries,
             "rate_limit_remaining": self.rate_limit_remaining,
             "errors": self.errors,
+            "user_high_water_marks": {
+                user: mark.isoformat() for user, mark in self.user_high_water_marks.items()
+            },
         }
 
     @classmethod
@@ -94,7 +106,13 @@ class DiscoveryRun:
             newly_merged_prs=data.get("newly_merged_prs", 0),
             newly_closed_prs=data.get("newly_closed_prs", 0),
             total_processed=data.get("total_processed", 0),
+            unchanged_prs=data.get("unchanged_prs", 0),
             api_calls_made=data.get("api_calls_made", 0),
+            api_retries=data.get("api_retries", 0),
             rate_limit_remaining=data.get("rate_limit_remaining", 5000),
             errors=data.get("errors", []),
+            user_high_water_marks={
+                user: parse_dt(mark)  # type: ignore[misc]
+                for user, mark in data.get("user_high_water_marks", {}).items()
+            },
         )
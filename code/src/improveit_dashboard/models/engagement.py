@@ -0,0 +1,129 @@
+"""EngagementState model for incremental comment analysis."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from improveit_dashboard.models.comment import AuthorType, Comment
+
+
+@dataclass
+class EngagementState:
+    """Compact summary of a PR's comment thread.
+
+    Holds everything engagement analysis needs from comments already seen,
+    so that a refresh only has to fetch and fold in newer comments
+    (``since=last_seen_at``) instead of the whole thread.
+    """
+
+    # Counts by author type
+    submitter_comments: int = 0
+    maintainer_comments: int = 0
+    bot_comments: int = 0
+
+    # Pointers into the thread
+    first_maintainer_comment_at: datetime | None = None
+    last_comment_author: str | None = None
+    last_comment_author_type: AuthorType | None = None
+    last_comment_at: datetime | None = None
+    last_maintainer_comment_id: int | None = None
+    last_maintainer_comment_at: datetime | None = None
+
+    # Fetch cursor
+    last_comment_id: int = 0
+    last_seen_at: datetime | None = None
+
+    @property
+    def total_comments(self) -> int:
+        """Total number of comments folded in."""
+        return self.submitter_comments + self.maintainer_comments + self.bot_comments
+
+    def new_comments(self, comments: list[Comment]) -> list[Comment] | None:
+        """Select the comments not folded in yet from an incremental fetch.
+
+        Args:
+            comments: Comments returned for ``since=last_seen_at``
+
+        Returns:
+            Comments newer than the last one seen, or None if an already
+            seen comment was edited (which requires a full reanalysis)
+        """
+        new = []
+        for comment in comments:
+            if comment.id > self.last_comment_id:
+                new.append(comment)
+            elif (
+                comment.updated_at and self.last_seen_at and comment.updated_at > self.last_seen_at
+            ):
+                return None
+        return new
+
+    def fold(self, comments: list[Comment]) -> None:
+        """Fold comments posted after the ones already seen into the state.
+
+        Args:
+            comments: New comments (any order)
+        """
+        for comment in sorted(comments, key=lambda c: c.created_at):
+            if comment.author_type == "submitter":
+                self.submitter_comments += 1
+            elif comment.author_type == "maintainer":
+                self.maintainer_comments += 1
+                if self.first_maintainer_comment_at is None:
+                    self.first_maintainer_comment_at = comment.created_at
+                self.last_maintainer_comment_id = comment.id
+                self.last_maintainer_comment_at = comment.created_at
+            else:
+                self.bot_comments += 1
+
+            self.last_comment_author = comment.author
+            self.last_comment_author_type = comment.author_type
+            self.last_comment_at = comment.created_at
+
+            self.last_comment_id = max(self.last_comment_id, comment.id)
+            seen_at = comment.updated_at or comment.created_at
+            if self.last_seen_at is None or seen_at > self.last_seen_at:
+                self.last_seen_at = seen_at
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+
+        def fmt_dt(val: datetime | None) -> str | None:
+            return val.isoformat() if val else None
+
+        return {
+            "submitter_comments": self.submitter_comments,
+            "maintainer_comments": self.maintainer_comments,
+            "bot_comments": self.bot_comments,
+            "first_maintainer_comment_at": fmt_dt(self.first_maintainer_comment_at),
+            "last_comment_author": self.last_comment_author,
+            "last_comment_author_type": self.last_comment_author_type,
+            "last_comment_at": fmt_dt(self.last_comment_at),
+            "last_maintainer_comment_id": self.last_maintainer_comment_id,
+            "last_maintainer_comment_at": fmt_dt(self.last_maintainer_comment_at),
+            "last_comment_id": self.last_comment_id,
+            "last_seen_at": fmt_dt(self.last_seen_at),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EngagementState":
+        """Create from dictionary (JSON deserialization)."""
+
+        def parse_dt(val: str | None) -> datetime | None:
+            if val is None:
+                return None
+            return datetime.fromisoformat(val.replace("Z", "+00:00"))
+
+        return cls(
+            submitter_comments=data.get("submitter_comments", 0),
+            maintainer_comments=data.get("maintainer_comments", 0),
+            bot_comments=data.get("bot_comments", 0),
+            first_maintainer_comment_at=parse_dt(data.get("first_maintainer_comment_at")),
+            last_comment_author=data.get("last_comment_author"),
+            last_comment_author_type=data.get("last_comment_author_type"),
+            last_comment_at=parse_dt(data.get("last_comment_at")),
+            last_maintainer_comment_id=data.get("last_maintainer_comment_id"),
+            last_maintainer_comment_at=parse_dt(data.get("last_maintainer_comment_at")),
+            last_comment_id=data.get("last_comment_id", 0),
+            last_seen_at=parse_dt(data.get("last_seen_at")),
+        )
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 
+from improveit_dashboard.models.engagement import EngagementState
+
 PRStatus = Literal["draft", "open", "merged", "closed"]
 AnalysisStatus = Literal["never_analyzed", "analyzed", "needs_reanalysis"]
 ResponseStatus = Literal["awaiting_submitter", "awaiting_maintainer", "no_response"]
@@ -65,6 +67,7 @@ class PullRequest:
     last_developer_comment_body: str | None = None
 
     # CI and merge status
+    head_sha: str | None = None  # Head commit the CI status was fetched for
     has_conflicts: bool = False
     ci_status: CIStatus | None = None
     main_branch_ci: CIStatus | None = None
@@ -73,6 +76,9 @@ class PullRequest:
     # Closure information
     closed_by: str | None = None  # GitHub username who merged or closed the PR
 
+    # Incremental comment analysis state
+    engagement: EngagementState | None = None
+
     @property
     def is_active(self) -> bool:
         """True if PR is draft or open (not merged/closed)."""
@@ -164,11 +170,13 @@ class PullRequest:
             "etag": self.etag,
             "last_fetched_at": (self.last_fetched_at.isoformat() if self.last_fetched_at else None),
             "last_developer_comment_body": self.last_developer_comment_body,
+            "head_sha": self.head_sha,
             "has_conflicts": self.has_conflicts,
             "ci_status": self.ci_status,
             "main_branch_ci": self.main_branch_ci,
             "codespell_workflow_ci": self.codespell_workflow_ci,
             "closed_by": self.closed_by,
+            "engagement": self.engagement.to_dict() if self.engagement else None,
         }
 
     @classmethod
@@ -211,9 +219,13 @@ class PullRequest:
             etag=data.get("etag"),
             last_fetched_at=parse_dt(data.get("last_fetched_at")),
             last_developer_comment_body=data.get("last_developer_comment_body"),
+            head_sha=data.get("head_sha"),
             has_conflicts=data.get("has_conflicts", False),
             ci_status=data.get("ci_status"),
             main_branch_ci=data.get("main_branch_ci"),
             codespell_workflow_ci=data.get("codespell_workflow_ci"),
             closed_by=data.get("closed_by"),
+            engagement=(
+                EngagementState.from_dict(data["engagement"]) if data.get("engagement") else None
+            ),
         )
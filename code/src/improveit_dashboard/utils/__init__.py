@@ -1,11 +1,50 @@
-"""Utility modules for improveit-dashboard."""
+"""Utility modules for improveit-dashboard.
 
-from improveit_dashboard.utils.logging import get_logger, setup_logging
-from improveit_dashboard.utils.rate_limit import RateLimitError, RateLimitHandler
+Exports are resolved on first access (PEP 562), so importing one utility
+module (e.g. logging) does not load the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from improveit_dashboard.utils.git import create_commit
+    from improveit_dashboard.utils.logging import get_logger, setup_logging
+    from improveit_dashboard.utils.matching import BotMatcher, TitleMatcher
+    from improveit_dashboard.utils.rate_limit import RateLimitError, RateLimitHandler
+    from improveit_dashboard.utils.retry import RetryPolicy
+    from improveit_dashboard.utils.token_pool import TokenPool
+
+# Exported name -> defining module
+_EXPORTS = {
+    "BotMatcher": "improveit_dashboard.utils.matching",
+    "RateLimitError": "improveit_dashboard.utils.rate_limit",
+    "RateLimitHandler": "improveit_dashboard.utils.rate_limit",
+    "RetryPolicy": "improveit_dashboard.utils.retry",
+    "TitleMatcher": "improveit_dashboard.utils.matching",
+    "TokenPool": "improveit_dashboard.utils.token_pool",
+    "create_commit": "improveit_dashboard.utils.git",
+    "get_logger": "improveit_dashboard.utils.logging",
+    "setup_logging": "improveit_dashboard.utils.logging",
+}
 
 __all__ = [
+    "BotMatcher",
     "RateLimitError",
     "RateLimitHandler",
+    "RetryPolicy",
+    "TitleMatcher",
+    "TokenPool",
+    "create_commit",
     "get_logger",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
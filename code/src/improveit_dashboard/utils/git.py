@@ -0,0 +1,55 @@
+"""Git helpers for committing regenerated data and views."""
+
+import subprocess
+
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_commit(message: str) -> int:
+    """Create a git commit of all changes with the given message.
+
+    Args:
+        message: Commit message (first line is printed as the summary)
+
+    Returns:
+        0 on success or if there is nothing to commit, 2 on error
+    """
+    try:
+        # Check if there are changes to commit
+        result = subprocess.run(
+            ["git", "diff", "--quiet"],
+            capture_output=True,
+        )
+        staged_result = subprocess.run(
+            ["git", "diff", "--cached", "--quiet"],
+            capture_output=True,
+        )
+
+        # If both exit 0, there are no changes
+        if result.returncode == 0 and staged_result.returncode == 0:
+            print("No changes to commit")
+            return 0
+
+        # Stage all changes
+        subprocess.run(["git", "add", "-A"], check=True)
+
+        # Create commit
+        subprocess.run(
+            ["git", "commit", "-m", message],
+            check=True,
+        )
+
+        print("Created commit with summary:")
+        # Print first line of commit message
+        print(f"  {message.split(chr(10))[0]}")
+
+        return 0
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Git commit failed: {e}")
+        return 2
+    except FileNotFoundError:
+        logger.error("Git not found in PATH")
+        return 2
@@ -1,12 +1,27 @@
 """Rate limit handling for GitHub API."""
 
+import asyncio
+import threading
 import time
+from dataclasses import dataclass, field
 from typing import Any
 
 from improveit_dashboard.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Resource reported by GitHub when X-RateLimit-Resource is missing
+DEFAULT_RESOURCE = "core"
+
+# Documented hourly (search: per-minute) limits of authenticated requests,
+# assumed for resources no response has reported yet
+DEFAULT_LIMITS = {"core": 5000, "search": 30, "code_search": 10, "graphql": 5000}
+
+
+def default_limit(resource: str) -> int:
+    """Get the documented limit of a rate limit resource."""
+    return DEFAULT_LIMITS.get(resource, DEFAULT_LIMITS[DEFAULT_RESOURCE])
+
 
 class RateLimitError(Exception):
     """Raised when rate limit is critically low."""
@@ -16,53 +31,92 @@ class RateLimitError(Exception):
         self.reset_timestamp = reset_timestamp
 
 
+@dataclass
+class _Bucket:
+    """Token bucket pacing requests against one rate limit resource."""
+
+    remaining: int = 5000
+    limit: int = 5000
+    reset_timestamp: int = 0
+    tokens: float = 0.0
+    refill_rate: float | None = None  # tokens/second, None = not yet observed
+    last_refill: float = field(default_factory=time.monotonic)
+
+
 class RateLimitHandler:
     """Handles GitHub API rate limiting.
 
-    Monitors rate limit headers and pauses when limit is low.
+    Monitors rate limit headers and pauses when limit is low. Every resource
+    (core, search, ...) is tracked separately; ``remaining``, ``limit`` and
+    ``reset_timestamp`` describe the most recent response only.
+
+    In pacing mode, requests are spread evenly across the rate limit window
+    instead: each resource (core, search, ...) gets a token bucket that refills
+    at ``(remaining - reserve) / seconds_until_reset``, as observed from the
+    latest response headers. ``acquire()`` (or ``acquire_async()``) blocks until
+    a token is available. The handler is shared safely between threads and
+    asyncio tasks: waiters reserve their slot under a lock and sleep outside it.
     """
 
-    def __init__(self, threshold: int = 100, critical_threshold: int = 10):
+    def __init__(
+        self,
+        threshold: int = 100,
+        critical_threshold: int = 10,
+        pacing: bool = False,
+        burst: int = 10,
+    ):
         """Initialize rate limit handler.
 
         Args:
             threshold: Pause when remaining calls fall below this
             critical_threshold: Abort when remaining falls below this
+            pacing: Spread the remaining budget evenly over the window
+            burst: Maximum number of requests allowed back-to-back when pacing
         """
         self.threshold = threshold
         self.critical_threshold = critical_threshold
+        self.pacing = pacing
+        self.burst = burst
         self.remaining = 5000
         self.limit = 5000
         self.reset_timestamp = 0
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
 
     def check_and_wait(self, response: Any) -> None:
         """Check rate limit from response headers and wait if needed.
 
+        In pacing mode no waiting happens here; ``acquire()`` spreads requests
+        over the window instead.
+
         Args:
             response: requests.Response object
 
         Raises:
             RateLimitError: If rate limit is critically low
         """
-        headers = response.headers
-
-        # Parse rate limit headers
-        self.remaining = int(headers.get("X-RateLimit-Remaining", self.remaining))
-        self.limit = int(headers.get("X-RateLimit-Limit", self.limit))
-        self.reset_timestamp = int(headers.get("X-RateLimit-Reset", 0))
+        resource = self.update_from_response(response)
 
         logger.debug(
-            f"Rate limit: {self.remaining}/{self.limit} remaining, resets at {self.reset_timestamp}"
+            f"Rate limit ({resource}): {self.remaining}/{self.limit} remaining, "
+            f"resets at {self.reset_timestamp}"
         )
 
+        critical_threshold = self.critical_threshold
+        if self.pacing:
+            critical_threshold = self._scaled(critical_threshold, self.limit)
+
         # Critical threshold - abort
-        if self.remaining < self.critical_threshold:
+        if self.remaining < critical_threshold:
             wait_seconds = max(0, self.reset_timestamp - int(time.time()))
             raise RateLimitError(
                 f"Rate limit critically low ({self.remaining}), resets in {wait_seconds}s",
                 reset_timestamp=self.reset_timestamp,
             )
 
+        if self.pacing:
+            return
+
         # Low threshold - wait for reset
         if self.remaining < self.threshold:
             wait_seconds = max(0, self.reset_timestamp - int(time.time()))
@@ -72,18 +126,153 @@ class RateLimitHandler:
                 )
                 time.sleep(wait_seconds + 1)  # Add 1s buffer
 
-    def update_from_response(self, response: Any) -> None:
+    def update_from_response(self, response: Any) -> str:
         """Update rate limit info from response without waiting.
 
         Useful for non-blocking updates.
 
         Args:
             response: requests.Response object
+
+        Returns:
+            Name of the rate limit resource the response was counted against
         """
         headers = response.headers
-        self.remaining = int(headers.get("X-RateLimit-Remaining", self.remaining))
-        self.limit = int(headers.get("X-RateLimit-Limit", self.limit))
-        self.reset_timestamp = int(headers.get("X-RateLimit-Reset", 0))
+        resource = headers.get("X-RateLimit-Resource", DEFAULT_RESOURCE)
+        with self._lock:
+            self.remaining = int(headers.get("X-RateLimit-Remaining", self.remaining))
+            self.reset_timestamp = int(headers.get("X-RateLimit-Reset", 0))
+
+            if "X-RateLimit-Remaining" in headers:
+                bucket = self._get_bucket(resource)
+                if self.pacing:
+                    self._refill(bucket, time.monotonic())
+                bucket.remaining = self.remaining
+                bucket.limit = int(headers.get("X-RateLimit-Limit", bucket.limit))
+                bucket.reset_timestamp = self.reset_timestamp
+                self.limit = bucket.limit
+                if self.pacing:
+                    bucket.refill_rate = self._observed_rate(bucket)
+        return str(resource)
+
+    def available(self, resource: str = DEFAULT_RESOURCE) -> int:
+        """Get the number of calls left in the current window.
+
+        Resources not seen yet report their documented default limit (see
+        ``DEFAULT_LIMITS``), resources whose window has already reset their
+        last reported limit.
+
+        Args:
+            resource: Rate limit resource (core, search, ...)
+
+        Returns:
+            Remaining calls
+        """
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            if bucket is None:
+                return default_limit(resource)
+            if bucket.reset_timestamp <= time.time():
+                return bucket.limit
+            return bucket.remaining
+
+    def headroom(self, resource: str = DEFAULT_RESOURCE) -> int:
+        """Get the number of calls left above the reserve threshold (may be negative)."""
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            limit = bucket.limit if bucket else default_limit(resource)
+        return self.available(resource) - self._scaled(self.threshold, limit)
+
+    def reset_at(self, resource: str = DEFAULT_RESOURCE) -> int:
+        """Get the reset timestamp of a resource's window (0 if unknown)."""
+        with self._lock:
+            bucket = self._buckets.get(resource)
+            return bucket.reset_timestamp if bucket else 0
+
+    def acquire(self, resource: str = DEFAULT_RESOURCE) -> float:
+        """Block until a request against ``resource`` may be sent.
+
+        A no-op unless pacing is enabled.
+
+        Args:
+            resource: Rate limit resource the request will count against
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self._reserve(resource)
+        if delay > 0:
+            logger.debug(f"Pacing {resource} requests: waiting {delay:.2f}s")
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, resource: str = DEFAULT_RESOURCE) -> float:
+        """Asyncio variant of ``acquire()`` that does not block the event loop.
+
+        Args:
+            resource: Rate limit resource the request will count against
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self._reserve(resource)
+        if delay > 0:
+            logger.debug(f"Pacing {resource} requests: waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+        return delay
+
+    def _reserve(self, resource: str) -> float:
+        """Take a token from the bucket, returning how long to wait for it."""
+        if not self.pacing:
+            return 0.0
+
+        with self._lock:
+            bucket = self._get_bucket(resource)
+            rate = bucket.refill_rate
+            if rate is None:
+                # Nothing observed yet - let the first requests through
+                return 0.0
+
+            if rate <= 0:
+                # Budget for this window is spent - wait for the reset
+                return float(max(0, bucket.reset_timestamp - int(time.time())) + 1)
+
+            self._refill(bucket, time.monotonic())
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return 0.0
+            # Tokens went negative: this caller queues behind earlier reservations
+            return -bucket.tokens / rate
+
+    def _get_bucket(self, resource: str) -> _Bucket:
+        """Get or create the bucket for a resource (caller holds the lock)."""
+        bucket = self._buckets.get(resource)
+        if bucket is None:
+            limit = default_limit(resource)
+            bucket = _Bucket(remaining=limit, limit=limit, tokens=float(self.burst))
+            self._buckets[resource] = bucket
+        return bucket
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        """Add tokens accrued since the last refill (caller holds the lock)."""
+        if bucket.refill_rate:
+            elapsed = now - bucket.last_refill
+            bucket.tokens = min(float(self.burst), bucket.tokens + elapsed * bucket.refill_rate)
+        bucket.last_refill = now
+
+    def _observed_rate(self, bucket: _Bucket) -> float | None:
+        """Compute the sustainable request rate from the latest headers."""
+        seconds_left = bucket.reset_timestamp - time.time()
+        if bucket.reset_timestamp <= 0 or seconds_left <= 0:
+            # Unknown or already reset window - wait for fresh headers
+            return None
+        budget = bucket.remaining - self._scaled(self.threshold, bucket.limit)
+        return max(0, budget) / max(seconds_left, 1.0)
+
+    @staticmethod
+    def _scaled(threshold: int, limit: int) -> int:
+        """Scale a threshold down for small resources (e.g. search: 30/min)."""
+        return min(threshold, max(1, limit // 10))
 
     def get_status(self) -> dict[str, int]:
         """Get current rate limit status.
@@ -0,0 +1,121 @@
+"""Retry policy for transient GitHub API failures."""
+
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Patterns collapsing concrete endpoints into templates for failure counters
+_ENDPOINT_PATTERNS = [
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"/[0-9a-f]{40}(?=/|$)"), "/{sha}"),
+    (re.compile(r"/branches/.+$"), "/branches/{branch}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{number}"),
+]
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Normalize an API endpoint into a template for per-endpoint statistics.
+
+    Example: ``/repos/foo/bar/pulls/12/files`` -> ``/repos/{owner}/{repo}/pulls/{number}/files``
+    """
+    key = "/" + endpoint.lstrip("/")
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+@dataclass
+class RetryPolicy:
+    """Decides whether and how long to wait before retrying a failed request.
+
+    Uses exponential backoff with jitter, honors server-provided waits
+    (``Retry-After`` or rate limit reset), and caps the total number of
+    retries per run so a persistent outage cannot stall a run indefinitely.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    retry_budget: int = 200
+    max_rate_limit_wait: float = 900.0
+
+    retries_used: int = 0
+    failure_counts: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def backoff(
+        self,
+        endpoint: str,
+        attempt: int,
+        retry_after: float | None = None,
+        reason: str = "",
+    ) -> float | None:
+        """Record a failed attempt and compute the delay before the next one.
+
+        Args:
+            endpoint: API endpoint that failed
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Server-requested wait in seconds, if any
+            reason: Short description of the failure for logging
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        key = endpoint_key(endpoint)
+        with self._lock:
+            self.failure_counts[key] += 1
+
+            if attempt >= self.max_attempts:
+                logger.warning(f"Giving up on {endpoint} after {attempt} attempts: {reason}")
+                return None
+
+            if self.retries_used >= self.retry_budget:
+                logger.warning(
+                    f"Retry budget ({self.retry_budget}) exhausted, not retrying {endpoint}"
+                )
+                return None
+
+            if retry_after is not None and retry_after > self.max_rate_limit_wait:
+                logger.warning(
+                    f"Server asked to wait {retry_after:.0f}s for {endpoint}, "
+                    f"more than {self.max_rate_limit_wait:.0f}s allowed"
+                )
+                return None
+
+            self.retries_used += 1
+
+        if retry_after is not None:
+            # Server knows best; jitter only spreads concurrent retries apart
+            delay = retry_after + random.uniform(0, 1)
+        else:
+            ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            delay = random.uniform(ceiling / 2, ceiling)
+
+        logger.info(f"Retrying {endpoint} in {delay:.1f}s (attempt {attempt + 1}): {reason}")
+        return delay
+
+    def rate_limit_delay(self, reset_timestamp: int) -> float | None:
+        """Compute how long to wait for a rate limit window to reset.
+
+        Args:
+            reset_timestamp: Unix timestamp when the window resets
+
+        Returns:
+            Seconds to wait, or None if the reset is too far away
+        """
+        wait = max(0, reset_timestamp - int(time.time())) + 1
+        if wait > self.max_rate_limit_wait:
+            return None
+        return float(wait)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get failure counts per endpoint template."""
+        with self._lock:
+            return dict(self.failure_counts)
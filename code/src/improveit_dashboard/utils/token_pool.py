@@ -0,0 +1,104 @@
+"""Pool of GitHub tokens with per-token rate limit tracking."""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.rate_limit import DEFAULT_RESOURCE, RateLimitHandler
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PooledToken:
+    """A token together with its own rate limit bucket."""
+
+    token: str
+    rate_limit: RateLimitHandler
+
+    @property
+    def label(self) -> str:
+        """Short, log-safe identifier for the token."""
+        return f"...{self.token[-4:]}" if self.token else "<anonymous>"
+
+    @property
+    def key(self) -> str:
+        """Stable, non-secret identifier for the token (to scope ETags to it)."""
+        return hashlib.sha256(self.token.encode()).hexdigest()[:8]
+
+
+class TokenPool:
+    """Distributes requests over several tokens.
+
+    Each request goes to the token with the most rate limit headroom.
+    Exhausted tokens (below the threshold, window not yet reset) are skipped
+    until their reset time; when all are exhausted, the one resetting first
+    is returned and its handler does the waiting.
+    """
+
+    def __init__(
+        self,
+        tokens: list[str],
+        threshold: int = 100,
+        pacing: bool = False,
+    ):
+        """Initialize token pool.
+
+        Args:
+            tokens: GitHub tokens (duplicates and empty strings are dropped;
+                an empty list means unauthenticated access)
+            threshold: Per-token reserve below which a token counts as exhausted
+            pacing: Pace requests per token (see RateLimitHandler)
+        """
+        unique = list(dict.fromkeys(t for t in tokens if t)) or [""]
+        self.entries = [
+            PooledToken(token, RateLimitHandler(threshold=threshold, pacing=pacing))
+            for token in unique
+        ]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def select(self, resource: str = DEFAULT_RESOURCE) -> PooledToken:
+        """Pick the token to use for the next request.
+
+        Args:
+            resource: Rate limit resource the request counts against
+
+        Returns:
+            Token with the most headroom, or the one resetting first if all
+            are exhausted
+        """
+        if len(self.entries) == 1:
+            return self.entries[0]
+
+        with self._lock:
+            headrooms = [(entry.rate_limit.headroom(resource), entry) for entry in self.entries]
+            best_headroom, best = max(headrooms, key=lambda pair: pair[0])
+            if best_headroom > 0:
+                return best
+
+            # Everything exhausted - go with the earliest reset
+            entry = min(self.entries, key=lambda e: e.rate_limit.reset_at(resource))
+            logger.warning(f"All {len(self.entries)} tokens exhausted for {resource}")
+            return entry
+
+    def find(self, key: str) -> PooledToken | None:
+        """Get the entry whose ``PooledToken.key`` is ``key``, if any."""
+        return next((entry for entry in self.entries if entry.key == key), None)
+
+    def has_headroom(
+        self, resource: str = DEFAULT_RESOURCE, exclude: PooledToken | None = None
+    ) -> bool:
+        """Check whether any token (other than ``exclude``) still has headroom."""
+        return any(
+            entry.rate_limit.headroom(resource) > 0
+            for entry in self.entries
+            if entry is not exclude
+        )
+
+    def total_remaining(self, resource: str = DEFAULT_RESOURCE) -> int:
+        """Sum of remaining calls across all tokens."""
+        return sum(entry.rate_limit.available(resource) for entry in self.entries)
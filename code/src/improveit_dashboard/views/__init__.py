@@ -1,9 +1,41 @@
-"""View generation for improveit-dashboard."""
+"""View generation for improveit-dashboard.
 
-from improveit_dashboard.views.dashboard import generate_dashboard
-from improveit_dashboard.views.reports import generate_user_reports
+Exports are resolved on first access (PEP 562), so importing one view
+module (e.g. export) does not load the others and numpy.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from improveit_dashboard.views.dashboard import generate_dashboard
+    from improveit_dashboard.views.export import export_prs
+    from improveit_dashboard.views.reports import generate_user_reports
+    from improveit_dashboard.views.statistics import generate_statistics_report
+    from improveit_dashboard.views.trends import generate_trends_report
+
+# Exported name -> defining module
+_EXPORTS = {
+    "export_prs": "improveit_dashboard.views.export",
+    "generate_dashboard": "improveit_dashboard.views.dashboard",
+    "generate_statistics_report": "improveit_dashboard.views.statistics",
+    "generate_trends_report": "improveit_dashboard.views.trends",
+    "generate_user_reports": "improveit_dashboard.views.reports",
+}
 
 __all__ = [
+    "export_prs",
     "generate_dashboard",
+    "generate_statistics_report",
+    "generate_trends_report",
     "generate_user_reports",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,14 @@
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
+
+from improveit_dashboard.controllers.analytics import (
+    CLOSED,
+    MERGED,
+    ModelSnapshot,
+    RepositoryMetrics,
+)
 from improveit_dashboard.models.pull_request import PullRequest
 from improveit_dashboard.models.repository import Repository
 from improveit_dashboard.utils.logging import get_logger
@@ -99,6 +107,7 @@ def generate_dashboard(
             f"- **Total PRs**: {total_prs}",
             f"- **Merged**: {total_merged}",
             f"- **Open**: {total_open}",
+            "- **Statistics**: [response and merge times](Summaries/statistics.md)",
             "",
         ]
     )
@@ -196,6 +205,7 @@ def generate_responsiveness_reports(
     repositories: dict[str, Repository],
     output_dir: Path,
     behavior_overrides: dict[str, str] | None = None,
+    snapshot: ModelSnapshot | None = None,
 ) -> list[Path]:
     """Generate per-category responsiveness detail files.
 
@@ -210,6 +220,7 @@ def generate_responsiveness_reports(
         repositories: Dict mapping full_name to Repository
         output_dir: Base output directory (e.g., Summaries/)
         behavior_overrides: Optional dict mapping repo full_name to behavior category override
+        snapshot: Columnar snapshot of ``repositories`` (built if not given)
 
     Returns:
         List of generated file paths
@@ -233,6 +244,13 @@ def generate_responsiveness_reports(
         category = overrides.get(repo.full_name, repo.behavior_category)
         repos_by_category[category].append(repo)
 
+    # Per-repository aggregates for all tables, in one vectorized pass
+    snapshot = snapshot or ModelSnapshot.from_repositories(repositories)
+    metrics = RepositoryMetrics.from_snapshot(snapshot)
+    metrics_index = {name: i for i, name in enumerate(metrics.repo_names)}
+    merged_counts = metrics.count(MERGED)
+    closed_counts = metrics.count(CLOSED)
+
     # Sort repos in each category by name
     for repos in repos_by_category.values():
         repos.sort(key=lambda r: r.full_name.lower())
@@ -269,25 +287,21 @@ def generate_responsiveness_reports(
             )
 
             for repo in repos:
-                merged = repo.merged_count
-                closed = sum(1 for pr in repo.prs.values() if pr.status == "closed")
-                total = len(repo.prs)
-
-                # Calculate acceptance rate
-                decided = merged + closed
-                if decided > 0:
-                    acceptance = f"{(merged / decided * 100):.0f}%"
+                i = metrics_index[repo.full_name]
+                merged = int(merged_counts[i])
+                closed = int(closed_counts[i])
+                total = int(metrics.total[i])
+
+                # Acceptance among decided (merged or closed) PRs
+                decided_rate = float(metrics.decided_acceptance_rate[i])
+                if not np.isnan(decided_rate):
+                    acceptance = f"{(decided_rate * 100):.0f}%"
                 else:
                     acceptance = "-"
 
-                # Calculate average response time
-                response_times = [
-                    pr.time_to_first_response_hours
-                    for pr in repo.prs.values()
-                    if pr.time_to_first_response_hours is not None
-                ]
-                if response_times:
-                    avg_hours = sum(response_times) / len(response_times)
+                # Average response time
+                avg_hours = float(metrics.avg_response_hours[i])
+                if not np.isnan(avg_hours):
                     if avg_hours < 24:
                         avg_response = f"{avg_hours:.0f}h"
                     else:
@@ -0,0 +1,243 @@
+"""Streaming export of PRs as JSON, JSONL, CSV or Parquet.
+
+Rows are serialized and written one PR at a time (Parquet: one row group
+per batch), so exports can be piped and their memory use does not grow
+with the number of PRs. Parquet requires the optional ``pyarrow``
+dependency (``pip install improveit-dashboard[parquet]``).
+"""
+
+import csv
+import json
+import types
+from collections.abc import Iterable, Sequence
+from dataclasses import fields
+from datetime import datetime
+from typing import IO, Any, Literal, Union, get_args, get_origin, get_type_hints
+
+from improveit_dashboard.models.engagement import EngagementState
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ExportFormat = Literal["json", "jsonl", "csv", "parquet", "text"]
+EXPORT_FORMATS: tuple[ExportFormat, ...] = ("json", "jsonl", "csv", "parquet", "text")
+
+# Formats written as bytes rather than text
+BINARY_FORMATS = frozenset({"parquet"})
+
+# PR fields that can be exported, in model order
+PR_FIELDS = tuple(f.name for f in fields(PullRequest))
+
+# Columns exported as CSV unless --fields is given
+CSV_FIELDS = (
+    "repository",
+    "number",
+    "title",
+    "author",
+    "status",
+    "tool",
+    "created_at",
+    "merged_at",
+    "response_status",
+    "last_developer_comment_body",
+)
+
+# Columns of the tab-separated text listing unless --fields is given
+TEXT_FIELDS = ("repository", "number", "status", "tool", "author", "title")
+
+# --filter presets, as filter expressions (see controllers.query)
+FILTER_PRESETS: dict[str, str | None] = {
+    "all": None,
+    "needs-response": "response_status = awaiting_submitter",
+    "open": "status in (draft, open)",
+    "merged": "status = merged",
+}
+
+# Rows per Parquet row group
+PARQUET_BATCH_SIZE = 10_000
+
+
+def parse_fields(spec: str) -> tuple[str, ...]:
+    """Parse a comma-separated field list.
+
+    Args:
+        spec: Field names, e.g. "repository,number,status"
+
+    Returns:
+        Field names in the given order
+
+    Raises:
+        ValueError: If a name is not a PR field
+    """
+    names = tuple(name.strip() for name in spec.split(",") if name.strip())
+    if unknown := [name for name in names if name not in PR_FIELDS]:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(PR_FIELDS)}"
+        )
+    return names
+
+
+def export_prs(
+    prs: Iterable[PullRequest],
+    out: IO[Any],
+    fmt: ExportFormat = "json",
+    field_names: Sequence[str] | None = None,
+) -> int:
+    """Write PRs to a stream in the given format.
+
+    Args:
+        prs: PRs to export
+        out: Text stream, or binary stream for formats in BINARY_FORMATS
+            (CSV streams should be opened with ``newline=""``)
+        fmt: Output format
+        field_names: Fields to export (default: all fields; CSV_FIELDS for
+            CSV, TEXT_FIELDS for text)
+
+    Returns:
+        Number of exported PRs
+    """
+    if fmt == "json":
+        return _write_json(prs, out, field_names)
+    if fmt == "jsonl":
+        return _write_jsonl(prs, out, field_names)
+    if fmt == "csv":
+        return _write_csv(prs, out, field_names or CSV_FIELDS)
+    if fmt == "text":
+        return _write_text(prs, out, field_names or TEXT_FIELDS)
+    return _write_parquet(prs, out, field_names or PR_FIELDS)
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a PR field value to its JSON representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, EngagementState):
+        return value.to_dict()
+    return value
+
+
+def pr_row(pr: PullRequest, field_names: Sequence[str] | None = None) -> dict[str, Any]:
+    """Serialize the selected fields of a PR as JSON values.
+
+    Args:
+        pr: PR to serialize
+        field_names: Fields to include (default: all, as in ``pr.to_dict()``)
+
+    Returns:
+        Mapping of field name to JSON value
+    """
+    if field_names is None:
+        return pr.to_dict()
+    return {name: _jsonable(getattr(pr, name)) for name in field_names}
+
+
+def _write_json(prs: Iterable[PullRequest], out: IO[str], field_names: Sequence[str] | None) -> int:
+    """Write a JSON array, laid out like ``json.dumps(rows, indent=2)``."""
+    count = 0
+    for pr in prs:
+        item = json.dumps(pr_row(pr, field_names), indent=2).replace("\n", "\n  ")
+        out.write(("[\n  " if count == 0 else ",\n  ") + item)
+        count += 1
+    out.write("\n]\n" if count else "[]\n")
+    return count
+
+
+def _write_jsonl(
+    prs: Iterable[PullRequest], out: IO[str], field_names: Sequence[str] | None
+) -> int:
+    """Write one compact JSON object per line."""
+    count = 0
+    for pr in prs:
+        out.write(json.dumps(pr_row(pr, field_names), separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert a PR field value to a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(value)
+    if isinstance(value, EngagementState):
+        return json.dumps(value.to_dict(), separators=(",", ":"))
+    return _jsonable(value)
+
+
+def _write_csv(prs: Iterable[PullRequest], out: IO[str], field_names: Sequence[str]) -> int:
+    """Write CSV with a header row."""
+    writer = csv.writer(out)
+    writer.writerow(field_names)
+    count = 0
+    for pr in prs:
+        writer.writerow([_csv_value(getattr(pr, name)) for name in field_names])
+        count += 1
+    return count
+
+
+def _write_text(prs: Iterable[PullRequest], out: IO[str], field_names: Sequence[str]) -> int:
+    """Write a tab-separated listing with a header, for reading in a terminal."""
+    out.write("\t".join(field_names) + "\n")
+    count = 0
+    for pr in prs:
+        cells = (_csv_value(getattr(pr, name)) for name in field_names)
+        out.write("\t".join(" ".join(str(cell).split()) or "-" for cell in cells) + "\n")
+        count += 1
+    return count
+
+
+def _arrow_type(hint: Any) -> Any:
+    """Map a PullRequest field annotation to an Arrow type."""
+    import pyarrow as pa
+
+    if get_origin(hint) in (Union, types.UnionType):
+        # Optional[X]: nullability is the Arrow default
+        (hint,) = [arg for arg in get_args(hint) if arg is not type(None)]
+    if get_origin(hint) is Literal or hint is str:
+        return pa.string()
+    if get_origin(hint) is list:
+        return pa.list_(pa.string())
+    if hint is datetime:
+        return pa.timestamp("us", tz="UTC")
+    # EngagementState is exported as a JSON string, like its to_dict() in JSONL
+    return {bool: pa.bool_(), int: pa.int64(), float: pa.float64()}.get(hint, pa.string())
+
+
+def _arrow_value(value: Any) -> Any:
+    """Convert a PR field value for Arrow."""
+    if isinstance(value, EngagementState):
+        return json.dumps(value.to_dict(), separators=(",", ":"))
+    return value
+
+
+def _write_parquet(prs: Iterable[PullRequest], out: IO[bytes], field_names: Sequence[str]) -> int:
+    """Write Parquet, one row group per PARQUET_BATCH_SIZE PRs."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet export requires pyarrow (pip install improveit-dashboard[parquet])"
+        ) from e
+
+    hints = get_type_hints(PullRequest)
+    schema = pa.schema([(name, _arrow_type(hints[name])) for name in field_names])
+    columns: dict[str, list[Any]] = {name: [] for name in field_names}
+    count = 0
+
+    def flush(writer: Any) -> None:
+        writer.write_table(pa.table(columns, schema=schema))
+        for values in columns.values():
+            values.clear()
+
+    with pq.ParquetWriter(out, schema) as writer:
+        for pr in prs:
+            for name in field_names:
+                columns[name].append(_arrow_value(getattr(pr, name)))
+            count += 1
+            if count % PARQUET_BATCH_SIZE == 0:
+                flush(writer)
+        if count % PARQUET_BATCH_SIZE or count == 0:
+            flush(writer)
+    return count
@@ -0,0 +1,159 @@
+"""Cross-repository statistics report generation."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from improveit_dashboard.controllers.analytics import (
+    BEHAVIOR_CATEGORIES,
+    MERGE_TIME_BUCKETS,
+    ModelSnapshot,
+    compute_statistics,
+)
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.markdown import write_if_changed
+from improveit_dashboard.views.dashboard import BEHAVIOR_INFO
+
+logger = get_logger(__name__)
+
+TOOL_DISPLAY = {"codespell": "Codespell", "shellcheck": "Shellcheck", "other": "Other"}
+ADOPTION_DISPLAY = {
+    "full_automation": "Full automation",
+    "config_only": "Config only",
+    "typo_fixes": "Typo fixes",
+    "rejected": "Rejected",
+}
+
+
+def generate_statistics_report(
+    repositories: dict[str, Repository],
+    output_dir: Path,
+    behavior_overrides: dict[str, str] | None = None,
+    snapshot: ModelSnapshot | None = None,
+) -> list[Path]:
+    """Generate the statistics report and its JSON companion.
+
+    Creates:
+    - {output_dir}/statistics.md
+    - {output_dir}/statistics.json
+
+    Args:
+        repositories: Dict mapping full_name to Repository
+        output_dir: Base output directory (e.g., Summaries/)
+        behavior_overrides: Optional dict mapping repo full_name to behavior category override
+        snapshot: Columnar snapshot of ``repositories`` (built if not given)
+
+    Returns:
+        List of generated file paths
+    """
+    overrides = behavior_overrides or {}
+    output_dir.mkdir(parents=True, exist_ok=True)
+    snapshot = snapshot or ModelSnapshot.from_repositories(repositories)
+
+    categories = [
+        overrides.get(name, repositories[name].behavior_category) for name in snapshot.repo_names
+    ]
+    stats = compute_statistics(snapshot, categories)
+
+    json_path = output_dir / "statistics.json"
+    write_if_changed(json_path, json.dumps(stats, indent=2, sort_keys=True) + "\n")
+
+    md_path = output_dir / "statistics.md"
+    write_if_changed(md_path, "\n".join(_render_markdown(stats)) + "\n")
+
+    logger.info(f"Generated statistics for {stats['total_prs']} PRs")
+    return [md_path, json_path]
+
+
+def _format_hours(hours: float | None) -> str:
+    """Format a duration in hours for a table cell."""
+    if hours is None:
+        return "-"
+    if hours < 24:
+        return f"{hours:.0f}h"
+    return f"{hours / 24:.1f}d"
+
+
+def _render_markdown(stats: dict[str, Any]) -> list[str]:
+    """Render statistics as markdown lines."""
+    lines = [
+        "# Statistics",
+        "",
+        f"*Last updated: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M UTC')}*",
+        "",
+        "[< Back to Dashboard](../README.md)",
+        "",
+        f"Across **{stats['total_prs']}** PRs in **{stats['total_repositories']}** repositories.",
+        "Medians and percentiles are shown instead of averages, which a few",
+        "long-ignored PRs would skew. Machine-readable data: [statistics.json](statistics.json).",
+        "",
+    ]
+
+    # Time to first response
+    response = stats["time_to_first_response_hours"]
+    lines.extend(
+        [
+            "## Time to First Response",
+            "",
+            "| Tool | PRs with response | Median | p90 | Mean |",
+            "|------|-------------------|--------|-----|------|",
+        ]
+    )
+    rows = [("All", response["all"])]
+    rows.extend((TOOL_DISPLAY[tool], s) for tool, s in response["by_tool"].items() if s["count"])
+    for label, s in rows:
+        lines.append(
+            f"| {label} | {s['count']} | {_format_hours(s['p50'])} "
+            f"| {_format_hours(s['p90'])} | {_format_hours(s['mean'])} |"
+        )
+    lines.append("")
+
+    # Time to merge distributions
+    merge = stats["time_to_merge_hours"]
+    lines.extend(["## Time to Merge", ""])
+    for title, display, groups in [
+        ("By Tool", TOOL_DISPLAY, merge["by_tool"]),
+        ("By Adoption Level", ADOPTION_DISPLAY, merge["by_adoption_level"]),
+    ]:
+        lines.extend(
+            [
+                f"### {title}",
+                "",
+                "| Group | Merged | p25 | Median | p75 | p90 | "
+                + " | ".join(MERGE_TIME_BUCKETS)
+                + " |",
+                "|-------|--------|-----|--------|-----|-----|" + "---|" * len(MERGE_TIME_BUCKETS),
+            ]
+        )
+        rows = [("All", merge["all"])]
+        rows.extend((display[key], s) for key, s in groups.items() if s["count"])
+        for label, s in rows:
+            percentiles = " | ".join(_format_hours(s[p]) for p in ("p25", "p50", "p75", "p90"))
+            histogram = " | ".join(str(s["histogram"][b]) for b in MERGE_TIME_BUCKETS)
+            lines.append(f"| {label} | {s['count']} | {percentiles} | {histogram} |")
+        lines.append("")
+
+    # Acceptance by responsiveness category
+    lines.extend(
+        [
+            "## Acceptance by Repository Responsiveness",
+            "",
+            "Acceptance is the share of merged PRs among merged and closed ones.",
+            "",
+            "| Category | Repositories | PRs | Merged | Closed | Acceptance |",
+            "|----------|--------------|-----|--------|--------|------------|",
+        ]
+    )
+    for category in BEHAVIOR_CATEGORIES:
+        s = stats["acceptance_by_behavior"][category]
+        rate = s["acceptance_rate"]
+        acceptance = "-" if rate is None else f"{rate * 100:.0f}%"
+        lines.append(
+            f"| {BEHAVIOR_INFO[category]['display']} | {s['repositories']} | {s['prs']} "
+            f"| {s['merged']} | {s['closed']} | {acceptance} |"
+        )
+    lines.append("")
+
+    return lines
@@ -0,0 +1,70 @@
+"""Trend report generation from the run history."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from improveit_dashboard.controllers.history import HistoryEntry, HistoryStore
+from improveit_dashboard.utils.logging import get_logger
+from improveit_dashboard.utils.markdown import write_if_changed
+
+logger = get_logger(__name__)
+
+
+def generate_trends_report(history: HistoryStore, output_dir: Path, limit: int = 50) -> Path | None:
+    """Generate the trends report from the run history only.
+
+    Creates {output_dir}/trends.md. The model itself is not loaded.
+
+    Args:
+        history: Run history store
+        output_dir: Base output directory (e.g., Summaries/)
+        limit: Maximum number of most recent runs to list
+
+    Returns:
+        Generated file path, or None if there is no history yet
+    """
+    entries: list[HistoryEntry] = []
+    for entry in history.entries():
+        entries.append(entry)
+        if len(entries) > limit:
+            del entries[0]
+    if not entries:
+        logger.info("No run history to report trends from")
+        return None
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / "trends.md"
+
+    lines = [
+        "# Trends",
+        "",
+        f"*Last updated: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M UTC')}*",
+        "",
+        "[< Back to Dashboard](../README.md)",
+        "",
+        "Totals after each recorded run, with the changes that run found (most recent first).",
+        "",
+        "| Date | Source | PRs | Open | Merged | Closed | Merge Rate "
+        "| Awaiting Maintainer | New | Newly Merged | Newly Closed |",
+        "|------|--------|-----|------|--------|--------|------------"
+        "|---------------------|-----|--------------|--------------|",
+    ]
+
+    for entry in reversed(entries):
+        totals = entry.aggregates
+        rate = totals.get("merge_rate")
+        merge_rate = "-" if rate is None else f"{rate * 100:.0f}%"
+        lines.append(
+            f"| {entry.at.strftime('%Y-%m-%d %H:%M')} | {entry.source} "
+            f"| {totals.get('total_prs', 0)} | {totals.get('open', 0)} "
+            f"| {totals.get('merged', 0)} | {totals.get('closed', 0)} | {merge_rate} "
+            f"| {totals.get('awaiting_maintainer', 0)} "
+            f"| {entry.new_prs} "
+            f"| {entry.count_transitions('status', 'merged')} "
+            f"| {entry.count_transitions('status', 'closed')} |"
+        )
+    lines.append("")
+
+    write_if_changed(output_path, "\n".join(lines) + "\n")
+    logger.info(f"Generated trends report from {len(entries)} runs")
+    return output_path
@@ -0,0 +1,102 @@
+"""Micro-benchmark for columnar repository analytics.
+
+Builds a synthetic model, then times building the columnar snapshot and
+the vectorized per-repository aggregations against the per-repository
+Python loops.
+
+Run with::
+
+    python tests/benchmarks/bench_analytics.py [--prs N] [--repos R]
+"""
+
+import argparse
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from improveit_dashboard.controllers.analytics import (
+    ModelSnapshot,
+    RepositoryMetrics,
+    grouped_percentiles,
+)
+from improveit_dashboard.models.pull_request import PRStatus, PullRequest
+from improveit_dashboard.models.repository import Repository
+
+STATUSES: list[PRStatus] = ["draft", "open", "merged", "closed"]
+
+
+def make_model(n_prs: int, n_repos: int, seed: int = 0) -> dict[str, Repository]:
+    """Generate repositories with randomly distributed PRs."""
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1, tzinfo=UTC)
+    repositories = {
+        f"owner/repo{i}": Repository(
+            owner="owner", name=f"repo{i}", platform="github", url=f"https://github.com/x/{i}"
+        )
+        for i in range(n_repos)
+    }
+    names = list(repositories)
+    for number in range(n_prs):
+        repo = repositories[rng.choice(names)]
+        created = start + timedelta(hours=rng.uniform(0, 40000))
+        status = rng.choice(STATUSES)
+        repo.prs[number] = PullRequest(
+            number=number,
+            repository=repo.full_name,
+            platform="github",
+            url="",
+            tool="codespell",
+            title="",
+            author=f"user{number % 3}",
+            created_at=created,
+            updated_at=created,
+            merged_at=created + timedelta(hours=rng.expovariate(0.01))
+            if status == "merged"
+            else None,
+            status=status,
+            total_comments=rng.randint(0, 20),
+            time_to_first_response_hours=rng.choice([None, rng.expovariate(0.02)]),
+        )
+    return repositories
+
+
+def timed(label: str, fn: "object") -> None:
+    """Print the best of three wall-clock timings of a callable."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn()  # type: ignore[operator]
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:>32}: {best * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prs", type=int, default=100_000)
+    parser.add_argument("--repos", type=int, default=5_000)
+    args = parser.parse_args()
+
+    repositories = make_model(args.prs, args.repos)
+    snapshot = ModelSnapshot.from_repositories(repositories)
+
+    def loop_metrics() -> None:
+        for repo in repositories.values():
+            repo.recalculate_metrics()
+
+    timed("per-repository loop", loop_metrics)
+    timed("snapshot build", lambda: ModelSnapshot.from_repositories(repositories))
+    timed("vectorized metrics", lambda: RepositoryMetrics.from_snapshot(snapshot))
+    timed(
+        "p50/p90 response per repository",
+        lambda: grouped_percentiles(
+            snapshot.response_hours, snapshot.repo, len(snapshot.repo_names), [50, 90]
+        ),
+    )
+    print(f"{'PRs':>32}: {snapshot.size:>9}  ({int(np.unique(snapshot.repo).size)} repositories)")
+
+
+if __name__ == "__main__":
+    main()
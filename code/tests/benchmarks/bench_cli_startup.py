@@ -0,0 +1,71 @@
+"""Benchmark of CLI startup time.
+
+Times ``improveit-dashboard --version`` and the import of each command's
+modules in fresh interpreters, and lists the slowest imports reported by
+``python -X importtime``. tests/unit/test_cli.py checks that startup does
+not load the heavy dependencies.
+
+Run with::
+
+    python tests/benchmarks/bench_cli_startup.py [--runs N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "--version": "from improveit_dashboard.cli import main\ntry: main(['--version'])\n"
+    "except SystemExit: pass",
+    "generate": "import improveit_dashboard.controllers.pipeline",
+    "export": "import improveit_dashboard.controllers.persistence",
+    "update": "import improveit_dashboard.controllers.pipeline, "
+    "improveit_dashboard.controllers.discovery",
+}
+
+
+def wall_time(code: str, runs: int) -> float:
+    """Best wall-clock time of running code in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def slowest_imports(code: str, count: int = 10) -> list[tuple[int, str]]:
+    """Get the imports with the largest self time (microseconds)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, _, name = line.removeprefix("import time:").split("|")
+            timings.append((int(self_us), name.strip()))
+    return sorted(timings, reverse=True)[:count]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = wall_time("pass", args.runs)
+    print(f"{'interpreter':>32}: {baseline * 1000:>9.1f} ms")
+    for label, code in COMMANDS.items():
+        print(f"{label:>32}: {wall_time(code, args.runs) * 1000:>9.1f} ms")
+
+    print("\nSlowest imports for --version:")
+    for self_us, name in slowest_imports(COMMANDS["--version"]):
+        print(f"{name:>32}: {self_us / 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
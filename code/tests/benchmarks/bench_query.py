@@ -0,0 +1,38 @@
+"""Micro-benchmark for filter expression selection with and without indexes.
+
+Times a full scan against indexed selection for a selective query (one
+repository) and a broad one (one status), plus the cost of building the
+indexes, which a long-lived process pays once per model load.
+
+Run with::
+
+    python tests/benchmarks/bench_query.py [--prs N] [--repos R]
+"""
+
+import argparse
+
+from bench_analytics import make_model, timed
+
+from improveit_dashboard.controllers.query import ModelIndex, Query
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prs", type=int, default=100_000)
+    parser.add_argument("--repos", type=int, default=5_000)
+    args = parser.parse_args()
+
+    repositories = make_model(args.prs, args.repos)
+    timed("build index", lambda: ModelIndex(repositories))
+    index = ModelIndex(repositories)
+
+    for text in ("repository = 'owner/repo7' and status = open", "status = merged"):
+        query = Query(text)
+        print(f"{text}: {sum(1 for _ in query.select(repositories))} PRs")
+        timed("scan", lambda: sum(1 for _ in query.select(repositories)))  # noqa: B023
+        timed("index", lambda: sum(1 for _ in query.select(repositories, index)))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Micro-benchmark for query server latency.
+
+Times loading a synthetic model into the server (what the old export-per-page
+approach paid on every request) against answering typical requests from the
+loaded, indexed model.
+
+Run with::
+
+    python tests/benchmarks/bench_server.py [--prs N] [--repos R]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from bench_analytics import make_model, timed
+
+from improveit_dashboard.controllers.persistence import save_model
+from improveit_dashboard.controllers.server import ModelServer
+from improveit_dashboard.models.config import Configuration
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prs", type=int, default=100_000)
+    parser.add_argument("--repos", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Configuration(data_file=Path(tmp) / "repositories.json")
+        save_model(config.data_file, make_model(args.prs, args.repos))
+        config.model_cache = False
+        timed("load model + indexes (JSON)", lambda: ModelServer(config))
+        config.model_cache = True
+        ModelServer(config)
+        timed("load model + indexes (cache)", lambda: ModelServer(config))
+
+        server = ModelServer(config)
+        for target in (
+            "/prs?author=user1&status=open&limit=100",
+            "/prs?repository=owner/repo7",
+            "/inbox?author=user1",
+            "/repos?min_prs=30",
+            "/status",
+        ):
+            timed(target, lambda: server.handle(target))  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Unit tests for columnar analytics."""
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pytest
+
+from improveit_dashboard.controllers.analytics import (
+    BEHAVIOR_CATEGORIES,
+    MERGED,
+    ModelSnapshot,
+    RepositoryMetrics,
+    compute_statistics,
+    grouped_percentiles,
+)
+from improveit_dashboard.models.pull_request import PRStatus, PullRequest
+from improveit_dashboard.models.repository import Repository
+
+STATUSES: list[PRStatus] = ["draft", "open", "merged", "closed"]
+
+
+def _random_model(seed: int = 0, n_repos: int = 40) -> dict[str, Repository]:
+    """Build repositories with random PR statuses, responses and comments."""
+    rng = random.Random(seed)
+    created = datetime(2024, 1, 1, tzinfo=UTC)
+    repositories: dict[str, Repository] = {}
+    for r in range(n_repos):
+        repo = Repository(owner="o", name=f"r{r}", platform="github", url=f"https://x/o/r{r}")
+        for number in range(1, rng.randint(0, 6) + 1):
+            status = rng.choice(STATUSES)
+            response: Any = rng.choice([None, rng.uniform(0, 300)])
+            repo.add_pr(
+                PullRequest(
+                    number=number,
+                    repository=repo.full_name,
+                    platform="github",
+                    url=f"https://x/{repo.full_name}/pull/{number}",
+                    tool="codespell",
+                    title="Add codespell",
+                    author=rng.choice(["a", "b"]),
+                    created_at=created,
+                    updated_at=created,
+                    merged_at=created + timedelta(hours=5) if status == "merged" else None,
+                    status=status,
+                    total_comments=rng.randint(0, 9),
+                    time_to_first_response_hours=response,
+                )
+            )
+        repositories[repo.full_name] = repo
+    return repositories
+
+
+class TestModelSnapshot:
+    """Tests for building the columnar snapshot."""
+
+    @pytest.mark.ai_generated
+    def test_columns(self, sample_repository: Repository) -> None:
+        """Test PR attributes are encoded into aligned columns."""
+        snapshot = ModelSnapshot.from_repositories({sample_repository.full_name: sample_repository})
+        pr = next(iter(sample_repository.prs.values()))
+
+        assert snapshot.size == 1
+        assert snapshot.repo_names == [sample_repository.full_name]
+        assert snapshot.authors == [pr.author]
+        assert snapshot.created_at[0] == pr.created_at.timestamp()
+        assert np.isnan(snapshot.merged_at[0]) == (pr.merged_at is None)
+
+    @pytest.mark.ai_generated
+    def test_empty(self) -> None:
+        """Test an empty model yields empty columns and metrics."""
+        metrics = RepositoryMetrics.from_snapshot(ModelSnapshot.from_repositories({}))
+        assert metrics.total.shape == (0,)
+
+
+class TestRepositoryMetrics:
+    """Tests for vectorized metric recomputation."""
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_per_repository_metrics(self, seed: int) -> None:
+        """Test vectorized metrics agree with Repository.recalculate_metrics."""
+        repositories = _random_model(seed)
+        metrics = RepositoryMetrics.from_snapshot(ModelSnapshot.from_repositories(repositories))
+
+        for i, repo in enumerate(repositories.values()):
+            repo.recalculate_metrics()
+            assert BEHAVIOR_CATEGORIES[metrics.behavior[i]] == repo.behavior_category
+            assert metrics.acceptance_rate[i] == pytest.approx(repo.pr_acceptance_rate)
+            assert metrics.avg_engagement[i] == pytest.approx(repo.avg_engagement_level)
+            if repo.avg_time_to_first_response_hours is None:
+                assert np.isnan(metrics.avg_response_hours[i])
+            else:
+                assert metrics.avg_response_hours[i] == pytest.approx(
+                    repo.avg_time_to_first_response_hours
+                )
+        assert list(metrics.count(MERGED)) == [r.merged_count for r in repositories.values()]
+
+
+class TestGroupedPercentiles:
+    """Tests for per-group percentiles."""
+
+    @pytest.mark.ai_generated
+    def test_matches_numpy(self) -> None:
+        """Test results agree with np.nanpercentile on each group."""
+        rng = np.random.default_rng(0)
+        values = rng.exponential(50, 500)
+        values[rng.random(500) < 0.2] = np.nan
+        groups = rng.integers(0, 6, 500)
+        percentiles = [0, 25, 50, 90, 100]
+
+        result = grouped_percentiles(values, groups, 7, percentiles)
+
+        for g in range(6):
+            expected = np.nanpercentile(values[groups == g], percentiles)
+            np.testing.assert_allclose(result[g], expected)
+        assert np.isnan(result[6]).all()
+
+
+class TestComputeStatistics:
+    """Tests for cross-repository statistics."""
+
+    @pytest.mark.ai_generated
+    def test_statistics(self) -> None:
+        """Test percentiles, merge histograms and acceptance per category."""
+        repositories = _random_model(4)
+        snapshot = ModelSnapshot.from_repositories(repositories)
+        categories = ["welcoming" if i % 2 else "hostile" for i in range(len(repositories))]
+
+        stats = compute_statistics(snapshot, categories)
+
+        responses = [
+            pr.time_to_first_response_hours
+            for repo in repositories.values()
+            for pr in repo.prs.values()
+            if pr.time_to_first_response_hours is not None
+        ]
+        response = stats["time_to_first_response_hours"]["all"]
+        assert response["count"] == len(responses)
+        assert response["p50"] == pytest.approx(np.median(responses), abs=0.01)
+
+        merged = sum(r.merged_count for r in repositories.values())
+        merge = stats["time_to_merge_hours"]
+        assert merge["all"]["count"] == merged
+        assert merge["all"]["p50"] == 5.0
+        assert merge["by_tool"]["codespell"]["histogram"]["< 1 day"] == merged
+        assert merge["by_adoption_level"]["rejected"]["count"] == 0
+
+        acceptance = stats["acceptance_by_behavior"]
+        assert acceptance["welcoming"]["repositories"] == len(repositories) // 2
+        assert sum(a["prs"] for a in acceptance.values()) == snapshot.size
+        assert acceptance["selective"]["acceptance_rate"] is None
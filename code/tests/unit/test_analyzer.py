@@ -1,5 +1,7 @@
 """Unit tests for analyzer module."""
 
+from dataclasses import replace
+from datetime import UTC, datetime
 from typing import Any
 
 import pytest
@@ -10,6 +12,7 @@ from improveit_dashboard.controllers.analyzer import (
     detect_automation_types,
     determine_adoption_level,
 )
+from improveit_dashboard.models.comment import Comment
 from improveit_dashboard.models.pull_request import PullRequest
 
 
@@ -148,6 +151,63 @@ class TestAnalyzeEngagement:
         assert sample_pull_request.last_comment_is_maintainer is True
 
 
+def _comment(comment_id: int, author_type: str, day: int, edited_day: int | None = None) -> Comment:
+    return Comment(
+        id=comment_id,
+        author=author_type,
+        author_type=author_type,  # type: ignore[arg-type]
+        body=f"comment {comment_id}",
+        created_at=datetime(2025, 1, day, tzinfo=UTC),
+        is_bot=author_type == "bot",
+        updated_at=datetime(2025, 1, edited_day or day, tzinfo=UTC),
+    )
+
+
+class TestIncrementalEngagement:
+    """Tests for folding new comments into a stored engagement state."""
+
+    THREAD = [
+        _comment(1, "bot", 16),
+        _comment(2, "maintainer", 17),
+        _comment(3, "submitter", 18),
+        _comment(4, "maintainer", 19),
+        _comment(5, "bot", 20),
+    ]
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize("split", [0, 1, 2, 3, 4, 5])
+    def test_incremental_matches_full(self, sample_pull_request: PullRequest, split: int) -> None:
+        """Test folding a thread in two batches gives the full analysis result."""
+        full_pr = replace(sample_pull_request)
+        full_state = analyze_engagement(self.THREAD, full_pr)
+
+        pr = replace(sample_pull_request)
+        state = analyze_engagement(self.THREAD[:split], pr)
+        new = state.new_comments(self.THREAD[split - 1 if split else 0 :])
+        assert new is not None
+        state = analyze_engagement(new, pr, state)
+
+        assert state == full_state
+        assert pr.to_dict() == full_pr.to_dict()
+        assert pr.last_developer_comment_body == "comment 4"
+
+    @pytest.mark.ai_generated
+    def test_edit_of_seen_comment_detected(self, sample_pull_request: PullRequest) -> None:
+        """Test an edited, already analyzed comment forces a full reanalysis."""
+        state = analyze_engagement(self.THREAD[:3], sample_pull_request)
+
+        assert state.new_comments([_comment(2, "maintainer", 17, edited_day=21)]) is None
+
+    @pytest.mark.ai_generated
+    def test_state_roundtrip(self, sample_pull_request: PullRequest) -> None:
+        """Test the engagement state survives PR serialization."""
+        analyze_engagement(self.THREAD, sample_pull_request)
+
+        restored = PullRequest.from_dict(sample_pull_request.to_dict())
+
+        assert restored.engagement == sample_pull_request.engagement
+
+
 class TestDetectAutomationTypes:
     """Tests for automation type detection."""
 
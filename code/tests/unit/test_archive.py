@@ -0,0 +1,55 @@
+"""Unit tests for the raw payload archive."""
+
+from pathlib import Path
+
+import pytest
+
+from improveit_dashboard.controllers.archive import PayloadArchive
+
+
+class TestPayloadArchive:
+    """Tests for storing and loading payloads."""
+
+    @pytest.mark.ai_generated
+    def test_put_get_roundtrip(self, tmp_path: Path) -> None:
+        """Test a payload can be read back after flushing and reopening."""
+        archive = PayloadArchive(tmp_path / "archive")
+        archive.put("a/b", 1, "files", [{"filename": "setup.cfg"}])
+        archive.flush()
+
+        reopened = PayloadArchive(tmp_path / "archive")
+        assert reopened.get("a/b", 1, "files") == [{"filename": "setup.cfg"}]
+        assert reopened.get("a/b", 1, "comments") is None
+        assert reopened.get("a/b", 2, "files") is None
+
+    @pytest.mark.ai_generated
+    def test_content_addressed(self, tmp_path: Path) -> None:
+        """Test identical payloads are stored once with deterministic bytes."""
+        archive = PayloadArchive(tmp_path / "archive")
+        first = archive.put("a/b", 1, "files", {"x": 1, "y": 2})
+        second = archive.put("c/d", 7, "files", {"y": 2, "x": 1})
+
+        objects = list((tmp_path / "archive" / "objects").rglob("*.json.gz"))
+        assert first == second
+        assert len(objects) == 1
+
+        other = PayloadArchive(tmp_path / "other")
+        other.put("a/b", 1, "files", {"x": 1, "y": 2})
+        copy = next((tmp_path / "other" / "objects").rglob("*.json.gz"))
+        assert copy.read_bytes() == objects[0].read_bytes()
+
+    @pytest.mark.ai_generated
+    def test_merge_comments(self, tmp_path: Path) -> None:
+        """Test incremental comments are merged into an archived thread only."""
+        archive = PayloadArchive(tmp_path / "archive")
+        archive.merge_comments("a/b", 1, [{"id": 3}])
+        assert archive.get("a/b", 1, "comments") is None
+
+        archive.put("a/b", 1, "comments", [{"id": 1}, {"id": 2, "body": "old"}])
+        archive.merge_comments("a/b", 1, [{"id": 2, "body": "edited"}, {"id": 3}])
+
+        assert archive.get("a/b", 1, "comments") == [
+            {"id": 1},
+            {"id": 2, "body": "edited"},
+            {"id": 3},
+        ]
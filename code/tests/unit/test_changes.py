@@ -0,0 +1,111 @@
+"""Unit tests for the per-run change feed."""
+
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from improveit_dashboard.controllers.changes import ChangeFeed, diff_pr, feed_file
+from improveit_dashboard.controllers.discovery import _process_pr
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+KEY = "kestra-io/kestra#12912"
+
+
+def _read(path: Path) -> list[dict[str, Any]]:
+    """Events of a feed file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestDiffPR:
+    """Tests for deriving change events."""
+
+    @pytest.mark.ai_generated
+    def test_new_pr(self, sample_pull_request: PullRequest) -> None:
+        """Test a new PR yields a single new_pr event."""
+        events = diff_pr(None, sample_pull_request)
+
+        assert [e["type"] for e in events] == ["new_pr"]
+        assert events[0]["pr"] == KEY
+        assert events[0]["status"] == "open"
+
+    @pytest.mark.ai_generated
+    def test_changes(self, sample_pull_request: PullRequest) -> None:
+        """Test status, maintainer comment and CI changes are reported."""
+        before = replace(sample_pull_request, ci_status="success", maintainer_comments=1)
+        after = replace(
+            before,
+            status="merged",
+            ci_status="failure",
+            maintainer_comments=3,
+            last_maintainer_comment_at=datetime(2025, 1, 21, tzinfo=UTC),
+        )
+
+        events = diff_pr(before, after)
+
+        assert [e["type"] for e in events] == ["status", "maintainer_comment", "ci"]
+        assert events[0]["old"] == "open" and events[0]["new"] == "merged"
+        assert events[1]["count"] == 2
+        assert events[1]["at"] == "2025-01-21T00:00:00+00:00"
+        assert events[2]["field"] == "ci_status" and events[2]["new"] == "failure"
+
+    @pytest.mark.ai_generated
+    def test_no_changes(self, sample_pull_request: PullRequest) -> None:
+        """Test an unchanged PR yields no events."""
+        assert diff_pr(replace(sample_pull_request), sample_pull_request) == []
+
+
+class TestChangeFeed:
+    """Tests for writing feed files."""
+
+    @pytest.mark.ai_generated
+    def test_roundtrip(self, tmp_path: Path, sample_pull_request: PullRequest) -> None:
+        """Test events are appended as JSON lines."""
+        path = feed_file(tmp_path / "changes", datetime(2025, 1, 15, 10, tzinfo=UTC))
+        feed = ChangeFeed(path)
+        feed.record(replace(sample_pull_request), sample_pull_request)
+        assert not path.exists()  # Nothing to report yet
+
+        feed.record(None, sample_pull_request)
+        feed.close()
+
+        assert path.name == "20250115T100000Z.jsonl"
+        assert [(e["type"], e["pr"]) for e in _read(path)] == [("new_pr", KEY)]
+        assert feed.events == 1
+
+    @pytest.mark.ai_generated
+    def test_discovery_status_change(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test a status change applied from search data is reported."""
+        pr = sample_repository.prs[12912]
+        pr.analysis_status = "analyzed"
+        feed = ChangeFeed(tmp_path / "feed.jsonl")
+
+        _process_pr(
+            client=Mock(),
+            config=Configuration(),
+            repositories={sample_repository.full_name: sample_repository},
+            repo_name=sample_repository.full_name,
+            pr_number=12912,
+            search_data={
+                "number": 12912,
+                "state": "closed",
+                "draft": False,
+                "comments": 0,
+                "updated_at": "2025-01-25T09:00:00Z",
+                "closed_at": "2025-01-25T09:00:00Z",
+                "pull_request": {"merged_at": None},
+            },
+            run=DiscoveryRun(started_at=datetime.now(UTC)),
+            feed=feed,
+        )
+        feed.close()
+
+        events = _read(feed.path)
+        assert [(e["type"], e["old"], e["new"]) for e in events] == [("status", "open", "closed")]
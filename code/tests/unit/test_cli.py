@@ -0,0 +1,128 @@
+"""Unit tests for the command-line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from improveit_dashboard.cli import main
+from improveit_dashboard.controllers.persistence import save_model
+from improveit_dashboard.models.repository import Repository
+
+# Modules that only some commands need; none may load at CLI startup
+HEAVY_MODULES = {
+    "asyncio",
+    "csv",
+    "numpy",
+    "requests",
+    "subprocess",
+    "yaml",
+    "improveit_dashboard.controllers.analytics",
+    "improveit_dashboard.controllers.github_client",
+    "improveit_dashboard.views",
+}
+
+
+def _imported_modules(code: str, cwd: Path) -> set[str]:
+    """Run Python code with ``-X importtime`` and get the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and not line.endswith("| imported package")
+    }
+
+
+def _run_cli(*args: str) -> str:
+    """Code running the CLI with arguments, exiting with its status."""
+    return f"import sys; from improveit_dashboard.cli import main; sys.exit(main({list(args)!r}))"
+
+
+class TestStartupImports:
+    """Tests that commands import only what they use (see bench_cli_startup.py)."""
+
+    @pytest.mark.ai_generated
+    def test_import_is_light(self, tmp_path: Path) -> None:
+        """Test importing the CLI loads none of the heavy dependencies."""
+        modules = _imported_modules("import improveit_dashboard.cli", tmp_path)
+
+        assert "improveit_dashboard.cli" in modules
+        assert modules & HEAVY_MODULES == set()
+
+    @pytest.mark.ai_generated
+    def test_version(self, tmp_path: Path) -> None:
+        """Test --version loads no command dependencies."""
+        modules = _imported_modules(
+            "from improveit_dashboard.cli import main\ntry: main(['--version'])\nexcept SystemExit: pass",
+            tmp_path,
+        )
+
+        assert modules & HEAVY_MODULES == set()
+
+    @pytest.mark.ai_generated
+    def test_offline_commands_skip_network_stack(self, tmp_path: Path) -> None:
+        """Test generate and export do not import the GitHub client."""
+        generate = _imported_modules(_run_cli("generate"), tmp_path)
+        export = _imported_modules(_run_cli("export"), tmp_path)
+
+        assert "improveit_dashboard.controllers.pipeline" in generate
+        assert "requests" not in generate
+        assert "improveit_dashboard.controllers.persistence" in export
+        assert not export & {"requests", "numpy"}
+
+    @pytest.mark.ai_generated
+    def test_update_plan_is_offline(self, tmp_path: Path) -> None:
+        """Test update --plan needs no token and does not import the GitHub client."""
+        save_model(tmp_path / "data" / "repositories.json", {})
+        code = f"import os; os.environ.pop('GITHUB_TOKEN', None); {_run_cli('update', '--plan')}"
+
+        modules = _imported_modules(code, tmp_path)
+
+        assert "improveit_dashboard.controllers.planner" in modules
+        assert "requests" not in modules
+
+
+class TestQueryCommand:
+    """Tests for the query and export --where commands."""
+
+    @pytest.fixture
+    def data_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_repository: Repository
+    ) -> Path:
+        """Model file with the sample repository, at the default data file location."""
+        path = tmp_path / "data" / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+        monkeypatch.chdir(tmp_path)
+        return path
+
+    @pytest.mark.ai_generated
+    def test_query(self, data_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test query lists matching PRs and counts them."""
+        assert main(["query", "tool = codespell", "--fields", "repository,number"]) == 0
+        assert capsys.readouterr().out == "repository\tnumber\nkestra-io/kestra\t12912\n"
+
+        assert main(["query", "status = merged", "--count"]) == 0
+        assert capsys.readouterr().out == "0\n"
+
+    @pytest.mark.ai_generated
+    def test_invalid_expression(self, data_file: Path) -> None:
+        """Test an invalid expression fails before loading the model."""
+        assert main(["query", "status = pending"]) == 1
+        assert main(["export", "--where", "bogus = 1"]) == 1
+
+    @pytest.mark.ai_generated
+    def test_export_where(self, data_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test export combines --filter with --where."""
+        args = ["export", "--format", "jsonl", "--fields", "number", "--filter", "open"]
+
+        assert main([*args, "--where", "author = yarikoptic"]) == 0
+        assert capsys.readouterr().out == '{"number":12912}\n'
+        assert main([*args, "--where", "author = someone"]) == 0
+        assert capsys.readouterr().out == ""
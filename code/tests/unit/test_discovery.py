@@ -0,0 +1,667 @@
+"""Unit tests for discovery orchestration (mocked client)."""
+
+import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from improveit_dashboard.controllers.analyzer import analyze_engagement, classify_comments
+from improveit_dashboard.controllers.discovery import (
+    _analyze_comments,
+    _process_pr,
+    _search_change,
+    _search_cutoffs,
+    _with_rate_limit_wait,
+    discover,
+    process_pr,
+    run_discovery,
+    search_updates,
+)
+from improveit_dashboard.controllers.github_client import GitHubClient
+from improveit_dashboard.controllers.persistence import (
+    checkpoint_path,
+    load_checkpoint,
+    load_model,
+    save_checkpoint,
+)
+from improveit_dashboard.models.checkpoint import DiscoveryCheckpoint
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.rate_limit import RateLimitError
+from improveit_dashboard.utils.retry import RetryPolicy
+
+MODULE = "improveit_dashboard.controllers.discovery"
+
+
+class TestRateLimitWait:
+    """Tests for waiting out rate limit resets during discovery."""
+
+    @pytest.mark.ai_generated
+    def test_waits_and_retries_once(self) -> None:
+        """Test a near reset is waited out instead of aborting."""
+        client = Mock(retry_policy=RetryPolicy(max_rate_limit_wait=600))
+        func = Mock(side_effect=[RateLimitError("low", int(time.time()) + 60), "ok"])
+
+        with patch("improveit_dashboard.controllers.discovery.time.sleep") as sleep:
+            assert _with_rate_limit_wait(client, func) == "ok"
+
+        sleep.assert_called_once()
+        assert func.call_count == 2
+
+    @pytest.mark.ai_generated
+    def test_distant_reset_raises(self) -> None:
+        """Test a distant reset propagates so discovery can stop cleanly."""
+        client = Mock(retry_policy=RetryPolicy(max_rate_limit_wait=600))
+        func = Mock(side_effect=RateLimitError("low", int(time.time()) + 3600))
+
+        with pytest.raises(RateLimitError):
+            _with_rate_limit_wait(client, func)
+
+
+def _mock_client(search_results: list[dict[str, Any]] | None = None) -> Mock:
+    """Build a GitHub client mock with the attributes discovery reads."""
+    client = Mock(api_calls=0, retry_policy=RetryPolicy())
+    client.token_pool.total_remaining.return_value = 5000
+    client.search_user_prs.return_value = search_results or []
+    return client
+
+
+def _search_item(
+    number: int, user: str = "u", updated_at: str = "2025-01-10T00:00:00Z"
+) -> dict[str, Any]:
+    return {
+        "repository_url": "https://api.github.com/repos/a/b",
+        "number": number,
+        "user": {"login": user},
+        "updated_at": updated_at,
+    }
+
+
+class TestCheckpointing:
+    """Tests for checkpointing and resuming discovery runs."""
+
+    @pytest.mark.ai_generated
+    def test_resume_skips_search_and_completed(self, tmp_path: Path) -> None:
+        """Test resuming processes only the PRs left in the checkpoint."""
+        config = Configuration(data_file=tmp_path / "repositories.json", tracked_users=["u"])
+        ckpt = DiscoveryCheckpoint(
+            run=DiscoveryRun(started_at=datetime.now(UTC), new_prs=1),
+            queue=[("a/b", 1, {}), ("a/b", 2, {})],
+        )
+        ckpt.mark_completed("a/b", 1)
+        save_checkpoint(checkpoint_path(config.data_file), ckpt)
+        client = _mock_client()
+
+        with (
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=client),
+            patch(f"{MODULE}._process_pr", return_value="new") as process,
+        ):
+            run = run_discovery(config, resume=True)
+
+        client.search_user_prs.assert_not_called()
+        assert [c.kwargs["pr_number"] for c in process.call_args_list] == [2]
+        assert run.new_prs == 2
+        assert run.completed_at is not None
+        assert not checkpoint_path(config.data_file).exists()
+
+    @pytest.mark.ai_generated
+    def test_resume_reports_changes_before_interruption(self, tmp_path: Path) -> None:
+        """Test PRs done before an interruption count as changed on resume."""
+        config = Configuration(data_file=tmp_path / "repositories.json", tracked_users=["u"])
+        ckpt = DiscoveryCheckpoint(
+            run=DiscoveryRun(started_at=datetime.now(UTC)),
+            queue=[("a/b", 1, {}), ("a/b", 2, {}), ("a/b", 3, {})],
+        )
+        ckpt.mark_completed("a/b", 1)
+        save_checkpoint(checkpoint_path(config.data_file), ckpt)
+
+        with (
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=_mock_client()),
+            patch(f"{MODULE}._process_pr", side_effect=["updated", "unchanged"]),
+        ):
+            result = discover(config, resume=True)
+
+        assert result.changed == {"a/b#1", "a/b#2"}
+        assert result.run.completed_at is not None
+
+    @pytest.mark.ai_generated
+    def test_rate_limit_stop_keeps_checkpoint(self, tmp_path: Path) -> None:
+        """Test a distant rate limit reset leaves a resumable checkpoint."""
+        config = Configuration(data_file=tmp_path / "repositories.json", tracked_users=["u"])
+        client = _mock_client([_search_item(1), _search_item(2)])
+        reset = int(time.time()) + 3600
+
+        with (
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=client),
+            patch(f"{MODULE}._process_pr", side_effect=["new", RateLimitError("low", reset)]),
+        ):
+            run = run_discovery(config)
+
+        assert run.completed_at is None
+        assert any("--resume" in e for e in run.errors)
+        ckpt = load_checkpoint(checkpoint_path(config.data_file))
+        assert ckpt is not None
+        assert [item[1] for item in ckpt.pending()] == [2]
+        # The model still records no completed run
+        _, last_run = load_model(config.data_file)
+        assert last_run is None
+
+    @pytest.mark.ai_generated
+    def test_crash_saves_checkpoint(self, tmp_path: Path) -> None:
+        """Test an unexpected interruption still checkpoints progress."""
+        config = Configuration(data_file=tmp_path / "repositories.json", tracked_users=["u"])
+        client = _mock_client([_search_item(1), _search_item(2)])
+
+        with (
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=client),
+            patch(f"{MODULE}._process_pr", side_effect=["new", KeyboardInterrupt]),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            run_discovery(config)
+
+        ckpt = load_checkpoint(checkpoint_path(config.data_file))
+        assert ckpt is not None
+        assert ckpt.completed == {"a/b#1"}
+
+
+class TestHighWaterMarks:
+    """Tests for per-user incremental search cutoffs."""
+
+    @pytest.mark.ai_generated
+    def test_new_user_gets_full_backfill(self) -> None:
+        """Test users without a mark are searched without a cutoff."""
+        mark = datetime(2025, 1, 10, 8, 0, tzinfo=UTC)
+        last_run = DiscoveryRun(started_at=mark, user_high_water_marks={"old": mark})
+        config = Configuration(tracked_users=["old", "new"])
+
+        cutoffs = _search_cutoffs(config, {}, last_run, incremental=True)
+
+        assert cutoffs == {"old": mark, "new": None}
+
+    @pytest.mark.ai_generated
+    def test_legacy_model_uses_last_run(self, sample_repository: Repository) -> None:
+        """Test models without marks fall back to the last run for known authors."""
+        started = datetime(2025, 1, 10, 8, 0, tzinfo=UTC)
+        repositories = {sample_repository.full_name: sample_repository}
+        config = Configuration(tracked_users=["YarikOptic", "new"])
+
+        cutoffs = _search_cutoffs(config, repositories, DiscoveryRun(started_at=started), True)
+
+        assert cutoffs == {"YarikOptic": started, "new": None}
+
+    @pytest.mark.ai_generated
+    def test_full_mode_ignores_marks(self) -> None:
+        """Test --full searches everything."""
+        mark = datetime(2025, 1, 10, tzinfo=UTC)
+        last_run = DiscoveryRun(started_at=mark, user_high_water_marks={"u": mark})
+
+        cutoffs = _search_cutoffs(Configuration(tracked_users=["u"]), {}, last_run, False)
+
+        assert cutoffs == {"u": None}
+
+    @pytest.mark.ai_generated
+    def test_marks_advance_only_when_user_done(self, tmp_path: Path) -> None:
+        """Test a user with unprocessed PRs keeps their previous mark."""
+        config = Configuration(
+            data_file=tmp_path / "repositories.json",
+            tracked_users=["u", "v"],
+            max_prs_per_run=2,
+        )
+        client = _mock_client()
+        client.search_user_prs.side_effect = [
+            [_search_item(1, "u", "2025-01-12T10:00:00Z")],
+            [_search_item(2, "v", "2025-01-13T10:00:00Z"), _search_item(3, "v")],
+        ]
+
+        with (
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=client),
+            patch(f"{MODULE}._process_pr", return_value="new"),
+        ):
+            run = run_discovery(config)
+
+        assert run.user_high_water_marks == {"u": datetime(2025, 1, 12, 10, 0, tzinfo=UTC)}
+
+
+class TestPlanningBudget:
+    """Tests for the API budget discovery plans against."""
+
+    @pytest.mark.ai_generated
+    def test_search_limit_does_not_cap_core_budget(
+        self, tmp_path: Path, mock_response: Any
+    ) -> None:
+        """Test PRs found by search are processed when only search responses were seen."""
+        config = Configuration(data_file=tmp_path / "repositories.json", tracked_users=["u"])
+        client = GitHubClient(token="fake-token", rate_limit_threshold=100)
+        search = mock_response(
+            json_data={
+                "items": [_search_item(1, "u", "2025-01-12T10:00:00Z") | {"title": "Add codespell"}]
+            },
+            headers={
+                "X-RateLimit-Resource": "search",
+                "X-RateLimit-Limit": "30",
+                "X-RateLimit-Remaining": "29",
+                "X-RateLimit-Reset": str(int(time.time()) + 60),
+            },
+        )
+
+        with (
+            patch.object(client.session, "request", return_value=search),
+            patch(f"{MODULE}.GitHubClient.from_config", return_value=client),
+            patch(f"{MODULE}._process_pr", return_value="new") as process,
+            patch("improveit_dashboard.utils.rate_limit.time.sleep"),
+        ):
+            run = run_discovery(config)
+
+        assert [c.kwargs["pr_number"] for c in process.call_args_list] == [1]
+        assert run.new_prs == 1
+        assert run.user_high_water_marks == {"u": datetime(2025, 1, 12, 10, 0, tzinfo=UTC)}
+        assert run.rate_limit_remaining == 5000
+
+
+class TestSearchFastPath:
+    """Tests for skipping API calls based on the search payload."""
+
+    @pytest.fixture
+    def analyzed_repo(self, sample_repository: Repository) -> Repository:
+        pr = sample_repository.prs[12912]
+        pr.analysis_status = "analyzed"
+        pr.total_comments = 2
+        pr.automation_types = ["workflow"]
+        pr.head_sha = "abc"
+        pr.ci_status = "success"
+        return sample_repository
+
+    def _search_data(self, **overrides: Any) -> dict[str, Any]:
+        data = {
+            "number": 12912,
+            "state": "open",
+            "draft": False,
+            "comments": 2,
+            "updated_at": "2025-01-20T14:30:00Z",
+            "closed_at": None,
+            "pull_request": {"merged_at": None},
+        }
+        data.update(overrides)
+        return data
+
+    def _process(
+        self, repo: Repository, search_data: dict[str, Any], client: Mock
+    ) -> tuple[str, DiscoveryRun]:
+        run = DiscoveryRun(started_at=datetime.now(UTC))
+        outcome = _process_pr(
+            client=client,
+            config=Configuration(),
+            repositories={repo.full_name: repo},
+            repo_name=repo.full_name,
+            pr_number=12912,
+            search_data=search_data,
+            run=run,
+        )
+        return outcome, run
+
+    @pytest.mark.ai_generated
+    def test_unchanged_makes_no_api_calls(self, analyzed_repo: Repository) -> None:
+        """Test a PR with the same updated_at and comment count is skipped."""
+        client = _mock_client()
+        outcome, _ = self._process(analyzed_repo, self._search_data(), client)
+
+        assert outcome == "unchanged"
+        client.fetch_pr_details.assert_not_called()
+
+    @pytest.mark.ai_generated
+    def test_pending_ci_refetches_status_only(self, analyzed_repo: Repository) -> None:
+        """Test an unchanged PR with pending CI only gets its CI status refetched."""
+        analyzed_repo.prs[12912].ci_status = "pending"
+        client = _mock_client()
+        client.fetch_pr_status.return_value = {"ci_status": "success"}
+        client.fetch_branch_status.return_value = "success"
+
+        outcome, _ = self._process(analyzed_repo, self._search_data(), client)
+
+        assert outcome == "updated"
+        client.fetch_pr_details.assert_not_called()
+        assert client.fetch_pr_status.call_args.args == ("kestra-io", "kestra", 12912, "abc")
+        assert analyzed_repo.prs[12912].ci_status == "success"
+        assert analyzed_repo.prs[12912].main_branch_ci == "success"
+
+        # Still pending: nothing changed
+        analyzed_repo.prs[12912].ci_status = "pending"
+        client.fetch_pr_status.return_value = {"ci_status": "pending"}
+        assert self._process(analyzed_repo, self._search_data(), client)[0] == "unchanged"
+
+    @pytest.mark.ai_generated
+    def test_ci_change(self, analyzed_repo: Repository) -> None:
+        """Test only active PRs with unfinished CI need a CI refetch."""
+        pr = analyzed_repo.prs[12912]
+        data = self._search_data()
+
+        assert _search_change(pr, data) == "unchanged"
+        pr.ci_status = None
+        assert _search_change(pr, data) == "ci"
+        pr.head_sha = None
+        assert _search_change(pr, data) == "full"  # Head commit unknown
+
+    @pytest.mark.ai_generated
+    def test_closed_applied_from_payload(self, analyzed_repo: Repository) -> None:
+        """Test closing a PR is applied without fetching it."""
+        search_data = self._search_data(
+            state="closed",
+            updated_at="2025-01-25T09:00:00Z",
+            closed_at="2025-01-25T09:00:00Z",
+        )
+
+        client = _mock_client()
+        outcome, run = self._process(analyzed_repo, search_data, client)
+
+        pr: PullRequest = analyzed_repo.prs[12912]
+        assert outcome == "updated"
+        client.fetch_pr_details.assert_not_called()
+        assert pr.status == "closed"
+        assert pr.adoption_level == "rejected"
+        assert pr.closed_at == datetime(2025, 1, 25, 9, 0, tzinfo=UTC)
+        assert run.newly_closed_prs == 1
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"comments": 3},
+            {"state": "closed", "pull_request": {"merged_at": "2025-01-25T09:00:00Z"}},
+        ],
+        ids=["new-activity", "new-comment", "merged"],
+    )
+    def test_other_changes_fetch_details(
+        self, analyzed_repo: Repository, overrides: dict[str, Any]
+    ) -> None:
+        """Test changes the payload cannot describe take the full path."""
+        search_data = self._search_data(updated_at="2025-01-25T09:00:00Z", **overrides)
+        client = _mock_client()
+        client.fetch_pr_details.return_value = (None, None, False)
+
+        outcome, _ = self._process(analyzed_repo, search_data, client)
+
+        client.fetch_pr_details.assert_called_once()
+        assert outcome == "unchanged"
+
+
+class TestPolling:
+    """Tests for the entry points the watch daemon polls through."""
+
+    @pytest.mark.ai_generated
+    def test_poll_is_conditional(self, sample_repository: Repository) -> None:
+        """Test polling a known PR without search data sends its ETag."""
+        sample_repository.prs[12912].etag = '"abc"'
+        client = _mock_client()
+        client.fetch_pr_details.return_value = (None, '"abc"', False)
+
+        outcome = process_pr(
+            client,
+            Configuration(),
+            {sample_repository.full_name: sample_repository},
+            sample_repository.full_name,
+            12912,
+            DiscoveryRun(started_at=datetime.now(UTC)),
+        )
+
+        assert outcome == "unchanged"
+        assert client.fetch_pr_details.call_args.kwargs["etag"] == '"abc"'
+        client.fetch_pr_files.assert_not_called()
+
+    @pytest.mark.ai_generated
+    def test_not_modified_refreshes_pending_ci(self, sample_repository: Repository) -> None:
+        """Test a 304 for an open PR whose CI had not finished still refetches its CI."""
+        pr = sample_repository.prs[12912]
+        pr.etag = '"abc"'
+        pr.head_sha = "abc"
+        pr.ci_status = "pending"
+        client = _mock_client()
+        client.fetch_pr_details.return_value = (None, '"abc"', False)
+        client.fetch_pr_status.return_value = {"ci_status": "failure"}
+        client.fetch_branch_status.return_value = "success"
+
+        def poll() -> str:
+            return process_pr(
+                client,
+                Configuration(),
+                {sample_repository.full_name: sample_repository},
+                sample_repository.full_name,
+                12912,
+                DiscoveryRun(started_at=datetime.now(UTC)),
+            )
+
+        assert poll() == "updated"
+        assert pr.ci_status == "failure"
+        client.fetch_pr_files.assert_not_called()
+
+        # CI finished: later 304s cost nothing more
+        client.fetch_pr_status.reset_mock()
+        assert poll() == "unchanged"
+        client.fetch_pr_status.assert_not_called()
+
+    @pytest.mark.ai_generated
+    def test_search_updates_advances_marks(self) -> None:
+        """Test searches start from the run's marks and advance them."""
+        client = _mock_client([_search_item(1, updated_at="2025-02-01T00:00:00Z")])
+        run = DiscoveryRun(
+            started_at=datetime.now(UTC),
+            user_high_water_marks={"u": datetime(2025, 1, 1, tzinfo=UTC)},
+        )
+
+        items = search_updates(client, Configuration(tracked_users=["u"]), {}, run)
+
+        assert [(name, number) for name, number, _ in items] == [("a/b", 1)]
+        assert client.search_user_prs.call_args.kwargs["updated_since"] == datetime(
+            2025, 1, 1, tzinfo=UTC
+        )
+        assert run.user_high_water_marks["u"] == datetime(2025, 2, 1, tzinfo=UTC)
+
+
+class TestClosedFreezing:
+    """Tests for freezing closed PRs."""
+
+    NOW = datetime(2025, 2, 1, tzinfo=UTC)
+
+    @pytest.fixture
+    def closed_repo(self, sample_repository: Repository) -> Repository:
+        pr = sample_repository.prs[12912]
+        pr.status = "closed"
+        pr.analysis_status = "analyzed"
+        pr.total_comments = 2
+        pr.automation_types = ["codespell-config"]
+        pr.last_fetched_at = self.NOW - timedelta(days=1)
+        return sample_repository
+
+    def _search_data(self, **overrides: Any) -> dict[str, Any]:
+        data = {
+            "number": 12912,
+            "state": "closed",
+            "comments": 2,
+            "updated_at": "2025-01-20T14:30:00Z",
+            "pull_request": {"merged_at": None},
+        }
+        data.update(overrides)
+        return data
+
+    def _pr_data(self, state: str) -> dict[str, Any]:
+        return {
+            "state": state,
+            "title": "Add codespell support",
+            "user": {"login": "yarikoptic"},
+            "updated_at": "2025-01-25T09:00:00Z",
+            "head": {"sha": "abc"},
+        }
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("overrides", "fetched_days_ago", "expected"),
+        [
+            ({}, 1, "unchanged"),
+            ({"updated_at": "2025-01-25T09:00:00Z"}, 1, "revalidate"),
+            ({"comments": 3}, 1, "revalidate"),
+            ({}, 8, "revalidate"),
+            ({"state": "open", "updated_at": "2025-01-25T09:00:00Z"}, 1, "full"),
+        ],
+        ids=["frozen", "activity", "new-comment", "interval", "reopened"],
+    )
+    def test_search_change(
+        self,
+        closed_repo: Repository,
+        overrides: dict[str, Any],
+        fetched_days_ago: int,
+        expected: str,
+    ) -> None:
+        """Test closed PRs stay frozen until reopened, active or due for revalidation."""
+        pr = closed_repo.prs[12912]
+        pr.last_fetched_at = self.NOW - timedelta(days=fetched_days_ago)
+
+        assert _search_change(pr, self._search_data(**overrides), 7, self.NOW) == expected
+        assert _search_change(pr, {}, 7, self.NOW) == "revalidate"  # Direct poll
+
+    def _process(self, repo: Repository, search_data: dict[str, Any], client: Mock) -> str:
+        return _process_pr(
+            client=client,
+            config=Configuration(),
+            repositories={repo.full_name: repo},
+            repo_name=repo.full_name,
+            pr_number=12912,
+            search_data=search_data,
+            run=DiscoveryRun(started_at=datetime.now(UTC)),
+        )
+
+    @pytest.mark.ai_generated
+    def test_revalidation_keeps_files(self, closed_repo: Repository) -> None:
+        """Test revalidating a closed PR fetches details and comments only."""
+        client = _mock_client()
+        client.fetch_pr_details.return_value = (self._pr_data("closed"), '"e"', True)
+        client.fetch_pr_comments.return_value = []
+
+        outcome = self._process(
+            closed_repo, self._search_data(updated_at="2025-01-25T09:00:00Z"), client
+        )
+
+        assert outcome == "updated"
+        client.fetch_pr_comments.assert_called_once()
+        client.fetch_pr_files.assert_not_called()
+        client.fetch_pr_status.assert_not_called()
+        assert closed_repo.prs[12912].automation_types == ["codespell-config"]
+
+    @pytest.mark.ai_generated
+    def test_reopen_unfreezes(self, closed_repo: Repository) -> None:
+        """Test a reopened PR is fetched in full, including files and CI."""
+        client = _mock_client()
+        client.fetch_pr_details.return_value = (self._pr_data("open"), '"e"', True)
+        client.fetch_pr_comments.return_value = []
+        client.fetch_pr_files.return_value = []
+        client.fetch_pr_status.return_value = {"ci_status": "success"}
+
+        self._process(
+            closed_repo,
+            self._search_data(state="open", updated_at="2025-01-25T09:00:00Z"),
+            client,
+        )
+
+        assert closed_repo.prs[12912].status == "open"
+        client.fetch_pr_files.assert_called_once()
+        client.fetch_pr_status.assert_called_once()
+
+
+class TestRateLimitRerun:
+    """Tests for rerunning a PR after a rate limit wait."""
+
+    @pytest.mark.ai_generated
+    def test_transition_counted_once(self, sample_repository: Repository) -> None:
+        """Test a merge is counted once when a later fetch hits the rate limit."""
+        client = _mock_client()
+        client.retry_policy = RetryPolicy(max_rate_limit_wait=600)
+        client.fetch_pr_details.return_value = (
+            {
+                "state": "closed",
+                "merged": True,
+                "merged_at": "2025-01-25T09:00:00Z",
+                "title": "Add codespell support",
+                "user": {"login": "yarikoptic"},
+                "updated_at": "2025-01-25T09:00:00Z",
+            },
+            '"e"',
+            True,
+        )
+        client.fetch_pr_comments.return_value = []
+        client.fetch_pr_files.side_effect = [RateLimitError("low", int(time.time()) + 60), []]
+        run = DiscoveryRun(started_at=datetime.now(UTC))
+
+        with patch(f"{MODULE}.time.sleep"):
+            outcome = process_pr(
+                client,
+                Configuration(),
+                {sample_repository.full_name: sample_repository},
+                sample_repository.full_name,
+                12912,
+                run,
+                search_data={"state": "closed", "updated_at": "2025-01-25T09:00:00Z"},
+            )
+
+        assert outcome == "updated"
+        assert sample_repository.prs[12912].status == "merged"
+        assert run.newly_merged_prs == 1
+
+
+class TestIncrementalComments:
+    """Tests for fetching only new comments."""
+
+    @pytest.fixture
+    def analyzed(
+        self, sample_repository: Repository, sample_comment_data: list[dict[str, Any]]
+    ) -> tuple[Repository, PullRequest]:
+        pr = sample_repository.prs[12912]
+        analyze_engagement(classify_comments(sample_comment_data, pr.author), pr)
+        return sample_repository, pr
+
+    def _new_comment(self) -> dict[str, Any]:
+        return {
+            "id": 999999,
+            "user": {"login": "maintainer2", "type": "User"},
+            "body": "Any update?",
+            "created_at": "2025-02-01T10:00:00Z",
+            "updated_at": "2025-02-01T10:00:00Z",
+        }
+
+    @pytest.mark.ai_generated
+    def test_fetches_since_last_seen(self, analyzed: tuple[Repository, PullRequest]) -> None:
+        """Test only comments after the stored cursor are requested and folded in."""
+        repo, existing = analyzed
+        pr = replace(existing, engagement=None)
+        client = _mock_client()
+        client.fetch_pr_comments.return_value = [self._new_comment()]
+
+        _analyze_comments(client, repo, pr, existing, expected_count=4)
+
+        client.fetch_pr_comments.assert_called_once()
+        assert client.fetch_pr_comments.call_args.kwargs["since"] is not None
+        assert pr.total_comments == 4
+        assert pr.last_comment_author == "maintainer2"
+        assert pr.last_developer_comment_body == "Any update?"
+
+    @pytest.mark.ai_generated
+    def test_count_mismatch_refetches(
+        self,
+        analyzed: tuple[Repository, PullRequest],
+        sample_comment_data: list[dict[str, Any]],
+    ) -> None:
+        """Test a deleted comment (count mismatch) triggers a full refetch."""
+        repo, existing = analyzed
+        pr = replace(existing, engagement=None)
+        client = _mock_client()
+        client.fetch_pr_comments.side_effect = [[], sample_comment_data[1:]]
+
+        _analyze_comments(client, repo, pr, existing, expected_count=2)
+
+        assert client.fetch_pr_comments.call_count == 2
+        assert "since" not in client.fetch_pr_comments.call_args.kwargs
+        assert pr.total_comments == 2
@@ -1,12 +1,17 @@
 """Unit tests for GitHub client (mocked)."""
 
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+import requests
 
 from improveit_dashboard.controllers.github_client import GitHubClient
+from improveit_dashboard.models.config import Configuration
 from improveit_dashboard.utils.rate_limit import RateLimitError
+from improveit_dashboard.utils.retry import RetryPolicy
 
 
 class TestGitHubClient:
@@ -53,7 +58,7 @@ class TestGitHubClient:
         assert modified is True
         assert pr_data is not None
         assert pr_data["number"] == 12912
-        assert etag == 'W/"abc123"'
+        assert etag == f'{client.token_pool.entries[0].key}:W/"abc123"'  # Scoped to the token
         assert client.api_calls == 1
 
     @pytest.mark.ai_generated
@@ -112,6 +117,20 @@ class TestGitHubClient:
         assert len(results) == 1
         assert results[0]["number"] == 123
 
+    @pytest.mark.ai_generated
+    def test_search_prs_updated_since_timestamp(
+        self, client: GitHubClient, mock_response: Any
+    ) -> None:
+        """Test the incremental cutoff is sent as a full UTC timestamp."""
+        response = mock_response(status_code=200, json_data={"items": []})
+        since = datetime(2025, 1, 15, 12, 30, 45, tzinfo=timezone(timedelta(hours=2)))
+
+        with patch.object(client.session, "request", return_value=response) as request:
+            client.search_user_prs(username="testuser", updated_since=since)
+
+        query = request.call_args.kwargs["params"]["q"]
+        assert "updated:>=2025-01-15T10:30:45Z" in query
+
     @pytest.mark.ai_generated
     def test_search_prs_keyword_filter(self, client: GitHubClient, mock_response: Any) -> None:
         """Test PR search filters by keywords."""
@@ -205,3 +224,191 @@ class TestGitHubClient:
         with patch.object(client.session, "request", return_value=response):
             with pytest.raises(RateLimitError):
                 client.fetch_pr_details("owner", "repo", 1)
+
+
+class TestGitHubClientRetries:
+    """Unit tests for transient failure retries."""
+
+    @pytest.fixture
+    def client(self) -> GitHubClient:
+        """Create client with a fast retry policy."""
+        return GitHubClient(
+            token="fake-token",
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01),
+        )
+
+    @pytest.mark.ai_generated
+    def test_retries_gateway_error(
+        self, client: GitHubClient, mock_response: Any, sample_pr_data: dict
+    ) -> None:
+        """Test a 502 is retried and the next response returned."""
+        responses = [
+            mock_response(status_code=502),
+            mock_response(status_code=200, json_data=sample_pr_data),
+        ]
+
+        with (
+            patch.object(client.session, "request", side_effect=responses),
+            patch("improveit_dashboard.controllers.github_client.time.sleep") as sleep,
+        ):
+            pr_data, _, modified = client.fetch_pr_details("owner", "repo", 1)
+
+        assert modified is True
+        assert pr_data is not None
+        assert sleep.call_count == 1
+        assert client.api_calls == 2
+        assert client.get_rate_limit_status()["retries"] == 1
+
+    @pytest.mark.ai_generated
+    def test_honors_retry_after(self, client: GitHubClient, mock_response: Any) -> None:
+        """Test secondary rate limit waits at least Retry-After seconds."""
+        limited = mock_response(status_code=403, headers={"Retry-After": "30"})
+        responses = [limited, mock_response(status_code=200, json_data=[])]
+
+        with (
+            patch.object(client.session, "request", side_effect=responses),
+            patch("improveit_dashboard.controllers.github_client.time.sleep") as sleep,
+        ):
+            client.fetch_pr_files("owner", "repo", 1)
+
+        assert 30 <= sleep.call_args[0][0] <= 31
+
+    @pytest.mark.ai_generated
+    def test_retries_connection_reset(
+        self, client: GitHubClient, mock_response: Any, sample_files_data: list
+    ) -> None:
+        """Test connection errors are retried."""
+        responses = [
+            requests.ConnectionError("Connection reset by peer"),
+            mock_response(status_code=200, json_data=sample_files_data),
+        ]
+
+        with (
+            patch.object(client.session, "request", side_effect=responses),
+            patch("improveit_dashboard.controllers.github_client.time.sleep"),
+        ):
+            files = client.fetch_pr_files("owner", "repo", 1)
+
+        assert len(files) == 2
+
+    @pytest.mark.ai_generated
+    def test_gives_up_after_max_attempts(self, client: GitHubClient, mock_response: Any) -> None:
+        """Test persistent failures surface after max attempts."""
+        with (
+            patch.object(
+                client.session, "request", return_value=mock_response(status_code=503)
+            ) as request,
+            patch("improveit_dashboard.controllers.github_client.time.sleep"),
+        ):
+            response = client._request("GET", "/repos/owner/repo/pulls/1")
+
+        assert response.status_code == 503
+        assert request.call_count == 3
+        assert client.retry_policy.get_stats() == {"/repos/{owner}/{repo}/pulls/{number}": 3}
+
+    @pytest.mark.ai_generated
+    def test_access_denied_not_retried(self, client: GitHubClient, mock_response: Any) -> None:
+        """Test a plain 403 (no rate limit signal) is returned immediately."""
+        denied = mock_response(status_code=403)
+        denied.text = '{"message": "Resource not accessible by integration"}'
+
+        with patch.object(client.session, "request", return_value=denied) as request:
+            assert client.fetch_repository("owner", "repo") is None
+
+        assert request.call_count == 1
+
+
+class TestGitHubClientTokenPool:
+    """Unit tests for multi-token rotation."""
+
+    @pytest.mark.ai_generated
+    def test_rotates_to_token_with_headroom(self, mock_response: Any, sample_pr_data: dict) -> None:
+        """Test requests move to another token when one runs low, without waiting."""
+        client = GitHubClient(token="primary", extra_tokens=["secondary"])
+        low = mock_response(
+            status_code=200,
+            json_data=sample_pr_data,
+            headers={
+                "X-RateLimit-Remaining": "50",
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Reset": str(int(time.time()) + 3000),
+            },
+        )
+        ok = mock_response(status_code=200, json_data=sample_pr_data)
+
+        with (
+            patch.object(client.session, "request", side_effect=[low, ok]) as request,
+            patch("improveit_dashboard.utils.rate_limit.time.sleep") as sleep,
+        ):
+            client.fetch_pr_details("owner", "repo", 1)
+            client.fetch_pr_details("owner", "repo", 2)
+
+        sleep.assert_not_called()
+        auth = [c.kwargs["headers"]["Authorization"] for c in request.call_args_list]
+        assert auth == ["Bearer primary", "Bearer secondary"]
+        assert client.get_rate_limit_status()["tokens"] == 2
+
+    @pytest.mark.ai_generated
+    def test_exhausted_token_switches_without_waiting(
+        self, mock_response: Any, sample_pr_data: dict
+    ) -> None:
+        """Test a primary rate limit 403 is retried at once with another token."""
+        client = GitHubClient(token="primary", extra_tokens=["secondary"])
+        exhausted = mock_response(
+            status_code=403,
+            headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Reset": str(int(time.time()) + 3000),
+            },
+        )
+        responses = iter([exhausted, mock_response(status_code=200, json_data=sample_pr_data)])
+        auth = []
+
+        def request(*args: Any, headers: dict[str, str], **kwargs: Any) -> Any:
+            auth.append(headers["Authorization"])
+            return next(responses)
+
+        with (
+            patch.object(client.session, "request", side_effect=request),
+            patch("improveit_dashboard.controllers.github_client.time.sleep") as sleep,
+        ):
+            pr_data, _, _ = client.fetch_pr_details("owner", "repo", 1)
+
+        assert pr_data is not None
+        sleep.assert_not_called()
+        assert auth == ["Bearer primary", "Bearer secondary"]
+
+    @pytest.mark.ai_generated
+    def test_etag_sent_only_with_its_token(self, mock_response: Any) -> None:
+        """Test an ETag goes to the token that received it, and not to others."""
+        client = GitHubClient(token="primary", extra_tokens=["secondary"])
+        primary, secondary = client.token_pool.entries
+        etag = f'{secondary.key}:W/"abc"'
+        sent = []
+
+        def request(*args: Any, headers: dict[str, str], **kwargs: Any) -> Any:
+            sent.append((headers["Authorization"], headers.get("If-None-Match")))
+            return mock_response(status_code=304)
+
+        with patch.object(client.session, "request", side_effect=request):
+            assert client.fetch_pr_details("owner", "repo", 1, etag=etag)[2] is False
+            secondary.rate_limit.update_from_response(
+                mock_response(
+                    headers={
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Limit": "5000",
+                        "X-RateLimit-Reset": str(int(time.time()) + 3000),
+                    }
+                )
+            )
+            client.fetch_pr_details("owner", "repo", 1, etag=etag)
+
+        assert sent == [("Bearer secondary", 'W/"abc"'), ("Bearer primary", None)]
+
+    @pytest.mark.ai_generated
+    def test_from_config_uses_all_tokens(self) -> None:
+        """Test the client picks up GITHUB_TOKEN plus the extra pool tokens."""
+        config = Configuration(github_token="one", github_tokens=["two", "one", "three"])
+        client = GitHubClient.from_config(config)
+        assert [e.token for e in client.token_pool.entries] == ["one", "two", "three"]
@@ -0,0 +1,105 @@
+"""Unit tests for the run history store and trends report."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from improveit_dashboard.controllers.history import HistoryStore
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.views.trends import generate_trends_report
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _model(sample_repository: Repository) -> dict[str, Repository]:
+    return {sample_repository.full_name: sample_repository}
+
+
+class TestHistoryStore:
+    """Tests for recording and replaying history."""
+
+    @pytest.mark.ai_generated
+    def test_records_only_changes(
+        self, tmp_path: Path, sample_repository: Repository, sample_pull_request: PullRequest
+    ) -> None:
+        """Test runs are delta-encoded and unchanged runs are not recorded."""
+        store = HistoryStore(tmp_path / "history")
+        repositories = _model(sample_repository)
+        key = f"{sample_pull_request.repository}#{sample_pull_request.number}"
+
+        first = store.record(repositories, T0)
+        assert first is not None
+        assert first.new_prs == 1
+
+        assert store.record(repositories, T0 + timedelta(hours=1)) is None
+
+        sample_pull_request.status = "merged"
+        second = store.record(repositories, T0 + timedelta(hours=2))
+        assert second is not None
+        assert second.transitions == [(key, "status", "open", "merged")]
+        assert second.count_transitions("status", "merged") == 1
+
+        lines = store.runs_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert '"total_prs"' not in lines[1]  # Unchanged aggregate not repeated
+
+    @pytest.mark.ai_generated
+    def test_entries_decode_full_aggregates(
+        self, tmp_path: Path, sample_repository: Repository, sample_pull_request: PullRequest
+    ) -> None:
+        """Test replayed entries carry full aggregate values."""
+        store = HistoryStore(tmp_path / "history")
+        repositories = _model(sample_repository)
+        store.record(repositories, T0)
+        sample_pull_request.status = "closed"
+        store.record(repositories, T0 + timedelta(days=1), source="reanalyze")
+
+        entries = list(store.entries())
+
+        assert [e.source for e in entries] == ["update", "reanalyze"]
+        assert entries[1].aggregates["total_prs"] == 1
+        assert entries[1].aggregates["closed"] == 1
+        assert entries[1].aggregates["merge_rate"] == 0.0
+
+    @pytest.mark.ai_generated
+    def test_rebuilds_stale_state(
+        self, tmp_path: Path, sample_repository: Repository, sample_pull_request: PullRequest
+    ) -> None:
+        """Test a missing state cache is rebuilt from the history."""
+        store = HistoryStore(tmp_path / "history")
+        repositories = _model(sample_repository)
+        store.record(repositories, T0)
+        store.state_path.unlink()
+
+        assert store.record(repositories, T0 + timedelta(hours=1)) is None
+
+        sample_pull_request.response_status = "awaiting_maintainer"
+        entry = store.record(repositories, T0 + timedelta(hours=2))
+        assert entry is not None
+        key = f"{sample_pull_request.repository}#{sample_pull_request.number}"
+        assert entry.transitions == [(key, "response_status", "no_response", "awaiting_maintainer")]
+
+
+class TestTrendsReport:
+    """Tests for the trends report."""
+
+    @pytest.mark.ai_generated
+    def test_generate_trends(
+        self, tmp_path: Path, sample_repository: Repository, sample_pull_request: PullRequest
+    ) -> None:
+        """Test the report lists recorded runs, most recent first."""
+        store = HistoryStore(tmp_path / "history")
+        assert generate_trends_report(store, tmp_path / "out") is None
+
+        store.record(_model(sample_repository), T0)
+        sample_pull_request.status = "merged"
+        store.record(_model(sample_repository), T0 + timedelta(days=1))
+
+        path = generate_trends_report(store, tmp_path / "out")
+
+        assert path is not None
+        rows = [line for line in path.read_text().splitlines() if line.startswith("| 2025")]
+        assert rows[0].startswith("| 2025-01-02")
+        assert "| 100% |" in rows[0]
@@ -0,0 +1,115 @@
+"""Unit tests for precompiled matchers."""
+
+import pytest
+
+from improveit_dashboard.models.comment import DEFAULT_BOT_MATCHER
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.utils.matching import BotMatcher, TitleMatcher, minimal_literals
+
+
+class TestMinimalLiterals:
+    """Tests for literal set reduction."""
+
+    @pytest.mark.ai_generated
+    def test_drops_redundant_literals(self) -> None:
+        """Test empty, duplicate and superstring literals are dropped."""
+        assert minimal_literals(["cla check", "", "cla", "codacy", "cla"]) == ("cla", "codacy")
+
+    @pytest.mark.ai_generated
+    def test_empty(self) -> None:
+        """Test an empty literal set stays empty."""
+        assert minimal_literals([]) == ()
+
+
+class TestBotMatcher:
+    """Tests for bot comment detection."""
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("login", "body", "user_type"),
+        [
+            ("renovate", "hello", "Bot"),
+            ("dependabot[bot]", "hello", "User"),
+            ("CLAassistant", "hello", "User"),
+            ("someone", "## Codecov Report\nCoverage is 90%", "User"),
+        ],
+    )
+    def test_detects_bots(self, login: str, body: str, user_type: str) -> None:
+        """Test each bot signal is detected case-insensitively."""
+        assert DEFAULT_BOT_MATCHER.is_bot(login, body, user_type)
+
+    @pytest.mark.ai_generated
+    def test_human_comment(self) -> None:
+        """Test an ordinary comment is not classified as a bot."""
+        assert not DEFAULT_BOT_MATCHER.is_bot("maintainer", "Thanks, merging!", "User")
+
+    @pytest.mark.ai_generated
+    def test_no_patterns(self) -> None:
+        """Test a matcher without message patterns only checks logins."""
+        matcher = BotMatcher(["ci-helper"], [])
+        assert matcher.is_bot("CI-Helper", "anything")
+        assert not matcher.is_bot("person", "anything")
+
+    @pytest.mark.ai_generated
+    def test_extend(self) -> None:
+        """Test extending keeps existing rules and adds new ones."""
+        matcher = DEFAULT_BOT_MATCHER.extend(["deploy-bot"], ["Preview Deployed"])
+        assert matcher.is_bot("deploy-bot", "hi")
+        assert matcher.is_bot_message("Your PREVIEW DEPLOYED at ...")
+        assert matcher.is_bot_message("codecov report")
+        assert not DEFAULT_BOT_MATCHER.is_bot_message("preview deployed")
+
+
+class TestConfiguredBotMatcher:
+    """Tests for bot rules from configuration."""
+
+    @pytest.mark.ai_generated
+    def test_default_rules(self) -> None:
+        """Test the built-in matcher is used without extra rules."""
+        assert Configuration().get_bot_matcher() is DEFAULT_BOT_MATCHER
+
+    @pytest.mark.ai_generated
+    def test_extra_rules(self) -> None:
+        """Test configured usernames and patterns extend the built-in ones."""
+        config = Configuration._from_dict(
+            {"bot_usernames": ["netlify"], "bot_message_patterns": ["deploy preview"]}
+        )
+        matcher = config.get_bot_matcher()
+        assert matcher.is_bot("Netlify", "hi")
+        assert matcher.is_bot("person", "Deploy Preview ready")
+        assert matcher.is_bot("person", "codecov report")
+        assert config.get_bot_matcher() is matcher
+
+
+class TestTitleMatcher:
+    """Tests for title to tool classification."""
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("title", "tool"),
+        [
+            ("Add codespell CI", "codespell"),
+            ("Add CODESPELLIT workflow", "codespell"),
+            ("[codespell] fix typos", "codespell"),
+            ("ci: shellcheck-py hook", "shellcheck"),
+            ("Add shellcheck and codespell", "codespell"),
+            ("Update mycodespell", None),
+            ("Fix typo", None),
+        ],
+    )
+    def test_match(self, title: str, tool: str | None) -> None:
+        """Test keywords match at word starts with tool priority order."""
+        matcher = TitleMatcher({"codespell": ["codespell"], "shellcheck": ["shellcheck"]})
+        assert matcher.match(title) == tool
+
+    @pytest.mark.ai_generated
+    def test_empty(self) -> None:
+        """Test a matcher without keywords matches nothing."""
+        assert TitleMatcher({"codespell": []}).match("codespell") is None
+
+    @pytest.mark.ai_generated
+    def test_config_matcher_cached(self) -> None:
+        """Test the configuration compiles its keywords once."""
+        config = Configuration()
+        assert config.get_title_matcher() is config.get_title_matcher()
+        assert config.get_tool_for_title("Codespellit: fix") == "codespell"
@@ -240,6 +240,16 @@ class TestConfiguration:
         assert config.get_tool_for_title("Add shellcheck workflow") == "shellcheck"
         assert config.get_tool_for_title("Fix typo") == "other"
 
+    @pytest.mark.ai_generated
+    def test_token_pool_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test extra tokens are read from GITHUB_TOKENS."""
+        monkeypatch.setenv("GITHUB_TOKEN", "main")
+        monkeypatch.setenv("GITHUB_TOKENS", "extra1, extra2\nmain")
+        config = Configuration.from_env()
+
+        assert config.github_tokens == ["extra1", "extra2", "main"]
+        assert config.get_all_tokens() == ["main", "extra1", "extra2"]
+
     @pytest.mark.ai_generated
     def test_from_file_missing(self, tmp_path: Path) -> None:
         """Test loading from missing file returns defaults."""
@@ -374,9 +384,11 @@ class TestDiscoveryRun:
             started_at=datetime(2025, 1, 15, 10, 0, 0, tzinfo=UTC),
             new_prs=3,
             errors=["Error 1", "Error 2"],
+            user_high_water_marks={"alice": datetime(2025, 1, 14, 8, 30, 5, tzinfo=UTC)},
         )
         data = run.to_dict()
         restored = DiscoveryRun.from_dict(data)
 
         assert restored.new_prs == run.new_prs
         assert restored.errors == run.errors
+        assert restored.user_high_water_marks == run.user_high_water_marks
@@ -1,15 +1,27 @@
 """Unit tests for persistence layer."""
 
+import os
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from improveit_dashboard.controllers.persistence import (
+    checkpoint_path,
+    clear_checkpoint,
+    clear_dirty,
+    dirty_path,
     get_last_updated,
+    load_checkpoint,
+    load_dirty,
     load_model,
+    mark_dirty,
+    model_cache_path,
+    save_checkpoint,
     save_model,
 )
+from improveit_dashboard.models.checkpoint import DiscoveryCheckpoint
 from improveit_dashboard.models.discovery_run import DiscoveryRun
 from improveit_dashboard.models.pull_request import PullRequest
 from improveit_dashboard.models.repository import Repository
@@ -141,3 +153,147 @@ class TestPersistence:
         assert loaded_pr.adoption_level == pr.adoption_level
         assert loaded_pr.time_to_first_response_hours == pr.time_to_first_response_hours
         assert loaded_pr.etag == pr.etag
+
+
+def _age(path: Path) -> None:
+    """Backdate a file's mtime so it is not considered racily modified."""
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime - 60))
+
+
+class TestModelCache:
+    """Tests for the pickled model cache."""
+
+    @pytest.mark.ai_generated
+    def test_second_load_uses_cache(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test a fresh cache is loaded without parsing the JSON."""
+        path = tmp_path / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+        _age(path)
+        load_model(path)
+        assert model_cache_path(path).exists()
+
+        with patch.object(Repository, "from_dict", side_effect=AssertionError("parsed")):
+            repositories, _ = load_model(path)
+
+        assert repositories[sample_repository.full_name].prs[12912].author == "yarikoptic"
+
+    @pytest.mark.ai_generated
+    def test_rewritten_identical_file_uses_cache(
+        self, tmp_path: Path, sample_repository: Repository
+    ) -> None:
+        """Test a new mtime with identical content still hits via the hash."""
+        path = tmp_path / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+        load_model(path)
+        path.write_bytes(path.read_bytes())
+
+        with patch.object(Repository, "from_dict", side_effect=AssertionError("parsed")):
+            repositories, _ = load_model(path)
+
+        assert sample_repository.full_name in repositories
+
+    @pytest.mark.ai_generated
+    def test_changed_content_invalidates(
+        self, tmp_path: Path, sample_repository: Repository
+    ) -> None:
+        """Test an edit keeping the size is detected by the content hash."""
+        path = tmp_path / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+        load_model(path)
+        path.write_text(path.read_text().replace('"open"', '"shut"'))
+
+        repositories, _ = load_model(path)
+
+        assert repositories[sample_repository.full_name].prs[12912].status == "shut"
+
+    @pytest.mark.ai_generated
+    def test_save_removes_cache(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test saving the model invalidates its cache."""
+        path = tmp_path / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+        load_model(path)
+
+        save_model(path, {})
+
+        assert not model_cache_path(path).exists()
+        assert load_model(path)[0] == {}
+
+    @pytest.mark.ai_generated
+    def test_disabled_or_corrupt(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test the cache can be disabled and a corrupt cache is ignored."""
+        path = tmp_path / "repositories.json"
+        save_model(path, {sample_repository.full_name: sample_repository})
+
+        load_model(path, cache=False)
+        assert not model_cache_path(path).exists()
+
+        model_cache_path(path).write_bytes(b"garbage")
+        repositories, _ = load_model(path)
+        assert sample_repository.full_name in repositories
+
+
+class TestCheckpoint:
+    """Tests for discovery checkpoint persistence."""
+
+    @pytest.mark.ai_generated
+    def test_checkpoint_path_beside_model(self) -> None:
+        """Test the checkpoint lives next to the model file."""
+        path = checkpoint_path(Path("data/repositories.json"))
+        assert path == Path("data/repositories.checkpoint.json")
+
+    @pytest.mark.ai_generated
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test a checkpoint survives save and load."""
+        path = tmp_path / "repositories.checkpoint.json"
+        run = DiscoveryRun(started_at=datetime(2025, 1, 15, tzinfo=UTC), new_prs=2)
+        ckpt = DiscoveryCheckpoint(
+            run=run,
+            queue=[("a/b", 1, {"title": "x"}), ("a/b", 2, {})],
+        )
+        ckpt.mark_completed("a/b", 1)
+
+        save_checkpoint(path, ckpt)
+        loaded = load_checkpoint(path)
+
+        assert loaded is not None
+        assert loaded.run.new_prs == 2
+        assert loaded.saved_at is not None
+        assert loaded.queue[0] == ("a/b", 1, {"title": "x"})
+        assert loaded.pending() == [("a/b", 2, {})]
+
+    @pytest.mark.ai_generated
+    def test_missing_or_corrupt_returns_none(self, tmp_path: Path) -> None:
+        """Test unreadable checkpoints are ignored."""
+        path = tmp_path / "repositories.checkpoint.json"
+        assert load_checkpoint(path) is None
+
+        path.write_text("{not json")
+        assert load_checkpoint(path) is None
+
+    @pytest.mark.ai_generated
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clearing removes the file and tolerates absence."""
+        path = tmp_path / "repositories.checkpoint.json"
+        save_checkpoint(path, DiscoveryCheckpoint(run=DiscoveryRun(started_at=datetime.now(UTC))))
+        clear_checkpoint(path)
+        assert not path.exists()
+        clear_checkpoint(path)
+
+
+class TestDirtySet:
+    """Tests for the PRs awaiting view generation."""
+
+    @pytest.mark.ai_generated
+    def test_marks_accumulate_until_cleared(self, tmp_path: Path) -> None:
+        """Test marked PRs are added to those already recorded until cleared."""
+        data_file = tmp_path / "data" / "repositories.json"
+        assert dirty_path(data_file) == data_file.with_name("repositories.dirty.json")
+        assert load_dirty(data_file) == set()
+
+        mark_dirty(data_file, {"a/b#1"})
+        mark_dirty(data_file, {"a/b#2", "a/b#1"})
+        assert load_dirty(data_file) == {"a/b#1", "a/b#2"}
+
+        clear_dirty(data_file)
+        assert load_dirty(data_file) == set()
+        clear_dirty(data_file)
@@ -0,0 +1,153 @@
+"""Unit tests for the in-process update pipeline."""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from improveit_dashboard.controllers.discovery import DiscoveryResult
+from improveit_dashboard.controllers.persistence import load_dirty, mark_dirty
+from improveit_dashboard.controllers.pipeline import (
+    changed_authors,
+    generate_views,
+    run_pipeline,
+)
+from improveit_dashboard.models.config import Configuration, RepositoryOverride
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+MODULE = "improveit_dashboard.controllers.pipeline"
+
+
+def _config(tmp_path: Path) -> Configuration:
+    """Configuration writing everything under tmp_path."""
+    return Configuration(
+        tracked_users=["yarikoptic", "other"],
+        data_file=tmp_path / "data" / "repositories.json",
+        output_readme=tmp_path / "README.md",
+        output_readmes_dir=tmp_path / "READMEs",
+        output_summaries_dir=tmp_path / "Summaries",
+    )
+
+
+def _model(
+    sample_repository: Repository, sample_pull_request: PullRequest
+) -> dict[str, Repository]:
+    """Model with one PR by each tracked user."""
+    sample_repository.add_pr(replace(sample_pull_request, number=1, author="other"))
+    return {sample_repository.full_name: sample_repository}
+
+
+class TestGenerateViews:
+    """Tests for generating views from the in-memory model."""
+
+    @pytest.mark.ai_generated
+    def test_nothing_changed(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test an empty dirty set generates nothing."""
+        config = _config(tmp_path)
+
+        assert generate_views(config, {sample_repository.full_name: sample_repository}, set()) == []
+        assert not config.output_readme.exists()
+
+    @pytest.mark.ai_generated
+    def test_only_changed_authors(
+        self,
+        tmp_path: Path,
+        sample_repository: Repository,
+        sample_pull_request: PullRequest,
+    ) -> None:
+        """Test only the reports of authors with changed PRs are regenerated."""
+        config = _config(tmp_path)
+        repositories = _model(sample_repository, sample_pull_request)
+
+        assert changed_authors(repositories, {"kestra-io/kestra#1", "gone/repo#5"}) == {"other"}
+        paths = generate_views(config, repositories, {"kestra-io/kestra#1"})
+
+        assert config.output_readme in paths
+        assert (config.output_readmes_dir / "other.md").exists()
+        assert not (config.output_readmes_dir / "yarikoptic.md").exists()
+        assert (config.output_summaries_dir / "statistics.json").exists()
+
+    @pytest.mark.ai_generated
+    def test_dirty_prs_regenerated_later(
+        self,
+        tmp_path: Path,
+        sample_repository: Repository,
+        sample_pull_request: PullRequest,
+    ) -> None:
+        """Test PRs saved without generating views are regenerated with the next changes."""
+        config = _config(tmp_path)
+        repositories = _model(sample_repository, sample_pull_request)
+        mark_dirty(config.data_file, {"kestra-io/kestra#1"})
+
+        generate_views(config, repositories, set())
+
+        assert (config.output_readmes_dir / "other.md").exists()
+        assert not (config.output_readmes_dir / "yarikoptic.md").exists()
+        assert load_dirty(config.data_file) == set()
+
+    @pytest.mark.ai_generated
+    def test_failed_generation_keeps_dirty(
+        self, tmp_path: Path, sample_repository: Repository
+    ) -> None:
+        """Test PRs stay dirty when generating the views fails."""
+        config = _config(tmp_path)
+        mark_dirty(config.data_file, {"kestra-io/kestra#12912"})
+
+        with (
+            patch(f"{MODULE}.generate_statistics_report", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            generate_views(config, {sample_repository.full_name: sample_repository}, set())
+
+        assert load_dirty(config.data_file) == {"kestra-io/kestra#12912"}
+
+    @pytest.mark.ai_generated
+    def test_behavior_overrides_applied(
+        self, tmp_path: Path, sample_repository: Repository
+    ) -> None:
+        """Test configured overrides place repositories in their category."""
+        config = _config(tmp_path)
+        config.repository_overrides = {
+            sample_repository.full_name: RepositoryOverride(category="hostile")
+        }
+
+        generate_views(config, {sample_repository.full_name: sample_repository})
+
+        hostile = config.output_summaries_dir / "responsiveness" / "hostile.md"
+        assert sample_repository.full_name in hostile.read_text()
+
+
+class TestRunPipeline:
+    """Tests for the update -> generate -> commit pipeline."""
+
+    @pytest.mark.ai_generated
+    def test_uses_in_memory_model(
+        self,
+        tmp_path: Path,
+        sample_repository: Repository,
+        sample_pull_request: PullRequest,
+    ) -> None:
+        """Test generation uses discovery's model without reloading it."""
+        config = _config(tmp_path)
+        discovery = DiscoveryResult(
+            run=DiscoveryRun(started_at=datetime.now(UTC)),
+            repositories=_model(sample_repository, sample_pull_request),
+            changed={"kestra-io/kestra#12912"},
+        )
+
+        with (
+            patch("improveit_dashboard.controllers.discovery.discover", return_value=discovery),
+            patch("improveit_dashboard.controllers.persistence.load_model") as load,
+            patch(f"{MODULE}.create_commit", return_value=0) as commit,
+        ):
+            result = run_pipeline(config, commit=True)
+
+        load.assert_not_called()
+        commit.assert_called_once_with(discovery.run.to_commit_message())
+        assert result.commit_status == 0
+        assert config.output_readmes_dir / "yarikoptic.md" in result.generated
+        assert not (config.output_readmes_dir / "other.md").exists()
@@ -0,0 +1,174 @@
+"""Unit tests for budget-aware refresh planning."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from improveit_dashboard.controllers.discovery import discover
+from improveit_dashboard.controllers.persistence import save_model
+from improveit_dashboard.controllers.planner import (
+    Candidate,
+    estimate_calls,
+    offline_plan,
+    plan_refresh,
+    refresh_value,
+    seconds_per_call,
+)
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.discovery_run import DiscoveryRun
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.retry import RetryPolicy
+
+NOW = datetime(2025, 1, 20, 14, 30, tzinfo=UTC)
+
+
+def _item(number: int, user: str = "u", **data: Any) -> tuple[str, int, dict[str, Any]]:
+    """Search result work item for a/b#number."""
+    return ("a/b", number, {"number": number, "user": {"login": user}, **data})
+
+
+def _pr(pr: PullRequest, number: int, **changes: Any) -> PullRequest:
+    """Copy of a PR as a/b#number with changed fields."""
+    return replace(pr, repository="a/b", number=number, **changes)
+
+
+class TestEstimates:
+    """Tests for per-PR cost and value estimates."""
+
+    @pytest.mark.ai_generated
+    def test_calls(self, sample_pull_request: PullRequest) -> None:
+        """Test costs depend on status, comment pages and the search change."""
+        closed = replace(sample_pull_request, status="closed")
+
+        assert estimate_calls(Candidate(_item(1), None)) == 8  # Open: with CI
+        assert estimate_calls(Candidate(_item(1, comments=250), None)) == 10
+        assert estimate_calls(Candidate(_item(1), closed)) == 3
+        assert estimate_calls(Candidate(_item(1), sample_pull_request, "unchanged")) == 0
+        assert estimate_calls(Candidate(_item(1), closed, "skip")) == 0
+        assert estimate_calls(Candidate(_item(1), closed, "revalidate")) == 2
+        assert estimate_calls(Candidate(_item(1), sample_pull_request, "ci")) == 5
+        assert estimate_calls(Candidate(_item(1, state="open"), closed)) == 8  # Reopened
+
+    @pytest.mark.ai_generated
+    def test_value(self, sample_pull_request: PullRequest) -> None:
+        """Test awaiting the submitter, recent activity and pending CI add value."""
+        old = NOW + timedelta(days=365)
+        waiting = replace(sample_pull_request, response_status="awaiting_submitter")
+        pending = replace(sample_pull_request, ci_status="pending")
+
+        idle, _ = refresh_value(Candidate(_item(1), sample_pull_request), old)
+        fresh, reasons = refresh_value(Candidate(_item(1), sample_pull_request), NOW)
+
+        assert fresh == pytest.approx(idle + 3.0)
+        assert reasons == ["open", "active 0d ago"]
+        assert refresh_value(Candidate(_item(1), waiting), old)[0] == pytest.approx(idle + 3.0)
+        assert refresh_value(Candidate(_item(1), pending), old)[0] == pytest.approx(idle + 2.0)
+        assert refresh_value(Candidate(_item(1), replace(pending, status="closed")), old)[0] < idle
+
+    @pytest.mark.ai_generated
+    def test_seconds_per_call(self) -> None:
+        """Test the duration estimate uses the last run's measured pace."""
+        run = DiscoveryRun(started_at=NOW, completed_at=NOW + timedelta(seconds=60))
+        run.api_calls_made = 200
+
+        assert seconds_per_call(run) == 0.3
+        assert seconds_per_call(None) == 0.5
+
+
+class TestPlanRefresh:
+    """Tests for choosing PRs within a budget."""
+
+    @pytest.mark.ai_generated
+    def test_budget(self, sample_pull_request: PullRequest) -> None:
+        """Test the most valuable PRs per call fit the budget and the rest are deferred."""
+        awaiting = _pr(sample_pull_request, 2, response_status="awaiting_submitter")
+        candidates = [
+            Candidate(_item(1, user="v"), _pr(sample_pull_request, 1), "unchanged"),
+            Candidate(_item(2), awaiting),
+            Candidate(_item(3, user="v"), _pr(sample_pull_request, 3, status="closed")),
+            Candidate(_item(4, user="w"), _pr(sample_pull_request, 4)),
+        ]
+
+        plan = plan_refresh(candidates, budget=11, now=NOW)
+
+        # 2 (8 calls) and 3 (3 calls) fit; 4 is worth more than 3 but does not fit
+        assert [p.key for p in plan.selected] == ["a/b#2", "a/b#3", "a/b#1"]
+        assert [p.key for p in plan.deferred] == ["a/b#4"]
+        assert plan.calls == 11
+        assert plan.deferred_authors() == {"w"}
+        assert plan.duration == timedelta(seconds=6)
+
+    @pytest.mark.ai_generated
+    def test_max_prs_and_new_first(self, sample_pull_request: PullRequest) -> None:
+        """Test max_prs caps fetched PRs and new PRs are processed first."""
+        waiting = _pr(sample_pull_request, 1, response_status="awaiting_submitter")
+        candidates = [Candidate(_item(1), waiting), Candidate(_item(2), None)]
+
+        plan = plan_refresh(candidates, budget=100, now=NOW)
+        capped = plan_refresh(candidates, budget=100, now=NOW, max_prs=1)
+
+        assert [p.key for p in plan.selected] == ["a/b#2", "a/b#1"]
+        assert len(capped.selected) == 1 and len(capped.deferred) == 1
+        assert "deferred 1" in capped.summary()
+
+    @pytest.mark.ai_generated
+    def test_discover_defers_over_budget(self, tmp_path: Path) -> None:
+        """Test discovery fetches only planned PRs and holds back deferring users' marks."""
+        config = Configuration(
+            data_file=tmp_path / "repositories.json",
+            tracked_users=["u", "v"],
+            rate_limit_threshold=100,
+        )
+        client = Mock(api_calls=0, retry_policy=RetryPolicy())
+        client.token_pool.total_remaining.return_value = 108  # One new open PR
+        client.search_user_prs.side_effect = [
+            [_item(1, updated_at="2025-01-12T10:00:00Z")[2] | {"repository_url": "x/a/b"}],
+            [_item(2, "v", updated_at="2025-01-13T10:00:00Z")[2] | {"repository_url": "x/a/b"}],
+        ]
+
+        with (
+            patch(
+                "improveit_dashboard.controllers.discovery.GitHubClient.from_config",
+                return_value=client,
+            ),
+            patch(
+                "improveit_dashboard.controllers.discovery._process_pr", return_value="new"
+            ) as process,
+        ):
+            result = discover(config)
+
+        assert process.call_count == 1
+        assert len(result.run.user_high_water_marks) == 1
+
+
+class TestOfflinePlan:
+    """Tests for the update --plan dry run."""
+
+    @pytest.mark.ai_generated
+    def test_plans_model_without_network(
+        self, tmp_path: Path, sample_repository: Repository
+    ) -> None:
+        """Test every non-merged PR is planned against the last run's headroom."""
+        merged = _pr(sample_repository.prs[12912], 1, status="merged")
+        sample_repository.prs[1] = replace(merged, repository=sample_repository.full_name)
+        config = Configuration(
+            data_file=tmp_path / "repositories.json",
+            github_token="a",
+            github_tokens=["b"],
+            rate_limit_threshold=0,
+        )
+        last_run = DiscoveryRun(started_at=NOW, completed_at=NOW, rate_limit_remaining=42)
+        save_model(config.data_file, {sample_repository.full_name: sample_repository}, last_run)
+
+        recent = offline_plan(config, now=NOW + timedelta(minutes=10))
+        later = offline_plan(config, now=NOW + timedelta(hours=2))
+
+        assert recent.budget == 42
+        assert later.budget == 10000  # Full hourly limit of both tokens
+        assert [p.key for p in recent.selected if p.calls] == ["kestra-io/kestra#12912"]
+        assert "kestra-io/kestra#12912" in recent.render()
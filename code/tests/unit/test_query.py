@@ -0,0 +1,208 @@
+"""Unit tests for filter expressions and model indexes."""
+
+import random
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from improveit_dashboard.controllers.query import (
+    BoolOp,
+    Comparison,
+    ModelIndex,
+    Not,
+    Query,
+    QueryError,
+    combine,
+)
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+NOW = datetime(2025, 3, 1, tzinfo=UTC)
+
+
+def _model(seed: int = 0, n_repos: int = 30) -> dict[str, Repository]:
+    """Build repositories with random PR authors, statuses, tools and dates."""
+    rng = random.Random(seed)
+    repositories: dict[str, Repository] = {}
+    for r in range(n_repos):
+        repo = Repository(owner="o", name=f"r{r}", platform="github", url=f"https://x/o/r{r}")
+        repo.behavior_category = rng.choice(["welcoming", "unresponsive", "insufficient_data"])
+        for number in range(1, rng.randint(0, 8) + 1):
+            created = NOW - timedelta(days=rng.randint(1, 400))
+            status: Any = rng.choice(["draft", "open", "merged", "closed"])
+            repo.add_pr(
+                PullRequest(
+                    number=number,
+                    repository=repo.full_name,
+                    platform="github",
+                    url=f"https://x/{repo.full_name}/pull/{number}",
+                    tool=rng.choice(["codespell", "shellcheck", "other"]),
+                    title=rng.choice(["Fix typos", "Add codespell support", "Shellcheck fixes"]),
+                    author=rng.choice(["alice", "bob", "carol"]),
+                    created_at=created,
+                    updated_at=created + timedelta(days=rng.randint(0, 30)),
+                    status=status,
+                    response_status=rng.choice(
+                        ["awaiting_maintainer", "awaiting_submitter", "no_response"]
+                    ),
+                    automation_types=rng.sample(["config", "workflow"], rng.randint(0, 2)),
+                )
+            )
+        repositories[repo.full_name] = repo
+    return repositories
+
+
+def _numbers(prs: Any) -> list[tuple[str, int]]:
+    """Identify PRs by (repository, number)."""
+    return [(pr.repository, pr.number) for pr in prs]
+
+
+class TestParsing:
+    """Tests for parsing filter expressions."""
+
+    @pytest.mark.ai_generated
+    def test_precedence(self) -> None:
+        """Test "and" binds tighter than "or" and "not" applies to a factor."""
+        query = Query("status = open or tool = codespell and not author = bob")
+
+        assert query.node == BoolOp(
+            "or",
+            (
+                Comparison("status", "=", "open"),
+                BoolOp(
+                    "and",
+                    (Comparison("tool", "=", "codespell"), Not(Comparison("author", "=", "bob"))),
+                ),
+            ),
+        )
+
+    @pytest.mark.ai_generated
+    def test_values_are_coerced(self) -> None:
+        """Test values are coerced to the field's type when parsing."""
+        query = Query(
+            "number >= 10 and merged_at = null and created_at < 2025-01-01 and title ~ 'a b'"
+        )
+
+        assert isinstance(query.node, BoolOp)
+        assert [c.value for c in query.node.operands if isinstance(c, Comparison)] == [
+            10,
+            None,
+            datetime(2025, 1, 1, tzinfo=UTC),
+            "a b",
+        ]
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("bogus = 1", "Unknown field"),
+            ("status = pending", "pending"),
+            ("number = many", "many"),
+            ("status =", "Expected a field or value"),
+            ("status open", "Expected an operator"),
+            ("(status = open", r"Expected \), found end"),
+            ("status = open extra", "extra"),
+            ("title = 'unterminated", "Unexpected"),
+        ],
+    )
+    def test_errors(self, text: str, message: str) -> None:
+        """Test invalid expressions raise QueryError naming the problem."""
+        with pytest.raises(QueryError, match=message):
+            Query(text)
+
+    @pytest.mark.ai_generated
+    def test_combine(self) -> None:
+        """Test expressions are ANDed, skipping empty ones."""
+        assert combine(None, "status = open") == "(status = open)"
+        assert combine("a = 1 or b = 2", "c = 3") == "(a = 1 or b = 2) and (c = 3)"
+        assert combine(None, "") is None
+
+
+class TestMatching:
+    """Tests for evaluating filter expressions."""
+
+    @pytest.mark.ai_generated
+    def test_comparisons(
+        self, sample_pull_request: PullRequest, sample_repository: Repository
+    ) -> None:
+        """Test equality, ordering, substring, membership and negation."""
+        sample_pull_request.automation_types = ["config", "workflow"]
+
+        def matches(text: str) -> bool:
+            return Query(text).matches(sample_pull_request, sample_repository)
+
+        assert matches("status = open and number > 12000")
+        assert not matches("status != open")
+        assert matches("title ~ CODESPELL")
+        assert matches("status in (draft, open) and tool not in (shellcheck)")
+        assert matches("automation_types = workflow")
+        assert not matches("automation_types = other")
+        assert matches("merged_at = null and not merged_at != null")
+        assert not matches("merged_at > 2025-01-01")  # None never orders
+        assert matches("repo.name = kestra and repo.owner = 'kestra-io'")
+
+    @pytest.mark.ai_generated
+    def test_derived_days(
+        self, sample_pull_request: PullRequest, sample_repository: Repository
+    ) -> None:
+        """Test age_days and idle_days count (fractional) days before the reference time."""
+        # Created 2025-01-15 10:00 (44.6 days before NOW), updated 2025-01-20 14:30 (39.4)
+        query = Query("age_days > 44.5 and age_days < 45 and idle_days < 40", now=NOW)
+
+        assert query.matches(sample_pull_request, sample_repository)
+        assert not Query("idle_days > 40", now=NOW).matches(sample_pull_request, sample_repository)
+
+    @pytest.mark.ai_generated
+    def test_behavior_overrides(
+        self, sample_pull_request: PullRequest, sample_repository: Repository
+    ) -> None:
+        """Test repo.behavior_category applies configured overrides."""
+        text = "repo.behavior_category = welcoming"
+        overrides = {sample_repository.full_name: "welcoming"}
+
+        assert not Query(text).matches(sample_pull_request, sample_repository)
+        assert Query(text, overrides).matches(sample_pull_request, sample_repository)
+
+
+class TestModelIndex:
+    """Tests for indexed selection."""
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "author = alice",
+            "status in (open, draft) and tool = codespell",
+            "author = bob or repository = 'o/r3'",
+            "author = bob or idle_days > 10",
+            "not status = merged and author != carol",
+            "tool = codespell and (status = open or age_days < 100)",
+            "repo.behavior_category = welcoming and response_status = awaiting_maintainer",
+            "repo.behavior_category in (hostile, unresponsive) or author = carol",
+            "status = closed and status = open",
+        ],
+    )
+    def test_index_matches_scan(self, text: str) -> None:
+        """Test indexed selection returns the scan's PRs in model order."""
+        repositories = _model()
+        overrides = {"o/r1": "hostile", "o/r2": "welcoming"}
+        query = Query(text, overrides, now=NOW)
+
+        scanned = _numbers(query.select(repositories))
+        indexed = _numbers(query.select(repositories, ModelIndex(repositories, overrides)))
+
+        assert indexed == scanned
+        # An index built with other overrides is not used
+        assert _numbers(query.select(repositories, ModelIndex(repositories))) == scanned
+
+    @pytest.mark.ai_generated
+    def test_lookup(self) -> None:
+        """Test the index maps field values to PR positions."""
+        repositories = _model()
+        index = ModelIndex(repositories)
+
+        alice = [index.prs[p] for p in index.lookup("author", "alice")]
+        assert alice and all(pr.author == "alice" for pr in alice)
+        assert sum(index.values("status").values()) == len(index.prs)
+        assert index.lookup("author", "nobody") == []
@@ -0,0 +1,164 @@
+"""Unit tests for rate limit handling and request pacing."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from improveit_dashboard.utils.rate_limit import RateLimitError, RateLimitHandler
+
+
+def _headers(remaining: int, limit: int = 5000, reset_in: int = 1000, **extra: str) -> dict:
+    headers = {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(int(time.time()) + reset_in),
+    }
+    headers.update(extra)
+    return headers
+
+
+class TestRateLimitHandler:
+    """Tests for the classic threshold behavior."""
+
+    @pytest.mark.ai_generated
+    def test_waits_until_reset_below_threshold(self, mock_response: Any) -> None:
+        """Test non-pacing mode sleeps until the window resets."""
+        handler = RateLimitHandler(threshold=100)
+        response = mock_response(headers=_headers(remaining=50, reset_in=30))
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep") as sleep:
+            handler.check_and_wait(response)
+
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] >= 30
+
+    @pytest.mark.ai_generated
+    def test_acquire_is_noop_without_pacing(self) -> None:
+        """Test acquire never waits when pacing is disabled."""
+        handler = RateLimitHandler()
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep") as sleep:
+            for _ in range(100):
+                assert handler.acquire() == 0.0
+        sleep.assert_not_called()
+
+
+class TestPacing:
+    """Tests for token bucket pacing."""
+
+    @pytest.mark.ai_generated
+    def test_no_sleep_until_reset_when_pacing(self, mock_response: Any) -> None:
+        """Test pacing mode does not stall in check_and_wait."""
+        handler = RateLimitHandler(threshold=100, pacing=True)
+        response = mock_response(headers=_headers(remaining=50, reset_in=3000))
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep") as sleep:
+            handler.check_and_wait(response)
+
+        sleep.assert_not_called()
+
+    @pytest.mark.ai_generated
+    def test_burst_then_paced(self, mock_response: Any) -> None:
+        """Test requests beyond the burst are spaced at the observed rate."""
+        handler = RateLimitHandler(threshold=100, pacing=True, burst=2)
+        # 1000 spare calls over 1000s -> 1 request per second
+        handler.update_from_response(mock_response(headers=_headers(remaining=1100)))
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep") as sleep:
+            delays = [handler.acquire() for _ in range(4)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == 0.0
+        assert delays[2] == pytest.approx(1.0, abs=0.05)
+        assert delays[3] == pytest.approx(2.0, abs=0.05)
+        assert sleep.call_count == 2
+
+    @pytest.mark.ai_generated
+    def test_exhausted_budget_waits_for_reset(self, mock_response: Any) -> None:
+        """Test pacing waits for the reset once the reserve is reached."""
+        handler = RateLimitHandler(threshold=100, pacing=True)
+        handler.update_from_response(mock_response(headers=_headers(remaining=80, reset_in=60)))
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep"):
+            delay = handler.acquire()
+
+        assert 59 <= delay <= 62
+
+    @pytest.mark.ai_generated
+    def test_resources_have_separate_buckets(self, mock_response: Any) -> None:
+        """Test search headers do not throttle core requests."""
+        handler = RateLimitHandler(threshold=100, pacing=True, burst=1)
+        handler.update_from_response(mock_response(headers=_headers(remaining=4000)))
+        handler.update_from_response(
+            mock_response(
+                headers=_headers(
+                    remaining=5, limit=30, reset_in=60, **{"X-RateLimit-Resource": "search"}
+                )
+            )
+        )
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep"):
+            assert handler.acquire("core") == 0.0
+            # Search reserve is scaled to 3 of 30, 2 spare calls over 60s
+            handler.acquire("search")
+            assert handler.acquire("search") == pytest.approx(30.0, abs=1.0)
+
+    @pytest.mark.ai_generated
+    def test_search_critical_threshold_scaled(self, mock_response: Any) -> None:
+        """Test the critical threshold does not trip on the small search limit."""
+        handler = RateLimitHandler(pacing=True)
+        response = mock_response(
+            headers=_headers(
+                remaining=5, limit=30, reset_in=60, **{"X-RateLimit-Resource": "search"}
+            )
+        )
+        handler.check_and_wait(response)
+
+        response = mock_response(
+            headers=_headers(
+                remaining=2, limit=30, reset_in=60, **{"X-RateLimit-Resource": "search"}
+            )
+        )
+        with pytest.raises(RateLimitError):
+            handler.check_and_wait(response)
+
+    @pytest.mark.ai_generated
+    def test_threads_share_budget(self, mock_response: Any) -> None:
+        """Test concurrent threads queue behind each other instead of bursting."""
+        handler = RateLimitHandler(threshold=100, pacing=True, burst=1)
+        handler.update_from_response(mock_response(headers=_headers(remaining=1100)))
+        delays: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            delay = handler.acquire()
+            with lock:
+                delays.append(delay)
+
+        with patch("improveit_dashboard.utils.rate_limit.time.sleep"):
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert sorted(round(d) for d in delays) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.ai_generated
+    def test_acquire_async(self, mock_response: Any) -> None:
+        """Test asyncio tasks share one budget without blocking the loop."""
+        handler = RateLimitHandler(threshold=100, pacing=True, burst=1)
+        handler.update_from_response(mock_response(headers=_headers(remaining=1100)))
+
+        async def fake_sleep(_: float) -> None:
+            return None
+
+        async def run() -> list[float]:
+            with patch("improveit_dashboard.utils.rate_limit.asyncio.sleep", new=fake_sleep):
+                return list(await asyncio.gather(*(handler.acquire_async() for _ in range(3))))
+
+        delays = asyncio.run(run())
+        assert sorted(round(d) for d in delays) == [0, 1, 2]
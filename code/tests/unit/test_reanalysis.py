@@ -0,0 +1,130 @@
+"""Unit tests for bulk offline reanalysis."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from improveit_dashboard.controllers.archive import PayloadArchive
+from improveit_dashboard.controllers.reanalysis import (
+    PRSelector,
+    reanalyze_bulk,
+    select_prs,
+)
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+
+class TestReanalyzeFromArchive:
+    """Tests for offline reanalysis."""
+
+    @pytest.mark.ai_generated
+    def test_recomputes_derived_fields(
+        self,
+        tmp_path: Path,
+        sample_repository: Repository,
+        sample_comment_data: list[dict[str, Any]],
+        sample_files_data: list[dict[str, Any]],
+    ) -> None:
+        """Test comments, files and checks are reanalyzed without API calls."""
+        pr = sample_repository.prs[12912]
+        archive = PayloadArchive(tmp_path / "archive")
+        archive.put(pr.repository, pr.number, "comments", sample_comment_data)
+        archive.put(pr.repository, pr.number, "files", sample_files_data)
+        archive.put(
+            pr.repository,
+            pr.number,
+            "checks",
+            {
+                "status_state": None,
+                "check_runs": [{"name": "Codespell", "conclusion": "failure"}],
+            },
+        )
+
+        result = reanalyze_bulk(
+            {sample_repository.full_name: sample_repository}, archive, PRSelector(), jobs=1
+        )
+
+        pr = sample_repository.prs[12912]
+        assert result.reanalyzed == 1
+        assert pr.total_comments == len(sample_comment_data)
+        assert pr.automation_types
+        assert pr.ci_status == "failure"
+        assert pr.codespell_workflow_ci == "failure"
+
+    @pytest.mark.ai_generated
+    def test_missing_payloads(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test PRs without archived payloads are counted and left untouched."""
+        before = sample_repository.prs[12912].to_dict()
+
+        result = reanalyze_bulk(
+            {sample_repository.full_name: sample_repository},
+            PayloadArchive(tmp_path),
+            PRSelector(),
+        )
+
+        assert (result.selected, result.missing, result.reanalyzed) == (1, 1, 0)
+        assert sample_repository.prs[12912].to_dict() == before
+
+
+def _model(sample_pull_request: PullRequest, count: int) -> dict[str, Repository]:
+    """Build a model with ``count`` copies of the sample PR spread over two repos."""
+    repositories: dict[str, Repository] = {}
+    for i in range(count):
+        owner = "even" if i % 2 == 0 else "odd"
+        repo = repositories.setdefault(
+            f"{owner}/repo",
+            Repository(owner=owner, name="repo", platform="github", url=""),
+        )
+        pr = PullRequest.from_dict(
+            {**sample_pull_request.to_dict(), "number": i + 1, "repository": repo.full_name}
+        )
+        pr.author = "alice" if i < count // 2 else "bob"
+        repo.add_pr(pr)
+    return repositories
+
+
+class TestBulkReanalysis:
+    """Tests for selectors and the process-pool engine."""
+
+    @pytest.mark.ai_generated
+    def test_selectors(self, sample_pull_request: PullRequest) -> None:
+        """Test selector criteria combine with AND."""
+        repositories = _model(sample_pull_request, 8)
+        repositories["odd/repo"].prs[2].analysis_status = "needs_reanalysis"
+
+        assert len(select_prs(repositories, PRSelector())) == 8
+        assert len(select_prs(repositories, PRSelector(repositories={"even/repo"}))) == 4
+        assert len(select_prs(repositories, PRSelector(authors={"ALICE"}))) == 4
+        selected = select_prs(
+            repositories,
+            PRSelector(repositories={"odd/repo"}, analysis_statuses={"needs_reanalysis"}),
+        )
+        assert [pr.number for pr in selected] == [2]
+        assert select_prs(repositories, PRSelector(prs={"even/repo#3"}))[0].number == 3
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_bulk_matches_serial(
+        self,
+        tmp_path: Path,
+        sample_pull_request: PullRequest,
+        sample_comment_data: list[dict[str, Any]],
+        jobs: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test pooled reanalysis merges the same results back into the model."""
+        monkeypatch.setattr("improveit_dashboard.controllers.reanalysis.MIN_PARALLEL_PRS", 0)
+        repositories = _model(sample_pull_request, 10)
+        archive = PayloadArchive(tmp_path / "archive")
+        for repo in repositories.values():
+            for pr in list(repo.prs.values())[:-1]:
+                archive.put(pr.repository, pr.number, "comments", sample_comment_data)
+                pr.analysis_status = "needs_reanalysis"
+
+        result = reanalyze_bulk(repositories, archive, PRSelector(), jobs=jobs)
+
+        assert (result.selected, result.reanalyzed, result.missing) == (10, 8, 2)
+        analyzed = [pr for repo in repositories.values() for pr in repo.prs.values()]
+        assert sum(pr.total_comments == len(sample_comment_data) for pr in analyzed) == 8
+        assert sum(pr.analysis_status == "analyzed" for pr in analyzed) == 8
@@ -0,0 +1,80 @@
+"""Unit tests for the retry policy."""
+
+import time
+
+import pytest
+
+from improveit_dashboard.utils.retry import RetryPolicy, endpoint_key
+
+
+class TestEndpointKey:
+    """Tests for endpoint normalization."""
+
+    @pytest.mark.ai_generated
+    def test_normalizes_repo_and_number(self) -> None:
+        """Test owner, repo and PR number are templated."""
+        assert (
+            endpoint_key("/repos/foo/bar/pulls/12/files")
+            == "/repos/{owner}/{repo}/pulls/{number}/files"
+        )
+
+    @pytest.mark.ai_generated
+    def test_normalizes_sha_and_branch(self) -> None:
+        """Test commit SHAs and branch names are templated."""
+        sha = "a" * 40
+        assert endpoint_key(f"/repos/o/r/commits/{sha}/status") == (
+            "/repos/{owner}/{repo}/commits/{sha}/status"
+        )
+        assert endpoint_key("/repos/o/r/branches/main") == "/repos/{owner}/{repo}/branches/{branch}"
+
+    @pytest.mark.ai_generated
+    def test_search_unchanged(self) -> None:
+        """Test endpoints without identifiers are kept."""
+        assert endpoint_key("search/issues") == "/search/issues"
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions."""
+
+    @pytest.mark.ai_generated
+    def test_exponential_backoff_with_jitter(self) -> None:
+        """Test delays grow exponentially and stay within jitter bounds."""
+        policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=8.0)
+        for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (6, 8.0)]:
+            delay = policy.backoff("/x", attempt)
+            assert delay is not None
+            assert ceiling / 2 <= delay <= ceiling
+
+    @pytest.mark.ai_generated
+    def test_retry_after_respected(self) -> None:
+        """Test server-provided waits take precedence over backoff."""
+        policy = RetryPolicy()
+        delay = policy.backoff("/x", 1, retry_after=42)
+        assert delay is not None
+        assert 42 <= delay <= 43
+
+    @pytest.mark.ai_generated
+    def test_retry_after_too_long(self) -> None:
+        """Test waits beyond max_rate_limit_wait are not retried."""
+        policy = RetryPolicy(max_rate_limit_wait=60)
+        assert policy.backoff("/x", 1, retry_after=3600) is None
+
+    @pytest.mark.ai_generated
+    def test_budget_exhausted(self) -> None:
+        """Test the per-run retry budget caps total retries."""
+        policy = RetryPolicy(retry_budget=2)
+        assert policy.backoff("/a", 1) is not None
+        assert policy.backoff("/b", 1) is not None
+        assert policy.backoff("/c", 1) is None
+        assert policy.retries_used == 2
+        assert policy.get_stats() == {"/a": 1, "/b": 1, "/c": 1}
+
+    @pytest.mark.ai_generated
+    def test_rate_limit_delay(self) -> None:
+        """Test waiting for a near rate limit reset but not a distant one."""
+        policy = RetryPolicy(max_rate_limit_wait=600)
+        now = int(time.time())
+        delay = policy.rate_limit_delay(now + 120)
+        assert delay is not None
+        assert 120 <= delay <= 122
+        assert policy.rate_limit_delay(now + 3600) is None
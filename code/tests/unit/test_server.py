@@ -0,0 +1,153 @@
+"""Unit tests for the JSON query server."""
+
+import json
+import os
+import threading
+import urllib.request
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from improveit_dashboard.controllers.persistence import save_model
+from improveit_dashboard.controllers.server import ModelServer
+from improveit_dashboard.models.config import Configuration, RepositoryOverride
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+
+
+@pytest.fixture
+def config(tmp_path: Path, sample_repository: Repository) -> Configuration:
+    """Configuration whose model holds the sample repository and a second one."""
+    other = Repository(owner="o", name="other", platform="github", url="https://x/o/other")
+    other.behavior_category = "welcoming"
+    other.add_pr(
+        PullRequest(
+            number=1,
+            repository="o/other",
+            platform="github",
+            url="https://x/o/other/pull/1",
+            tool="shellcheck",
+            title="Fix shellcheck warnings",
+            author="alice",
+            created_at=datetime(2025, 1, 1, tzinfo=UTC),
+            updated_at=datetime(2025, 1, 2, tzinfo=UTC),
+            status="open",
+            response_status="awaiting_submitter",
+            last_maintainer_comment_at=datetime(2025, 1, 2, tzinfo=UTC),
+        )
+    )
+    config = Configuration(data_file=tmp_path / "repositories.json")
+    save_model(config.data_file, {sample_repository.full_name: sample_repository, "o/other": other})
+    return config
+
+
+@pytest.fixture
+def server(config: Configuration) -> Iterator[ModelServer]:
+    """Model server over the test model."""
+    server = ModelServer(config, poll_interval=0.01)
+    yield server
+    server.stop()
+
+
+class TestModelServer:
+    """Tests for answering queries."""
+
+    @pytest.mark.ai_generated
+    def test_prs(self, server: ModelServer) -> None:
+        """Test /prs combines the expression with shortcut parameters."""
+        status, body = server.handle("/prs?q=status+in+(open,draft)&tool=shellcheck&fields=number")
+
+        assert status == 200
+        assert body == {"total": 1, "offset": 0, "prs": [{"number": 1}]}
+
+    @pytest.mark.ai_generated
+    def test_pagination_and_category(self, server: ModelServer) -> None:
+        """Test limit/offset page results and category queries the repository."""
+        _, page = server.handle("/prs?limit=1&offset=1&fields=repository")
+        _, welcoming = server.handle("/prs?category=welcoming&fields=repository")
+
+        assert page == {"total": 2, "offset": 1, "prs": [{"repository": "o/other"}]}
+        assert welcoming["prs"] == [{"repository": "o/other"}]
+
+    @pytest.mark.ai_generated
+    def test_behavior_overrides(self, config: Configuration) -> None:
+        """Test configured overrides apply to category queries and statistics."""
+        config.repository_overrides = {"o/other": RepositoryOverride(category="hostile")}
+        server = ModelServer(config)
+
+        _, body = server.handle("/prs?category=hostile")
+        _, repos = server.handle("/repos?category=hostile")
+
+        assert body["total"] == 1
+        assert [r["repository"] for r in repos["repositories"]] == ["o/other"]
+
+    @pytest.mark.ai_generated
+    def test_inbox(self, server: ModelServer) -> None:
+        """Test /inbox lists open PRs awaiting the submitter."""
+        _, body = server.handle("/inbox?fields=repository,number")
+        _, none = server.handle("/inbox?author=yarikoptic")
+
+        assert body == {"total": 1, "prs": [{"repository": "o/other", "number": 1}]}
+        assert none["total"] == 0
+
+    @pytest.mark.ai_generated
+    def test_repository(self, server: ModelServer) -> None:
+        """Test /repos/<owner>/<name> returns statistics and PRs."""
+        status, body = server.handle("/repos/kestra-io/kestra?fields=number")
+
+        assert status == 200
+        assert body["open"] == 1
+        assert body["total_prs"] == 1
+        assert body["prs"] == [{"number": 12912}]
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("target", "status"),
+        [
+            ("/prs?q=status+=+pending", 400),
+            ("/prs?fields=bogus", 400),
+            ("/prs?limit=-1", 400),
+            ("/repos/no/such", 404),
+            ("/nothing", 404),
+        ],
+    )
+    def test_errors(self, server: ModelServer, target: str, status: int) -> None:
+        """Test invalid requests get an error status and message."""
+        code, body = server.handle(target)
+
+        assert code == status
+        assert "error" in body
+
+    @pytest.mark.ai_generated
+    def test_reload_if_changed(
+        self, server: ModelServer, config: Configuration, sample_repository: Repository
+    ) -> None:
+        """Test the model is reloaded only after its file changes."""
+        assert not server.reload_if_changed()
+
+        save_model(config.data_file, {sample_repository.full_name: sample_repository})
+        stat = config.data_file.stat()
+        os.utime(config.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert server.reload_if_changed()
+        assert server.handle("/status")[1]["prs"] == 1
+
+    @pytest.mark.ai_generated
+    def test_http(self, server: ModelServer) -> None:
+        """Test the HTTP server answers with JSON."""
+        httpd = server.make_http_server("127.0.0.1", 0)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{httpd.server_address[1]}/status"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers["Content-Type"] == "application/json"
+                body = json.load(response)
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+        assert body["repositories"] == 2
+        assert body["statuses"] == {"open": 2}
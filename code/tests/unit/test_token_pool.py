@@ -0,0 +1,80 @@
+"""Unit tests for the GitHub token pool."""
+
+import time
+from typing import Any
+
+import pytest
+
+from improveit_dashboard.utils.token_pool import TokenPool
+
+
+def _headers(remaining: int, reset_in: int = 1000) -> dict[str, str]:
+    return {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Reset": str(int(time.time()) + reset_in),
+    }
+
+
+class TestTokenPool:
+    """Tests for TokenPool selection."""
+
+    @pytest.mark.ai_generated
+    def test_deduplicates_tokens(self) -> None:
+        """Test duplicate and empty tokens are dropped."""
+        pool = TokenPool(["a", "", "b", "a"])
+        assert [e.token for e in pool.entries] == ["a", "b"]
+
+    @pytest.mark.ai_generated
+    def test_anonymous_when_no_tokens(self) -> None:
+        """Test an empty pool still yields an (unauthenticated) entry."""
+        pool = TokenPool([])
+        assert pool.select().token == ""
+
+    @pytest.mark.ai_generated
+    def test_selects_most_headroom(self, mock_response: Any) -> None:
+        """Test the token with the most remaining calls is chosen."""
+        pool = TokenPool(["a", "b", "c"])
+        pool.entries[0].rate_limit.update_from_response(mock_response(headers=_headers(3000)))
+        pool.entries[1].rate_limit.update_from_response(mock_response(headers=_headers(4000)))
+        pool.entries[2].rate_limit.update_from_response(mock_response(headers=_headers(1000)))
+
+        assert pool.select().token == "b"
+        assert pool.total_remaining() == 8000
+
+    @pytest.mark.ai_generated
+    def test_skips_exhausted_until_reset(self, mock_response: Any) -> None:
+        """Test exhausted tokens are skipped, and reset windows count as full."""
+        pool = TokenPool(["a", "b"], threshold=100)
+        pool.entries[0].rate_limit.update_from_response(mock_response(headers=_headers(50)))
+        pool.entries[1].rate_limit.update_from_response(mock_response(headers=_headers(200)))
+        assert pool.select().token == "b"
+
+        # Token a's window has reset since its last response
+        pool.entries[0].rate_limit.update_from_response(
+            mock_response(headers=_headers(50, reset_in=-5))
+        )
+        assert pool.select().token == "a"
+
+    @pytest.mark.ai_generated
+    def test_all_exhausted_picks_earliest_reset(self, mock_response: Any) -> None:
+        """Test the token resetting first is used when all are exhausted."""
+        pool = TokenPool(["a", "b"], threshold=100)
+        pool.entries[0].rate_limit.update_from_response(
+            mock_response(headers=_headers(10, reset_in=900))
+        )
+        pool.entries[1].rate_limit.update_from_response(
+            mock_response(headers=_headers(10, reset_in=300))
+        )
+        assert pool.select().token == "b"
+        assert not pool.has_headroom()
+
+    @pytest.mark.ai_generated
+    def test_resources_counted_separately(self, mock_response: Any) -> None:
+        """Test a search response does not change the core headroom."""
+        pool = TokenPool(["a", "b"])
+        search = _headers(29) | {"X-RateLimit-Limit": "30", "X-RateLimit-Resource": "search"}
+        pool.entries[0].rate_limit.update_from_response(mock_response(headers=search))
+
+        assert pool.total_remaining() == 10000  # Core not seen yet: documented 5000 each
+        assert pool.total_remaining("search") == 59
@@ -1,10 +1,15 @@
 """Unit tests for view generation."""
 
+import csv
+import io
+import json
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from improveit_dashboard.controllers.query import Query
 from improveit_dashboard.models.pull_request import PullRequest
 from improveit_dashboard.models.repository import Repository
 from improveit_dashboard.utils.markdown import (
@@ -14,7 +19,9 @@ from improveit_dashboard.utils.markdown import (
     write_if_changed,
 )
 from improveit_dashboard.views.dashboard import generate_dashboard
+from improveit_dashboard.views.export import FILTER_PRESETS, export_prs, parse_fields
 from improveit_dashboard.views.reports import generate_user_reports
+from improveit_dashboard.views.statistics import generate_statistics_report
 
 
 class TestDashboardGeneration:
@@ -180,6 +187,104 @@ class TestUserReports:
         assert "waiting 5 days" in content
 
 
+class TestStatisticsReport:
+    """Tests for the statistics report."""
+
+    @pytest.mark.ai_generated
+    def test_generate_statistics(self, tmp_path: Path, sample_repository: Repository) -> None:
+        """Test markdown and JSON statistics are written with overrides applied."""
+        repositories = {sample_repository.full_name: sample_repository}
+        paths = generate_statistics_report(
+            repositories, tmp_path, behavior_overrides={sample_repository.full_name: "hostile"}
+        )
+
+        assert [p.name for p in paths] == ["statistics.md", "statistics.json"]
+        assert "## Time to Merge" in paths[0].read_text()
+        stats = json.loads(paths[1].read_text())
+        assert stats["total_prs"] == 1
+        assert stats["acceptance_by_behavior"]["hostile"]["prs"] == 1
+
+
+class TestExport:
+    """Tests for streaming export."""
+
+    @pytest.mark.ai_generated
+    def test_json_matches_document_layout(self, sample_pull_request: PullRequest) -> None:
+        """Test streamed JSON equals the indented array of full PR dicts."""
+        prs = [sample_pull_request, replace(sample_pull_request, number=2)]
+        out = io.StringIO()
+
+        assert export_prs(prs, out, "json") == 2
+        assert out.getvalue() == json.dumps([pr.to_dict() for pr in prs], indent=2) + "\n"
+
+        empty = io.StringIO()
+        export_prs([], empty, "json")
+        assert json.loads(empty.getvalue()) == []
+
+    @pytest.mark.ai_generated
+    def test_jsonl_projection(self, sample_pull_request: PullRequest) -> None:
+        """Test JSONL writes one object per PR with only the requested fields."""
+        out = io.StringIO()
+
+        export_prs([sample_pull_request], out, "jsonl", parse_fields("number, created_at"))
+
+        assert out.getvalue().splitlines() == [
+            '{"number":12912,"created_at":"2025-01-15T10:00:00+00:00"}'
+        ]
+
+    @pytest.mark.ai_generated
+    def test_csv(self, sample_pull_request: PullRequest) -> None:
+        """Test CSV has a header, blank None cells and joined lists."""
+        pr = replace(sample_pull_request, automation_types=["config", "workflow"])
+        out = io.StringIO(newline="")
+
+        export_prs([pr], out, "csv", ["number", "merged_at", "automation_types"])
+
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        assert rows == [
+            ["number", "merged_at", "automation_types"],
+            ["12912", "", "config;workflow"],
+        ]
+
+    @pytest.mark.ai_generated
+    def test_text(self, sample_pull_request: PullRequest) -> None:
+        """Test the text listing is tab-separated with one line per PR."""
+        sample_pull_request.title = "Fix\ttypos\nin docs"
+        out = io.StringIO()
+
+        export_prs([sample_pull_request], out, "text", ["number", "title", "merged_at"])
+
+        assert out.getvalue() == "number\ttitle\tmerged_at\n12912\tFix typos in docs\t-\n"
+
+    @pytest.mark.ai_generated
+    def test_parquet(self, tmp_path: Path, sample_pull_request: PullRequest) -> None:
+        """Test Parquet export round-trips typed columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "prs.parquet"
+
+        with open(path, "wb") as f:
+            export_prs([sample_pull_request], f, "parquet", ["number", "created_at", "merged_at"])
+
+        table = pq.read_table(path)
+        assert table.column_names == ["number", "created_at", "merged_at"]
+        assert table.to_pylist()[0]["created_at"] == sample_pull_request.created_at
+
+    @pytest.mark.ai_generated
+    def test_filters_and_fields(self, sample_repository: Repository) -> None:
+        """Test export filter presets select PRs and unknown fields are rejected."""
+        repositories = {sample_repository.full_name: sample_repository}
+
+        def select(preset: str) -> list[PullRequest]:
+            expression = FILTER_PRESETS[preset]
+            assert expression is not None
+            return list(Query(expression).select(repositories))
+
+        assert len(select("open")) == 1
+        assert select("merged") == []
+        with pytest.raises(ValueError, match="bogus"):
+            parse_fields("number,bogus")
+
+
 class TestMarkdownSanitization:
     """Tests for markdown sanitization utilities."""
 
@@ -0,0 +1,244 @@
+"""Unit tests for the watch daemon (fake clock, patched fetches)."""
+
+import os
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from improveit_dashboard.controllers.persistence import load_model, save_model
+from improveit_dashboard.controllers.watch import (
+    PollPolicy,
+    WatchDaemon,
+    WatchState,
+    watch_state_path,
+)
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.pull_request import PullRequest
+from improveit_dashboard.models.repository import Repository
+from improveit_dashboard.utils.rate_limit import RateLimitError
+from improveit_dashboard.utils.retry import RetryPolicy
+
+MODULE = "improveit_dashboard.controllers.watch"
+KEY = "kestra-io/kestra#12912"
+# Two days after the sample PR's last update
+START = datetime(2025, 1, 22, 14, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+def config(tmp_path: Path, sample_repository: Repository) -> Configuration:
+    """Configuration whose model holds the sample repository."""
+    config = Configuration(
+        tracked_users=["yarikoptic"],
+        data_file=tmp_path / "data" / "repositories.json",
+        change_feed=False,
+    )
+    save_model(config.data_file, {sample_repository.full_name: sample_repository})
+    return config
+
+
+@pytest.fixture
+def client() -> Mock:
+    """GitHub client mock with the attributes checkpoints read."""
+    client = Mock(api_calls=0, retry_policy=RetryPolicy())
+    client.token_pool.total_remaining.return_value = 5000
+    return client
+
+
+@pytest.fixture
+def search() -> Iterator[Mock]:
+    """Patched incremental search, finding nothing by default."""
+    with patch(f"{MODULE}.search_updates", return_value=[]) as search:
+        yield search
+
+
+@pytest.fixture
+def process() -> Iterator[Mock]:
+    """Patched process_pr, finding PRs unchanged by default."""
+    with patch(f"{MODULE}.process_pr", return_value="unchanged") as process:
+        yield process
+
+
+@pytest.fixture
+def daemon(config: Configuration, client: Mock, search: Mock, process: Mock) -> WatchDaemon:
+    """Daemon started at START over the test model."""
+    return WatchDaemon(config, client=client, generate=False, now=START)
+
+
+def _touch(
+    client: Any,
+    config: Any,
+    repositories: dict[str, Repository],
+    repo_name: str,
+    number: int,
+    *args: Any,
+    **kwargs: Any,
+) -> str:
+    """process_pr side effect: the PR had new activity at START."""
+    pr = repositories[repo_name].prs[number]
+    repositories[repo_name].prs[number] = replace(pr, updated_at=START, last_fetched_at=START)
+    return "updated"
+
+
+class TestPollPolicy:
+    """Tests for the per-PR polling cadence."""
+
+    @pytest.mark.ai_generated
+    @pytest.mark.parametrize(
+        ("idle", "expected"),
+        [
+            (timedelta(minutes=30), 300.0),
+            (timedelta(days=2), 7200.0),
+            (timedelta(days=60), 86400.0),
+        ],
+        ids=["hot", "idle", "stale"],
+    )
+    def test_open_prs_scale_with_idle_time(
+        self, sample_pull_request: PullRequest, idle: timedelta, expected: float
+    ) -> None:
+        """Test open PRs are polled after 1/24 of their idle time, within bounds."""
+        now = sample_pull_request.updated_at + idle
+
+        assert PollPolicy().interval(sample_pull_request, now) == expected
+
+    @pytest.mark.ai_generated
+    def test_recent_activity_makes_hot(self, sample_pull_request: PullRequest) -> None:
+        """Test a recent maintainer comment or observed change shortens the interval."""
+        now = sample_pull_request.updated_at + timedelta(days=30)
+        policy = PollPolicy()
+        commented = replace(sample_pull_request, last_maintainer_comment_at=now)
+
+        assert policy.interval(commented, now) == policy.hot
+        assert policy.interval(sample_pull_request, now, changed_at=now) == policy.hot
+
+    @pytest.mark.ai_generated
+    def test_closed_and_merged(self, sample_pull_request: PullRequest) -> None:
+        """Test closed PRs are polled weekly and merged PRs not at all."""
+        now = sample_pull_request.updated_at
+        policy = PollPolicy()
+
+        assert policy.interval(replace(sample_pull_request, status="closed"), now) == 604800.0
+        assert policy.interval(replace(sample_pull_request, status="merged"), now) is None
+
+
+class TestWatchDaemon:
+    """Tests for scheduling, searching and checkpointing."""
+
+    @pytest.mark.ai_generated
+    def test_polls_when_due(self, daemon: WatchDaemon, process: Mock) -> None:
+        """Test an unchanged PR is polled again only after its interval."""
+        assert daemon.next_due() == datetime(2025, 1, 20, 16, 30, tzinfo=UTC)
+
+        daemon.tick(START)
+        daemon.tick(START + timedelta(hours=1))
+        assert process.call_count == 1
+        assert process.call_args.kwargs["search_data"] is None  # Conditional poll
+
+        daemon.tick(START + timedelta(hours=2))
+        assert process.call_count == 2
+        assert daemon.run.unchanged_prs == 2
+        assert daemon.pending == set()
+
+    @pytest.mark.ai_generated
+    def test_changes_are_checkpointed(
+        self, daemon: WatchDaemon, process: Mock, config: Configuration
+    ) -> None:
+        """Test changed PRs are saved at the checkpoint interval and polled sooner."""
+        process.side_effect = _touch
+        daemon.tick(START)
+
+        assert daemon.pending == {KEY}
+        assert daemon.next_due() == START + timedelta(seconds=daemon.policy.hot)
+        assert (
+            load_model(config.data_file, cache=False)[0]["kestra-io/kestra"].prs[12912].updated_at
+            < START
+        )  # Not saved before the checkpoint interval
+
+        daemon.tick(START + timedelta(minutes=4))
+        daemon.tick(START + timedelta(minutes=10))
+
+        repositories, last_run = load_model(config.data_file, cache=False)
+        assert repositories["kestra-io/kestra"].prs[12912].updated_at == START
+        assert last_run is not None and last_run.updated_prs == 2
+        assert daemon.pending == set()
+        state = WatchState.load(watch_state_path(config.data_file))
+        assert state.changed_at[KEY] == START + timedelta(minutes=10)
+
+    @pytest.mark.ai_generated
+    def test_restart_keeps_schedule(
+        self, daemon: WatchDaemon, config: Configuration, client: Mock
+    ) -> None:
+        """Test a restarted daemon does not poll PRs polled before it stopped."""
+        daemon.tick(START)
+        daemon.pending.add(KEY)
+        daemon.checkpoint(START)
+
+        restarted = WatchDaemon(config, client=client, generate=False, now=START)
+
+        assert restarted.state.polled_at[KEY] == START
+        assert restarted.next_due() == START + timedelta(hours=2)
+
+    @pytest.mark.ai_generated
+    def test_search_adds_new_prs(
+        self,
+        daemon: WatchDaemon,
+        search: Mock,
+        process: Mock,
+        sample_pull_request: PullRequest,
+    ) -> None:
+        """Test PRs found by the search are fetched and scheduled."""
+
+        def add(client: Any, config: Any, repositories: Any, *args: Any, **kwargs: Any) -> str:
+            new = replace(sample_pull_request, number=13001, updated_at=START)
+            repositories["kestra-io/kestra"].add_pr(new)
+            return "new"
+
+        process.side_effect = add
+        search.return_value = [("kestra-io/kestra", 13001, {"number": 13001})]
+        daemon._schedule(KEY, START, due=START + timedelta(days=1))  # Only the search is due
+
+        assert daemon.tick(START) == 1
+        assert daemon.pending == {"kestra-io/kestra#13001"}
+        assert daemon.run.new_prs == 1
+        assert daemon.next_due() == START + timedelta(seconds=daemon.policy.hot)
+
+        daemon.tick(START + timedelta(minutes=5))
+        assert search.call_count == 1  # Next search after watch_search_interval
+
+    @pytest.mark.ai_generated
+    def test_rate_limit_pauses(self, daemon: WatchDaemon, process: Mock) -> None:
+        """Test hitting the rate limit pauses polling until the reset."""
+        reset = START + timedelta(hours=1)
+        process.side_effect = [RateLimitError("low", int(reset.timestamp())), "unchanged"]
+
+        daemon.tick(START)
+        daemon.tick(START + timedelta(minutes=30))
+        assert process.call_count == 1
+        assert daemon.paused_until == reset
+
+        daemon.tick(reset)
+        assert process.call_count == 2
+
+    @pytest.mark.ai_generated
+    def test_external_save_repolls(
+        self,
+        daemon: WatchDaemon,
+        process: Mock,
+        config: Configuration,
+        sample_repository: Repository,
+    ) -> None:
+        """Test unsaved changes are re-polled when another process saves the model."""
+        process.return_value = "updated"
+        daemon.tick(START)
+
+        save_model(config.data_file, {sample_repository.full_name: sample_repository})
+        stat = config.data_file.stat()
+        os.utime(config.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        daemon.tick(START + timedelta(minutes=1))
+
+        assert process.call_count == 2
+        assert daemon.pending == {KEY}
@@ -0,0 +1,234 @@
+"""Unit tests for the webhook receiver, replaying tests/fixtures/webhooks."""
+
+import json
+import os
+import threading
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from improveit_dashboard.controllers.persistence import load_model, save_model
+from improveit_dashboard.controllers.webhook import (
+    WebhookReceiver,
+    combined_state,
+    load_delivery,
+    sign,
+    verify_signature,
+)
+from improveit_dashboard.models.config import Configuration
+from improveit_dashboard.models.repository import Repository
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "webhooks"
+SECRET = "It's a Secret to Everybody"
+KEY = "kestra-io/kestra#13001"
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> Configuration:
+    """Configuration writing the model, archive and views under tmp_path."""
+    return Configuration(
+        tracked_users=["yarikoptic"],
+        webhook_secret=SECRET,
+        data_file=tmp_path / "data" / "repositories.json",
+        output_readme=tmp_path / "README.md",
+        output_readmes_dir=tmp_path / "READMEs",
+        output_summaries_dir=tmp_path / "Summaries",
+    )
+
+
+def _body(name: str) -> tuple[str, bytes]:
+    """Get the event and request body of a recorded delivery."""
+    event, payload = load_delivery(FIXTURES / f"{name}.json")
+    return event, json.dumps(payload).encode("utf-8")
+
+
+def _deliver(receiver: WebhookReceiver, name: str) -> tuple[int, dict[str, Any]]:
+    """Deliver a recorded delivery, signed with the shared secret."""
+    event, body = _body(name)
+    return receiver.deliver(event, body, sign(SECRET, body), f"test-{name}")
+
+
+class TestSignature:
+    """Tests for delivery verification."""
+
+    @pytest.mark.ai_generated
+    def test_verify_signature(self) -> None:
+        """Test signatures match GitHub's documented example."""
+        signature = "sha256=757107ea0eb2509fc211221cce984b8a37570b6d7586c22c46f4379c8b043e17"
+
+        assert sign(SECRET, b"Hello, World!") == signature
+        assert verify_signature(SECRET, b"Hello, World!", signature)
+        assert not verify_signature(SECRET, b"Hello, World?", signature)
+        assert not verify_signature(SECRET, b"Hello, World!", None)
+
+    @pytest.mark.ai_generated
+    def test_rejects_unsigned(self, config: Configuration) -> None:
+        """Test deliveries with a wrong signature are rejected and not applied."""
+        receiver = WebhookReceiver(config)
+        event, body = _body("pull_request-opened")
+
+        status, _ = receiver.deliver(event, body, sign("wrong", body))
+
+        assert status == 401
+        assert receiver.pending == set()
+
+    @pytest.mark.ai_generated
+    def test_ping_and_unsupported_events(self, config: Configuration) -> None:
+        """Test pings are answered and other events ignored."""
+        receiver = WebhookReceiver(config)
+        body = b'{"zen": "Keep it logically awesome."}'
+
+        assert receiver.deliver("ping", body, sign(SECRET, body))[0] == 200
+        assert receiver.deliver("star", body, sign(SECRET, body))[0] == 202
+
+
+class TestReplay:
+    """Tests applying the recorded corpus to the model."""
+
+    @pytest.mark.ai_generated
+    def test_lifecycle(self, config: Configuration) -> None:
+        """Test a PR is tracked from opening to merge without API calls."""
+        receiver = WebhookReceiver(config)
+
+        assert _deliver(receiver, "pull_request-opened") == (200, {"changed": [KEY]})
+        pr = receiver.repositories["kestra-io/kestra"].prs[13001]
+        assert (pr.tool, pr.status, pr.response_status) == ("codespell", "open", "no_response")
+        assert pr.analysis_status == "never_analyzed"  # Files are left to the next update
+
+        _deliver(receiver, "issue_comment-created")
+        assert (pr.maintainer_comments, pr.response_status) == (1, "awaiting_submitter")
+        assert pr.last_developer_comment_body is not None
+
+        # Both CI events are matched to the fork PR by its head commit
+        assert _deliver(receiver, "check_run-completed")[1] == {"changed": [KEY]}
+        assert _deliver(receiver, "status-success")[1] == {"changed": []}
+        assert (pr.ci_status, pr.codespell_workflow_ci) == ("failure", "failure")
+        assert receiver.archive is not None
+        checks = receiver.archive.get("kestra-io/kestra", 13001, "checks")
+        assert checks["status_state"] == "success"
+
+        _deliver(receiver, "pull_request-closed")
+        assert (pr.status, pr.closed_by, pr.adoption_level) == (
+            "merged",
+            "loicmathieu",
+            "typo_fixes",
+        )
+        assert receiver.pending == {KEY}
+
+    @pytest.mark.ai_generated
+    def test_untracked_prs_are_ignored(self, config: Configuration) -> None:
+        """Test PRs by untracked authors are not added."""
+        receiver = WebhookReceiver(config)
+
+        assert _deliver(receiver, "pull_request-opened-untracked") == (200, {"changed": []})
+        assert receiver.repositories == {}
+
+    @pytest.mark.ai_generated
+    def test_comment_without_engagement_state(
+        self, config: Configuration, sample_repository: Repository
+    ) -> None:
+        """Test a comment that cannot be folded in marks the PR for reanalysis."""
+        save_model(config.data_file, {sample_repository.full_name: sample_repository})
+        receiver = WebhookReceiver(config)
+        event, payload = load_delivery(FIXTURES / "issue_comment-created.json")
+        payload["issue"]["number"] = 12912
+
+        assert receiver.apply(event, payload) == {"kestra-io/kestra#12912"}
+        assert receiver.repositories["kestra-io/kestra"].prs[12912].analysis_status == (
+            "needs_reanalysis"
+        )
+
+    @pytest.mark.ai_generated
+    def test_combined_state(self) -> None:
+        """Test commit statuses combine like GitHub's combined status."""
+        assert combined_state({}) is None
+        assert combined_state({"a": "success", "b": "pending"}) == "pending"
+        assert combined_state({"a": "error", "b": "pending"}) == "failure"
+        assert combined_state({"a": "success"}) == "success"
+        assert combined_state({"a": "success"}, "failure") == "failure"
+        assert combined_state({}, "pending") == "pending"
+
+    @pytest.mark.ai_generated
+    def test_status_keeps_rest_state(self, config: Configuration) -> None:
+        """Test a status delivery does not upgrade past the combined status discovery stored."""
+        receiver = WebhookReceiver(config)
+        _deliver(receiver, "pull_request-opened")
+        pr = receiver.repositories["kestra-io/kestra"].prs[13001]
+        # Discovery's REST combined status, failing in a context no delivery named
+        receiver._put_checks(pr, {"status_state": "failure", "check_runs": []})
+        _deliver(receiver, "pull_request-opened")
+
+        _deliver(receiver, "status-success")
+
+        assert receiver.archive is not None
+        checks = receiver.archive.get("kestra-io/kestra", 13001, "checks")
+        assert checks["statuses"] == {"ci/circleci: build": "success"}
+        assert checks["status_state"] == "failure"
+        assert pr.ci_status == "failure"
+
+
+class TestFlush:
+    """Tests for saving batched changes."""
+
+    @pytest.mark.ai_generated
+    def test_flush_saves_and_regenerates(self, config: Configuration) -> None:
+        """Test flushing saves the model and regenerates views of changed PRs."""
+        receiver = WebhookReceiver(config)
+        _deliver(receiver, "pull_request-opened")
+
+        generated = receiver.flush()
+
+        repositories, _ = load_model(config.data_file, cache=False)
+        assert KEY.split("#")[0] in repositories
+        assert config.output_readme in generated
+        assert config.output_readmes_dir / "yarikoptic.md" in generated
+        assert receiver.pending == set()
+        assert receiver.flush() == []
+
+    @pytest.mark.ai_generated
+    def test_replays_over_external_save(
+        self, config: Configuration, sample_repository: Repository
+    ) -> None:
+        """Test unsaved deliveries are replayed when another process saves the model."""
+        receiver = WebhookReceiver(config, generate=False)
+        _deliver(receiver, "pull_request-opened")
+
+        # A reconciliation update replaces the model file
+        save_model(config.data_file, {sample_repository.full_name: sample_repository})
+        stat = config.data_file.stat()
+        os.utime(config.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        receiver.flush()
+
+        repositories, _ = load_model(config.data_file, cache=False)
+        assert set(repositories["kestra-io/kestra"].prs) == {12912, 13001}
+        assert receiver.feed is not None
+        assert receiver.feed.events == 1  # The replay is not reported again
+
+    @pytest.mark.ai_generated
+    def test_http(self, config: Configuration, tmp_path: Path) -> None:
+        """Test deliveries are accepted over HTTP and recorded for replay."""
+        receiver = WebhookReceiver(config, generate=False, record_dir=tmp_path / "recorded")
+        httpd = receiver.make_http_server("127.0.0.1", 0)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        event, body = _body("pull_request-opened")
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{httpd.server_address[1]}/",
+            data=body,
+            headers={
+                "X-GitHub-Event": event,
+                "X-GitHub-Delivery": "72d3162e",
+                "X-Hub-Signature-256": sign(SECRET, body),
+                "Content-Type": "application/json",
+            },
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                assert json.load(response) == {"changed": [KEY]}
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+        recorded = tmp_path / "recorded" / "pull_request-72d3162e.json"
+        assert load_delivery(recorded) == load_delivery(FIXTURES / "pull_request-opened.json")